@@ -0,0 +1,15 @@
+"""Offline benchmark suite for the data fetcher.
+
+Runs complete fetches against in-process stand-ins for SFTP, the SIRENE API
+and S3, and reports throughput, per-bundle latency and peak RSS as JSON.
+Run with ``python -m benchmarks``.
+"""
+
+from .scenarios import SCENARIOS, ScenarioResult, build_report, run_scenario
+
+__all__ = [
+    "SCENARIOS",
+    "ScenarioResult",
+    "build_report",
+    "run_scenario",
+]
@@ -0,0 +1,74 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from .log_setup import quiet_logging
+from .scenarios import SCENARIOS, ScenarioResult, build_report, run_scenario
+
+
+def _run_isolated(name: str, scale: float) -> ScenarioResult:
+    """Run a scenario in a fresh interpreter so its peak RSS is its own."""
+    completed = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "benchmarks",
+            "--in-process",
+            "--scenario",
+            name,
+            "--scale",
+            str(scale),
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    result = json.loads(completed.stdout)["results"][0]
+    return ScenarioResult(**result)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected scenarios and print or write the JSON report."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable; defaults to all)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply the size of every scenario (default: 1.0)",
+    )
+    parser.add_argument("--output", type=Path, help="Write the report to this file")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run scenarios in this process (peak RSS is then cumulative)",
+    )
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    results = [
+        run_scenario(name, args.scale)
+        if args.in_process
+        else _run_isolated(name, args.scale)
+        for name in args.scenario or list(SCENARIOS)
+    ]
+
+    report = json.dumps(build_report(results), indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        sys.stdout.write(report + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
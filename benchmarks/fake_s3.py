@@ -0,0 +1,144 @@
+"""In-memory S3 stand-in.
+
+``InMemoryS3Storage`` is an ``S3Storage`` whose sync and async clients write to
+an ``InMemoryS3`` object store, so the real bundle, multipart upload and
+completion code paths run without AWS. Object bodies are counted but not kept
+by default, so the peak RSS of a benchmark reflects the fetcher rather than
+the stand-in.
+"""
+
+# Method signatures mirror the boto3 S3 client keyword arguments
+# ruff: noqa: N803
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, cast
+
+from data_fetcher_core.storage.s3_storage import S3Storage, S3StorageBundle
+
+if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+
+    from data_fetcher_core.core import BundleRef
+
+
+@dataclass
+class InMemoryS3:
+    """Objects written through the fake S3 clients.
+
+    Args:
+        part_latency_seconds: Delay added to every uploaded part.
+        bandwidth_bytes_per_second: Upload bandwidth, or None for no limit.
+        keep_data: Keep object bodies (otherwise only sizes are recorded).
+    """
+
+    part_latency_seconds: float = 0.0
+    bandwidth_bytes_per_second: float | None = None
+    keep_data: bool = False
+    objects: dict[str, int] = field(default_factory=dict)
+    data: dict[str, bytes] = field(default_factory=dict)
+    parts_uploaded: int = 0
+    _uploads: dict[str, list[bytes | int]] = field(default_factory=dict)
+    _upload_ids: "itertools.count[int]" = field(default_factory=itertools.count)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of every stored object."""
+        return sum(self.objects.values())
+
+    def _store(self, bucket: str, key: str, body: bytes | int) -> None:
+        name = f"{bucket}/{key}"
+        self.objects[name] = body if isinstance(body, int) else len(body)
+        if self.keep_data and isinstance(body, bytes):
+            self.data[name] = body
+
+    def put_object(
+        self, Bucket: str, Key: str, Body: str | bytes, **_: object
+    ) -> dict[str, Any]:
+        """Store a whole object (sync client API)."""
+        self._store(Bucket, Key, Body.encode() if isinstance(Body, str) else Body)
+        return {"ETag": '"fake"'}
+
+    async def create_multipart_upload(
+        self, Bucket: str, Key: str, **_: object
+    ) -> dict[str, Any]:
+        """Start a multipart upload."""
+        upload_id = f"{Bucket}/{Key}#{next(self._upload_ids)}"
+        self._uploads[upload_id] = []
+        return {"UploadId": upload_id}
+
+    async def upload_part(
+        self,
+        UploadId: str,
+        PartNumber: int,
+        Body: bytes,
+        **_: object,
+    ) -> dict[str, Any]:
+        """Upload one part of a multipart upload."""
+        delay = self.part_latency_seconds
+        if self.bandwidth_bytes_per_second:
+            delay += len(Body) / self.bandwidth_bytes_per_second
+        if delay:
+            await asyncio.sleep(delay)
+        self._uploads[UploadId].append(Body if self.keep_data else len(Body))
+        self.parts_uploaded += 1
+        return {"ETag": f'"{PartNumber}"'}
+
+    async def complete_multipart_upload(
+        self,
+        Bucket: str,
+        Key: str,
+        UploadId: str,
+        **_: object,
+    ) -> dict[str, Any]:
+        """Assemble the uploaded parts into an object."""
+        parts = self._uploads.pop(UploadId)
+        if self.keep_data:
+            self._store(
+                Bucket, Key, b"".join(part for part in parts if isinstance(part, bytes))
+            )
+        else:
+            self._store(
+                Bucket, Key, sum(part for part in parts if isinstance(part, int))
+            )
+        return {}
+
+    async def abort_multipart_upload(
+        self, UploadId: str, **_: object
+    ) -> dict[str, Any]:
+        """Discard a multipart upload."""
+        self._uploads.pop(UploadId, None)
+        return {}
+
+    async def __aenter__(self) -> "InMemoryS3":
+        """Act as the async client context manager."""
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Nothing to release."""
+
+
+class InMemoryS3StorageBundle(S3StorageBundle):
+    """S3StorageBundle uploading to an InMemoryS3."""
+
+    def _async_client(self) -> "AbstractAsyncContextManager[Any]":
+        return cast("AbstractAsyncContextManager[Any]", self.s3_client)
+
+
+@dataclass
+class InMemoryS3Storage(S3Storage):
+    """S3Storage backed by an InMemoryS3 instead of AWS."""
+
+    bucket_name: str = "benchmark-bucket"
+    s3: InMemoryS3 = field(default_factory=InMemoryS3)
+
+    def __post_init__(self) -> None:
+        """Use the in-memory store as the S3 client."""
+        self.s3_client = self.s3
+        self._active_bundles: dict[str, Any] = {}
+
+    def _create_bundle(self, bundle_ref: "BundleRef") -> S3StorageBundle:
+        return InMemoryS3StorageBundle(
+            self.s3, self.bucket_name, self.prefix, bundle_ref
+        )
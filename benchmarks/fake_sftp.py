@@ -0,0 +1,254 @@
+"""In-process SFTP stand-in.
+
+``FakeSftpManager`` is an ``SftpManager`` whose pools hand out
+``FakeSftpConnection`` objects instead of ``pysftp.Connection``. The real pool,
+rate limiter, retry engine, locators and loader all run unchanged; only the
+network is replaced by an in-memory file system. Like pysftp, every operation
+blocks the calling thread, so per-operation latency and transfer bandwidth are
+simulated with ``time.sleep``.
+"""
+
+import io
+import posixpath
+import random
+import stat
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from data_fetcher_sftp.sftp_config import SftpProtocolConfig
+from data_fetcher_sftp.sftp_manager import SftpManager
+from data_fetcher_sftp.sftp_pool import SftpConnectionPool
+
+if TYPE_CHECKING:
+    from data_fetcher_core.config import FetcherConfig
+    from data_fetcher_sftp.sftp_credentials import SftpCredentialsWrapper
+
+# Content served for files without explicit data: a fixed pseudo-random block
+# (incompressible, like most archives) repeated up to the file size
+_BLOCK_SIZE = 1024 * 1024
+_BLOCK = random.Random(0).randbytes(_BLOCK_SIZE)  # noqa: S311
+
+
+@dataclass
+class RemoteFile:
+    """A file on the fake SFTP server."""
+
+    size: int
+    data: bytes | None = None
+    mtime: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class FakeStat:
+    """The subset of ``os.stat_result`` read by the fetcher."""
+
+    st_size: int
+    st_mtime: float
+    st_mode: int
+
+
+class FakeSftpFile(io.RawIOBase):
+    """A readable remote file, throttled to the server bandwidth."""
+
+    def __init__(self, remote: RemoteFile, bandwidth: float | None) -> None:
+        """Initialize the file at offset zero."""
+        super().__init__()
+        self._remote = remote
+        self._bandwidth = bandwidth
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Return True; fake files are read-only."""
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (the rest of the file if negative)."""
+        remaining = self._remote.size - self._position
+        size = remaining if size < 0 else min(size, remaining)
+        if size <= 0:
+            return b""
+        start = self._position
+        self._position += size
+        if self._remote.data is not None:
+            chunk = self._remote.data[start : start + size]
+        else:
+            chunk = b"".join(
+                _BLOCK[offset % _BLOCK_SIZE : offset % _BLOCK_SIZE + length]
+                for offset, length in _spans(start, size)
+            )
+        if self._bandwidth:
+            time.sleep(size / self._bandwidth)
+        return chunk
+
+
+def _spans(start: int, size: int) -> list[tuple[int, int]]:
+    """Split a byte range so that no part crosses a block boundary."""
+    parts = []
+    while size > 0:
+        length = min(size, _BLOCK_SIZE - start % _BLOCK_SIZE)
+        parts.append((start, length))
+        start += length
+        size -= length
+    return parts
+
+
+@dataclass
+class FakeSftpFileSystem:
+    """Files served by the fake SFTP server.
+
+    Args:
+        latency_seconds: Blocking delay added to every remote operation.
+        bandwidth_bytes_per_second: Per-connection read bandwidth, or None for
+            unthrottled reads.
+    """
+
+    latency_seconds: float = 0.0
+    bandwidth_bytes_per_second: float | None = None
+    files: dict[str, RemoteFile] = field(default_factory=dict)
+
+    def add_file(
+        self, path: str, size: int | None = None, data: bytes | None = None
+    ) -> None:
+        """Add a file with explicit content or ``size`` bytes of filler."""
+        if data is None and size is None:
+            raise ValueError("Either size or data is required")  # noqa: TRY003
+        self.files[posixpath.normpath(path)] = RemoteFile(
+            size=len(data) if data is not None else int(size or 0), data=data
+        )
+
+    def is_dir(self, path: str) -> bool:
+        """Check whether any file lives under ``path``."""
+        prefix = posixpath.normpath(path).rstrip("/") + "/"
+        return any(name.startswith(prefix) for name in self.files)
+
+    def get(self, path: str) -> RemoteFile:
+        """Get a file, raising FileNotFoundError like pysftp."""
+        try:
+            return self.files[posixpath.normpath(path)]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of every file."""
+        return sum(remote.size for remote in self.files.values())
+
+
+class FakeSftpConnection:
+    """Stand-in for ``pysftp.Connection`` backed by a FakeSftpFileSystem."""
+
+    def __init__(self, filesystem: FakeSftpFileSystem) -> None:
+        """Initialize the connection in the root directory."""
+        self._filesystem = filesystem
+        self._cwd = "/"
+        self.closed = False
+
+    def _round_trip(self) -> None:
+        if self.closed:
+            raise OSError("Connection is closed")  # noqa: TRY003
+        if self._filesystem.latency_seconds:
+            time.sleep(self._filesystem.latency_seconds)
+
+    def _resolve(self, path: str) -> str:
+        return posixpath.normpath(posixpath.join(self._cwd, path))
+
+    @property
+    def pwd(self) -> str:
+        """Current remote directory."""
+        self._round_trip()
+        return self._cwd
+
+    def chdir(self, path: str) -> None:
+        """Change the remote directory."""
+        self._round_trip()
+        self._cwd = self._resolve(path)
+
+    def listdir(self, path: str = ".") -> list[str]:
+        """List the names directly under ``path``."""
+        self._round_trip()
+        prefix = self._resolve(path).rstrip("/") + "/"
+        names = {
+            name[len(prefix) :].split("/", 1)[0]
+            for name in self._filesystem.files
+            if name.startswith(prefix)
+        }
+        return sorted(names)
+
+    def stat(self, path: str) -> FakeStat:
+        """Stat a file or directory."""
+        self._round_trip()
+        resolved = self._resolve(path)
+        if self._filesystem.is_dir(resolved):
+            return FakeStat(st_size=0, st_mtime=0.0, st_mode=stat.S_IFDIR | 0o755)
+        remote = self._filesystem.get(resolved)
+        return FakeStat(
+            st_size=remote.size, st_mtime=remote.mtime, st_mode=stat.S_IFREG | 0o644
+        )
+
+    def open(self, path: str, mode: str = "r") -> FakeSftpFile:
+        """Open a file for reading."""
+        self._round_trip()
+        if "w" in mode or "a" in mode:
+            raise PermissionError(path)
+        return FakeSftpFile(
+            self._filesystem.get(self._resolve(path)),
+            self._filesystem.bandwidth_bytes_per_second,
+        )
+
+    def exists(self, path: str) -> bool:
+        """Check whether a file or directory exists."""
+        self._round_trip()
+        resolved = self._resolve(path)
+        return resolved in self._filesystem.files or self._filesystem.is_dir(resolved)
+
+    def isdir(self, path: str) -> bool:
+        """Check whether ``path`` is a directory."""
+        self._round_trip()
+        return self._filesystem.is_dir(self._resolve(path))
+
+    def isfile(self, path: str) -> bool:
+        """Check whether ``path`` is a file."""
+        self._round_trip()
+        return self._resolve(path) in self._filesystem.files
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.closed = True
+
+
+@dataclass
+class FakeSftpConnectionPool(SftpConnectionPool):
+    """SftpConnectionPool that connects to a FakeSftpFileSystem."""
+
+    filesystem: FakeSftpFileSystem = field(default_factory=FakeSftpFileSystem)
+    connections_opened: int = 0
+
+    async def _create_inner_connection(
+        self,
+        app_config: "FetcherConfig",  # noqa: ARG002
+        credentials_provider: "SftpCredentialsWrapper",  # noqa: ARG002
+    ) -> "FakeSftpConnection":
+        # Connecting costs a few round trips (handshake, auth, subsystem)
+        for _ in range(3):
+            if self.filesystem.latency_seconds:
+                time.sleep(self.filesystem.latency_seconds)
+        self.connections_opened += 1
+        return FakeSftpConnection(self.filesystem)
+
+
+class FakeSftpManager(SftpManager):
+    """SftpManager whose pools serve a FakeSftpFileSystem."""
+
+    def __init__(self, filesystem: FakeSftpFileSystem) -> None:
+        """Initialize the manager for the given file system."""
+        super().__init__()
+        self.filesystem = filesystem
+
+    def _get_or_create_pool(self, config: SftpProtocolConfig) -> SftpConnectionPool:
+        connection_key = config.get_connection_key()
+        if connection_key not in self._connection_pools:
+            self._connection_pools[connection_key] = FakeSftpConnectionPool(
+                config=config, filesystem=self.filesystem
+            )
+        return self._connection_pools[connection_key]
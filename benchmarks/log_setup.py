@@ -0,0 +1,19 @@
+"""Logging setup for benchmark runs."""
+
+import logging
+import sys
+
+import structlog
+
+
+def quiet_logging() -> None:
+    """Send warnings and errors to stderr so stdout carries only the report.
+
+    Debug and info events are dropped, so timings measure the fetcher rather
+    than log rendering.
+    """
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+    )
@@ -0,0 +1,391 @@
+"""Micro-benchmarks for the queue, serializer and KV primitives.
+
+Each benchmark is an async context manager that sets up its fixtures and
+yields the operation to time (a plain or async callable taking no
+arguments). The harness calls the operation ``ops`` times per round and
+reports the best round's ops/sec (like ``timeit``, the least disturbed by
+other load on the machine) alongside the median.
+
+Usage::
+
+    python -m benchmarks.micro run [--output results.json]
+    python -m benchmarks.micro compare [--threshold 0.2]
+    python -m benchmarks.micro update-baseline
+
+``compare`` exits non-zero when any benchmark is slower than its committed
+baseline by more than the threshold. Baselines are machine specific: refresh
+them with ``update-baseline`` on the machine that runs the comparison.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from data_fetcher_core.core import BundleRef
+from data_fetcher_core.kv_store import InMemoryKeyValueStore, RedisKeyValueStore
+from data_fetcher_core.kv_store.helper import deserialize_value, serialize_value
+from data_fetcher_core.queue import BundleRefSerializer, InMemoryQueue, KVStoreQueue
+
+from .log_setup import quiet_logging
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "micro.json"
+DEFAULT_THRESHOLD = 0.2
+
+Operation = Callable[[], object] | Callable[[], Awaitable[object]]
+Setup = Callable[["MicroContext"], AbstractAsyncContextManager[Operation]]
+
+
+@dataclass
+class MicroContext:
+    """Options shared by every benchmark setup."""
+
+    redis_host: str | None = None
+    redis_port: int = 6379
+
+
+@dataclass
+class MicroBenchmark:
+    """A registered micro-benchmark."""
+
+    name: str
+    setup: Setup
+    ops: int
+    requires_redis: bool = False
+
+
+@dataclass
+class MicroResult:
+    """Timing of one micro-benchmark."""
+
+    name: str
+    ops_per_sec: float
+    median_ops_per_sec: float
+    min_ops_per_sec: float
+    rounds: int
+    ops_per_round: int
+
+
+BENCHMARKS: dict[str, MicroBenchmark] = {}
+
+
+def micro_benchmark(
+    name: str, *, ops: int = 10_000, requires_redis: bool = False
+) -> Callable[[Setup], Setup]:
+    """Register an async-context-manager setup as a micro-benchmark."""
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = MicroBenchmark(name, setup, ops, requires_redis)
+        return setup
+
+    return decorator
+
+
+def _bundle_ref() -> BundleRef:
+    return BundleRef(
+        bid="bid:v1:sftp:20240115103000:abc12345",
+        request_meta={
+            "url": "sftp:///data/daily/companies_20240115.csv.gz",
+            "resources_count": 0,
+            "headers": {"Accept": "application/json"},
+        },
+    )
+
+
+@micro_benchmark("bundle_ref.from_dict", ops=20_000)
+@asynccontextmanager
+async def _bundle_ref_from_dict(_ctx: MicroContext) -> AsyncIterator[Operation]:
+    ref = _bundle_ref()
+    data = {"bid": str(ref.bid), "request_meta": dict(ref.request_meta)}
+    yield lambda: BundleRef.from_dict(data)
+
+
+@micro_benchmark("bundle_ref_serializer.dumps", ops=20_000)
+@asynccontextmanager
+async def _serializer_dumps(_ctx: MicroContext) -> AsyncIterator[Operation]:
+    serializer = BundleRefSerializer()
+    ref = _bundle_ref()
+    yield lambda: serializer.dumps(ref)
+
+
+@micro_benchmark("bundle_ref_serializer.loads", ops=20_000)
+@asynccontextmanager
+async def _serializer_loads(_ctx: MicroContext) -> AsyncIterator[Operation]:
+    serializer = BundleRefSerializer()
+    data = serializer.dumps(_bundle_ref())
+    yield lambda: serializer.loads(data)
+
+
+def _kv_value() -> dict[str, Any]:
+    ref = _bundle_ref()
+    return {
+        "bid": str(ref.bid),
+        "request_meta": dict(ref.request_meta),
+        "file_path": "/data/daily/companies_20240115.csv.gz",
+    }
+
+
+def _serialize_setup(serializer: str) -> Setup:
+    @asynccontextmanager
+    async def setup(_ctx: MicroContext) -> AsyncIterator[Operation]:
+        value = _kv_value()
+        yield lambda: serialize_value(value, serializer)
+
+    return setup
+
+
+def _deserialize_setup(serializer: str) -> Setup:
+    @asynccontextmanager
+    async def setup(_ctx: MicroContext) -> AsyncIterator[Operation]:
+        data = serialize_value(_kv_value(), serializer)
+        yield lambda: deserialize_value(data, serializer)
+
+    return setup
+
+
+for _serializer in ("json", "pickle"):
+    micro_benchmark(f"kv_serialize.{_serializer}", ops=20_000)(
+        _serialize_setup(_serializer)
+    )
+    micro_benchmark(f"kv_deserialize.{_serializer}", ops=20_000)(
+        _deserialize_setup(_serializer)
+    )
+
+
+@micro_benchmark("in_memory_queue.enqueue_dequeue", ops=10_000)
+@asynccontextmanager
+async def _in_memory_queue(_ctx: MicroContext) -> AsyncIterator[Operation]:
+    queue = InMemoryQueue(BundleRefSerializer())
+    ref = _bundle_ref()
+
+    async def operation() -> None:
+        await queue.enqueue([ref])
+        await queue.dequeue(max_items=1)
+
+    yield operation
+    await queue.close()
+
+
+async def _kv_queue_operation(queue: KVStoreQueue) -> Operation:
+    ref = _bundle_ref()
+
+    async def operation() -> None:
+        await queue.enqueue([ref])
+        await queue.dequeue(max_items=1)
+
+    return operation
+
+
+@micro_benchmark("kv_store_queue.memory.enqueue_dequeue", ops=2_000)
+@asynccontextmanager
+async def _kv_queue_memory(_ctx: MicroContext) -> AsyncIterator[Operation]:
+    store = InMemoryKeyValueStore()
+    queue = KVStoreQueue(store, "benchmark", BundleRefSerializer())
+    yield await _kv_queue_operation(queue)
+    await store.close()
+
+
+@micro_benchmark("kv_store_queue.redis.enqueue_dequeue", ops=500, requires_redis=True)
+@asynccontextmanager
+async def _kv_queue_redis(ctx: MicroContext) -> AsyncIterator[Operation]:
+    store = RedisKeyValueStore(host=ctx.redis_host, port=ctx.redis_port)
+    namespace = f"data_fetcher_benchmark:{uuid.uuid4().hex}"
+    queue = KVStoreQueue(store, namespace, BundleRefSerializer())
+    try:
+        yield await _kv_queue_operation(queue)
+    finally:
+        await queue.clear()
+        await store.delete(f"{namespace}:next_id")
+        await store.delete(f"{namespace}:size")
+        await store.close()
+
+
+async def _time_rounds(
+    benchmark: MicroBenchmark, ctx: MicroContext, rounds: int, ops: int
+) -> list[float]:
+    rates: list[float] = []
+    async with benchmark.setup(ctx) as operation:
+        is_async = inspect.iscoroutinefunction(operation)
+        # The first round is an untimed warm-up
+        for round_index in range(rounds + 1):
+            started = time.perf_counter()
+            if is_async:
+                for _ in range(ops):
+                    await operation()  # type: ignore[misc]
+            else:
+                for _ in range(ops):
+                    operation()
+            elapsed = time.perf_counter() - started
+            if round_index:
+                rates.append(ops / elapsed if elapsed else float("inf"))
+    return rates
+
+
+def run_benchmark(
+    benchmark: MicroBenchmark,
+    ctx: MicroContext,
+    *,
+    rounds: int = 5,
+    scale: float = 1.0,
+) -> MicroResult:
+    """Time one micro-benchmark."""
+    ops = max(1, round(benchmark.ops * scale))
+    rates = asyncio.run(_time_rounds(benchmark, ctx, rounds, ops))
+    return MicroResult(
+        name=benchmark.name,
+        ops_per_sec=round(max(rates), 1),
+        median_ops_per_sec=round(statistics.median(rates), 1),
+        min_ops_per_sec=round(min(rates), 1),
+        rounds=rounds,
+        ops_per_round=ops,
+    )
+
+
+def run_all(
+    ctx: MicroContext,
+    *,
+    names: list[str] | None = None,
+    rounds: int = 5,
+    scale: float = 1.0,
+) -> dict[str, Any]:
+    """Run the selected benchmarks (all by default) and build a report.
+
+    Benchmarks that need Redis are skipped unless a Redis host is given.
+    """
+    selected = [
+        benchmark
+        for name, benchmark in BENCHMARKS.items()
+        if (not names or any(pattern in name for pattern in names))
+        and (ctx.redis_host or not benchmark.requires_redis)
+    ]
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "benchmarks": {
+            benchmark.name: asdict(
+                run_benchmark(benchmark, ctx, rounds=rounds, scale=scale)
+            )
+            for benchmark in selected
+        },
+    }
+
+
+@dataclass
+class Comparison:
+    """A benchmark result compared with its baseline."""
+
+    name: str
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+    change: float
+    regressed: bool
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compare a report with a baseline.
+
+    A benchmark regresses when its ops/sec dropped by more than
+    ``threshold`` (a fraction). Benchmarks missing from either side are
+    ignored.
+    """
+    comparisons = []
+    for name, result in report["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if not base or not base.get("ops_per_sec"):
+            continue
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_ops_per_sec=base["ops_per_sec"],
+                ops_per_sec=result["ops_per_sec"],
+                change=change,
+                regressed=change < -threshold,
+            )
+        )
+    return comparisons
+
+
+def _format_comparisons(comparisons: list[Comparison]) -> str:
+    width = max((len(c.name) for c in comparisons), default=4)
+    lines = [f"{'name':<{width}}  {'baseline':>12}  {'current':>12}  change"]
+    lines.extend(
+        f"{c.name:<{width}}  {c.baseline_ops_per_sec:>12,.0f}  "
+        f"{c.ops_per_sec:>12,.0f}  {c.change:+7.1%}"
+        + ("  REGRESSION" if c.regressed else "")
+        for c in comparisons
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run, compare or re-baseline the micro-benchmarks."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro")
+    parser.add_argument("command", choices=["run", "compare", "update-baseline"])
+    parser.add_argument(
+        "--filter",
+        action="append",
+        help="Only run benchmarks whose name contains this (repeatable)",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply the ops per round"
+    )
+    parser.add_argument(
+        "--redis", metavar="HOST[:PORT]", help="Also benchmark the Redis KV store"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed ops/sec drop before compare fails (default: 0.2)",
+    )
+    parser.add_argument("--output", type=Path, help="Also write the report here")
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    ctx = MicroContext()
+    if args.redis:
+        host, _, port = args.redis.partition(":")
+        ctx = MicroContext(redis_host=host, redis_port=int(port or 6379))
+
+    report = run_all(ctx, names=args.filter, rounds=args.rounds, scale=args.scale)
+    rendered = json.dumps(report, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(rendered)
+
+    if args.command == "run":
+        if not args.output:
+            sys.stdout.write(rendered)
+        return 0
+
+    if args.command == "update-baseline":
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(rendered)
+        sys.stdout.write(f"Baseline written to {args.baseline}\n")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    comparisons = compare(report, baseline, args.threshold)
+    sys.stdout.write(_format_comparisons(comparisons) + "\n")
+    return 1 if any(c.regressed for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
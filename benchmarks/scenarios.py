@@ -0,0 +1,293 @@
+"""Benchmark scenarios and measurement.
+
+Each scenario builds its stand-ins, runs a complete ``Fetcher`` pass against
+them and reports throughput, per-bundle latency percentiles (from the
+tracer's ``bundle`` spans) and the peak RSS of the process.
+"""
+
+import asyncio
+import gzip
+import math
+import platform
+import resource
+import sys
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from data_fetcher_core.config import FetcherConfig
+from data_fetcher_core.core import (
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.credentials import EnvironmentCredentialProvider
+from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.kv_store import InMemoryKeyValueStore
+from data_fetcher_core.storage.decorators import UnzipResourceDecorator
+from data_fetcher_core.tracing import (
+    ROOT_SPAN_NAME,
+    configure_tracer,
+    span_duration_seconds,
+)
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http.http_manager import HttpManager
+from data_fetcher_http_api.api_loader import HttpBundleLoader
+from data_fetcher_http_api.api_pagination_bundle_locators import (
+    CursorPaginationStrategy,
+)
+from data_fetcher_http_api.api_partitioned_bundle_locators import (
+    PartitionedPaginationHttpBundleLocator,
+)
+from data_fetcher_sftp.sftp_bundle_locators import DirectorySftpBundleLocator
+from data_fetcher_sftp.sftp_config import SftpProtocolConfig
+from data_fetcher_sftp.sftp_loader import SftpBundleLoader
+
+from .fake_s3 import InMemoryS3, InMemoryS3Storage
+from .fake_sftp import FakeSftpFileSystem, FakeSftpManager
+from .sirene_api import SireneApiStandIn
+
+# Rate limits high enough that the stand-ins, not the limiter, set the pace
+_UNLIMITED_RATE = 100_000.0
+_CONCURRENCY = 8
+
+
+@dataclass
+class ScenarioOutcome:
+    """What a scenario run produced."""
+
+    bundles: int
+    bytes_stored: int
+    errors: int
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one scenario run."""
+
+    scenario: str
+    scale: float
+    bundles: int
+    errors: int
+    elapsed_seconds: float
+    bundles_per_second: float
+    bytes_stored: int
+    bytes_per_second: float
+    bundle_latency_p50_seconds: float
+    bundle_latency_p99_seconds: float
+    bundle_latency_max_seconds: float
+    peak_rss_bytes: int
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+async def _run_fetcher(
+    loader: object, locators: list[Any], storage: object
+) -> tuple[int, int]:
+    app_config = FetcherConfig(
+        credential_provider=EnvironmentCredentialProvider(),
+        kv_store=InMemoryKeyValueStore(),
+        storage=storage,  # type: ignore[arg-type]
+    )
+    config = DataRegistryFetcherConfig(
+        loader=loader,
+        locators=locators,
+        concurrency=_CONCURRENCY,
+        config_id="benchmark",
+    )
+    context = FetchRunContext(run_id="benchmark", app_config=app_config)
+    result = await Fetcher().run(
+        FetchPlan(config=config, context=context, concurrency=_CONCURRENCY)
+    )
+    return result.processed_count, len(result.errors)
+
+
+async def _run_sftp(
+    filesystem: FakeSftpFileSystem,
+    storage: object,
+    s3: InMemoryS3,
+    filename_pattern: str = "*",
+) -> ScenarioOutcome:
+    manager = FakeSftpManager(filesystem)
+    sftp_config = SftpProtocolConfig(
+        config_name="benchmark",
+        rate_limit_requests_per_second=_UNLIMITED_RATE,
+        pool_max_size=_CONCURRENCY,
+    )
+    locator = DirectorySftpBundleLocator(
+        sftp_manager=manager,
+        sftp_config=sftp_config,
+        remote_dir="/data",
+        filename_pattern=filename_pattern,
+    )
+    loader = SftpBundleLoader(
+        sftp_manager=manager,
+        sftp_config=sftp_config,
+        remote_dir="/data",
+        filename_pattern=filename_pattern,
+    )
+    processed, errors = await _run_fetcher(loader, [locator], storage)
+    return ScenarioOutcome(
+        bundles=processed, bytes_stored=s3.total_bytes, errors=errors
+    )
+
+
+async def sftp_many_small_files(scale: float) -> ScenarioOutcome:
+    """Thousands of 4 KB files: per-file overhead dominates."""
+    filesystem = FakeSftpFileSystem(
+        latency_seconds=0.002, bandwidth_bytes_per_second=50 * 1024 * 1024
+    )
+    for index in range(_scaled(1000, scale)):
+        filesystem.add_file(f"/data/small_{index:06d}.csv", size=4 * 1024)
+    s3 = InMemoryS3()
+    return await _run_sftp(filesystem, InMemoryS3Storage(s3=s3), s3)
+
+
+async def sftp_few_large_files(scale: float) -> ScenarioOutcome:
+    """A handful of large files: transfer and multipart upload dominate."""
+    filesystem = FakeSftpFileSystem(
+        latency_seconds=0.005, bandwidth_bytes_per_second=200 * 1024 * 1024
+    )
+    size = _scaled(64 * 1024 * 1024, scale)
+    for index in range(4):
+        filesystem.add_file(f"/data/large_{index}.bin", size=size)
+    s3 = InMemoryS3(part_latency_seconds=0.005)
+    return await _run_sftp(filesystem, InMemoryS3Storage(s3=s3), s3)
+
+
+def _gzip_csv(rows: int, seed: int) -> bytes:
+    lines = (f"{seed},{row},COMPANY {seed}-{row},ACTIVE\n" for row in range(rows))
+    return gzip.compress("".join(lines).encode(), compresslevel=6)
+
+
+async def sftp_compressed_archives(scale: float) -> ScenarioOutcome:
+    """Gzipped CSV extracts, stored as-is and decompressed alongside."""
+    filesystem = FakeSftpFileSystem(
+        latency_seconds=0.002, bandwidth_bytes_per_second=50 * 1024 * 1024
+    )
+    for index in range(_scaled(40, scale)):
+        filesystem.add_file(
+            f"/data/extract_{index:04d}.csv.gz", data=_gzip_csv(50_000, seed=index)
+        )
+    s3 = InMemoryS3()
+    storage = UnzipResourceDecorator(InMemoryS3Storage(s3=s3))
+    return await _run_sftp(filesystem, storage, s3, filename_pattern="*.csv.gz")
+
+
+async def http_paginated_api(scale: float) -> ScenarioOutcome:
+    """SIRENE-style cursor pagination over date partitions."""
+    days = _scaled(10, scale)
+    start = date(2024, 1, 1)
+    api = SireneApiStandIn(records_per_day=2000, latency_seconds=0.01)
+    with api:
+        http_config = HttpProtocolConfig(
+            base_url=api.base_url,
+            rate_limit_requests_per_second=_UNLIMITED_RATE,
+            pool_max_size=_CONCURRENCY,
+        )
+        manager = HttpManager()
+        locator = PartitionedPaginationHttpBundleLocator(
+            http_config=http_config,
+            base_url=api.base_url,
+            date_start=start.isoformat(),
+            date_end=(start + timedelta(days=days - 1)).isoformat(),
+            max_records_per_page=200,
+            query_builder=lambda day, _narrowing: (
+                f"dateDernierTraitementUniteLegale:"
+                f"[{day}T00:00:00%20TO%20{day}T23:59:59]"
+            ),
+        )
+        loader = HttpBundleLoader(
+            http_manager=manager,
+            http_config=http_config,
+            pagination_strategy=CursorPaginationStrategy(),
+        )
+        s3 = InMemoryS3()
+        processed, errors = await _run_fetcher(
+            loader, [locator], InMemoryS3Storage(s3=s3)
+        )
+    return ScenarioOutcome(
+        bundles=processed, bytes_stored=s3.total_bytes, errors=errors
+    )
+
+
+SCENARIOS: dict[str, Callable[[float], Coroutine[Any, Any, ScenarioOutcome]]] = {
+    "sftp_many_small_files": sftp_many_small_files,
+    "sftp_few_large_files": sftp_few_large_files,
+    "sftp_compressed_archives": sftp_compressed_archives,
+    "http_paginated_api": http_paginated_api,
+}
+
+
+def run_scenario(name: str, scale: float = 1.0) -> ScenarioResult:
+    """Run one scenario in this process and measure it."""
+    # Bundle spans are collected synchronously so none are dropped under load
+    spans = InMemorySpanExporter()
+    tracer = configure_tracer(span_processors=[SimpleSpanProcessor(spans)])
+    started = time.perf_counter()
+    outcome = asyncio.run(SCENARIOS[name](scale))
+    elapsed = time.perf_counter() - started
+
+    latencies = [
+        span_duration_seconds(span)
+        for span in spans.get_finished_spans()
+        if span.name == ROOT_SPAN_NAME
+    ]
+    summary = tracer.summary()
+    return ScenarioResult(
+        scenario=name,
+        scale=scale,
+        bundles=outcome.bundles,
+        errors=outcome.errors,
+        elapsed_seconds=round(elapsed, 6),
+        bundles_per_second=round(outcome.bundles / elapsed, 3) if elapsed else 0.0,
+        bytes_stored=outcome.bytes_stored,
+        bytes_per_second=round(outcome.bytes_stored / elapsed, 1) if elapsed else 0.0,
+        bundle_latency_p50_seconds=round(percentile(latencies, 50), 6),
+        bundle_latency_p99_seconds=round(percentile(latencies, 99), 6),
+        bundle_latency_max_seconds=round(max(latencies, default=0.0), 6),
+        peak_rss_bytes=peak_rss_bytes(),
+        stages={
+            stage: {
+                "count": stats["count"],
+                "total_seconds": round(stats["total_seconds"], 6),
+            }
+            for stage, stats in summary.items()
+        },
+    )
+
+
+def build_report(results: list[ScenarioResult]) -> dict[str, Any]:
+    """Wrap scenario results with the environment they were measured in."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": [asdict(result) for result in results],
+    }
@@ -0,0 +1,167 @@
+"""Local HTTP server mimicking the SIRENE cursor-paginated API.
+
+``SireneApiStandIn`` serves ``/entreprises/sirene/V3.11/siren`` from a
+background thread. Every date in the query has ``records_per_day`` legal
+units, paged with ``nombre`` and ``curseur`` exactly as the INSEE API does: the
+header carries ``total``, ``nombre``, ``curseur`` and ``curseurSuivant``, and
+the last page repeats its own cursor. Response latency and bandwidth are
+configurable so the fetcher can be measured against slow upstreams.
+"""
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from urllib.parse import parse_qs, urlparse
+
+SIRENE_PATH = "/entreprises/sirene/V3.11/siren"
+
+_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})T00:00:00")
+_CURSOR_PREFIX = "AoE"
+_WRITE_CHUNK_SIZE = 16 * 1024
+
+
+@dataclass
+class SireneApiStandIn:
+    """Threaded SIRENE API mimic.
+
+    Args:
+        records_per_day: Legal units matching each date.
+        latency_seconds: Delay before each response is sent.
+        bandwidth_bytes_per_second: Response body bandwidth, or None for no
+            limit.
+    """
+
+    records_per_day: int = 1000
+    latency_seconds: float = 0.0
+    bandwidth_bytes_per_second: float | None = None
+    requests_served: int = 0
+    _server: ThreadingHTTPServer | None = field(default=None, repr=False)
+    _thread: threading.Thread | None = field(default=None, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def base_url(self) -> str:
+        """URL of the SIRENE ``siren`` endpoint."""
+        if self._server is None:
+            raise RuntimeError("Server is not started")  # noqa: TRY003
+        host, port = self._server.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}{SIRENE_PATH}"
+
+    def start(self) -> "SireneApiStandIn":
+        """Start serving on an ephemeral localhost port."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                stand_in._handle(self)  # noqa: SLF001
+
+            def log_message(self, *_args: object) -> None:
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="sirene-stand-in", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SireneApiStandIn":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def page(self, date_str: str, cursor: str, page_size: int) -> dict[str, object]:
+        """Build the response body for one page."""
+        offset = int(cursor[len(_CURSOR_PREFIX) :]) if cursor != "*" else 0
+        count = max(0, min(page_size, self.records_per_day - offset))
+        end = offset + count
+        next_cursor = f"{_CURSOR_PREFIX}{end}" if end < self.records_per_day else cursor
+        day_number = int(date_str.replace("-", "")) % 1000
+        return {
+            "header": {
+                "statut": 200,
+                "message": "OK",
+                "total": self.records_per_day,
+                "debut": offset,
+                "nombre": count,
+                "curseur": cursor,
+                "curseurSuivant": next_cursor,
+            },
+            "unitesLegales": [
+                {
+                    "siren": f"{day_number:03d}{index:06d}",
+                    "statutDiffusionUniteLegale": "O",
+                    "dateCreationUniteLegale": "2001-01-01",
+                    "dateDernierTraitementUniteLegale": f"{date_str}T08:00:00",
+                    "periodesUniteLegale": [
+                        {
+                            "dateDebut": "2001-01-01",
+                            "etatAdministratifUniteLegale": "A",
+                            "denominationUniteLegale": f"SOCIETE {index}",
+                            "categorieJuridiqueUniteLegale": "5710",
+                            "activitePrincipaleUniteLegale": "62.01Z",
+                        }
+                    ],
+                }
+                for index in range(offset, end)
+            ],
+        }
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        parsed = urlparse(handler.path)
+        params = parse_qs(parsed.query)
+        match = _DATE_PATTERN.search(params.get("q", [""])[0])
+        if parsed.path != SIRENE_PATH or match is None:
+            self._send(
+                handler, 400, {"header": {"statut": 400, "message": "Bad query"}}
+            )
+            return
+
+        body = self.page(
+            match.group(1),
+            params.get("curseur", ["*"])[0],
+            int(params.get("nombre", ["20"])[0]),
+        )
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        self._send(handler, 200, body)
+        with self._lock:
+            self.requests_served += 1
+
+    def _send(
+        self, handler: BaseHTTPRequestHandler, status: int, body: dict[str, object]
+    ) -> None:
+        payload = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json;charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        for start in range(0, len(payload), _WRITE_CHUNK_SIZE):
+            chunk = payload[start : start + _WRITE_CHUNK_SIZE]
+            handler.wfile.write(chunk)
+            if self.bandwidth_bytes_per_second:
+                time.sleep(len(chunk) / self.bandwidth_bytes_per_second)
@@ -46,6 +46,7 @@ class ConfigKwargs(TypedDict, total=False):
     redis_port: int
     redis_db: int
     redis_password: str
+    redis_binary: bool
     # Storage kwargs
     s3_bucket: str
     s3_prefix: str
@@ -176,6 +177,10 @@ class RunConfig:
         default=None,
         help="Redis key prefix for KV store (when using redis)",
     )
+    kvstore_redis_binary: bool = environ.bool_var(
+        default=False,
+        help="Use a binary-safe Redis connection for KV store (when using redis)",
+    )
 
     # Storage configuration
     storage_pipeline_aws_profile: str | None = environ.var(
@@ -220,6 +225,61 @@ class RunConfig:
         help="Local directory containing YAML configuration files (overrides S3 config loading)",
     )
 
+    # Fetch plan overrides (defaults come from the YAML fetcher configuration)
+    concurrency: int | None = environ.var(
+        default=None,
+        help="Number of concurrent workers (overrides YAML concurrency)",
+    )
+    target_queue_size: int | None = environ.var(
+        default=None,
+        help="Target bundle queue size (overrides YAML target_queue_size)",
+    )
+    auto_concurrency: bool = environ.bool_var(
+        default=False,
+        help="Size workers from the loader connection pool (pool_max_size)",
+    )
+    processes: int | None = environ.var(
+        default=None,
+        help="Number of worker processes loading bundles (1 runs in-process)",
+    )
+    distributed: bool = environ.bool_var(
+        default=False,
+        help="Share the work queue with other replicas through the Redis KV store",
+    )
+    distributed_run_id: str | None = environ.var(
+        default=None,
+        help="Identifier shared by every replica of a distributed run "
+        "(defaults to the data registry ID)",
+    )
+    lease_ttl_seconds: int | None = environ.var(
+        default=None,
+        help="Seconds a claimed bundle survives without a heartbeat before redelivery",
+    )
+    metrics_port: int | None = environ.var(
+        default=None,
+        help="Serve /metrics and health endpoints on this port during the run",
+    )
+    metrics_host: str = environ.var(
+        default="127.0.0.1", help="Host the run-time metrics server binds to"
+    )
+    trace_export_path: str | None = environ.var(
+        default=None,
+        help="Write per-bundle tracing spans to this file as OTLP/JSON lines",
+    )
+    profile: bool = environ.bool_var(
+        default=False,
+        help="Profile the run: event-loop lag, blocking calls, RSS and CPU",
+    )
+    profile_block_threshold_ms: int | None = environ.var(
+        default=None,
+        help="Report event-loop stalls longer than this many milliseconds "
+        "(default 100)",
+    )
+    profile_output_dir: str | None = environ.var(
+        default=None,
+        help="Write the profile report and sampled event-loop stacks to this directory",
+    )
+
 
 @environ.config(prefix="DATA_FETCHER_APP")
 class HealthConfig:
@@ -5,12 +5,17 @@ monitoring functionality.
 """
 
 import json
+import threading
 import time
 from collections.abc import Callable, Iterable
-from typing import Any, Protocol
+from typing import Any, Protocol, cast
+from wsgiref.simple_server import WSGIServer, make_server
 
 import structlog
 from openc_python_common.observability import log_bind, observe_around
+from prometheus_client import CollectorRegistry
+
+from data_fetcher_core.metrics import get_metrics_registry, render_metrics
 
 logger = structlog.get_logger(__name__)
 
@@ -103,13 +108,20 @@ class HealthCheck:
 class SimpleWSGIRouter:
     """Simple prefix-based WSGI router for health check endpoints."""
 
-    def __init__(self, health_check: HealthCheck) -> None:
+    def __init__(
+        self,
+        health_check: HealthCheck,
+        metrics_registry: CollectorRegistry | None = None,
+    ) -> None:
         """Initialize the router.
 
         Args:
             health_check: HealthCheck instance to use for endpoints.
+            metrics_registry: Registry served on /metrics. Defaults to the
+                process-wide registry.
         """
         self.health_check = health_check
+        self.metrics_registry = metrics_registry or get_metrics_registry()
         self.routes = {
             "/health": self._health_endpoint,
             "/health/": self._health_endpoint,
@@ -117,6 +129,8 @@ class SimpleWSGIRouter:
             "/status/": self._status_endpoint,
             "/heartbeat": self._heartbeat_endpoint,
             "/heartbeat/": self._heartbeat_endpoint,
+            "/metrics": self._metrics_endpoint,
+            "/metrics/": self._metrics_endpoint,
         }
 
     def __call__(
@@ -205,6 +219,25 @@ class SimpleWSGIRouter:
             start_response(status_code, [("Content-Type", "text/plain")])
             return [b"OK" if healthy else b"FAIL"]
 
+    def _metrics_endpoint(
+        self, _environ: dict[str, Any], start_response: StartResponse
+    ) -> list[bytes]:
+        """Metrics endpoint - returns metrics in the Prometheus text format.
+
+        Args:
+            environ: WSGI environment dictionary.
+            start_response: WSGI start_response callable.
+
+        Returns:
+            Response body as list of bytes.
+        """
+        body = render_metrics(self.metrics_registry).encode("utf-8")
+        start_response(
+            "200 OK",
+            [("Content-Type", "text/plain; version=0.0.4; charset=utf-8")],
+        )
+        return [body]
+
 
 def create_health_app(app_name: str = "data-fetcher-app") -> SimpleWSGIRouter:
     """Create a WSGI application with health check endpoints.
@@ -225,3 +258,28 @@ def create_health_app(app_name: str = "data-fetcher-app") -> SimpleWSGIRouter:
     health_check.add_check("basic", always_healthy)
 
     return SimpleWSGIRouter(health_check)
+
+
+def start_health_server_thread(
+    app: SimpleWSGIRouter, host: str, port: int
+) -> WSGIServer:
+    """Serve the health app from a daemon thread.
+
+    Used during fetch runs so /metrics can be scraped while the event loop is
+    busy. Call ``shutdown()`` on the returned server to stop it.
+
+    Args:
+        app: The health WSGI application.
+        host: Host to bind to.
+        port: Port to bind to.
+
+    Returns:
+        The running server.
+    """
+    server = make_server(host, port, cast("Any", app))
+    thread = threading.Thread(
+        target=server.serve_forever, name="health-server", daemon=True
+    )
+    thread.start()
+    logger.info("HEALTH_SERVER_THREAD_STARTED", host=host, port=port)
+    return server
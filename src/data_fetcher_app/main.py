@@ -6,6 +6,7 @@ argument parsing, configuration loading, and execution orchestration.
 # ruff: noqa: T201
 
 import asyncio
+import contextlib
 import os
 import sys
 from datetime import UTC, datetime
@@ -28,16 +29,22 @@ from data_fetcher_app.app_config import (
     create_health_config,
     create_run_config,
 )
-from data_fetcher_app.health import create_health_app
+from data_fetcher_app.health import create_health_app, start_health_server_thread
+from data_fetcher_app.profiler import create_run_profiler
 from data_fetcher_core.core import DataRegistryFetcherConfig, FetchPlan, FetchRunContext
+from data_fetcher_core.exceptions import ConfigurationError
 from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.kv_store import RedisKeyValueStore
 from data_fetcher_core.logging import (
     ConsoleMode,
     LoggingHandler,
     LoggingLevel,
     configure_logging,
 )
+from data_fetcher_core.multiprocess import MultiProcessFetcher
+from data_fetcher_core.queue import BundleRefSerializer, RedisLeasedQueue
 from data_fetcher_core.strategy_registration import create_strategy_registry
+from data_fetcher_core.tracing import configure_tracer
 from data_fetcher_http.http_manager import HttpManager
 from data_fetcher_sftp.sftp_manager import SftpManager
 
@@ -169,6 +176,7 @@ def run_command(args: list[str] | None = None) -> None:
             "kvstore_redis_db": "redis_db",
             "kvstore_redis_password": "redis_password",
             "kvstore_redis_key_prefix": "redis_key_prefix",
+            "kvstore_redis_binary": "redis_binary",
             # storage
             "storage_s3_bucket": "s3_bucket",
             "storage_s3_prefix": "s3_prefix",
@@ -195,6 +203,33 @@ def run_command(args: list[str] | None = None) -> None:
             "data_registry_id": data_registry_id,
             "stage": config.stage,
             "step": config.step,
+            "concurrency": int(config.concurrency)
+            if config.concurrency is not None
+            else None,
+            "target_queue_size": int(config.target_queue_size)
+            if config.target_queue_size is not None
+            else None,
+            "auto_concurrency": bool(config.auto_concurrency),
+            "processes": int(config.processes)
+            if config.processes is not None
+            else None,
+            "log_level": config.log_level,
+            "dev_mode": bool(config.dev_mode),
+            "distributed": bool(config.distributed),
+            "distributed_run_id": config.distributed_run_id,
+            "lease_ttl_seconds": int(config.lease_ttl_seconds)
+            if config.lease_ttl_seconds is not None
+            else None,
+            "metrics_port": int(config.metrics_port)
+            if config.metrics_port is not None
+            else None,
+            "metrics_host": config.metrics_host,
+            "trace_export_path": config.trace_export_path,
+            "profile": bool(config.profile),
+            "profile_block_threshold_ms": int(config.profile_block_threshold_ms)
+            if config.profile_block_threshold_ms is not None
+            else None,
+            "profile_output_dir": config.profile_output_dir,
         }
 
         # Run the async main function with robust error handling
@@ -253,7 +288,7 @@ def health_command(args: list[str] | None = None) -> None:
                 "HEALTH_CHECK_SERVER_STARTED",
                 host=config.host,
                 port=config.port,
-                endpoints=["/health", "/status", "/heartbeat"],
+                endpoints=["/health", "/status", "/heartbeat", "/metrics"],
             )
             httpd.serve_forever()
 
@@ -288,6 +323,19 @@ Options for run command:
     --kvstore <type>              Key-value store type (redis, memory)
     --log-level <level>           Log level (DEBUG, INFO, WARNING, ERROR)
     --dev-mode                    Enable development mode
+    --concurrency <n>             Concurrent workers (overrides YAML concurrency)
+    --target-queue-size <n>       Target bundle queue size (overrides YAML)
+    --auto-concurrency            Size workers from the loader connection pool
+    --processes <n>               Load bundles in n worker processes
+    --distributed                 Share the work queue with other replicas via Redis
+    --distributed-run-id <id>     Run identifier shared by all replicas
+    --lease-ttl-seconds <n>       Lease TTL before a claimed bundle is redelivered
+    --metrics-port <port>         Serve /metrics (Prometheus) during the run
+    --metrics-host <host>         Host for the metrics server (default 127.0.0.1)
+    --trace-export-path <file>    Write tracing spans to a file as OTLP/JSON lines
+    --profile                     Profile event-loop lag, blocking calls, RSS and CPU
+    --profile-block-threshold-ms <n>  Report event-loop stalls longer than n ms
+    --profile-output-dir <dir>    Write the profile report and sampled stacks here
 
 Examples:
     # Using environment variables (recommended)
@@ -331,6 +379,145 @@ def main() -> None:
     sys.exit(0)
 
 
+async def create_app_config(args: dict[str, Any]) -> FetcherConfig:
+    """Create the fetcher app configuration from run arguments."""
+    with observe_around(logger, "CREATE_FETCHER_APP_CONFIG"):
+        return await create_fetcher_app_config(
+            data_registry_id=args["config_name"],
+            credentials_provider_type=args["credentials_provider"],
+            storage_type=args["storage"],
+            kv_store_type=args["kvstore"],
+            **cast("dict[str, Any]", args.get("factory_kwargs", {})),
+        )
+
+
+async def build_fetch_plan(
+    args: dict[str, Any], app_config: FetcherConfig | None = None
+) -> FetchPlan:
+    """Load the YAML fetcher configuration and build the fetch plan.
+
+    This is also used by worker processes in multi-process mode, so it must
+    only depend on the picklable ``args`` dictionary.
+
+    Args:
+        args: Run arguments assembled by ``run_command``.
+        app_config: App configuration; created from ``args`` when omitted.
+
+    Returns:
+        The fetch plan for this run.
+    """
+    data_registry_id = args["config_name"]
+    run_id = args["run_id"]
+
+    if app_config is None:
+        app_config = await create_app_config(args)
+
+    with observe_around(logger, "INITIALIZE_FETCHER"):
+        logger.info("FETCHER_INITIALIZING", data_registry_id=data_registry_id)
+
+        # Use YAML configuration (configuration system)
+        config_dir = args.get("config_dir")
+        stage = args.get("stage", "raw")
+        step = args.get("step")
+
+        logger.info(
+            "USING_YAML_CONFIG",
+            data_registry_id=data_registry_id,
+            config_dir=config_dir,
+            stage=stage,
+            step=step,
+        )
+
+        # Load YAML fetcher configuration directly via DataPipelineConfig
+        sftp_manager = SftpManager()
+        http_manager = HttpManager()
+        strategy_registry = create_strategy_registry(
+            sftp_manager=sftp_manager, http_manager=http_manager
+        )
+        pipeline_config = DataPipelineConfig(
+            strategy_registry=strategy_registry,
+            local_config_dir=config_dir,
+        )
+
+        yaml_config = pipeline_config.load_config(
+            DataRegistryFetcherConfig,
+            data_registry_id=data_registry_id,
+            step=step,
+        )
+
+        # Create the fetch plan from YAML settings and CLI/env overrides
+        plan = FetchPlan.from_config(
+            yaml_config,
+            FetchRunContext(run_id=run_id, app_config=app_config),
+            concurrency=args.get("concurrency"),
+            target_queue_size=args.get("target_queue_size"),
+            auto_concurrency=bool(args.get("auto_concurrency", False)),
+        )
+        logger.info(
+            "FETCH_PLAN_CREATED",
+            concurrency=plan.concurrency,
+            target_queue_size=plan.target_queue_size,
+            auto_concurrency=bool(args.get("auto_concurrency", False)),
+        )
+    return plan
+
+
+async def build_worker_fetch_plan(args: dict[str, Any]) -> FetchPlan:
+    """Build the fetch plan inside a worker process of multi-process mode.
+
+    Spawned processes do not inherit logging configuration, so it is applied
+    again before delegating to ``build_fetch_plan``.
+    """
+    configure_logging(
+        logging_level=LoggingLevel(str(args.get("log_level", "INFO")).upper()),
+        package_log_levels={},
+        logging_handler=LoggingHandler.TEXT,
+        console_mode=ConsoleMode.FORCE if args.get("dev_mode") else ConsoleMode.AUTO,
+    )
+    with log_bind(run_id=args["run_id"], data_registry_id=args["config_name"]):
+        return await build_fetch_plan(args)
+
+
+async def create_distributed_queue(
+    args: dict[str, Any], app_config: FetcherConfig
+) -> RedisLeasedQueue:
+    """Create the leased work queue shared by every replica of a distributed run."""
+    kv_store = app_config.kv_store
+    if not isinstance(kv_store, RedisKeyValueStore):
+        error_message = "Distributed mode requires the redis kvstore"
+        raise ConfigurationError(error_message, "kvstore")
+
+    run_key = args.get("distributed_run_id") or args["config_name"]
+    lease_ttl = args.get("lease_ttl_seconds")
+    return RedisLeasedQueue(
+        client=await kv_store.get_client(),
+        namespace=f"{kv_store.key_prefix}fetcher:{args['config_name']}:{run_key}",
+        serializer=BundleRefSerializer(),
+        lease_ttl_seconds=float(lease_ttl) if lease_ttl is not None else 60.0,
+    )
+
+
+async def create_fetcher(
+    args: dict[str, Any], app_config: FetcherConfig | None = None
+) -> Fetcher:
+    """Create a single-process, multi-process or distributed fetcher."""
+    processes = args.get("processes")
+    if processes is not None and int(processes) > 1:
+        if args.get("distributed"):
+            error_message = "--processes and --distributed cannot be combined"
+            raise ConfigurationError(error_message, "processes")
+        return MultiProcessFetcher(
+            processes=int(processes),
+            plan_builder=build_worker_fetch_plan,
+            builder_args=args,
+        )
+    if args.get("distributed"):
+        if app_config is None:
+            app_config = await create_app_config(args)
+        return Fetcher(work_queue=await create_distributed_queue(args, app_config))
+    return Fetcher()
+
+
 async def main_async(args: dict[str, Any]) -> None:
     """Main entry point for the fetcher application."""
     # Get config_name and run_id from arguments
@@ -348,61 +535,29 @@ async def main_async(args: dict[str, Any]) -> None:
         )
 
         # Create fetcher configuration with CLI arguments
-        with observe_around(logger, "CREATE_FETCHER_APP_CONFIG"):
-            app_config = await create_fetcher_app_config(
-                data_registry_id=data_registry_id,
-                credentials_provider_type=args["credentials_provider"],
-                storage_type=args["storage"],
-                kv_store_type=args["kvstore"],
-                **cast("dict[str, Any]", args.get("factory_kwargs", {})),
+        app_config = await create_app_config(args)
+
+        # Spans are only written out when an export path is set
+        tracer = configure_tracer(export_path=args.get("trace_export_path"))
+
+        # Expose /metrics while the run is in progress
+        metrics_server = None
+        if args.get("metrics_port") is not None:
+            metrics_server = start_health_server_thread(
+                create_health_app(),
+                str(args.get("metrics_host") or "127.0.0.1"),
+                int(args["metrics_port"]),
             )
 
         try:
-            plan = None
-            with observe_around(logger, "INITIALIZE_FETCHER"):
-                logger.info("FETCHER_INITIALIZING", data_registry_id=data_registry_id)
-
-                # Use YAML configuration (configuration system)
-                config_dir = args.get("config_dir")
-                stage = args.get("stage", "raw")
-                step = args.get("step")
-
-                logger.info(
-                    "USING_YAML_CONFIG",
-                    data_registry_id=data_registry_id,
-                    config_dir=config_dir,
-                    stage=stage,
-                    step=step,
-                )
-
-                # Load YAML fetcher configuration directly via DataPipelineConfig
-                sftp_manager = SftpManager()
-                http_manager = HttpManager()
-                strategy_registry = create_strategy_registry(
-                    sftp_manager=sftp_manager, http_manager=http_manager
-                )
-                pipeline_config = DataPipelineConfig(
-                    strategy_registry=strategy_registry,
-                    local_config_dir=config_dir,
-                )
-
-                yaml_config = pipeline_config.load_config(
-                    DataRegistryFetcherConfig,
-                    data_registry_id=data_registry_id,
-                    step=step,
-                )
-
-                fetcher = Fetcher()
-
-                # Create a basic fetch plan with run_id in context
-                plan = FetchPlan(
-                    config=yaml_config,
-                    context=FetchRunContext(run_id=run_id, app_config=app_config),
-                )
+            plan = await build_fetch_plan(args, app_config)
+            fetcher = await create_fetcher(args, app_config)
 
-            # Run the fetcher
+            # Run the fetcher, profiled when --profile is set
+            profiler = create_run_profiler(args)
             with observe_around(logger, "FETCH_OPERATION"):
-                result = await fetcher.run(plan)
+                async with profiler or contextlib.nullcontext():
+                    result = await fetcher.run(plan)
                 logger.info(
                     "FETCH_OPERATION_COMPLETED",
                     data_registry_id=data_registry_id,
@@ -422,6 +577,11 @@ async def main_async(args: dict[str, Any]) -> None:
                 error=str(e),
             )
             sys.exit(502)
+        finally:
+            if metrics_server is not None:
+                metrics_server.shutdown()
+                metrics_server.server_close()
+            tracer.shutdown()
 
 
 if __name__ == "__main__":
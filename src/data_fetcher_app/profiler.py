@@ -0,0 +1,419 @@
+"""Opt-in run-level resource profiler.
+
+``RunProfiler`` watches a fetch run while it is in progress:
+
+* a probe task on the event loop measures how late its timer wakes up
+  (event-loop lag);
+* a watchdog thread notices when the probe has not run for longer than the
+  blocking threshold and captures the stack of the event-loop thread, so the
+  coroutine that blocked the loop can be identified;
+* the same thread samples RSS and CPU usage every interval and, when an output
+  directory is configured, samples the event-loop thread's stack into a
+  folded-stack profile (the format read by flamegraph.pl and speedscope).
+
+When the run finishes the profiler logs a ``RUN_PROFILE_SUMMARY`` event and
+optionally writes the full report and the sampled stacks to the output
+directory.
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import os
+import resource
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import FrameType, TracebackType
+from typing import Any
+
+import structlog
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Resource samples kept for the report (one hour at the default interval)
+MAX_RESOURCE_SAMPLES = 3600
+
+# Lag probes kept for percentiles (about an hour at the default probe interval)
+MAX_LAG_SAMPLES = 72_000
+
+# Longest blocking events kept (with stacks) for the report
+MAX_BLOCKING_EVENTS = 20
+
+# Frames kept from the top of a captured stack
+MAX_STACK_DEPTH = 40
+
+
+@dataclass
+class BlockingEvent:
+    """A period during which a callback blocked the event loop."""
+
+    started_at: float
+    duration_seconds: float
+    stack: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ResourceSample:
+    """Process resource usage over one sampling interval."""
+
+    elapsed_seconds: float
+    rss_bytes: int
+    cpu_percent: float
+
+
+@dataclass
+class ProfileReport:
+    """What the profiler observed during a run."""
+
+    duration_seconds: float
+    loop_lag: dict[str, float]
+    blocking: dict[str, Any]
+    cpu: dict[str, float]
+    rss: dict[str, int]
+    stack_samples: int
+    resource_samples: list[ResourceSample] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process.
+
+    Reads ``/proc/self/statm`` where available and falls back to the peak RSS
+    reported by ``getrusage`` elsewhere.
+    """
+    try:
+        with Path("/proc/self/statm").open() as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _folded_stack(frame: FrameType | None) -> str:
+    names: list[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{Path(code.co_filename).name}:{code.co_qualname}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class RunProfiler:
+    """Samples event-loop lag, blocking calls, RSS and CPU during a run.
+
+    Use it as an async context manager around the run; the report is logged
+    (and written when ``output_dir`` is set) on exit.
+
+    Args:
+        block_threshold_seconds: Loop stalls at least this long are reported
+            as blocking events with the stack of the blocking code.
+        interval_seconds: Interval between RSS/CPU samples.
+        probe_interval_seconds: Interval of the event-loop lag probe.
+        stack_sample_interval_seconds: Interval between event-loop stack
+            samples for the folded-stack profile.
+        output_dir: Directory the report and sampled stacks are written to.
+            Stack sampling is only enabled when it is set.
+        run_id: Prefix of the files written to ``output_dir``.
+    """
+
+    def __init__(
+        self,
+        *,
+        block_threshold_seconds: float = 0.1,
+        interval_seconds: float = 1.0,
+        probe_interval_seconds: float = 0.05,
+        stack_sample_interval_seconds: float = 0.01,
+        output_dir: str | None = None,
+        run_id: str = "run",
+    ) -> None:
+        """Initialize the profiler."""
+        self.block_threshold_seconds = block_threshold_seconds
+        self.interval_seconds = interval_seconds
+        self.probe_interval_seconds = probe_interval_seconds
+        self.stack_sample_interval_seconds = stack_sample_interval_seconds
+        self.output_dir = output_dir
+        self.run_id = run_id
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._probe_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._loop_thread_id: int | None = None
+
+        self._started_monotonic = 0.0
+        self._heartbeat = 0.0
+        self._captured_heartbeat: float | None = None
+        self._captured_stack: list[str] = []
+
+        self._lags: deque[float] = deque(maxlen=MAX_LAG_SAMPLES)
+        self._lag_count = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._blocking_count = 0
+        self._blocking_seconds = 0.0
+        self._blocking_events: list[BlockingEvent] = []
+        self._resource_samples: deque[ResourceSample] = deque(
+            maxlen=MAX_RESOURCE_SAMPLES
+        )
+        self._rss_start = 0
+        self._rss_max = 0
+        self._cpu_start = 0.0
+        self._stack_counts: Counter[str] = Counter()
+
+    @property
+    def sample_stacks(self) -> bool:
+        """Whether event-loop stacks are sampled into a profile."""
+        return self.output_dir is not None
+
+    def start(self) -> None:
+        """Start profiling; must be called from the running event loop."""
+        asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started_monotonic = time.monotonic()
+        self._heartbeat = self._started_monotonic
+        self._rss_start = self._rss_max = current_rss_bytes()
+        self._cpu_start = _cpu_seconds()
+        self._stopped.clear()
+
+        self._probe_task = asyncio.create_task(self._probe_loop())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="run-profiler", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "RUN_PROFILER_STARTED",
+            block_threshold_seconds=self.block_threshold_seconds,
+            sample_stacks=self.sample_stacks,
+        )
+
+    async def stop(self) -> ProfileReport:
+        """Stop profiling and build the report."""
+        self._stopped.set()
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        return self.report()
+
+    async def __aenter__(self) -> "RunProfiler":
+        """Start profiling."""
+        self.start()
+        # Let the probe arm its first timer before the profiled code runs
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop profiling, log the summary and write the output files."""
+        report = await self.stop()
+        self.log_report(report)
+        if self.output_dir is not None:
+            self.write(report, self.output_dir)
+
+    async def _probe_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            beat = time.monotonic()
+            self._heartbeat = beat
+            expected = loop.time() + self.probe_interval_seconds
+            await asyncio.sleep(self.probe_interval_seconds)
+            lag = max(0.0, loop.time() - expected)
+            self._lags.append(lag)
+            self._lag_count += 1
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+            if lag >= self.block_threshold_seconds:
+                self._record_blocking(beat, lag)
+
+    def _record_blocking(self, beat: float, lag: float) -> None:
+        with self._lock:
+            stack = self._captured_stack if self._captured_heartbeat == beat else []
+        started_at = time.time() - (time.monotonic() - beat)
+        self._blocking_count += 1
+        self._blocking_seconds += lag
+        self._blocking_events.append(
+            BlockingEvent(
+                started_at=started_at,
+                duration_seconds=round(lag, 6),
+                stack=stack,
+            )
+        )
+        self._blocking_events.sort(key=lambda event: -event.duration_seconds)
+        del self._blocking_events[MAX_BLOCKING_EVENTS:]
+        logger.warning(
+            "EVENT_LOOP_BLOCKED",
+            duration_seconds=round(lag, 6),
+            blocking_frame=stack[-1].strip() if stack else None,
+        )
+
+    def _loop_frame(self) -> FrameType | None:
+        if self._loop_thread_id is None:
+            return None
+        return sys._current_frames().get(self._loop_thread_id)  # noqa: SLF001
+
+    def _watch(self) -> None:
+        tick = min(
+            self.block_threshold_seconds / 4,
+            self.stack_sample_interval_seconds
+            if self.sample_stacks
+            else self.block_threshold_seconds,
+        )
+        last_sample = time.monotonic()
+        last_cpu = self._cpu_start
+        while not self._stopped.wait(tick):
+            now = time.monotonic()
+            beat = self._heartbeat
+            stalled = now - beat - self.probe_interval_seconds
+            if stalled >= self.block_threshold_seconds:
+                with self._lock:
+                    if self._captured_heartbeat != beat:
+                        frame = self._loop_frame()
+                        self._captured_heartbeat = beat
+                        self._captured_stack = (
+                            traceback.format_stack(frame)[-MAX_STACK_DEPTH:]
+                            if frame is not None
+                            else []
+                        )
+            if self.sample_stacks:
+                self._stack_counts[_folded_stack(self._loop_frame())] += 1
+            if now - last_sample >= self.interval_seconds:
+                cpu = _cpu_seconds()
+                self._add_resource_sample(now, (cpu - last_cpu) / (now - last_sample))
+                last_sample, last_cpu = now, cpu
+
+    def _add_resource_sample(self, now: float, cpu_fraction: float) -> None:
+        rss = current_rss_bytes()
+        self._rss_max = max(self._rss_max, rss)
+        self._resource_samples.append(
+            ResourceSample(
+                elapsed_seconds=round(now - self._started_monotonic, 3),
+                rss_bytes=rss,
+                cpu_percent=round(cpu_fraction * 100, 1),
+            )
+        )
+
+    def report(self) -> ProfileReport:
+        """Build the report from what has been observed so far."""
+        duration = time.monotonic() - self._started_monotonic
+        rss_end = current_rss_bytes()
+        cpu_seconds = _cpu_seconds() - self._cpu_start
+        cpu_samples = [sample.cpu_percent for sample in self._resource_samples]
+        lags = list(self._lags)
+        lag_count = self._lag_count
+        return ProfileReport(
+            duration_seconds=round(duration, 6),
+            loop_lag={
+                "samples": lag_count,
+                "mean_seconds": round(self._lag_total / lag_count, 6)
+                if lag_count
+                else 0.0,
+                "p50_seconds": round(_percentile(lags, 50), 6),
+                "p99_seconds": round(_percentile(lags, 99), 6),
+                "max_seconds": round(self._lag_max, 6),
+            },
+            blocking={
+                "threshold_seconds": self.block_threshold_seconds,
+                "count": self._blocking_count,
+                "total_seconds": round(self._blocking_seconds, 6),
+                "events": [asdict(event) for event in self._blocking_events],
+            },
+            cpu={
+                "cpu_seconds": round(cpu_seconds, 3),
+                "mean_percent": round(cpu_seconds / duration * 100, 1)
+                if duration
+                else 0.0,
+                "max_percent": max(cpu_samples, default=0.0),
+            },
+            rss={
+                "start_bytes": self._rss_start,
+                "end_bytes": rss_end,
+                "max_bytes": max(self._rss_max, rss_end),
+            },
+            stack_samples=sum(self._stack_counts.values()),
+            resource_samples=list(self._resource_samples),
+        )
+
+    def log_report(self, report: ProfileReport) -> None:
+        """Log the report summary."""
+        logger.info(
+            "RUN_PROFILE_SUMMARY",
+            duration_seconds=report.duration_seconds,
+            loop_lag_p99_seconds=report.loop_lag["p99_seconds"],
+            loop_lag_max_seconds=report.loop_lag["max_seconds"],
+            blocking_count=report.blocking["count"],
+            blocking_total_seconds=report.blocking["total_seconds"],
+            cpu_mean_percent=report.cpu["mean_percent"],
+            cpu_max_percent=report.cpu["max_percent"],
+            rss_max_bytes=report.rss["max_bytes"],
+        )
+
+    def write(self, report: ProfileReport, output_dir: str) -> list[Path]:
+        """Write the report and the sampled stacks to ``output_dir``.
+
+        Returns:
+            The paths of the files written.
+        """
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        report_path = directory / f"{self.run_id}.profile.json"
+        report_path.write_text(json.dumps(report.to_dict(), indent=2))
+        written = [report_path]
+        if self._stack_counts:
+            stacks_path = directory / f"{self.run_id}.stacks.folded"
+            stacks_path.write_text(
+                "".join(
+                    f"{stack} {count}\n"
+                    for stack, count in self._stack_counts.most_common()
+                    if stack
+                )
+            )
+            written.append(stacks_path)
+        logger.info("RUN_PROFILE_WRITTEN", paths=[str(path) for path in written])
+        return written
+
+
+def create_run_profiler(args: dict[str, Any]) -> RunProfiler | None:
+    """Create a RunProfiler from CLI arguments, or None when not enabled."""
+    if not args.get("profile"):
+        return None
+    threshold_ms = args.get("profile_block_threshold_ms")
+    return RunProfiler(
+        block_threshold_seconds=float(threshold_ms) / 1000
+        if threshold_ms is not None
+        else 0.1,
+        output_dir=args.get("profile_output_dir"),
+        run_id=str(args.get("run_id") or "run"),
+    )
@@ -0,0 +1,187 @@
+"""Memory-bounded probabilistic "seen" filter.
+
+This module provides a Bloom filter used by locators to deduplicate very large
+crawls (e.g. multi-week SIRENE backfills) without holding every identifier in
+a Python set. Memory is fixed by the configured capacity and false-positive
+rate, and the filter serializes to compact bytes for persistence in a
+key-value store.
+"""
+
+import base64
+import hashlib
+import math
+import struct
+from datetime import timedelta
+from typing import TYPE_CHECKING, NamedTuple
+
+import structlog
+
+if TYPE_CHECKING:
+    from data_fetcher_core.kv_store import KeyValueStore
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+_MAGIC = b"BLM1"
+_HEADER = struct.Struct(">4sQIQQ")
+
+
+class _BloomState(NamedTuple):
+    """Sizing and contents of a serialized filter."""
+
+    num_bits: int
+    num_hashes: int
+    item_count: int
+    bits: bytes
+
+
+class BloomFilter:
+    """Bloom filter over string items.
+
+    Membership tests may return false positives at roughly ``error_rate`` while
+    the filter holds at most ``capacity`` items, but never false negatives. A
+    false positive makes a locator treat an unseen item as already processed,
+    so the error rate should be chosen with that trade-off in mind.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.001,
+        *,
+        state: _BloomState | None = None,
+    ) -> None:
+        """Initialize an empty filter sized for the given capacity.
+
+        Args:
+            capacity: Expected number of items.
+            error_rate: Target false-positive rate at capacity, in (0, 1).
+            state: Restored sizing and contents, used by ``from_bytes``.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")  # noqa: TRY003
+        self.capacity = capacity
+
+        if state is not None:
+            self.num_bits = state.num_bits
+            self.num_hashes = state.num_hashes
+            self.count = state.item_count
+            self._bits = bytearray(state.bits)
+            self._overflow_logged = state.item_count > capacity
+            return
+
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")  # noqa: TRY003
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._overflow_logged = False
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def _positions(self, item: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over a single 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether an item may have been added."""
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of distinct items added (approximate)."""
+        return self.count
+
+    def add(self, item: str) -> bool:
+        """Add an item to the filter.
+
+        Args:
+            item: The item identifier.
+
+        Returns:
+            True if the item was not (probably) present before.
+        """
+        added = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self._bits[pos >> 3] & mask:
+                self._bits[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+            if self.count > self.capacity and not self._overflow_logged:
+                self._overflow_logged = True
+                logger.warning(
+                    "BLOOM_FILTER_CAPACITY_EXCEEDED",
+                    capacity=self.capacity,
+                    count=self.count,
+                )
+        return added
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter to compact bytes."""
+        header = _HEADER.pack(
+            _MAGIC, self.num_bits, self.num_hashes, self.capacity, self.count
+        )
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Restore a filter serialized with ``to_bytes``.
+
+        Args:
+            data: Serialized filter.
+
+        Returns:
+            The restored filter.
+        """
+        magic, num_bits, num_hashes, capacity, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized BloomFilter")  # noqa: TRY003
+        bits = data[_HEADER.size :]
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError("Serialized BloomFilter is truncated")  # noqa: TRY003
+
+        return cls(
+            capacity, state=_BloomState(num_bits, num_hashes, count, bytes(bits))
+        )
+
+    async def save(
+        self, store: "KeyValueStore", key: str, ttl: timedelta | None = None
+    ) -> None:
+        """Persist the filter to a key-value store.
+
+        Args:
+            store: The key-value store to write to.
+            key: Key to store the filter under.
+            ttl: Optional time-to-live.
+        """
+        encoded = base64.b64encode(self.to_bytes()).decode("ascii")
+        await store.put(key, encoded, ttl=ttl)
+
+    @classmethod
+    async def load(cls, store: "KeyValueStore", key: str) -> "BloomFilter | None":
+        """Load a filter previously written with ``save``.
+
+        Args:
+            store: The key-value store to read from.
+            key: Key the filter was stored under.
+
+        Returns:
+            The restored filter, or None if no filter is stored.
+        """
+        encoded = await store.get(key)
+        if not isinstance(encoded, str):
+            return None
+        return cls.from_bytes(base64.b64decode(encoded))
@@ -178,13 +178,56 @@ class DataRegistryFetcherConfig:
     loader: Annotated[LoaderStrategy, strategy]
     locators: list[Annotated[LocatorStrategy, strategy]]
 
-    concurrency: int = 10
+    # Worker count; when unset, FetchPlan.from_config uses 10, or the loader's
+    # pool size with auto concurrency
+    concurrency: int | None = None
     target_queue_size: int = 100
+    # Interleave locators through a weighted-fair queue instead of draining
+    # them one after another
+    fair_queueing: bool = False
+    # Per-locator queue weights and priorities, by position in ``locators``
+    # (setting either enables fair queueing)
+    locator_weights: list[float] | None = None
+    locator_priorities: list[int] | None = None
+    # Cancel a bundle load running longer than this many seconds
+    bundle_deadline_seconds: float | None = None
+    # Cancel a bundle load transferring fewer bytes per second than this,
+    # measured over stall_window_seconds
+    stall_min_bytes_per_second: float | None = None
+    stall_window_seconds: float = 60.0
+    # Times a cancelled bundle is put back on the queue before it fails
+    max_bundle_requeues: int = 2
+    # Once the queue is drained, let idle workers start a duplicate attempt of
+    # a bundle running straggler_slowdown times longer than expected (and for
+    # at least straggler_min_seconds); the first attempt to finish is kept
+    speculative_stragglers: bool = False
+    straggler_slowdown: float = 2.0
+    straggler_min_seconds: float = 10.0
     # Optional fields for backward compatibility with storage hooks
     config_id: str = ""
     # Protocol configurations for resolving relative configs
 
 
+def loader_pool_limit(loader: object) -> int | None:
+    """Return the smallest connection pool size among a loader's protocol configs.
+
+    Args:
+        loader: The loader strategy to inspect.
+
+    Returns:
+        The smallest ``pool_max_size`` found, or None if the loader has no
+        pooled protocol configuration.
+    """
+    limits: list[int] = []
+    for value in getattr(loader, "__dict__", {}).values():
+        if not isinstance(value, ProtocolConfig):
+            continue
+        pool_max_size = getattr(value, "pool_max_size", None)
+        if isinstance(pool_max_size, int):
+            limits.append(pool_max_size)
+    return min(limits) if limits else None
+
+
 @dataclass
 class FetchPlan:
     """Plan for fetching resources."""
@@ -194,6 +237,49 @@ class FetchPlan:
     concurrency: int = 1
     target_queue_size: int = 100
 
+    @classmethod
+    def from_config(
+        cls,
+        config: DataRegistryFetcherConfig,
+        context: FetchRunContext,
+        *,
+        concurrency: int | None = None,
+        target_queue_size: int | None = None,
+        auto_concurrency: bool = False,
+    ) -> FetchPlan:
+        """Create a plan from the fetcher configuration with optional overrides.
+
+        Args:
+            config: The YAML fetcher configuration.
+            context: The run context.
+            concurrency: Worker count overriding ``config.concurrency``.
+            target_queue_size: Queue size overriding ``config.target_queue_size``.
+            auto_concurrency: Size the worker count from the loader's connection
+                pool so workers never outnumber available connections. A
+                concurrency set on the command line or in the YAML config is
+                still honoured as an upper bound.
+
+        Returns:
+            The fetch plan.
+        """
+        requested = concurrency if concurrency is not None else config.concurrency
+        workers = requested if requested is not None else 10
+        if auto_concurrency:
+            pool_limit = loader_pool_limit(config.loader)
+            if pool_limit is not None:
+                workers = (
+                    pool_limit if requested is None else min(requested, pool_limit)
+                )
+
+        return cls(
+            config=config,
+            context=context,
+            concurrency=max(1, workers),
+            target_queue_size=target_queue_size
+            if target_queue_size is not None
+            else config.target_queue_size,
+        )
+
 
 # Lightweight public type aliases retained for backward compatibility with tests
 # RequestMeta/ResourceMeta are dictionaries passed through the queue and loader
@@ -4,31 +4,66 @@ This module provides the AWSSecretsCredentialProvider class for retrieving
 credentials from AWS Secrets Manager, including SFTP and API credentials.
 """
 
+import asyncio
 import json
 import os
+import threading
+import time
+from typing import Any
 
 import boto3
+import structlog
 from botocore.exceptions import ClientError
 
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Seconds a fetched secret is served from the cache before it is fetched again
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
 
 class AWSSecretsCredentialProvider:
-    """Default credential provider that fetches credentials from AWS Secrets Manager."""
+    """Default credential provider that fetches credentials from AWS Secrets Manager.
+
+    Each secret is fetched and parsed once and cached as a whole, so reading
+    ``host``, ``username``, ``password`` and ``port`` costs a single
+    ``get_secret_value`` call. Cached secrets expire after ``cache_ttl_seconds``.
+    Concurrent lookups of a secret that is not cached share one in-flight
+    fetch, so a burst of connections at startup still makes one call per
+    secret. The blocking boto3 call runs in a worker thread through one
+    Secrets Manager client shared by every lookup.
+    """
 
     def __init__(
-        self, region: str | None = None, endpoint_url: str | None = None
+        self,
+        region: str | None = None,
+        endpoint_url: str | None = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
     ) -> None:
         """Initialize the AWS Secrets credential provider.
 
         Args:
             region: AWS region to use for Secrets Manager. Defaults to AWS_REGION env var or eu-west-2.
             endpoint_url: Optional custom endpoint URL for testing or local development.
+            cache_ttl_seconds: Seconds a fetched secret is cached before it is
+                fetched again.
         """
         # Use AWS_REGION environment variable if region is not specified
         if region is None:
             region = os.getenv("AWS_REGION", "eu-west-2")
         self.region = region
         self.endpoint_url = endpoint_url
-        self._secrets_cache: dict[str, str] = {}
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # Parsed secrets and their expiry (monotonic seconds) by secret name
+        self._secrets_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    @staticmethod
+    def secret_name(config_name: str) -> str:
+        """Name of the secret holding the credentials of a configuration."""
+        return f"{config_name}-sftp-credentials"
 
     async def get_credential(self, config_name: str, config_key: str) -> str:
         """Get credential from AWS Secrets Manager.
@@ -36,59 +71,77 @@ class AWSSecretsCredentialProvider:
         The secret name is expected to be in the format: {config_name}-sftp-credentials
         The secret should contain keys like: username, password, host
         """
-        # Create secret name
-        secret_name = f"{config_name}-sftp-credentials"
-
-        # Check cache first
-        cache_key = f"{secret_name}:{config_key}"
-        if cache_key in self._secrets_cache:
-            return self._secrets_cache[cache_key]
-
-        # Create Secrets Manager client, respecting AWS profile overrides
-        profile_name = os.getenv(
-            "OC_CREDENTIAL_PROVIDER_AWS_PROFILE", os.getenv("AWS_PROFILE")
-        )
-        if profile_name:
-            session = boto3.session.Session(profile_name=profile_name)
-        else:
-            session = boto3.session.Session()
-        client_kwargs = {"service_name": "secretsmanager", "region_name": self.region}
-        if self.endpoint_url:
-            client_kwargs["endpoint_url"] = self.endpoint_url
-        client = session.client(**client_kwargs)  # type: ignore[call-overload]
-
-        def _raise_key_not_found() -> None:
-            """Raise error when key is not found in secret."""
+        secret_name = self.secret_name(config_name)
+        secret_data = await self._get_secret(secret_name)
+
+        if config_key not in secret_data:
             raise ValueError(f"Key '{config_key}' not found in secret '{secret_name}'")
 
-        def _raise_invalid_type() -> None:
-            """Raise error when credential value is not a string."""
+        credential_value = secret_data[config_key]
+
+        # Ensure the value is a string
+        if not isinstance(credential_value, str):
             raise TypeError(
                 f"Credential value for key '{config_key}' is not a string: {type(credential_value)}"
             )
 
+        return credential_value
+
+    async def _get_secret(self, secret_name: str) -> dict[str, Any]:
+        """Get a parsed secret from the cache, fetching it once if needed."""
+        cached = self._secrets_cache.get(secret_name)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Single flight: concurrent callers share the fetch already in progress.
+        # The fetch runs as its own task so a cancelled caller does not abort it
+        # for the others.
+        fetch = self._in_flight.get(secret_name)
+        if fetch is None:
+            fetch = asyncio.create_task(self._refresh_secret(secret_name))
+            self._in_flight[secret_name] = fetch
+        return await asyncio.shield(fetch)
+
+    async def _refresh_secret(self, secret_name: str) -> dict[str, Any]:
+        """Fetch a secret in a worker thread and cache it."""
+        try:
+            secret_data = await asyncio.to_thread(self._fetch_secret, secret_name)
+            self._secrets_cache[secret_name] = (
+                time.monotonic() + self.cache_ttl_seconds,
+                secret_data,
+            )
+            return secret_data
+        finally:
+            self._in_flight.pop(secret_name, None)
+
+    def _get_client(self) -> Any:  # noqa: ANN401
+        """Create the shared Secrets Manager client on first use."""
+        with self._client_lock:
+            if self._client is None:
+                # Respect AWS profile overrides
+                profile_name = os.getenv(
+                    "OC_CREDENTIAL_PROVIDER_AWS_PROFILE", os.getenv("AWS_PROFILE")
+                )
+                if profile_name:
+                    session = boto3.session.Session(profile_name=profile_name)
+                else:
+                    session = boto3.session.Session()
+                client_kwargs = {
+                    "service_name": "secretsmanager",
+                    "region_name": self.region,
+                }
+                if self.endpoint_url:
+                    client_kwargs["endpoint_url"] = self.endpoint_url
+                self._client = session.client(**client_kwargs)  # type: ignore[call-overload]
+            return self._client
+
+    def _fetch_secret(self, secret_name: str) -> dict[str, Any]:
+        """Fetch and parse a secret (blocking; runs in a worker thread)."""
         try:
-            # Get secret value
-            response = client.get_secret_value(SecretId=secret_name)
+            response = self._get_client().get_secret_value(SecretId=secret_name)
 
             # Parse secret (assuming JSON format)
             secret_data = json.loads(response["SecretString"])
-
-            # Get the specific key
-            if config_key not in secret_data:
-                _raise_key_not_found()
-
-            credential_value = secret_data[config_key]
-
-            # Ensure the value is a string
-            if not isinstance(credential_value, str):
-                _raise_invalid_type()
-
-            # Cache the result
-            self._secrets_cache[cache_key] = credential_value
-
-            return credential_value  # type: ignore[no-any-return]  # noqa: TRY300
-
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "ResourceNotFoundException":
@@ -103,6 +156,16 @@ class AWSSecretsCredentialProvider:
                 f"Unexpected error accessing secret '{secret_name}': {e}"
             ) from e
 
+        if not isinstance(secret_data, dict):
+            raise ValueError(f"Secret '{secret_name}' is not a JSON object")  # noqa: TRY004
+
+        logger.debug("SECRET_FETCHED", secret_name=secret_name)
+        return secret_data
+
+    def invalidate(self, config_name: str) -> None:
+        """Drop the cached secret of a configuration (e.g. after auth failure)."""
+        self._secrets_cache.pop(self.secret_name(config_name), None)
+
     def clear(self) -> None:
         """Clear the secrets cache."""
         self._secrets_cache.clear()
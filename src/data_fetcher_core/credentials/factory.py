@@ -6,7 +6,7 @@ including AWS Secrets Manager and environment variable providers.
 
 import os
 
-from .aws import AWSSecretsCredentialProvider
+from .aws import DEFAULT_CACHE_TTL_SECONDS, AWSSecretsCredentialProvider
 from .base import CredentialProvider
 from .environment import EnvironmentCredentialProvider
 
@@ -39,6 +39,7 @@ def create_credential_provider(
     aws_region: str | None = None,
     aws_endpoint_url: str | None = None,
     env_prefix: str | None = None,
+    aws_cache_ttl_seconds: float | None = None,
 ) -> CredentialProvider:
     """Create a credential provider instance.
 
@@ -51,6 +52,8 @@ def create_credential_provider(
                          If None, uses OC_CREDENTIAL_PROVIDER_AWS_ENDPOINT_URL env var.
         env_prefix: Environment variable prefix for environment provider.
                    If None, uses OC_CREDENTIAL_PROVIDER_ENV_PREFIX env var or "OC_CREDENTIAL_".
+        aws_cache_ttl_seconds: Seconds AWS secrets are cached.
+                   If None, uses OC_CREDENTIAL_PROVIDER_AWS_CACHE_TTL_SECONDS env var or 300.
 
     Returns:
         Configured credential provider instance.
@@ -67,9 +70,18 @@ def create_credential_provider(
             aws_region = _get_aws_region()
         if aws_endpoint_url is None:
             aws_endpoint_url = os.getenv("OC_CREDENTIAL_PROVIDER_AWS_ENDPOINT_URL")
+        if aws_cache_ttl_seconds is None:
+            aws_cache_ttl_seconds = float(
+                os.getenv(
+                    "OC_CREDENTIAL_PROVIDER_AWS_CACHE_TTL_SECONDS",
+                    str(DEFAULT_CACHE_TTL_SECONDS),
+                )
+            )
 
         return AWSSecretsCredentialProvider(
-            region=aws_region, endpoint_url=aws_endpoint_url
+            region=aws_region,
+            endpoint_url=aws_endpoint_url,
+            cache_ttl_seconds=aws_cache_ttl_seconds,
         )
     if provider_type in {"environment", "env"}:
         # Environment variable provider
@@ -104,6 +104,66 @@ class RetryableError(DataFetcherError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(DataFetcherError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    def __init__(self, message: str, circuit: str, retry_after: float) -> None:
+        """Initialize circuit open error.
+
+        Args:
+            message: Error message describing the rejected call.
+            circuit: Name of the open circuit (e.g. the pool or host).
+            retry_after: Seconds until the circuit lets a probe call through.
+        """
+        super().__init__(message, "CIRCUIT_OPEN")
+        self.circuit = circuit
+        self.retry_after = retry_after
+
+
+class BundleTimeoutError(DataFetcherError):
+    """Raised when a bundle load is cancelled for exceeding its deadline or stalling."""
+
+    def __init__(self, message: str, bid: str, reason: str) -> None:
+        """Initialize bundle timeout error.
+
+        Args:
+            message: Error message describing the cancelled load.
+            bid: Bundle id of the cancelled load.
+            reason: Why the load was cancelled (``"deadline"`` or ``"stalled"``).
+        """
+        super().__init__(message, "BUNDLE_TIMEOUT")
+        self.bid = bid
+        self.reason = reason
+
+
+class BundleSupersededError(DataFetcherError):
+    """Raised when another attempt at the same bundle has already committed it."""
+
+    def __init__(self, message: str, bid: str) -> None:
+        """Initialize bundle superseded error.
+
+        Args:
+            message: Error message describing the rejected commit.
+            bid: Bundle id of the duplicated bundle.
+        """
+        super().__init__(message, "BUNDLE_SUPERSEDED")
+        self.bid = bid
+
+
+class LeadershipLostError(DataFetcherError):
+    """Raised when a replica publishes work after losing the locator leadership."""
+
+    def __init__(self, message: str, consumer_id: str) -> None:
+        """Initialize leadership lost error.
+
+        Args:
+            message: Error message describing the rejected publish.
+            consumer_id: Identifier of the replica that lost the leadership.
+        """
+        super().__init__(message, "LEADERSHIP_LOST")
+        self.consumer_id = consumer_id
+
+
 class FatalError(DataFetcherError):
     """Raised when an operation fails and cannot be retried."""
 
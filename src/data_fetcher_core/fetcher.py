@@ -5,7 +5,10 @@ components that orchestrate the data fetching process across different protocols
 """
 
 import asyncio
+import math
+import time
 from dataclasses import dataclass
+from typing import Any, cast
 
 import structlog
 from openc_python_common.observability.log_util import observe_around
@@ -18,12 +21,28 @@ from data_fetcher_core.core import (
     FetchRunContext,
 )
 from data_fetcher_core.exceptions import (
+    BundleTimeoutError,
     ConfigurationError,
     FatalError,
+    LeadershipLostError,
     NetworkError,
     ResourceError,
 )
-from data_fetcher_core.queue import BundleRefSerializer, InMemoryQueue, RequestQueue
+from data_fetcher_core.metrics import (
+    BUNDLE_DURATION,
+    BUNDLES_TOTAL,
+    LOCATOR_LATENCY,
+    QUEUE_DEPTH,
+)
+from data_fetcher_core.queue import (
+    BundleRefSerializer,
+    InMemoryQueue,
+    RequestQueue,
+    WeightedFairQueue,
+)
+from data_fetcher_core.speculation import StragglerMonitor
+from data_fetcher_core.tracing import get_tracer
+from data_fetcher_core.watchdog import load_with_watchdog
 
 # Get logger for this module
 logger = structlog.get_logger(__name__)
@@ -47,6 +66,55 @@ def _raise_storage_required() -> None:
     raise ConfigurationError(error_message, "storage")
 
 
+def _is_leased_queue(queue: RequestQueue) -> bool:
+    """Check whether a queue supports leased delivery (claim/ack)."""
+    return hasattr(queue, "claim") and hasattr(queue, "ack")
+
+
+def _is_fair_queue(queue: RequestQueue) -> bool:
+    """Check whether a queue schedules items per flow (set_flow)."""
+    return hasattr(queue, "set_flow")
+
+
+def _uses_fair_queueing(config: DataRegistryFetcherConfig) -> bool:
+    """Check whether locators should be interleaved rather than drained in order."""
+    return bool(
+        config.fair_queueing or config.locator_weights or config.locator_priorities
+    )
+
+
+def _locator_flow(index: int) -> str:
+    """Name of the queue flow carrying a locator's bundles."""
+    return f"locator-{index}"
+
+
+def _locator_weights(config: DataRegistryFetcherConfig) -> list[float]:
+    """Queue weight of each locator (1.0 unless configured)."""
+    return _per_locator(config, "locator_weights", config.locator_weights, 1.0)
+
+
+def _locator_priorities(config: DataRegistryFetcherConfig) -> list[int]:
+    """Queue priority of each locator (0 unless configured)."""
+    return _per_locator(config, "locator_priorities", config.locator_priorities, 0)
+
+
+def _per_locator(
+    config: DataRegistryFetcherConfig,
+    name: str,
+    values: list[Any] | None,
+    default: Any,  # noqa: ANN401
+) -> list[Any]:
+    if values is None:
+        return [default] * len(config.locators)
+    if len(values) != len(config.locators):
+        error_message = (
+            f"{name} has {len(values)} entries but "
+            f"{len(config.locators)} locators are configured"
+        )
+        raise ConfigurationError(error_message, "fetcher_config")
+    return list(values)
+
+
 @dataclass
 class FetchResult:
     """Result of a fetch operation."""
@@ -59,8 +127,25 @@ class FetchResult:
 class Fetcher:
     """Main fetcher class that orchestrates frontier providers, loaders, and storage."""
 
-    def __init__(self) -> None:
-        """Initialize the fetcher."""
+    # Whether bundles are dequeued in this process, so queue wait can be traced
+    track_queue_wait = True
+
+    def __init__(self, work_queue: RequestQueue | None = None) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            work_queue: Optional shared work queue. A queue that supports leased
+                delivery (``claim``/``ack``, e.g. RedisLeasedQueue) makes this
+                fetcher one replica of a distributed run. Defaults to a
+                per-run in-memory queue.
+        """
+        self.work_queue = work_queue
+        # Enqueue timestamps (ns) by bundle id, for queue wait spans
+        self._enqueued_at: dict[str, int] = {}
+        # Times each bundle was re-queued after a deadline or stall, by bundle id
+        self._requeues: dict[str, int] = {}
+        # Bundles in flight, for speculative duplicates of stragglers
+        self._stragglers: StragglerMonitor | None = None
 
     async def run(self, plan: FetchPlan) -> FetchResult:
         """Run the fetcher with the given plan.
@@ -100,6 +185,10 @@ class Fetcher:
             )
             await run_ctx.app_config.storage.on_run_start(run_ctx, plan.config)
 
+        # Call on_run_start hook on the loader (e.g. to pre-warm connection pools)
+        if hasattr(plan.config.loader, "on_run_start"):
+            await plan.config.loader.on_run_start(run_ctx)
+
         logger.info(
             "FETCHER_RUN_STARTED",
             run_id=run_ctx.run_id,
@@ -108,17 +197,33 @@ class Fetcher:
             locators=len(plan.config.locators),
         )
 
-        # Create in-memory queue (persistence handled by locators)
-        queue: RequestQueue = InMemoryQueue(
-            serializer=BundleRefSerializer(),
+        # Use the shared queue if configured, else an in-memory queue
+        # (persistence handled by locators)
+        queue: RequestQueue = self.work_queue or self._create_queue(plan.config)
+        if _is_fair_queue(queue):
+            self._configure_flows(queue, plan.config)
+        distributed = _is_leased_queue(queue)
+        if distributed:
+            await queue.start()  # type: ignore[attr-defined]
+        self._enqueued_at = {}
+        self._requeues = {}
+        self._stragglers = (
+            StragglerMonitor(
+                plan.config.straggler_slowdown, plan.config.straggler_min_seconds
+            )
+            if plan.config.speculative_stragglers
+            else None
         )
 
         # Coordination primitives
         locator_completion_flag = asyncio.Event()
 
         # Start the locator thread to manage queue population
+        locator_thread = (
+            self._distributed_locator_thread if distributed else self._locator_thread
+        )
         locator_task = asyncio.create_task(
-            self._locator_thread(
+            locator_thread(
                 queue,
                 locator_completion_flag,
                 plan.target_queue_size,
@@ -154,8 +259,14 @@ class Fetcher:
         await asyncio.gather(*workers, return_exceptions=True)
         logger.info("ALL_WORKERS_COMPLETED", run_id=run_ctx.run_id)
 
+        # Call on_run_end hook on locators so buffered state is persisted,
+        # then on the loader so pooled connections are closed
+        for component in [*plan.config.locators, plan.config.loader]:
+            await self._run_end_hook(component, run_ctx)
+
         # Clean up queue resources
         await queue.close()
+        get_tracer().log_summary()
 
         # If nothing was processed and we have errors, treat run as failed
         if run_ctx.processed_count == 0 and run_ctx.errors:
@@ -170,6 +281,43 @@ class Fetcher:
             context=run_ctx,
         )
 
+    @staticmethod
+    async def _run_end_hook(component: object, run_ctx: FetchRunContext) -> None:
+        """Call a component's on_run_end hook, logging rather than raising errors.
+
+        A failing hook must not stop the remaining hooks or queue cleanup.
+        """
+        if not hasattr(component, "on_run_end"):
+            return
+        try:
+            await component.on_run_end(run_ctx)
+        except Exception as e:
+            logger.exception(
+                "RUN_END_HOOK_FAILED",
+                component_type=type(component).__name__,
+                error=str(e),
+            )
+
+    @staticmethod
+    def _create_queue(config: DataRegistryFetcherConfig) -> RequestQueue:
+        """Create the per-run in-memory queue."""
+        if _uses_fair_queueing(config):
+            return WeightedFairQueue(serializer=BundleRefSerializer())
+        return InMemoryQueue(serializer=BundleRefSerializer())
+
+    @staticmethod
+    def _configure_flows(
+        queue: RequestQueue, config: DataRegistryFetcherConfig
+    ) -> None:
+        """Give each locator's flow its configured weight and priority."""
+        fair_queue = cast("Any", queue)
+        weights = _locator_weights(config)
+        priorities = _locator_priorities(config)
+        for index in range(len(config.locators)):
+            fair_queue.set_flow(
+                _locator_flow(index), weight=weights[index], priority=priorities[index]
+            )
+
     async def _locator_thread(
         self,
         queue: RequestQueue,
@@ -182,7 +330,8 @@ class Fetcher:
 
         This thread ensures there are at least target_queue_size items in the queue
         by requesting bundle refs from locators until the queue is full or all locators
-        are exhausted.
+        are exhausted. Locators are drained one after another, or polled in turn
+        when fair queueing is configured.
 
         Args:
             queue: The persistent work queue to populate
@@ -197,10 +346,15 @@ class Fetcher:
         )
 
         current_locator_index = 0
+        # With fair queueing every locator that still has work is polled each
+        # round, so bundles from all of them reach the queue together
+        fair = _uses_fair_queueing(config)
+        active_locators = list(range(len(config.locators)))
 
         while not completion_flag.is_set():
             try:
                 current_queue_size = await queue.size()
+                QUEUE_DEPTH.set(current_queue_size)
 
                 # If queue is already at or above target size, wait a bit
                 if current_queue_size >= target_queue_size:
@@ -210,54 +364,49 @@ class Fetcher:
                 # Calculate how many bundle refs we need to reach target
                 bundle_refs_needed = target_queue_size - current_queue_size
 
+                if fair:
+                    if not active_locators:
+                        await self._complete_locators(
+                            queue, completion_flag, locator_logger
+                        )
+                        break
+                    await self._poll_locators_fairly(
+                        queue,
+                        active_locators,
+                        bundle_refs_needed,
+                        config,
+                        run_ctx,
+                        locator_logger,
+                    )
+                    continue
+
                 # Try to get bundle refs from current locator
                 if current_locator_index < len(config.locators):
                     provider = config.locators[current_locator_index]
-
-                    locator_logger.debug(
-                        "REQUESTING_BUNDLE_REFS_FROM_LOCATOR",
-                        locator_type=type(provider).__name__,
-                        locator_index=current_locator_index,
-                        bundle_refs_needed=bundle_refs_needed,
-                        current_queue_size=current_queue_size,
-                    )
-
-                    # Request bundle refs from current locator
-                    next_bundle_refs = await provider.get_next_bundle_refs(
-                        run_ctx, bundle_refs_needed
+                    next_bundle_refs = await self._request_bundle_refs(
+                        provider,
+                        current_locator_index,
+                        bundle_refs_needed,
+                        current_queue_size,
+                        run_ctx,
+                        locator_logger,
                     )
 
-                    locator_logger.debug(
-                        "RECEIVED_BUNDLE_REFS_FROM_LOCATOR",
-                        locator_type=type(provider).__name__,
-                        locator_index=current_locator_index,
-                        bundle_ref_count=len(next_bundle_refs),
-                    )
-
-                    # Guard: Check if locator returned more than requested
-                    if len(next_bundle_refs) > bundle_refs_needed:
-                        error_msg = (
-                            f"Locator {type(provider).__name__} returned {len(next_bundle_refs)} "
-                            f"bundle refs but only {bundle_refs_needed} were requested"
-                        )
-                        locator_logger.error(
-                            "LOCATOR_RETURNED_TOO_MANY_BUNDLE_REFS",
-                            locator_type=type(provider).__name__,
-                            returned_count=len(next_bundle_refs),
-                            requested_count=bundle_refs_needed,
-                        )
-                        raise ConfigurationError(error_msg, "bundle_locator")
-
                     # Add bundle refs to queue
                     if next_bundle_refs:
-                        await queue.enqueue(next_bundle_refs)
-                        new_size = await queue.size()
-                        locator_logger.debug(
-                            "BUNDLE_REFS_ADDED_TO_QUEUE",
-                            bundle_ref_count=len(next_bundle_refs),
-                            queue_size=new_size,
+                        await self._enqueue_bundle_refs(
+                            queue,
+                            next_bundle_refs,
+                            current_locator_index,
+                            locator_logger,
                         )
 
+                    # Locators that are waiting on in-flight bundles (e.g. cursor
+                    # pagination) report pending work and are polled again
+                    if not next_bundle_refs and self._has_pending_work(provider):
+                        await asyncio.sleep(0.1)
+                        continue
+
                     # If this locator didn't return any bundle refs, move to next locator
                     if not next_bundle_refs:
                         current_locator_index += 1
@@ -268,12 +417,9 @@ class Fetcher:
                         )
                 else:
                     # All locators exhausted
-                    final_size = await queue.size()
-                    locator_logger.info(
-                        "ALL_LOCATORS_EXHAUSTED_SETTING_COMPLETION_FLAG",
-                        queue_size=final_size,
+                    await self._complete_locators(
+                        queue, completion_flag, locator_logger
                     )
-                    completion_flag.set()
                     break
 
             except Exception as e:
@@ -299,6 +445,198 @@ class Fetcher:
 
         locator_logger.info("LOCATOR_THREAD_COMPLETED")
 
+    async def _request_bundle_refs(
+        self,
+        provider: Any,  # noqa: ANN401
+        locator_index: int,
+        bundle_refs_needed: int,
+        current_queue_size: int,
+        run_ctx: FetchRunContext,
+        locator_logger: Any,  # noqa: ANN401
+    ) -> list[BundleRef]:
+        """Request up to ``bundle_refs_needed`` bundle refs from one locator."""
+        locator_logger.debug(
+            "REQUESTING_BUNDLE_REFS_FROM_LOCATOR",
+            locator_type=type(provider).__name__,
+            locator_index=locator_index,
+            bundle_refs_needed=bundle_refs_needed,
+            current_queue_size=current_queue_size,
+        )
+
+        # Request bundle refs from the locator
+        with LOCATOR_LATENCY.labels(locator=type(provider).__name__).time():
+            next_bundle_refs = await provider.get_next_bundle_refs(
+                run_ctx, bundle_refs_needed
+            )
+
+        locator_logger.debug(
+            "RECEIVED_BUNDLE_REFS_FROM_LOCATOR",
+            locator_type=type(provider).__name__,
+            locator_index=locator_index,
+            bundle_ref_count=len(next_bundle_refs),
+        )
+
+        # Guard: Check if locator returned more than requested
+        if len(next_bundle_refs) > bundle_refs_needed:
+            error_msg = (
+                f"Locator {type(provider).__name__} returned {len(next_bundle_refs)} "
+                f"bundle refs but only {bundle_refs_needed} were requested"
+            )
+            locator_logger.error(
+                "LOCATOR_RETURNED_TOO_MANY_BUNDLE_REFS",
+                locator_type=type(provider).__name__,
+                returned_count=len(next_bundle_refs),
+                requested_count=bundle_refs_needed,
+            )
+            raise ConfigurationError(error_msg, "bundle_locator")
+
+        return cast("list[BundleRef]", next_bundle_refs)
+
+    async def _enqueue_bundle_refs(
+        self,
+        queue: RequestQueue,
+        bundle_refs: list[BundleRef],
+        locator_index: int,
+        locator_logger: Any,  # noqa: ANN401
+    ) -> None:
+        """Add a locator's bundle refs to the queue (in its flow if fair)."""
+        self._mark_enqueued(bundle_refs)
+        if hasattr(queue, "publish"):
+            # Shared queues only accept work from the current leader
+            await queue.publish(bundle_refs)
+        elif _is_fair_queue(queue):
+            await cast("Any", queue).enqueue(
+                bundle_refs, flow=_locator_flow(locator_index)
+            )
+        else:
+            await queue.enqueue(bundle_refs)
+        new_size = await queue.size()
+        locator_logger.debug(
+            "BUNDLE_REFS_ADDED_TO_QUEUE",
+            bundle_ref_count=len(bundle_refs),
+            locator_index=locator_index,
+            queue_size=new_size,
+        )
+
+    async def _poll_locators_fairly(
+        self,
+        queue: RequestQueue,
+        active_locators: list[int],
+        bundle_refs_needed: int,
+        config: DataRegistryFetcherConfig,
+        run_ctx: FetchRunContext,
+        locator_logger: Any,  # noqa: ANN401
+    ) -> None:
+        """Poll every active locator once, sharing the free queue space by weight.
+
+        Exhausted locators are removed from ``active_locators``.
+        """
+        weights = _locator_weights(config)
+        total_weight = sum(weights[index] for index in active_locators)
+        current_queue_size = await queue.size()
+        produced = False
+        for index in list(active_locators):
+            provider = config.locators[index]
+            share = max(
+                1, math.ceil(bundle_refs_needed * weights[index] / total_weight)
+            )
+            next_bundle_refs = await self._request_bundle_refs(
+                provider, index, share, current_queue_size, run_ctx, locator_logger
+            )
+            if next_bundle_refs:
+                produced = True
+                await self._enqueue_bundle_refs(
+                    queue, next_bundle_refs, index, locator_logger
+                )
+            elif not self._has_pending_work(provider):
+                active_locators.remove(index)
+                locator_logger.debug(
+                    "LOCATOR_EXHAUSTED",
+                    locator_index=index,
+                    active_locators=len(active_locators),
+                )
+        if not produced and active_locators:
+            # Only locators waiting on in-flight bundles are left
+            await asyncio.sleep(0.1)
+
+    async def _complete_locators(
+        self,
+        queue: RequestQueue,
+        completion_flag: asyncio.Event,
+        locator_logger: Any,  # noqa: ANN401
+    ) -> None:
+        """Signal that every locator is exhausted."""
+        final_size = await queue.size()
+        locator_logger.info(
+            "ALL_LOCATORS_EXHAUSTED_SETTING_COMPLETION_FLAG",
+            queue_size=final_size,
+        )
+        completion_flag.set()
+
+    async def _distributed_locator_thread(
+        self,
+        queue: RequestQueue,
+        completion_flag: asyncio.Event,
+        target_queue_size: int,
+        config: DataRegistryFetcherConfig,
+        run_ctx: FetchRunContext,
+    ) -> None:
+        """Run the locators on the one replica that holds the leadership.
+
+        Other replicas only process bundles from the shared queue. They wait
+        until the leader reports that the locators are exhausted, and take over
+        the locators if the leader's lock expires first (e.g. the pod died).
+        A leader that finds its lock taken over stops publishing and waits
+        like the other replicas.
+
+        Args:
+            queue: The shared leased work queue
+            completion_flag: Event to signal when no more bundle refs are available
+            target_queue_size: Target number of items to maintain in the queue
+            config: The fetcher configuration containing bundle locators
+            run_ctx: The fetch run context for this execution
+        """
+        leased_queue = cast("Any", queue)
+        while not await leased_queue.locators_done():
+            if await leased_queue.try_acquire_leadership():
+                logger.info(
+                    "LOCATOR_LEADERSHIP_ACQUIRED",
+                    consumer_id=leased_queue.consumer_id,
+                )
+                # Workers are only told the locators are done once the
+                # completion is recorded for every replica
+                try:
+                    await self._locator_thread(
+                        queue, asyncio.Event(), target_queue_size, config, run_ctx
+                    )
+                    await leased_queue.mark_locators_done()
+                    break
+                except LeadershipLostError:
+                    logger.warning(
+                        "LOCATOR_LEADERSHIP_LOST",
+                        consumer_id=leased_queue.consumer_id,
+                    )
+                except Exception:
+                    completion_flag.set()
+                    raise
+            await asyncio.sleep(leased_queue.heartbeat_interval_seconds)
+
+        completion_flag.set()
+
+    def _mark_enqueued(self, bundle_refs: list[BundleRef]) -> None:
+        """Remember when bundles were enqueued, for queue wait spans."""
+        if not self.track_queue_wait:
+            return
+        enqueued_at = time.time_ns()
+        for bundle_ref in bundle_refs:
+            self._enqueued_at[str(bundle_ref.bid)] = enqueued_at
+
+    @staticmethod
+    def _has_pending_work(provider: object) -> bool:
+        """Check whether a locator that returned nothing may still produce work."""
+        has_pending_work = getattr(provider, "has_pending_work", None)
+        return bool(callable(has_pending_work) and has_pending_work())
+
     async def _worker(
         self,
         worker_id: int,
@@ -326,20 +664,26 @@ class Fetcher:
         initial_size = await queue.size()
         worker_logger.info("WORKER_STARTED_WITH_QUEUE_SIZE", queue_size=initial_size)
 
+        leased = _is_leased_queue(queue)
+        leased_queue = cast("Any", queue)
+
         bundle_ref: BundleRef | None = None
         while True:
             try:
                 # Get next request from persistent queue
-                requests = await queue.dequeue(max_items=1)
+                lease = None
+                if leased:
+                    leases = await leased_queue.claim(max_items=1)
+                    lease = leases[0] if leases else None
+                    requests = [lease.item] if lease else []
+                else:
+                    requests = await queue.dequeue(max_items=1)
                 if not requests:
-                    # If no work and locators are done, exit
-                    if completion_flag.is_set():
+                    if await self._idle(queue, completion_flag):
                         worker_logger.info(
                             "NO_MORE_REQUESTS_WORKER_EXITING", worker_id=worker_id
                         )
                         break
-                    # Wait a bit for more work to arrive
-                    await asyncio.sleep(0.1)
                     continue
 
                 bundle_ref = requests[0]
@@ -349,15 +693,30 @@ class Fetcher:
                         item_type=type(bundle_ref).__name__,
                         worker_id=worker_id,
                     )
+                    if lease is not None:
+                        await leased_queue.ack(lease)
                     continue
 
                 # Process the request
-                with observe_around(
-                    worker_logger.bind(bid=str(getattr(bundle_ref, "bid", "unknown"))),
-                    "WORKER_PROCESS_URL",
-                    worker_id=worker_id,
+                bid_str = str(bundle_ref.bid)
+                with (
+                    observe_around(
+                        worker_logger.bind(bid=bid_str),
+                        "WORKER_PROCESS_URL",
+                        worker_id=worker_id,
+                    ),
+                    get_tracer().span("bundle", bid=bid_str, worker_id=worker_id),
                 ):
-                    await self._process_request(bundle_ref, config, run_ctx)
+                    # Bundles enqueued by another replica have no local timestamp
+                    enqueued_at = self._enqueued_at.pop(bid_str, None)
+                    if enqueued_at is not None:
+                        get_tracer().record("queue_wait", enqueued_at, time.time_ns())
+                    await self._process_request(bundle_ref, config, run_ctx, queue)
+
+                # Bundle errors are recorded by _process_request, so the lease is
+                # acked either way; only a crashed replica's leases are redelivered
+                if lease is not None:
+                    await leased_queue.ack(lease)
 
             except Exception as e:
                 bid_str = str(getattr(bundle_ref, "bid", "unknown"))
@@ -378,13 +737,40 @@ class Fetcher:
 
         worker_logger.debug("WORKER_COMPLETED")
 
+    async def _idle(self, queue: RequestQueue, completion_flag: asyncio.Event) -> bool:
+        """Wait for more work, or duplicate a straggler once the queue is drained.
+
+        Returns:
+            Whether the worker should exit.
+        """
+        # If no work and locators are done, exit. A shared queue must
+        # also be drained, since leases held by other replicas may
+        # still expire and be delivered again.
+        if completion_flag.is_set() and (
+            not _is_leased_queue(queue) or await cast("Any", queue).is_drained()
+        ):
+            # Idle workers may duplicate bundles still in flight
+            if self._stragglers is None or not self._stragglers.in_flight:
+                return True
+            if await self._stragglers.speculate():
+                return False
+        # Wait a bit for more work to arrive
+        await asyncio.sleep(0.1)
+        return False
+
     async def _process_request(
         self,
         bundle: BundleRef,
         config: DataRegistryFetcherConfig,
         run_ctx: FetchRunContext,
+        queue: RequestQueue | None = None,
     ) -> None:
-        """Process a single request through the pipeline."""
+        """Process a single request through the pipeline.
+
+        A load cancelled by the bundle deadline or stall detection is put back
+        on ``queue`` up to ``max_bundle_requeues`` times before it fails.
+        """
+        started = time.perf_counter()
         try:
             logger.debug("REQUEST_PROCESSING", bid=str(bundle.bid))
 
@@ -404,9 +790,11 @@ class Fetcher:
                 "REQUEST_LOADING_WITH_LOADER",
                 loader_type=type(config.loader).__name__,
             )
-            load_result: BundleLoadResult = await config.loader.load(
-                bundle, storage, run_ctx, config
-            )
+            tracer = get_tracer()
+            with tracer.span("load", loader=type(config.loader).__name__):
+                load_result: BundleLoadResult = await self._load(
+                    bundle, storage, run_ctx, config
+                )
             logger.debug(
                 "REQUEST_LOADED_SUCCESSFULLY",
                 bid=str(bundle.bid),
@@ -414,18 +802,29 @@ class Fetcher:
             )
 
             # 2. Notify providers that URL was processed
-            for provider in config.locators:
-                if hasattr(provider, "handle_bundle_processed"):
-                    logger.debug(
-                        "PROVIDER_NOTIFICATION_URL_PROCESSED",
-                        bid=str(bundle.bid),
-                        provider_type=type(provider).__name__,
-                    )
-                    await provider.handle_bundle_processed(bundle, load_result, run_ctx)
+            with tracer.span("locator_callbacks"):
+                for provider in config.locators:
+                    if hasattr(provider, "handle_bundle_processed"):
+                        logger.debug(
+                            "PROVIDER_NOTIFICATION_URL_PROCESSED",
+                            bid=str(bundle.bid),
+                            provider_type=type(provider).__name__,
+                        )
+                        await provider.handle_bundle_processed(
+                            bundle, load_result, run_ctx
+                        )
 
             logger.debug("REQUEST_PROCESSING_COMPLETED", bid=str(bundle.bid))
             run_ctx.processed_count += 1
+            BUNDLES_TOTAL.labels(outcome="processed").inc()
 
+        except BundleTimeoutError as e:
+            if queue is not None and await self._requeue(bundle, config, queue):
+                return
+            error_msg = f"Timed out processing bundle {bundle.bid!s}: {e!s}"
+            run_ctx.errors.append(error_msg)
+            BUNDLES_TOTAL.labels(outcome="error").inc()
+            await self._notify_bundle_error(bundle, error_msg, config, run_ctx)
         except Exception as e:
             # Create appropriate error message based on error type
             if isinstance(e, NetworkError | ResourceError):
@@ -456,6 +855,63 @@ class Fetcher:
                 )
 
             run_ctx.errors.append(error_msg)
+            BUNDLES_TOTAL.labels(outcome="error").inc()
+            await self._notify_bundle_error(bundle, error_msg, config, run_ctx)
+        finally:
+            BUNDLE_DURATION.observe(time.perf_counter() - started)
+
+    async def _load(
+        self,
+        bundle: BundleRef,
+        storage: object,
+        run_ctx: FetchRunContext,
+        config: DataRegistryFetcherConfig,
+    ) -> BundleLoadResult:
+        """Load a bundle, tracking it for speculative duplicates if enabled."""
+        if self._stragglers is None:
+            return await load_with_watchdog(bundle, storage, run_ctx, config)
+        return await self._stragglers.load(
+            bundle, lambda: load_with_watchdog(bundle, storage, run_ctx, config)
+        )
+
+    async def _requeue(
+        self,
+        bundle: BundleRef,
+        config: DataRegistryFetcherConfig,
+        queue: RequestQueue,
+    ) -> bool:
+        """Put a timed-out bundle back on the queue if it has requeues left."""
+        bid_str = str(bundle.bid)
+        requeues = self._requeues.get(bid_str, 0)
+        if requeues >= config.max_bundle_requeues:
+            return False
+        self._requeues[bid_str] = requeues + 1
+        self._mark_enqueued([bundle])
+        await queue.enqueue([bundle])
+        BUNDLES_TOTAL.labels(outcome="requeued").inc()
+        logger.warning("BUNDLE_REQUEUED", bid=bid_str, requeues=requeues + 1)
+        return True
+
+    async def _notify_bundle_error(
+        self,
+        bundle: BundleRef,
+        error_msg: str,
+        config: DataRegistryFetcherConfig,
+        run_ctx: FetchRunContext,
+    ) -> None:
+        """Let locators that track in-flight bundles know that one failed."""
+        for provider in config.locators:
+            if not hasattr(provider, "handle_bundle_error"):
+                continue
+            try:
+                await provider.handle_bundle_error(bundle, error_msg, run_ctx)
+            except Exception as e:
+                logger.exception(
+                    "PROVIDER_NOTIFICATION_BUNDLE_ERROR_FAILED",
+                    bid=str(bundle.bid),
+                    provider_type=type(provider).__name__,
+                    error=str(e),
+                )
 
 
 def run_fetcher(config_name: str, **kwargs: object) -> FetchResult:
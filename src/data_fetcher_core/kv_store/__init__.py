@@ -18,6 +18,7 @@ from .manager import (
     create_state_tracker,
 )
 from .memory import InMemoryKeyValueStore
+from .processed_items import ProcessedItemSet
 from .redis import RedisKeyValueStore
 
 
@@ -54,6 +55,7 @@ __all__ = [
     "BaseKeyValueStore",
     "InMemoryKeyValueStore",
     "KeyValueStore",
+    "ProcessedItemSet",
     "RedisKeyValueStore",
     "StateManagementManager",
     "StateTracker",
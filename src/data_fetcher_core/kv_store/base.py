@@ -4,6 +4,7 @@ This module defines the base KeyValueStore protocol for persisting application s
 across different storage backends. All key-value store implementations must implement this protocol.
 """
 
+from collections.abc import AsyncIterator
 from datetime import timedelta
 from typing import Any, Protocol, cast
 
@@ -57,6 +58,40 @@ class KeyValueStore(Protocol):
         """
         ...
 
+    async def put_raw(
+        self,
+        key: str,
+        value: str | bytes,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Store an already encoded value as is, bypassing the serializer.
+
+        Use this for values the caller has encoded itself (e.g. queue items),
+        so they are not encoded a second time.
+
+        Args:
+            key: The key to store the value under
+            value: The encoded value
+            ttl: Time-to-live in seconds or as timedelta. If None, uses default_ttl
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+        """
+        ...
+
+    async def get_raw(self, key: str, prefix: str | None = None) -> str | bytes | None:
+        """Retrieve a value written with ``put_raw`` without deserializing it.
+
+        Binary-safe stores return bytes, others return text.
+
+        Args:
+            key: The key to retrieve
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+
+        Returns:
+            The stored value, or None if not found
+        """
+        ...
+
     async def delete(
         self, key: str, prefix: str | None = None, **kwargs: object
     ) -> bool:
@@ -72,6 +107,36 @@ class KeyValueStore(Protocol):
         """
         ...
 
+    async def expire(
+        self, key: str, ttl: int | timedelta, prefix: str | None = None
+    ) -> bool:
+        """Set the time-to-live of an existing key without rewriting its value.
+
+        Args:
+            key: The key to expire
+            ttl: Time-to-live in seconds or as timedelta
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+
+        Returns:
+            True if the key exists, False otherwise
+        """
+        ...
+
+    async def expire_many(
+        self, keys: list[str], ttl: int | timedelta, prefix: str | None = None
+    ) -> int:
+        """Set the time-to-live of several existing keys in one round trip.
+
+        Args:
+            keys: The keys to expire
+            ttl: Time-to-live in seconds or as timedelta
+            prefix: Optional prefix to prepend to the keys. If None, uses the store's default prefix
+
+        Returns:
+            The number of keys that exist
+        """
+        ...
+
     async def exists(
         self, key: str, prefix: str | None = None, **kwargs: object
     ) -> bool:
@@ -93,6 +158,8 @@ class KeyValueStore(Protocol):
         end_key: str | None = None,
         limit: int | None = None,
         prefix: str | None = None,
+        *,
+        raw: bool = False,
         **kwargs: object,
     ) -> list[tuple[str, Any]]:
         """Get a range of key-value pairs.
@@ -102,6 +169,7 @@ class KeyValueStore(Protocol):
             end_key: The ending key (exclusive). If None, no upper bound
             limit: Maximum number of results to return
             prefix: Optional prefix to prepend to the keys. If None, uses the store's default prefix
+            raw: Return values as stored, like ``get_raw``
             **kwargs: Additional implementation-specific parameters
 
         Returns:
@@ -109,6 +177,114 @@ class KeyValueStore(Protocol):
         """
         ...
 
+    def iter_range(
+        self,
+        start_key: str,
+        end_key: str | None = None,
+        batch_size: int = 100,
+        prefix: str | None = None,
+        *,
+        raw: bool = False,
+    ) -> AsyncIterator[list[tuple[str, Any]]]:
+        """Stream a range of key-value pairs in bounded batches.
+
+        Unlike ``range_get`` the range is never held in memory as a whole.
+        Batches follow the store's natural order, which is not necessarily key
+        order (Redis returns keys in SCAN order).
+
+        Args:
+            start_key: The starting key (inclusive)
+            end_key: The ending key (exclusive). If None, no upper bound
+            batch_size: Approximate number of keys read per batch
+            prefix: Optional prefix to prepend to the keys. If None, uses the store's default prefix
+            raw: Return values as stored, like ``get_raw``
+
+        Yields:
+            Lists of (key, value) tuples in the specified range
+        """
+        ...
+
+    async def increment(
+        self,
+        key: str,
+        amount: int = 1,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        """Atomically add to an integer counter, creating it at zero.
+
+        Counters are stored as plain integers regardless of the serializer, so
+        read them with ``get_counter`` rather than ``get``.
+
+        Args:
+            key: The counter key
+            amount: Amount to add (may be negative)
+            ttl: Time-to-live in seconds or as timedelta. If None, uses default_ttl
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+
+        Returns:
+            The counter value after the increment
+        """
+        ...
+
+    async def get_counter(self, key: str, prefix: str | None = None) -> int:
+        """Get an integer counter written with ``increment`` (0 if missing)."""
+        ...
+
+    async def hash_increment(
+        self,
+        key: str,
+        increments: dict[str, float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically add to numeric fields of a hash, creating them at zero.
+
+        Args:
+            key: The hash key
+            increments: Amount to add per field
+            ttl: Time-to-live in seconds or as timedelta. If None, uses default_ttl
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+        """
+        ...
+
+    async def hash_set(
+        self,
+        key: str,
+        values: dict[str, str | float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Set fields of a hash, leaving other fields unchanged."""
+        ...
+
+    async def hash_update_extremes(
+        self,
+        key: str,
+        minimums: dict[str, float] | None = None,
+        maximums: dict[str, float] | None = None,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically lower or raise numeric fields of a hash.
+
+        Each field in ``minimums`` is set to the smaller of its stored value
+        and the given one, each field in ``maximums`` to the larger; missing
+        fields take the given value.
+
+        Args:
+            key: The hash key
+            minimums: Candidate minimum per field
+            maximums: Candidate maximum per field
+            ttl: Time-to-live in seconds or as timedelta. If None, uses default_ttl
+            prefix: Optional prefix to prepend to the key. If None, uses the store's default prefix
+        """
+        ...
+
+    async def hash_get_all(self, key: str, prefix: str | None = None) -> dict[str, str]:
+        """Get every field of a hash as strings (empty if missing)."""
+        ...
+
     async def close(self) -> None:
         """Close the store and release any resources."""
         ...
@@ -136,17 +312,19 @@ class BaseKeyValueStore:
         self._serializer: str = cast("str", kwargs.get("serializer", "json"))
         self._default_ttl: int | None = cast("int | None", kwargs.get("default_ttl"))
         self._key_prefix: str = cast("str", kwargs.get("key_prefix", "")) or ""
+        # Binary-safe stores keep values as bytes rather than text
+        self._binary: bool = bool(kwargs.get("binary", False))
 
     def _get_prefixed_key(self, key: str, prefix: str | None = None) -> str:
         """Get the key with prefix applied."""
         effective_prefix = prefix if prefix is not None else self._key_prefix
         return get_prefixed_key(key, effective_prefix)
 
-    def _serialize(self, value: object) -> str:
+    def _serialize(self, value: object) -> str | bytes:
         """Serialize a value for storage."""
-        return serialize_value(value, self._serializer)
+        return serialize_value(value, self._serializer, binary=self._binary)
 
-    def _deserialize(self, value: str) -> object:
+    def _deserialize(self, value: str | bytes) -> object:
         """Deserialize a value from storage."""
         return deserialize_value(value, self._serializer)
 
@@ -32,6 +32,16 @@ def _get_env_int(key: str, default: int) -> int:
         return default
 
 
+def _get_env_bool(key: str, *, default: bool = False) -> bool:
+    """Get boolean value from environment variable."""
+    value = os.getenv(key, "").lower()
+    if value in ("true", "1", "yes", "on"):
+        return True
+    if value in ("false", "0", "no", "off"):
+        return False
+    return default
+
+
 def _get_base_kv_config(
     serializer: str | None = None,
     default_ttl: int | None = None,
@@ -69,6 +79,8 @@ def _get_redis_config(
     redis_password: str | None = None,
     redis_key_prefix: str | None = None,
     base_config: dict[str, str | int] | None = None,
+    *,
+    redis_binary: bool | None = None,
 ) -> dict[str, str | int]:
     """Get Redis-specific configuration.
 
@@ -79,6 +91,7 @@ def _get_redis_config(
         redis_password: Redis password.
         redis_key_prefix: Redis key prefix.
         base_config: Base configuration to extend.
+        redis_binary: Whether to use a binary-safe connection.
 
     Returns:
         Redis configuration dictionary.
@@ -90,6 +103,11 @@ def _get_redis_config(
     )
     config["port"] = redis_port or _get_env_int("OC_KV_STORE_REDIS_PORT", 6379)
     config["db"] = redis_db or _get_env_int("OC_KV_STORE_REDIS_DB", 0)
+    config["binary"] = (
+        redis_binary
+        if redis_binary is not None
+        else _get_env_bool("OC_KV_STORE_REDIS_BINARY")
+    )
 
     # Handle key prefix with Redis-specific logic
     redis_key_prefix_value = redis_key_prefix or os.getenv(
@@ -138,6 +156,8 @@ def create_kv_store(
     redis_db: int | None = None,
     redis_password: str | None = None,
     redis_key_prefix: str | None = None,
+    *,
+    redis_binary: bool | None = None,
 ) -> KeyValueStore:
     """Create a key-value store instance with comprehensive configuration.
 
@@ -160,6 +180,8 @@ def create_kv_store(
                        If None, uses OC_KV_STORE_REDIS_PASSWORD env var.
         redis_key_prefix: Redis key prefix (when using redis).
                          If None, uses OC_KV_STORE_REDIS_KEY_PREFIX env var.
+        redis_binary: Use a binary-safe Redis connection (when using redis).
+                     If None, uses OC_KV_STORE_REDIS_BINARY env var or False.
 
     Returns:
         Configured key-value store instance.
@@ -181,6 +203,7 @@ def create_kv_store(
             redis_password,
             redis_key_prefix,
             base_config,
+            redis_binary=redis_binary,
         )
         return RedisKeyValueStore(**redis_config)
 
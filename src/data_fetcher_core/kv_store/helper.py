@@ -8,6 +8,9 @@ import json
 import pickle
 from datetime import timedelta
 
+# First byte of every pickle written with protocol 2 or later
+PICKLE_PROTO = pickle.PROTO
+
 
 def get_prefixed_key(key: str, prefix: str | None = None) -> str:
     """Get the key with prefix applied.
@@ -27,15 +30,19 @@ def get_prefixed_key(key: str, prefix: str | None = None) -> str:
     return key
 
 
-def serialize_value(value: object, serializer: str = "json") -> str:
+def serialize_value(
+    value: object, serializer: str = "json", *, binary: bool = False
+) -> str | bytes:
     """Serialize a value for storage.
 
     Args:
         value: The value to serialize
         serializer: The serializer to use ("json" or "pickle")
+        binary: Whether the store is binary-safe. Pickled values are then kept
+            as bytes instead of being hex-encoded to text
 
     Returns:
-        Serialized value as string
+        Serialized value
 
     Raises:
         ValueError: If serializer is not supported
@@ -43,15 +50,16 @@ def serialize_value(value: object, serializer: str = "json") -> str:
     if serializer == "json":
         return json.dumps(value, default=str)
     if serializer == "pickle":
-        return pickle.dumps(value).hex()
+        pickled = pickle.dumps(value)
+        return pickled if binary else pickled.hex()
     raise ValueError(f"Bad serializer: {serializer}")  # noqa: TRY003
 
 
-def deserialize_value(value: str, serializer: str = "json") -> object:
+def deserialize_value(value: str | bytes, serializer: str = "json") -> object:
     """Deserialize a value from storage.
 
     Args:
-        value: The serialized value
+        value: The serialized value, as text or as read from a binary-safe store
         serializer: The serializer to use ("json" or "pickle")
 
     Returns:
@@ -63,8 +71,15 @@ def deserialize_value(value: str, serializer: str = "json") -> object:
     if serializer == "json":
         return json.loads(value)
     if serializer == "pickle":
+        # Pickles start with the PROTO opcode; anything else was hex-encoded
+        # by a text-mode store
+        if isinstance(value, bytes) and value.startswith(PICKLE_PROTO):
+            pickled = value
+        else:
+            text = value.decode("ascii") if isinstance(value, bytes) else value
+            pickled = bytes.fromhex(text)
         # Note: pickle.loads can be unsafe with untrusted data, but this is for internal use only
-        return pickle.loads(bytes.fromhex(value))  # noqa: S301
+        return pickle.loads(pickled)  # noqa: S301
     raise ValueError(f"Bad serializer: {serializer}")  # noqa: TRY003
 
 
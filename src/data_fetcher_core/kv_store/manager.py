@@ -5,11 +5,24 @@ StateManagementManager and StateTracker classes for managing
 application state and processing statistics.
 """
 
+import asyncio
+import bisect
+import contextlib
+import math
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from typing import Any
+
+import structlog
+
+from data_fetcher_core.metrics import DEFAULT_BUCKETS
 
 from .base import KeyValueStore
 
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
 
 class StateManagementManager:
     """Manager for state management operations across different providers."""
@@ -112,79 +125,227 @@ class StateManagementManager:
                 await self.store.delete(key)
 
 
+@dataclass
+class _TimingAggregate:
+    """Timing samples recorded since the last flush."""
+
+    bucket_bounds: tuple[float, ...]
+    count: int = 0
+    total_time: float = 0.0
+    min_time: float = math.inf
+    max_time: float = 0.0
+    bucket_counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        self.min_time = min(self.min_time, duration)
+        self.max_time = max(self.max_time, duration)
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, duration)] += 1
+
+    def merge(self, other: "_TimingAggregate") -> None:
+        self.count += other.count
+        self.total_time += other.total_time
+        self.min_time = min(self.min_time, other.min_time)
+        self.max_time = max(self.max_time, other.max_time)
+        for index, bucket_count in enumerate(other.bucket_counts):
+            self.bucket_counts[index] += bucket_count
+
+    def increments(self) -> dict[str, float]:
+        values: dict[str, float] = {
+            "count": self.count,
+            "total_time": self.total_time,
+        }
+        bounds = [*map(str, self.bucket_bounds), "+Inf"]
+        for bound, bucket_count in zip(bounds, self.bucket_counts, strict=True):
+            if bucket_count:
+                values[f"bucket:{bound}"] = bucket_count
+        return values
+
+
 class StateTracker:
-    """Track processing state and statistics."""
+    """Track processing state and statistics.
+
+    Counters and processing times are aggregated in memory and flushed to the
+    store as deltas every ``flush_interval`` seconds, using atomic increments
+    so that concurrent workers and replicas never lose updates. Recording a
+    sample therefore costs no round trip except when a flush is due. A
+    background task started with the first sample also flushes once per
+    interval while no samples arrive; call ``close`` at the end of a run to
+    stop it and persist what is still buffered.
+
+    Counters and timings use the ``count`` and ``timing_stats`` key names:
+    earlier versions stored them as serialized values under ``counter`` and
+    ``timing``, which cannot be incremented in place, and those keys are left
+    to expire.
+    """
 
-    def __init__(self, store: KeyValueStore, prefix: str = "state_tracker") -> None:
+    def __init__(
+        self,
+        store: KeyValueStore,
+        prefix: str = "state_tracker",
+        flush_interval: float = 5.0,
+        timing_buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
         """Initialize the state tracker with a store and prefix.
 
         Args:
             store: The key-value store instance to use.
             prefix: Prefix for all state tracking keys.
+            flush_interval: Seconds between flushes of aggregated statistics.
+                0 flushes on every sample.
+            timing_buckets: Upper bounds (seconds) of the processing time
+                histogram buckets.
         """
         self.store = store
         self.prefix = prefix
+        self.flush_interval = flush_interval
+        self.timing_buckets = tuple(sorted(timing_buckets))
+        self._counter_deltas: dict[str, int] = {}
+        self._counter_totals: dict[str, int] = {}
+        self._timings: dict[str, _TimingAggregate] = {}
+        self._last_flush = time.monotonic()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def _counter_key(self, counter_name: str) -> str:
+        return f"{self.prefix}:count:{counter_name}"
+
+    def _timing_key(self, operation: str) -> str:
+        return f"{self.prefix}:timing_stats:{operation}"
+
+    async def _maybe_flush(self) -> None:
+        if self._flush_task is None and self.flush_interval > 0:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                continue
+            try:
+                await self.flush()
+            except Exception as e:  # noqa: BLE001
+                # Unwritten samples were put back and are retried next time
+                logger.warning(
+                    "STATE_TRACKER_FLUSH_FAILED",
+                    prefix=self.prefix,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def close(self) -> None:
+        """Stop the background flush and write what is still buffered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write aggregated counters and timings to the store."""
+        self._last_flush = time.monotonic()
+        # Swap the buffers first so samples recorded during the flush are kept
+        counters, self._counter_deltas = self._counter_deltas, {}
+        timings, self._timings = self._timings, {}
+
+        try:
+            for name, delta in list(counters.items()):
+                self._counter_totals[name] = await self.store.increment(
+                    self._counter_key(name), delta, ttl=timedelta(days=30)
+                )
+                del counters[name]
+
+            for operation, aggregate in list(timings.items()):
+                await self._flush_timing(operation, aggregate)
+                del timings[operation]
+        except Exception:
+            # Put back whatever was not written so it is retried next flush
+            for name, delta in counters.items():
+                self._counter_deltas[name] = self._counter_deltas.get(name, 0) + delta
+            for operation, aggregate in timings.items():
+                self._timing(operation).merge(aggregate)
+            raise
+
+    async def _flush_timing(self, operation: str, aggregate: _TimingAggregate) -> None:
+        key = self._timing_key(operation)
+        ttl = timedelta(days=7)
+        await self.store.hash_increment(key, aggregate.increments(), ttl=ttl)
+        await self.store.hash_update_extremes(
+            key,
+            minimums={"min_time": aggregate.min_time},
+            maximums={"max_time": aggregate.max_time},
+            ttl=ttl,
+        )
+        await self.store.hash_set(
+            key, {"last_updated": datetime.now(UTC).isoformat()}, ttl=ttl
+        )
 
-    async def increment_counter(self, counter_name: str, amount: int = 1) -> int:
-        """Increment a counter."""
-        key = f"{self.prefix}:counter:{counter_name}"
+    def _timing(self, operation: str) -> _TimingAggregate:
+        aggregate = self._timings.get(operation)
+        if aggregate is None:
+            aggregate = self._timings[operation] = _TimingAggregate(self.timing_buckets)
+        return aggregate
 
-        current_value = await self.store.get(key, 0)
-        new_value = current_value + amount if isinstance(current_value, int) else amount
+    async def increment_counter(self, counter_name: str, amount: int = 1) -> int:
+        """Increment a counter.
 
-        await self.store.put(key, new_value, ttl=timedelta(days=30))
-        return new_value
+        Returns:
+            The counter value as known to this tracker: the stored value at the
+            last flush plus increments not yet flushed.
+        """
+        self._counter_deltas[counter_name] = (
+            self._counter_deltas.get(counter_name, 0) + amount
+        )
+        await self._maybe_flush()
+        return self._counter_totals.get(counter_name, 0) + self._counter_deltas.get(
+            counter_name, 0
+        )
 
     async def get_counter(self, counter_name: str) -> int:
-        """Get a counter value."""
-        key = f"{self.prefix}:counter:{counter_name}"
-        result = await self.store.get(key, 0)
-        if isinstance(result, int):
-            return result
-        return 0
+        """Get a counter value, including increments not yet flushed."""
+        stored = await self.store.get_counter(self._counter_key(counter_name))
+        return stored + self._counter_deltas.get(counter_name, 0)
 
     async def record_processing_time(self, operation: str, duration: float) -> None:
         """Record processing time for an operation."""
-        key = f"{self.prefix}:timing:{operation}"
-
-        timing_data = await self.store.get(
-            key,
-            {
-                "count": 0,
-                "total_time": 0.0,
-                "min_time": float("inf"),
-                "max_time": 0.0,
-                "last_updated": None,
-            },
-        )
-
-        if isinstance(timing_data, dict):
-            timing_data["count"] += 1
-            timing_data["total_time"] += duration
-            timing_data["min_time"] = min(timing_data["min_time"], duration)
-            timing_data["max_time"] = max(timing_data["max_time"], duration)
-            timing_data["last_updated"] = datetime.now(UTC).isoformat()
-
-            await self.store.put(key, timing_data, ttl=timedelta(days=7))
+        self._timing(operation).add(duration)
+        await self._maybe_flush()
 
     async def get_processing_stats(self, operation: str) -> dict[str, Any]:
-        """Get processing statistics for an operation."""
-        key = f"{self.prefix}:timing:{operation}"
-        timing_data = await self.store.get(key, {})
-
-        if timing_data:
-            timing_data_dict = cast("dict[str, Any]", timing_data)
-            if timing_data_dict.get("count", 0) > 0:
-                return {
-                    "count": timing_data_dict["count"],
-                    "avg_time": timing_data_dict["total_time"]
-                    / timing_data_dict["count"],
-                    "min_time": timing_data_dict["min_time"],
-                    "max_time": timing_data_dict["max_time"],
-                    "last_updated": timing_data_dict["last_updated"],
-                }
+        """Get processing statistics for an operation.
 
-        return {}
+        Buffered samples are flushed first. ``buckets`` maps each histogram
+        upper bound to the cumulative number of samples at or below it.
+        """
+        if operation in self._timings:
+            await self.flush()
+
+        stored = await self.store.hash_get_all(self._timing_key(operation))
+        count = int(float(stored.get("count", 0)))
+        if count <= 0:
+            return {}
+
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound in [*map(str, self.timing_buckets), "+Inf"]:
+            cumulative += int(float(stored.get(f"bucket:{bound}", 0)))
+            buckets[bound] = cumulative
+
+        return {
+            "count": count,
+            "avg_time": float(stored["total_time"]) / count,
+            "min_time": float(stored.get("min_time", math.inf)),
+            "max_time": float(stored.get("max_time", 0.0)),
+            "last_updated": stored.get("last_updated"),
+            "buckets": buckets,
+        }
 
     async def save_session_info(self, session_id: str, info: dict[str, Any]) -> None:
         """Save session information."""
@@ -239,14 +400,17 @@ def create_state_management_manager(
     return StateManagementManager(store, prefix)
 
 
-def create_state_tracker(store: KeyValueStore, prefix: str) -> StateTracker:
+def create_state_tracker(
+    store: KeyValueStore, prefix: str, flush_interval: float = 5.0
+) -> StateTracker:
     """Create a state tracker with the given store and prefix.
 
     Args:
         store: The key-value store instance to use.
         prefix: Prefix for all state tracking keys.
+        flush_interval: Seconds between flushes of aggregated statistics.
 
     Returns:
         A configured StateTracker instance.
     """
-    return StateTracker(store, prefix)
+    return StateTracker(store, prefix, flush_interval=flush_interval)
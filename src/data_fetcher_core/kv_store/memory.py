@@ -8,9 +8,11 @@ State is not persisted and will be lost when the application restarts.
 import asyncio
 import contextlib
 import fnmatch
+import json
 import time
+from collections.abc import AsyncIterator
 from datetime import timedelta
-from typing import Any
+from typing import Any, cast
 
 import structlog
 
@@ -31,6 +33,9 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
     def __init__(self, **kwargs: object) -> None:
         """Initialize the in-memory store."""
         super().__init__(**kwargs)
+        # Values never leave the process, so there is no need to hex-encode
+        # pickles
+        self._binary = True
         self._store: dict[str, Any] = {}
         self._expiry_times: dict[str, float] = {}
         self._lock = asyncio.Lock()
@@ -55,19 +60,21 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
         prefixed_key = self._get_prefixed_key(key, prefix)
 
         async with self._lock:
-            # Serialize the value
-            serialized_value = self._serialize(value)
+            # Serialize and store the value
+            self._store_value(prefixed_key, self._serialize(value), ttl)
 
-            # Store the value
-            self._store[prefixed_key] = serialized_value
+    def _store_value(
+        self, prefixed_key: str, value: str | bytes, ttl: int | timedelta | None
+    ) -> None:
+        self._store[prefixed_key] = value
 
-            # Set expiry time if TTL is specified
-            ttl_seconds = self._normalize_ttl(ttl)
-            if ttl_seconds is not None:
-                self._expiry_times[prefixed_key] = time.time() + ttl_seconds
-            elif prefixed_key in self._expiry_times:
-                # Remove expiry if no TTL specified
-                del self._expiry_times[prefixed_key]
+        # Set expiry time if TTL is specified
+        ttl_seconds = self._normalize_ttl(ttl)
+        if ttl_seconds is not None:
+            self._expiry_times[prefixed_key] = time.time() + ttl_seconds
+        elif prefixed_key in self._expiry_times:
+            # Remove expiry if no TTL specified
+            del self._expiry_times[prefixed_key]
 
     async def get(
         self,
@@ -89,6 +96,29 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
             serialized_value = self._store[prefixed_key]
             return self._deserialize(serialized_value)
 
+    async def put_raw(
+        self,
+        key: str,
+        value: str | bytes,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Store an already encoded value as is, bypassing the serializer."""
+        await self._ensure_cleanup_started()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            self._store_value(prefixed_key, value, ttl)
+
+    async def get_raw(self, key: str, prefix: str | None = None) -> str | bytes | None:
+        """Retrieve a value written with ``put_raw`` without deserializing it."""
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            if not await self._is_valid_key(prefixed_key):
+                return None
+            return cast("str | bytes", self._store[prefixed_key])
+
     async def delete(
         self,
         key: str,
@@ -107,6 +137,31 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
                 return True
             return False
 
+    async def expire(
+        self, key: str, ttl: int | timedelta, prefix: str | None = None
+    ) -> bool:
+        """Set the time-to-live of an existing key without rewriting its value."""
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            if not await self._is_valid_key(prefixed_key):
+                return False
+            self._set_expiry(prefixed_key, ttl)
+            return True
+
+    async def expire_many(
+        self, keys: list[str], ttl: int | timedelta, prefix: str | None = None
+    ) -> int:
+        """Set the time-to-live of several existing keys."""
+        existing = 0
+        async with self._lock:
+            for key in keys:
+                prefixed_key = self._get_prefixed_key(key, prefix)
+                if await self._is_valid_key(prefixed_key):
+                    self._set_expiry(prefixed_key, ttl)
+                    existing += 1
+        return existing
+
     async def exists(
         self,
         key: str,
@@ -126,6 +181,8 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
         end_key: str | None = None,
         limit: int | None = None,
         prefix: str | None = None,
+        *,
+        raw: bool = False,
         **kwargs: object,  # noqa: ARG002
     ) -> list[tuple[str, Any]]:
         """Get a range of key-value pairs."""
@@ -158,7 +215,7 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
             result = []
             for key in valid_keys:
                 serialized_value = self._store[key]
-                value = self._deserialize(serialized_value)
+                value = serialized_value if raw else self._deserialize(serialized_value)
                 # Strip prefix from returned key
                 original_key = (
                     key[len(effective_prefix) :]
@@ -169,6 +226,133 @@ class InMemoryKeyValueStore(BaseKeyValueStore):
 
             return result
 
+    async def iter_range(
+        self,
+        start_key: str,
+        end_key: str | None = None,
+        batch_size: int = 100,
+        prefix: str | None = None,
+        *,
+        raw: bool = False,
+    ) -> AsyncIterator[list[tuple[str, Any]]]:
+        """Stream a range of key-value pairs in key order, page by page."""
+        next_key = start_key
+        while True:
+            batch = await self.range_get(
+                next_key, end_key, limit=batch_size, prefix=prefix, raw=raw
+            )
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            # Resume right after the last key returned
+            next_key = batch[-1][0] + "\0"
+
+    def _set_expiry(self, prefixed_key: str, ttl: int | timedelta | None) -> None:
+        ttl_seconds = self._normalize_ttl(ttl)
+        if ttl_seconds is not None:
+            self._expiry_times[prefixed_key] = time.time() + ttl_seconds
+
+    async def _read_hash(self, prefixed_key: str) -> dict[str, str]:
+        if not await self._is_valid_key(prefixed_key):
+            return {}
+        return cast("dict[str, str]", json.loads(self._store[prefixed_key]))
+
+    async def increment(
+        self,
+        key: str,
+        amount: int = 1,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        """Atomically add to an integer counter, creating it at zero."""
+        await self._ensure_cleanup_started()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            current = 0
+            if await self._is_valid_key(prefixed_key):
+                current = int(self._store[prefixed_key])
+            value = current + amount
+            # Stored as a plain integer, like Redis INCRBY
+            self._store[prefixed_key] = str(value)
+            self._set_expiry(prefixed_key, ttl)
+            return value
+
+    async def get_counter(self, key: str, prefix: str | None = None) -> int:
+        """Get an integer counter written with ``increment`` (0 if missing)."""
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            if not await self._is_valid_key(prefixed_key):
+                return 0
+            return int(self._store[prefixed_key])
+
+    async def hash_increment(
+        self,
+        key: str,
+        increments: dict[str, float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically add to numeric fields of a hash, creating them at zero."""
+        await self._ensure_cleanup_started()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            fields = await self._read_hash(prefixed_key)
+            for field, amount in increments.items():
+                fields[field] = repr(float(fields.get(field, 0.0)) + amount)
+            self._store[prefixed_key] = json.dumps(fields)
+            self._set_expiry(prefixed_key, ttl)
+
+    async def hash_set(
+        self,
+        key: str,
+        values: dict[str, str | float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Set fields of a hash, leaving other fields unchanged."""
+        await self._ensure_cleanup_started()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            fields = await self._read_hash(prefixed_key)
+            fields.update({field: str(value) for field, value in values.items()})
+            self._store[prefixed_key] = json.dumps(fields)
+            self._set_expiry(prefixed_key, ttl)
+
+    async def hash_update_extremes(
+        self,
+        key: str,
+        minimums: dict[str, float] | None = None,
+        maximums: dict[str, float] | None = None,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically lower or raise numeric fields of a hash."""
+        await self._ensure_cleanup_started()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            fields = await self._read_hash(prefixed_key)
+            for field, value in (minimums or {}).items():
+                if field not in fields or value < float(fields[field]):
+                    fields[field] = repr(float(value))
+            for field, value in (maximums or {}).items():
+                if field not in fields or value > float(fields[field]):
+                    fields[field] = repr(float(value))
+            self._store[prefixed_key] = json.dumps(fields)
+            self._set_expiry(prefixed_key, ttl)
+
+    async def hash_get_all(self, key: str, prefix: str | None = None) -> dict[str, str]:
+        """Get every field of a hash as strings (empty if missing)."""
+        prefixed_key = self._get_prefixed_key(key, prefix)
+
+        async with self._lock:
+            return dict(await self._read_hash(prefixed_key))
+
     async def scan(self, pattern: str) -> list[str]:
         """Scan for keys matching a pattern.
 
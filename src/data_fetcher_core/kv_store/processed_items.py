@@ -0,0 +1,249 @@
+"""Incrementally persisted set of processed item identifiers.
+
+This module provides ProcessedItemSet, which tracks processed items (e.g. URLs)
+in memory and persists only newly added items to the key-value store as
+append-only chunks. Persisting the whole set on every update makes KV traffic
+grow quadratically over a long backfill; appending chunks keeps each write
+proportional to the batch size.
+
+For very large crawls the in-memory set can be replaced by a Bloom filter so
+memory stays bounded; chunks then act as a journal that is periodically folded
+into a persisted filter snapshot.
+"""
+
+import base64
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+
+from data_fetcher_core.bloom_filter import BloomFilter
+
+from .base import KeyValueStore
+
+
+class ProcessedItemSet:
+    """Set of processed items persisted as append-only chunks.
+
+    Items are buffered in memory and written in batches of ``batch_size`` under
+    ``{key}:chunk:{sequence}``. ``load`` replays every chunk, and also merges a
+    legacy full-list value stored directly under ``key`` so state written by
+    earlier versions is not lost.
+
+    The store is passed to ``load`` and ``flush`` rather than held, matching
+    locators that resolve their store from the run context on each call.
+
+    The TTL covers the set as a whole: chunks written early in a long backfill
+    must not expire while the run is still adding to the set, so the TTL of
+    every stored chunk is refreshed on load and then every half TTL.
+
+    When ``seen_filter`` is given, membership is answered by the filter instead
+    of an exact set. Every ``snapshot_interval`` chunks the filter is written
+    to ``{key}:bloom`` together with the sequence it covers, and the chunks it
+    covers are deleted, so neither process memory nor stored state grows with
+    the number of items.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        batch_size: int = 100,
+        ttl: timedelta | None = None,
+        seen_filter: BloomFilter | None = None,
+        snapshot_interval: int = 100,
+    ) -> None:
+        """Initialize the processed item set.
+
+        Args:
+            key: Base key under which chunks are written.
+            batch_size: Number of new items buffered before a chunk is written.
+            ttl: Time-to-live of the persisted set, counted from its last refresh.
+            seen_filter: Optional Bloom filter used instead of an exact set.
+            snapshot_interval: Chunks written between filter snapshots.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")  # noqa: TRY003
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1")  # noqa: TRY003
+        self.key = key
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self.snapshot_interval = snapshot_interval
+        self._filter = seen_filter
+        self._items: set[str] = set()
+        self._pending: list[str] = []
+        self._next_sequence = 0
+        self._snapshot_sequence = 0
+        self._has_snapshot = False
+        self._ttl_refreshed_at: float | None = None
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """Whether persisted chunks have been loaded."""
+        return self._loaded
+
+    @property
+    def pending_count(self) -> int:
+        """Number of items added but not yet persisted."""
+        return len(self._pending)
+
+    @property
+    def probabilistic(self) -> bool:
+        """Whether membership is answered by a Bloom filter."""
+        return self._filter is not None
+
+    def __contains__(self, item: object) -> bool:
+        """Check whether an item has been marked as processed."""
+        if self._filter is not None:
+            return item in self._filter
+        return item in self._items
+
+    def __len__(self) -> int:
+        """Return the number of processed items."""
+        if self._filter is not None:
+            return len(self._filter)
+        return len(self._items)
+
+    def _chunk_key(self, sequence: int) -> str:
+        return f"{self.key}:chunk:{sequence:010d}"
+
+    @property
+    def _snapshot_key(self) -> str:
+        return f"{self.key}:bloom"
+
+    def _remember(self, items: Iterable[object]) -> None:
+        if self._filter is not None:
+            for item in items:
+                self._filter.add(str(item))
+        else:
+            self._items.update(str(item) for item in items)
+
+    async def load(self, store: KeyValueStore) -> None:
+        """Load the legacy full list and every persisted chunk.
+
+        Args:
+            store: The key-value store to load from.
+        """
+        if self._filter is not None:
+            snapshot = await store.get(self._snapshot_key)
+            if isinstance(snapshot, dict) and isinstance(snapshot.get("filter"), str):
+                self._filter = BloomFilter.from_bytes(
+                    base64.b64decode(snapshot["filter"])
+                )
+                self._snapshot_sequence = int(snapshot.get("through", 0))
+                self._next_sequence = self._snapshot_sequence
+                self._has_snapshot = True
+
+        legacy = await store.get(self.key, [])
+        if isinstance(legacy, list):
+            self._remember(legacy)
+
+        # ";" sorts directly after ":" so this bounds the range to our chunks;
+        # chunks already folded into a filter snapshot are skipped
+        chunks = await store.range_get(
+            self._chunk_key(self._snapshot_sequence), end_key=f"{self.key}:chunk;"
+        )
+        for chunk_key, chunk in chunks:
+            if isinstance(chunk, list):
+                self._remember(chunk)
+            sequence = chunk_key.rsplit(":", 1)[-1]
+            if sequence.isdigit():
+                self._next_sequence = max(self._next_sequence, int(sequence) + 1)
+
+        # Chunks from earlier runs carry whatever TTL they were written with
+        await self._refresh_ttl(store)
+        self._loaded = True
+
+    def add(self, item: str) -> bool:
+        """Mark an item as processed.
+
+        Args:
+            item: The item identifier.
+
+        Returns:
+            True if the item was not already in the set.
+        """
+        if self._filter is not None:
+            if not self._filter.add(item):
+                return False
+        elif item in self._items:
+            return False
+        else:
+            self._items.add(item)
+        self._pending.append(item)
+        return True
+
+    def update(self, items: Iterable[str]) -> None:
+        """Mark several items as processed."""
+        for item in items:
+            self.add(item)
+
+    async def flush(self, store: KeyValueStore, *, force: bool = False) -> bool:
+        """Persist buffered items as a new chunk.
+
+        Args:
+            store: The key-value store to write to.
+            force: Write the buffered items even if fewer than ``batch_size``.
+
+        Returns:
+            True if a chunk was written.
+        """
+        if not self._pending or (not force and len(self._pending) < self.batch_size):
+            return False
+
+        chunk, self._pending = self._pending, []
+        try:
+            await store.put(self._chunk_key(self._next_sequence), chunk, ttl=self.ttl)
+        except Exception:
+            # Keep the items buffered so the next flush retries them
+            self._pending = chunk + self._pending
+            raise
+        self._next_sequence += 1
+
+        if (
+            self._filter is not None
+            and self._next_sequence - self._snapshot_sequence >= self.snapshot_interval
+        ):
+            await self._write_snapshot(store)
+        if self._ttl_due():
+            await self._refresh_ttl(store)
+        return True
+
+    def _ttl_due(self) -> bool:
+        if self.ttl is None:
+            return False
+        if self._ttl_refreshed_at is None:
+            return True
+        elapsed = time.monotonic() - self._ttl_refreshed_at
+        return elapsed >= self.ttl.total_seconds() / 2
+
+    async def _refresh_ttl(self, store: KeyValueStore) -> None:
+        """Restart the TTL of every stored chunk and of the filter snapshot."""
+        if self.ttl is None:
+            return
+        keys = [
+            self._chunk_key(sequence)
+            for sequence in range(self._snapshot_sequence, self._next_sequence)
+        ]
+        if self._has_snapshot:
+            keys.append(self._snapshot_key)
+        await store.expire_many(keys, self.ttl)
+        self._ttl_refreshed_at = time.monotonic()
+
+    async def _write_snapshot(self, store: KeyValueStore) -> None:
+        """Persist the filter and drop the journal chunks it now covers."""
+        if self._filter is None:
+            return
+        through = self._next_sequence
+        await store.put(
+            self._snapshot_key,
+            {
+                "through": through,
+                "filter": base64.b64encode(self._filter.to_bytes()).decode("ascii"),
+            },
+            ttl=self.ttl,
+        )
+        for sequence in range(self._snapshot_sequence, through):
+            await store.delete(self._chunk_key(sequence))
+        self._snapshot_sequence = through
+        self._has_snapshot = True
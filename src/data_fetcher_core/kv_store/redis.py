@@ -5,6 +5,7 @@ using Redis, including connection management and Redis-specific operations
 for application state persistence.
 """
 
+from collections.abc import AsyncIterator
 from datetime import timedelta
 from typing import Any, cast
 
@@ -25,12 +26,41 @@ class RedisConnectionError(RuntimeError):
         super().__init__("Redis connection failed")
 
 
+# Sets each field to the smaller ("min") or larger ("max") of its stored value
+# and the given one. ARGV: ttl in seconds (0 for none), then field, mode, value
+# triples.
+_UPDATE_EXTREMES_SCRIPT = """
+for i = 2, #ARGV, 3 do
+    local value = tonumber(ARGV[i + 2])
+    local current = tonumber(redis.call('HGET', KEYS[1], ARGV[i]))
+    if current == nil
+        or (ARGV[i + 1] == 'min' and value < current)
+        or (ARGV[i + 1] == 'max' and value > current) then
+        redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 2])
+    end
+end
+local ttl = tonumber(ARGV[1])
+if ttl > 0 then
+    redis.call('EXPIRE', KEYS[1], ttl)
+end
+return 0
+"""
+
+
+def _decode(value: str | bytes) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
 class RedisKeyValueStore(BaseKeyValueStore):
     """Redis state management implementation.
 
     This store uses Redis as the backend and provides persistent state storage
     with high performance. It supports TTL functionality and range queries
     for application state using Redis SCAN and ZRANGE operations.
+
+    With ``binary=True`` the connection does not decode responses, so values
+    are stored and read as bytes: pickles are kept as is instead of being
+    hex-encoded, and ``get_raw`` returns bytes.
     """
 
     def __init__(self, **kwargs: object) -> None:
@@ -63,7 +93,7 @@ class RedisKeyValueStore(BaseKeyValueStore):
                     "socket_timeout": self._timeout,
                     "socket_connect_timeout": self._timeout,
                     "max_connections": self._max_connections,
-                    "decode_responses": True,
+                    "decode_responses": not self._binary,
                 }
 
                 # Only add SSL if it's True
@@ -81,6 +111,24 @@ class RedisKeyValueStore(BaseKeyValueStore):
             except Exception as e:
                 raise ConnectionError(f"Redis failed: {e}") from e  # noqa: TRY003
 
+    async def get_client(self) -> redis.Redis:
+        """Get the connected Redis client.
+
+        Used by components that need Redis data structures beyond key-value
+        access (e.g. the distributed leased work queue). Keys written through
+        the client are not prefixed automatically; use ``key_prefix``. In
+        binary mode the client returns bytes rather than strings.
+        """
+        await self._ensure_connection()
+        if self._redis is None:
+            raise ConnectionError("Redis connection not established")  # noqa: TRY003
+        return self._redis
+
+    @property
+    def key_prefix(self) -> str:
+        """Prefix applied to every key written by this store."""
+        return self._key_prefix
+
     async def put(
         self,
         key: str,
@@ -90,13 +138,25 @@ class RedisKeyValueStore(BaseKeyValueStore):
         **_kwargs: object,
     ) -> None:
         """Store a value with the given key."""
-        await self._ensure_connection()
-
         # Serialize the value
         serialized_value = self._serialize(value)
 
-        # Apply key prefix
-        prefixed_key = self._get_prefixed_key(key, prefix)
+        await self._set(self._get_prefixed_key(key, prefix), serialized_value, ttl)
+
+    async def put_raw(
+        self,
+        key: str,
+        value: str | bytes,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Store an already encoded value as is, bypassing the serializer."""
+        await self._set(self._get_prefixed_key(key, prefix), value, ttl)
+
+    async def _set(
+        self, prefixed_key: str, value: str | bytes, ttl: int | timedelta | None
+    ) -> None:
+        await self._ensure_connection()
 
         # Store the value
         if self._redis is None:
@@ -107,11 +167,11 @@ class RedisKeyValueStore(BaseKeyValueStore):
         if ttl is not None:
             ttl_seconds = self._normalize_ttl(ttl)
             if ttl_seconds is not None:
-                await self._redis.setex(prefixed_key, ttl_seconds, serialized_value)
+                await self._redis.setex(prefixed_key, ttl_seconds, value)
             else:
-                await self._redis.set(prefixed_key, serialized_value)
+                await self._redis.set(prefixed_key, value)
         else:
-            await self._redis.set(prefixed_key, serialized_value)
+            await self._redis.set(prefixed_key, value)
 
     async def get(
         self,
@@ -139,6 +199,11 @@ class RedisKeyValueStore(BaseKeyValueStore):
         # Deserialize and return
         return self._deserialize(serialized_value)
 
+    async def get_raw(self, key: str, prefix: str | None = None) -> str | bytes | None:
+        """Retrieve a value written with ``put_raw`` without deserializing it."""
+        client = await self.get_client()
+        return await client.get(self._get_prefixed_key(key, prefix))
+
     async def delete(
         self, key: str, prefix: str | None = None, **_kwargs: object
     ) -> bool:
@@ -156,6 +221,31 @@ class RedisKeyValueStore(BaseKeyValueStore):
         result = await self._redis.delete(prefixed_key)
         return bool(result > 0)
 
+    async def expire(
+        self, key: str, ttl: int | timedelta, prefix: str | None = None
+    ) -> bool:
+        """Set the time-to-live of an existing key with EXPIRE."""
+        client = await self.get_client()
+        ttl_seconds = int(ttl.total_seconds()) if isinstance(ttl, timedelta) else ttl
+        return bool(
+            await client.expire(self._get_prefixed_key(key, prefix), ttl_seconds)
+        )
+
+    async def expire_many(
+        self, keys: list[str], ttl: int | timedelta, prefix: str | None = None
+    ) -> int:
+        """Set the time-to-live of several keys with pipelined EXPIREs."""
+        if not keys:
+            return 0
+        client = await self.get_client()
+        ttl_seconds = int(ttl.total_seconds()) if isinstance(ttl, timedelta) else ttl
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(self._get_prefixed_key(key, prefix), ttl_seconds)
+            results = await pipe.execute()
+        return sum(1 for result in results if result)
+
     async def exists(
         self, key: str, prefix: str | None = None, **_kwargs: object
     ) -> bool:
@@ -179,6 +269,8 @@ class RedisKeyValueStore(BaseKeyValueStore):
         end_key: str | None = None,
         limit: int | None = None,
         prefix: str | None = None,
+        *,
+        raw: bool = False,
         **_kwargs: object,
     ) -> list[tuple[str, Any]]:
         """Get a range of key-value pairs."""
@@ -207,7 +299,8 @@ class RedisKeyValueStore(BaseKeyValueStore):
                 cursor=cursor, match=scan_pattern, count=100
             )
 
-            for key in keys:
+            for scanned_key in keys:
+                key = _decode(scanned_key)
                 # Remove prefix for comparison
                 original_key = (
                     key[len(effective_prefix) :]
@@ -221,11 +314,16 @@ class RedisKeyValueStore(BaseKeyValueStore):
                 if prefixed_end_key and key >= prefixed_end_key:
                     continue
 
-                # Get the value
-                value = await self._redis.get(key)
+                # Get the value; hashes and lists (e.g. StateTracker timings or
+                # the leased work queue) are not plain values and are skipped
+                try:
+                    value = await self._redis.get(key)
+                except redis.ResponseError:
+                    continue
                 if value is not None:
-                    deserialized_value = self._deserialize(value)
-                    result.append((original_key, deserialized_value))
+                    result.append(
+                        (original_key, value if raw else self._deserialize(value))
+                    )
 
                 # Apply limit
                 if limit is not None and len(result) >= limit:
@@ -241,6 +339,143 @@ class RedisKeyValueStore(BaseKeyValueStore):
         result.sort(key=lambda x: x[0])
         return result
 
+    async def iter_range(
+        self,
+        start_key: str,
+        end_key: str | None = None,
+        batch_size: int = 100,
+        prefix: str | None = None,
+        *,
+        raw: bool = False,
+    ) -> AsyncIterator[list[tuple[str, Any]]]:
+        """Stream a range of key-value pairs, one SCAN page at a time.
+
+        Values of each page are read with a single MGET, which returns nothing
+        for hashes and lists, so those are skipped like in ``range_get``.
+        """
+        client = await self.get_client()
+        effective_prefix = prefix if prefix is not None else self._key_prefix
+        scan_pattern = f"{effective_prefix}*" if effective_prefix else "*"
+
+        cursor = 0
+        while True:
+            cursor, keys = await client.scan(
+                cursor=cursor, match=scan_pattern, count=batch_size
+            )
+            in_range: list[tuple[str, str]] = []
+            for scanned_key in keys:
+                key = _decode(scanned_key)
+                original_key = (
+                    key[len(effective_prefix) :]
+                    if effective_prefix and key.startswith(effective_prefix)
+                    else key
+                )
+                if original_key < start_key:
+                    continue
+                if end_key is not None and original_key >= end_key:
+                    continue
+                in_range.append((key, original_key))
+
+            if in_range:
+                values = await client.mget([key for key, _ in in_range])
+                batch = [
+                    (original_key, value if raw else self._deserialize(value))
+                    for (_, original_key), value in zip(in_range, values, strict=True)
+                    if value is not None
+                ]
+                if batch:
+                    yield batch
+
+            if cursor == 0:
+                break
+
+    async def increment(
+        self,
+        key: str,
+        amount: int = 1,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        """Atomically add to an integer counter with INCRBY."""
+        client = await self.get_client()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+        ttl_seconds = self._normalize_ttl(ttl)
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.incrby(prefixed_key, amount)
+            if ttl_seconds is not None:
+                pipe.expire(prefixed_key, ttl_seconds)
+            results = await pipe.execute()
+        return int(results[0])
+
+    async def get_counter(self, key: str, prefix: str | None = None) -> int:
+        """Get an integer counter written with ``increment`` (0 if missing)."""
+        client = await self.get_client()
+        value = await client.get(self._get_prefixed_key(key, prefix))
+        return int(value) if value is not None else 0
+
+    async def hash_increment(
+        self,
+        key: str,
+        increments: dict[str, float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically add to numeric hash fields with HINCRBYFLOAT."""
+        client = await self.get_client()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+        ttl_seconds = self._normalize_ttl(ttl)
+
+        async with client.pipeline(transaction=False) as pipe:
+            for field, amount in increments.items():
+                pipe.hincrbyfloat(prefixed_key, field, amount)
+            if ttl_seconds is not None:
+                pipe.expire(prefixed_key, ttl_seconds)
+            await pipe.execute()
+
+    async def hash_set(
+        self,
+        key: str,
+        values: dict[str, str | float],
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Set fields of a hash with HSET, leaving other fields unchanged."""
+        client = await self.get_client()
+        prefixed_key = self._get_prefixed_key(key, prefix)
+        ttl_seconds = self._normalize_ttl(ttl)
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(prefixed_key, mapping={k: str(v) for k, v in values.items()})
+            if ttl_seconds is not None:
+                pipe.expire(prefixed_key, ttl_seconds)
+            await pipe.execute()
+
+    async def hash_update_extremes(
+        self,
+        key: str,
+        minimums: dict[str, float] | None = None,
+        maximums: dict[str, float] | None = None,
+        ttl: int | timedelta | None = None,
+        prefix: str | None = None,
+    ) -> None:
+        """Atomically lower or raise numeric hash fields with a Lua script."""
+        client = await self.get_client()
+        ttl_seconds = self._normalize_ttl(ttl)
+        args: list[str] = [str(ttl_seconds or 0)]
+        for mode, values in (("min", minimums or {}), ("max", maximums or {})):
+            for field, value in values.items():
+                args.extend((field, mode, repr(float(value))))
+        await client.eval(
+            _UPDATE_EXTREMES_SCRIPT, 1, self._get_prefixed_key(key, prefix), *args
+        )
+
+    async def hash_get_all(self, key: str, prefix: str | None = None) -> dict[str, str]:
+        """Get every field of a hash as strings (empty if missing)."""
+        client = await self.get_client()
+        result = await client.hgetall(self._get_prefixed_key(key, prefix))
+        return {_decode(field): _decode(value) for field, value in result.items()}
+
     async def close(self) -> None:
         """Close the store and release resources."""
         if self._redis is not None:
@@ -313,7 +548,7 @@ class RedisKeyValueStore(BaseKeyValueStore):
 
             # Remove prefix from keys
             for key in batch_keys:
-                original_key = key[len(self._key_prefix) :]
+                original_key = _decode(key)[len(self._key_prefix) :]
                 keys.append(original_key)
 
             if cursor == 0:
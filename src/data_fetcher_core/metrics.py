@@ -0,0 +1,145 @@
+"""Prometheus metrics for the key stages of a fetch run.
+
+This module defines the ``prometheus_client`` counters, gauges and histograms
+recorded by the framework (queue depth, locator latency, loader
+time-to-first-byte, bytes transferred, S3 part uploads, retries, rate-limiter
+waits and pool utilization). They are registered in a process-wide registry
+that the ``/metrics`` endpoint of the health app renders with
+``generate_latest``.
+
+Each process has its own registry; in multi-process mode the coordinator only
+reports the metrics it records itself.
+"""
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_registry = CollectorRegistry()
+
+
+def get_metrics_registry() -> CollectorRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+def render_metrics(registry: CollectorRegistry | None = None) -> str:
+    """Render a registry in the Prometheus text exposition format.
+
+    Args:
+        registry: Registry to render. Defaults to the process-wide registry.
+
+    Returns:
+        The metrics in the Prometheus text format.
+    """
+    return generate_latest(registry or _registry).decode("utf-8")
+
+
+# Metrics recorded by the framework
+
+QUEUE_DEPTH = Gauge(
+    "data_fetcher_queue_depth",
+    "Bundle refs waiting in the work queue",
+    registry=_registry,
+)
+BUNDLES_TOTAL = Counter(
+    "data_fetcher_bundles_total",
+    "Bundles processed by outcome",
+    ("outcome",),
+    registry=_registry,
+)
+BUNDLE_DURATION = Histogram(
+    "data_fetcher_bundle_duration_seconds",
+    "Time to load and store one bundle",
+    buckets=DEFAULT_BUCKETS,
+    registry=_registry,
+)
+BUNDLE_TIMEOUTS = Counter(
+    "data_fetcher_bundle_timeouts_total",
+    "Bundle loads cancelled by their deadline or stall detection",
+    ("reason",),
+    registry=_registry,
+)
+SPECULATIVE_ATTEMPTS = Counter(
+    "data_fetcher_speculative_attempts_total",
+    "Duplicate attempts started for straggler bundles, and those that won",
+    ("outcome",),
+    registry=_registry,
+)
+LOCATOR_LATENCY = Histogram(
+    "data_fetcher_locator_latency_seconds",
+    "Time for a locator to return the next bundle refs",
+    ("locator",),
+    buckets=DEFAULT_BUCKETS,
+    registry=_registry,
+)
+LOADER_TTFB = Histogram(
+    "data_fetcher_loader_ttfb_seconds",
+    "Time from issuing a request to receiving the first byte",
+    ("protocol",),
+    buckets=DEFAULT_BUCKETS,
+    registry=_registry,
+)
+BYTES_TRANSFERRED = Counter(
+    "data_fetcher_bytes_transferred_total",
+    "Bytes downloaded from data sources",
+    ("protocol",),
+    registry=_registry,
+)
+S3_PART_UPLOAD_LATENCY = Histogram(
+    "data_fetcher_s3_part_upload_seconds",
+    "Latency of S3 multipart part uploads",
+    buckets=DEFAULT_BUCKETS,
+    registry=_registry,
+)
+RETRIES_TOTAL = Counter(
+    "data_fetcher_retries_total",
+    "Retried attempts and exhausted retries",
+    ("outcome",),
+    registry=_registry,
+)
+RATE_LIMIT_WAIT = Histogram(
+    "data_fetcher_rate_limiter_wait_seconds",
+    "Time spent waiting on rate limiters and gates",
+    ("protocol",),
+    buckets=DEFAULT_BUCKETS,
+    registry=_registry,
+)
+POOL_CONNECTIONS_OPEN = Gauge(
+    "data_fetcher_pool_connections_open",
+    "Connections opened by the connection pools",
+    ("protocol",),
+    registry=_registry,
+)
+POOL_CONNECTIONS_IN_USE = Gauge(
+    "data_fetcher_pool_connections_in_use",
+    "Connections currently leased from the connection pools",
+    ("protocol",),
+    registry=_registry,
+)
+HTTP_HEDGED_REQUESTS = Counter(
+    "data_fetcher_http_hedged_requests_total",
+    "Hedge-eligible HTTP requests and the hedges sent, won or skipped",
+    ("outcome",),
+    registry=_registry,
+)
@@ -0,0 +1,446 @@
+"""Multi-process fetcher execution mode.
+
+This module provides MultiProcessFetcher, which runs locators in a coordinator
+process and spreads bundle loading across several worker processes. Storage
+decorators do CPU-bound work (decompression, hashing, JSON), so a single
+process caps throughput at one core; worker processes each run their own event
+loop, connection pools and storage while all locator state stays in the
+coordinator.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import queue as queue_module
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import structlog
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.exceptions import (
+    BundleTimeoutError,
+    ConfigurationError,
+    FatalError,
+)
+from data_fetcher_core.fetcher import Fetcher, FetchResult
+from data_fetcher_core.queue import BundleRefSerializer
+from data_fetcher_core.tracing import configure_tracer, get_tracer
+from data_fetcher_core.watchdog import load_with_watchdog
+
+if TYPE_CHECKING:
+    from multiprocessing.context import ForkContext, ForkServerContext, SpawnContext
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue as ProcessQueue
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Builds the fetch plan inside a worker process. Must be a module-level
+# function so it can be pickled by reference for the "spawn" start method.
+PlanBuilder = Callable[[dict[str, Any]], Awaitable[FetchPlan]]
+
+_POLL_INTERVAL_SECONDS = 0.1
+
+_MSG_PROCESSED = "processed"
+_MSG_ERROR = "error"
+_MSG_DONE = "done"
+
+
+@dataclass
+class _ProcessWorkQueue:
+    """RequestQueue adapter that hands bundles to worker processes.
+
+    ``size`` reports bundles that have been handed out but whose result has not
+    yet come back, so the locator thread keeps ``target_queue_size`` bundles
+    outstanding across all worker processes.
+    """
+
+    work_queue: ProcessQueue[str | None]
+    serializer: BundleRefSerializer = field(default_factory=BundleRefSerializer)
+    outstanding: int = 0
+
+    async def enqueue(self, items: Iterable[object]) -> int:
+        count = 0
+        for item in items:
+            self.work_queue.put(self.serializer.dumps(item))
+            count += 1
+        self.outstanding += count
+        return count
+
+    async def dequeue(self, max_items: int = 1) -> list[object]:  # noqa: ARG002
+        # Bundles are only dequeued by worker processes
+        return []
+
+    async def peek(self, max_items: int = 1) -> list[object]:  # noqa: ARG002
+        return []
+
+    async def size(self) -> int:
+        return self.outstanding
+
+    async def clear(self) -> int:
+        return 0
+
+    async def close(self) -> None:
+        return None
+
+
+class MultiProcessFetcher(Fetcher):
+    """Fetcher that loads bundles in several worker processes.
+
+    The coordinator (the calling process) runs the locators exactly as
+    ``Fetcher`` does and sends serialized bundle refs to a shared
+    ``multiprocessing`` queue. Each worker process rebuilds its own plan with
+    ``plan_builder(builder_args)``, then runs ``plan.concurrency`` loader tasks.
+    Results and errors are sent back so the coordinator can notify locators and
+    aggregate a single ``FetchResult``.
+    """
+
+    track_queue_wait = False
+
+    def __init__(
+        self,
+        processes: int,
+        plan_builder: PlanBuilder,
+        builder_args: dict[str, Any],
+        start_method: Literal["spawn", "fork", "forkserver"] = "spawn",
+    ) -> None:
+        """Initialize the multi-process fetcher.
+
+        Args:
+            processes: Number of worker processes.
+            plan_builder: Module-level coroutine function building the plan in
+                each worker process.
+            builder_args: Picklable arguments passed to ``plan_builder``.
+            start_method: Multiprocessing start method. "spawn" avoids forking
+                a process that already holds event loops and open sockets.
+        """
+        super().__init__()
+        if processes < 1:
+            raise ValueError("processes must be at least 1")  # noqa: TRY003
+        self.processes = processes
+        self.plan_builder = plan_builder
+        self.builder_args = builder_args
+        self.start_method = start_method
+
+    async def run(self, plan: FetchPlan) -> FetchResult:
+        """Run the locators here and load bundles in worker processes.
+
+        Args:
+            plan: The coordinator's fetch plan; its loader is not used.
+
+        Returns:
+            FetchResult aggregated across all worker processes.
+        """
+        run_ctx = plan.context
+        if not run_ctx.run_id:
+            error_message = "run_id is required in FetchRunContext but was not provided"
+            raise ConfigurationError(error_message, "fetch_run_context")
+        if not plan.config.locators:
+            error_message = "No locators configured in the fetcher configuration"
+            raise ConfigurationError(error_message, "locators")
+
+        # get_context is only typed per literal; each of these contexts has Process
+        mp_context = cast(
+            "SpawnContext | ForkContext | ForkServerContext",
+            multiprocessing.get_context(self.start_method),
+        )
+        work_queue: ProcessQueue[str | None] = mp_context.Queue()
+        result_queue: ProcessQueue[str] = mp_context.Queue()
+        processes: list[BaseProcess] = [
+            mp_context.Process(
+                target=_worker_process_main,
+                args=(
+                    index,
+                    self.plan_builder,
+                    self.builder_args,
+                    work_queue,
+                    result_queue,
+                    get_tracer().settings,
+                ),
+                name=f"fetcher-worker-{index}",
+                daemon=True,
+            )
+            for index in range(self.processes)
+        ]
+        for process in processes:
+            process.start()
+
+        logger.info(
+            "MULTIPROCESS_FETCHER_RUN_STARTED",
+            run_id=run_ctx.run_id,
+            processes=self.processes,
+            target_queue_size=plan.target_queue_size,
+            locators=len(plan.config.locators),
+        )
+
+        adapter = _ProcessWorkQueue(work_queue=work_queue)
+        completion_flag = asyncio.Event()
+        locator_task = asyncio.create_task(
+            self._locator_thread(
+                adapter,
+                completion_flag,
+                plan.target_queue_size,
+                plan.config,
+                run_ctx,
+            )
+        )
+
+        try:
+            await self._collect_results(
+                plan, adapter, result_queue, processes, locator_task
+            )
+            await locator_task
+        finally:
+            if not locator_task.done():
+                locator_task.cancel()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                await asyncio.to_thread(process.join)
+            work_queue.close()
+            result_queue.close()
+
+        logger.info(
+            "MULTIPROCESS_FETCHER_RUN_COMPLETED",
+            run_id=run_ctx.run_id,
+            processed_count=run_ctx.processed_count,
+            error_count=len(run_ctx.errors),
+        )
+
+        for provider in plan.config.locators:
+            await self._run_end_hook(provider, run_ctx)
+
+        if run_ctx.processed_count == 0 and run_ctx.errors:
+            error_message = (
+                f"Fetch run failed with {len(run_ctx.errors)} error(s) "
+                "and 0 items processed"
+            )
+            raise FatalError(error_message)
+
+        return FetchResult(
+            processed_count=run_ctx.processed_count,
+            errors=run_ctx.errors,
+            context=run_ctx,
+        )
+
+    async def _collect_results(
+        self,
+        plan: FetchPlan,
+        adapter: _ProcessWorkQueue,
+        result_queue: ProcessQueue[str],
+        processes: list[BaseProcess],
+        locator_task: asyncio.Task[None],
+    ) -> None:
+        """Apply worker results to the locators until every worker has finished."""
+        serializer = adapter.serializer
+        finished: set[int] = set()
+        stop_sent = False
+
+        while len(finished) < len(processes):
+            if locator_task.done() and locator_task.exception() is not None:
+                return
+
+            if not stop_sent and locator_task.done() and adapter.outstanding == 0:
+                for _ in processes:
+                    adapter.work_queue.put(None)
+                stop_sent = True
+
+            try:
+                raw = await asyncio.to_thread(
+                    result_queue.get, block=True, timeout=_POLL_INTERVAL_SECONDS
+                )
+            except queue_module.Empty:
+                for index, process in enumerate(processes):
+                    if index not in finished and process.exitcode is not None:
+                        error_message = (
+                            f"Worker process {process.name} exited unexpectedly "
+                            f"with code {process.exitcode}"
+                        )
+                        raise FatalError(error_message) from None
+                continue
+
+            message = json.loads(raw)
+            kind = message["type"]
+            if kind == _MSG_DONE:
+                finished.add(int(message["worker"]))
+                if not stop_sent:
+                    # A worker that stops early leaves bundles nobody will ack
+                    error_message = (
+                        f"Worker process {message['worker']} stopped before the run "
+                        f"completed: {message.get('error') or 'no error reported'}"
+                    )
+                    raise FatalError(error_message)
+                continue
+
+            adapter.outstanding -= 1
+            bundle = serializer.loads(message["bundle"])
+            if kind == _MSG_PROCESSED:
+                await self._apply_processed(bundle, message, plan, plan.context)
+            else:
+                error_msg = str(message["error"])
+                plan.context.errors.append(error_msg)
+                await self._notify_bundle_error(
+                    bundle, error_msg, plan.config, plan.context
+                )
+
+    async def _apply_processed(
+        self,
+        bundle: BundleRef,
+        message: dict[str, Any],
+        plan: FetchPlan,
+        run_ctx: FetchRunContext,
+    ) -> None:
+        """Notify locators of a bundle a worker process loaded successfully."""
+        load_result = BundleLoadResult(
+            bundle=bundle,
+            bundle_meta=message.get("bundle_meta") or {},
+            resources=message.get("resources") or [],
+        )
+        try:
+            for provider in plan.config.locators:
+                if hasattr(provider, "handle_bundle_processed"):
+                    await provider.handle_bundle_processed(bundle, load_result, run_ctx)
+        except Exception as e:
+            error_msg = f"Error processing bundle {bundle.bid!s}: {e!s}"
+            logger.exception(
+                "REQUEST_PROCESSING_ERROR",
+                bid=str(bundle.bid),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            run_ctx.errors.append(error_msg)
+            await self._notify_bundle_error(bundle, error_msg, plan.config, run_ctx)
+            return
+        run_ctx.processed_count += 1
+
+
+def _worker_process_main(
+    worker_index: int,
+    plan_builder: PlanBuilder,
+    builder_args: dict[str, Any],
+    work_queue: ProcessQueue[str | None],
+    result_queue: ProcessQueue[str],
+    tracer_settings: dict[str, Any],
+) -> None:
+    """Entry point of a worker process."""
+    done: dict[str, Any] = {"type": _MSG_DONE, "worker": worker_index}
+    # Spans go to the coordinator's export file, next to its own spans
+    tracer = configure_tracer(**tracer_settings, append=True)
+    try:
+        asyncio.run(
+            _worker_process_async(
+                worker_index, plan_builder, builder_args, work_queue, result_queue
+            )
+        )
+    except BaseException as e:
+        logger.exception("WORKER_PROCESS_FAILED", process_index=worker_index)
+        done["error"] = f"{type(e).__name__}: {e!s}"
+        raise
+    finally:
+        tracer.shutdown()
+        result_queue.put(json.dumps(done))
+
+
+async def _load_bundle(
+    bundle: BundleRef,
+    storage: object,
+    run_ctx: FetchRunContext,
+    config: DataRegistryFetcherConfig,
+) -> BundleLoadResult:
+    """Load a bundle, trying again in place when it times out.
+
+    The coordinator may already have sent the stop signals, so a bundle that
+    hits its deadline or stalls is retried here instead of being re-queued.
+    """
+    for attempt in range(config.max_bundle_requeues):
+        try:
+            return await load_with_watchdog(bundle, storage, run_ctx, config)
+        except BundleTimeoutError:
+            logger.warning("BUNDLE_RETRIED", bid=str(bundle.bid), attempt=attempt + 1)
+    return await load_with_watchdog(bundle, storage, run_ctx, config)
+
+
+async def _worker_process_async(
+    worker_index: int,
+    plan_builder: PlanBuilder,
+    builder_args: dict[str, Any],
+    work_queue: ProcessQueue[str | None],
+    result_queue: ProcessQueue[str],
+) -> None:
+    """Load bundles from the shared work queue until told to stop."""
+    plan = await plan_builder(builder_args)
+    run_ctx = plan.context
+    storage = run_ctx.app_config.storage if run_ctx.app_config else None
+    if storage is not None and hasattr(storage, "on_run_start"):
+        await storage.on_run_start(run_ctx, plan.config)
+    loader = plan.config.loader
+    if hasattr(loader, "on_run_start"):
+        await loader.on_run_start(run_ctx)
+
+    worker_logger = logger.bind(process_index=worker_index)
+    worker_logger.info("WORKER_PROCESS_STARTED", concurrency=plan.concurrency)
+
+    serializer = BundleRefSerializer()
+    # A single-slot hand-off keeps one process from hoarding shared work
+    local_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1)
+
+    async def feed() -> None:
+        while True:
+            try:
+                raw = await asyncio.to_thread(
+                    work_queue.get, block=True, timeout=_POLL_INTERVAL_SECONDS
+                )
+            except queue_module.Empty:
+                continue
+            if raw is None:
+                for _ in range(plan.concurrency):
+                    await local_queue.put(None)
+                return
+            await local_queue.put(raw)
+
+    async def work() -> None:
+        while (raw := await local_queue.get()) is not None:
+            bundle = serializer.loads(raw)
+            message: dict[str, Any] = {"bundle": raw}
+            try:
+                if storage is None:
+                    error_message = "Storage is required in app_config but was None"
+                    raise ConfigurationError(error_message, "storage")  # noqa: TRY301
+                with get_tracer().span("bundle", bid=str(bundle.bid)):
+                    load_result = await _load_bundle(
+                        bundle, storage, run_ctx, plan.config
+                    )
+                message.update(
+                    type=_MSG_PROCESSED,
+                    bundle_meta=dict(load_result.bundle_meta),
+                    resources=load_result.resources,
+                )
+            except Exception as e:
+                worker_logger.exception(
+                    "REQUEST_PROCESSING_ERROR",
+                    bid=str(bundle.bid),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                message.update(
+                    type=_MSG_ERROR,
+                    error=f"Error processing bundle {bundle.bid!s}: {e!s}",
+                )
+            result_queue.put(json.dumps(message, default=str))
+
+    await asyncio.gather(feed(), *(work() for _ in range(plan.concurrency)))
+    # Flush and close this process's storage and loader as Fetcher.run does
+    for component in (storage, loader):
+        await Fetcher._run_end_hook(component, run_ctx)  # noqa: SLF001
+    get_tracer().log_summary()
+    worker_logger.info("WORKER_PROCESS_COMPLETED")
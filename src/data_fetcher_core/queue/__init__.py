@@ -7,14 +7,19 @@ enabling resumable operations without re-querying remote data providers.
 from .base import RequestQueue, Serializer
 from .in_memory_queue import InMemoryQueue
 from .kv_store_queue import KVStoreQueue
+from .leased_queue import Lease, RedisLeasedQueue
 from .serializers import BundleRefSerializer, JSONSerializer, RequestMetaSerializer
+from .weighted_fair_queue import WeightedFairQueue
 
 __all__ = [
     "BundleRefSerializer",
     "InMemoryQueue",
     "JSONSerializer",
     "KVStoreQueue",
+    "Lease",
+    "RedisLeasedQueue",
     "RequestMetaSerializer",
     "RequestQueue",
     "Serializer",
+    "WeightedFairQueue",
 ]
@@ -8,6 +8,7 @@ Includes automatic recovery from inconsistencies and compensating actions for fa
 from __future__ import annotations
 
 import asyncio
+import json
 from typing import TYPE_CHECKING, cast
 
 import structlog
@@ -29,7 +30,7 @@ class KVStoreQueue:
     """Queue implementation using KeyValueStore for persistence with recovery.
 
     Uses a simple counter-based approach:
-    - queue:items:{id} -> serialized item
+    - queue:items:{id} -> serialized item, stored raw so it is encoded once
     - queue:next_id -> next available ID
     - queue:size -> current queue size
 
@@ -94,6 +95,21 @@ class KVStoreQueue:
         """
         return f"{self._ns}:items:{item_id}"
 
+    def _loads(self, data: str | bytes) -> object:
+        """Deserialize an item read from the store.
+
+        Items written before they were stored raw went through the store's
+        JSON serializer too, and are unwrapped first.
+        """
+        text = data.decode("utf-8") if isinstance(data, bytes) else data
+        try:
+            return self._ser.loads(text)
+        except (ValueError, TypeError, AttributeError):
+            legacy = json.loads(text)
+            if not isinstance(legacy, str):
+                raise
+            return self._ser.loads(legacy)
+
     async def _ensure_initialized(self) -> None:
         """Ensure queue is initialized and recovered."""
         if not self._initialized:
@@ -111,7 +127,10 @@ class KVStoreQueue:
             
             # Scan for actual items in the queue
             items_prefix = f"{self._ns}:items:"
-            actual_items = await self._kv.range_get(items_prefix)
+            # ";" sorts directly after ":" so this bounds the scan to our items
+            actual_items = await self._kv.range_get(
+                items_prefix, end_key=f"{self._ns}:items;", raw=True
+            )
             
             if actual_items:
                 # Find the actual range of items
@@ -215,7 +234,9 @@ class KVStoreQueue:
                     for item in items_list:
                         try:
                             serialized_item = self._ser.dumps(item)
-                            await self._kv.put(self._item_key(next_id), serialized_item)
+                            await self._kv.put_raw(
+                                self._item_key(next_id), serialized_item
+                            )
                             stored_item_ids.append(next_id)
                             next_id += 1
                         except Exception as e:
@@ -294,9 +315,9 @@ class KVStoreQueue:
                         item_key = self._item_key(item_id)
                         
                         try:
-                            item_data = await self._kv.get(item_key)
+                            item_data = await self._kv.get_raw(item_key)
                             if item_data is not None:
-                                deserialized_item = self._ser.loads(cast("str", item_data))
+                                deserialized_item = self._loads(item_data)
                                 results.append(deserialized_item)
                                 await self._kv.delete(item_key)
                                 deleted_item_ids.append(item_id)
@@ -382,9 +403,9 @@ class KVStoreQueue:
         for i in range(items_to_get):
             item_id = start_id + i
             item_key = self._item_key(item_id)
-            item_data = await self._kv.get(item_key)
+            item_data = await self._kv.get_raw(item_key)
             if item_data is not None:
-                results.append(self._ser.loads(cast("str", item_data)))
+                results.append(self._loads(item_data))
 
         return results
 
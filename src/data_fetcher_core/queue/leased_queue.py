@@ -0,0 +1,383 @@
+"""Redis-backed work queue with leases for distributed fetching.
+
+This module provides RedisLeasedQueue, a queue shared by fetcher replicas on
+several nodes. Workers claim items under a lease that they keep alive with a
+heartbeat; items whose lease expires (e.g. because the pod died) are delivered
+again. A leader lock lets exactly one replica run the locators at a time.
+
+Delivery is at-least-once: an item can be processed twice if a lease expires
+while its worker is still running, so loaders and storage must be idempotent
+per bundle ID.
+
+Runs that share a namespace (e.g. successive runs of the same data registry)
+reuse its keys, so once a run completes they are set to expire: a new run
+started after that starts from an empty queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from data_fetcher_core.exceptions import ConfigurationError, LeadershipLostError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .base import Serializer
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Keys describing a run, expired once it completes
+_RUN_KEYS = (
+    "items",
+    "pending",
+    "processing",
+    "leases",
+    "next_id",
+    "leader",
+    "locators_done",
+)
+
+
+@dataclass(frozen=True)
+class Lease:
+    """An item claimed from the queue, held until acked or released."""
+
+    item_id: str
+    item: object
+
+
+def _text(value: object) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+class RedisLeasedQueue:
+    """Distributed queue with leased delivery on top of Redis.
+
+    Uses the following keys under ``namespace``:
+
+    - ``items``: hash of item id -> serialized item
+    - ``pending``: list of item ids waiting to be claimed
+    - ``processing``: list of claimed item ids
+    - ``leases``: sorted set of claimed item id -> lease expiry (epoch ms)
+    - ``leader``: lock held by the replica running the locators
+    - ``locators_done``: set once the locators are exhausted
+
+    Claims move ids from ``pending`` to ``processing`` with ``LMOVE`` so two
+    replicas can never claim the same id. A claimed id that has no lease (the
+    claimer died between ``LMOVE`` and ``ZADD``) is given one by the reaper so
+    it eventually expires and is delivered again.
+
+    The leader publishes the locators' work with ``publish``, which checks
+    that it still holds the ``leader`` lock before every batch.
+    """
+
+    def __init__(
+        self,
+        client: Any,  # noqa: ANN401
+        namespace: str,
+        serializer: Serializer,
+        lease_ttl_seconds: float = 60.0,
+        heartbeat_interval_seconds: float | None = None,
+        consumer_id: str | None = None,
+    ) -> None:
+        """Initialize the leased queue.
+
+        Args:
+            client: An async Redis client (``redis.asyncio.Redis`` compatible).
+            namespace: Namespace shared by every replica of the same run.
+            serializer: Serializer for queue items.
+            lease_ttl_seconds: How long a claim survives without a heartbeat.
+            heartbeat_interval_seconds: Interval between lease renewals and
+                reaper passes. Defaults to a third of the lease TTL.
+            consumer_id: Identifier of this replica, for logging and leadership.
+        """
+        if not namespace or not namespace.strip():
+            error_message = "namespace must be a non-empty string"
+            raise ConfigurationError(error_message, "queue")
+        if lease_ttl_seconds <= 0:
+            error_message = "lease_ttl_seconds must be positive"
+            raise ConfigurationError(error_message, "queue")
+
+        self._client = client
+        self._ns = namespace.strip()
+        self._ser = serializer
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.heartbeat_interval_seconds = (
+            heartbeat_interval_seconds
+            if heartbeat_interval_seconds is not None
+            else lease_ttl_seconds / 3
+        )
+        self.consumer_id = consumer_id or uuid.uuid4().hex
+        self._held: set[str] = set()
+        self._is_leader = False
+        self._maintenance_task: asyncio.Task[None] | None = None
+
+    def _key(self, name: str) -> str:
+        return f"{self._ns}:{name}"
+
+    def _expiry_ms(self) -> int:
+        return int((time.time() + self.lease_ttl_seconds) * 1000)
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this replica currently holds the locator leadership."""
+        return self._is_leader
+
+    async def enqueue(self, items: Iterable[object]) -> int:
+        """Add items to the queue.
+
+        Args:
+            items: Iterable of items to add to the queue.
+
+        Returns:
+            Number of items enqueued.
+        """
+        count = 0
+        for item in items:
+            item_id = str(await self._client.incr(self._key("next_id")))
+            # Store the payload before publishing its id so a claimer never
+            # sees an id without an item
+            await self._client.hset(self._key("items"), item_id, self._ser.dumps(item))
+            await self._client.rpush(self._key("pending"), item_id)
+            count += 1
+        return count
+
+    async def publish(self, items: Iterable[object]) -> int:
+        """Add items found by the locators, while holding the leadership.
+
+        Args:
+            items: Iterable of items to add to the queue.
+
+        Returns:
+            Number of items enqueued.
+
+        Raises:
+            LeadershipLostError: If another replica has taken over the locators.
+        """
+        await self._ensure_leadership()
+        return await self.enqueue(items)
+
+    async def claim(self, max_items: int = 1) -> list[Lease]:
+        """Claim up to ``max_items`` items under a lease.
+
+        Args:
+            max_items: Maximum number of items to claim.
+
+        Returns:
+            The leases for the claimed items.
+        """
+        leases: list[Lease] = []
+        for _ in range(max_items):
+            item_id = _text(
+                await self._client.lmove(
+                    self._key("pending"), self._key("processing"), "LEFT", "RIGHT"
+                )
+            )
+            if item_id is None:
+                break
+            await self._client.zadd(self._key("leases"), {item_id: self._expiry_ms()})
+            self._held.add(item_id)
+
+            data = _text(await self._client.hget(self._key("items"), item_id))
+            if data is None:
+                # Payload already acked by a replica whose lease had expired
+                await self.ack(item_id)
+                continue
+            leases.append(Lease(item_id=item_id, item=self._ser.loads(data)))
+        return leases
+
+    async def dequeue(self, max_items: int = 1) -> list[object]:
+        """Claim items and return them without their leases.
+
+        Callers using this method cannot ack, so the items are delivered again
+        once their leases expire; prefer ``claim`` and ``ack``.
+        """
+        return [lease.item for lease in await self.claim(max_items)]
+
+    async def ack(self, lease: Lease | str) -> None:
+        """Mark a claimed item as done and remove it from the queue."""
+        item_id = lease.item_id if isinstance(lease, Lease) else lease
+        await self._client.zrem(self._key("leases"), item_id)
+        await self._client.lrem(self._key("processing"), 1, item_id)
+        await self._client.hdel(self._key("items"), item_id)
+        self._held.discard(item_id)
+
+    async def release(self, lease: Lease | str) -> None:
+        """Give up a claimed item so another worker can claim it."""
+        item_id = lease.item_id if isinstance(lease, Lease) else lease
+        if await self._client.zrem(self._key("leases"), item_id):
+            await self._client.rpush(self._key("pending"), item_id)
+            await self._client.lrem(self._key("processing"), 1, item_id)
+        self._held.discard(item_id)
+
+    async def heartbeat(self) -> int:
+        """Extend the leases of every item this replica holds.
+
+        Returns:
+            Number of leases extended. Leases that were already reaped are
+            dropped; their items have been delivered again.
+        """
+        extended = 0
+        expiry = self._expiry_ms()
+        for item_id in list(self._held):
+            if await self._client.zadd(
+                self._key("leases"), {item_id: expiry}, xx=True, ch=True
+            ):
+                extended += 1
+            elif await self._client.zscore(self._key("leases"), item_id) is None:
+                logger.warning("LEASE_LOST", item_id=item_id, namespace=self._ns)
+                self._held.discard(item_id)
+        return extended
+
+    async def reap_expired(self) -> int:
+        """Deliver again every item whose lease has expired.
+
+        Returns:
+            Number of items returned to the pending list.
+        """
+        now_ms = int(time.time() * 1000)
+        expired = await self._client.zrangebyscore(self._key("leases"), "-inf", now_ms)
+        requeued = 0
+        for raw_id in expired:
+            item_id = _text(raw_id)
+            # Only the replica whose ZREM succeeds requeues the item
+            if item_id and await self._client.zrem(self._key("leases"), item_id):
+                await self._client.rpush(self._key("pending"), item_id)
+                await self._client.lrem(self._key("processing"), 1, item_id)
+                requeued += 1
+
+        # Claimed ids without a lease get one so they cannot be stranded
+        for raw_id in await self._client.lrange(self._key("processing"), 0, -1):
+            item_id = _text(raw_id)
+            if item_id is not None:
+                await self._client.zadd(
+                    self._key("leases"), {item_id: self._expiry_ms()}, nx=True
+                )
+
+        if requeued:
+            logger.info("EXPIRED_LEASES_REQUEUED", count=requeued, namespace=self._ns)
+        return requeued
+
+    async def try_acquire_leadership(self) -> bool:
+        """Try to become (or remain) the replica that runs the locators."""
+        ttl_ms = int(self.lease_ttl_seconds * 1000)
+        key = self._key("leader")
+        if await self._client.set(key, self.consumer_id, nx=True, px=ttl_ms):
+            self._is_leader = True
+        elif _text(await self._client.get(key)) == self.consumer_id:
+            await self._client.pexpire(key, ttl_ms)
+            self._is_leader = True
+        else:
+            self._is_leader = False
+        return self._is_leader
+
+    async def release_leadership(self) -> None:
+        """Give up the locator leadership if this replica holds it."""
+        key = self._key("leader")
+        if _text(await self._client.get(key)) == self.consumer_id:
+            await self._client.delete(key)
+        self._is_leader = False
+
+    async def _ensure_leadership(self) -> None:
+        """Raise unless the ``leader`` lock is still held by this replica."""
+        if _text(await self._client.get(self._key("leader"))) != self.consumer_id:
+            self._is_leader = False
+            error_message = f"Replica {self.consumer_id} lost the locator leadership"
+            raise LeadershipLostError(error_message, self.consumer_id)
+
+    async def mark_locators_done(self) -> None:
+        """Record that the locators have no more work to publish.
+
+        Raises:
+            LeadershipLostError: If another replica has taken over the locators.
+        """
+        await self._ensure_leadership()
+        await self._client.set(self._key("locators_done"), self.consumer_id)
+
+    async def locators_done(self) -> bool:
+        """Check whether the locators have finished publishing work."""
+        return bool(await self._client.exists(self._key("locators_done")))
+
+    async def size(self) -> int:
+        """Get the number of items waiting to be claimed."""
+        return int(await self._client.llen(self._key("pending")))
+
+    async def is_drained(self) -> bool:
+        """Check that no item is waiting or leased anywhere."""
+        pending = int(await self._client.llen(self._key("pending")))
+        leased = int(await self._client.zcard(self._key("leases")))
+        return pending == 0 and leased == 0
+
+    async def peek(self, max_items: int = 1) -> list[object]:
+        """Peek at pending items without claiming them."""
+        ids = await self._client.lrange(self._key("pending"), 0, max_items - 1)
+        items: list[object] = []
+        for raw_id in ids:
+            data = _text(await self._client.hget(self._key("items"), _text(raw_id)))
+            if data is not None:
+                items.append(self._ser.loads(data))
+        return items
+
+    async def clear(self) -> int:
+        """Remove every item and lease from the queue."""
+        cleared = int(await self._client.llen(self._key("pending")))
+        for name in ("items", "pending", "processing", "leases", "locators_done"):
+            await self._client.delete(self._key(name))
+        self._held.clear()
+        return cleared
+
+    async def start(self) -> None:
+        """Start the background heartbeat, leadership renewal and reaper."""
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintain())
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            try:
+                await self.heartbeat()
+                if self._is_leader:
+                    await self.try_acquire_leadership()
+                await self.reap_expired()
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "LEASED_QUEUE_MAINTENANCE_FAILED",
+                    namespace=self._ns,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    async def close(self) -> None:
+        """Stop maintenance and hand back anything still held.
+
+        Once the run is complete its keys are set to expire after one lease
+        TTL, which leaves other replicas time to see that the locators are
+        done before the namespace is reset for the next run.
+        """
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+        for item_id in list(self._held):
+            await self.release(item_id)
+        if self._is_leader:
+            await self.release_leadership()
+        if await self.locators_done() and await self.is_drained():
+            ttl_ms = int(self.lease_ttl_seconds * 1000)
+            for name in _RUN_KEYS:
+                await self._client.pexpire(self._key(name), ttl_ms)
+            logger.info("RUN_KEYS_EXPIRING", namespace=self._ns, ttl_ms=ttl_ms)
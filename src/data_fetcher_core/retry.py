@@ -5,20 +5,142 @@ and components can use, ensuring consistent retry behavior across the applicatio
 """
 
 import asyncio
+import contextvars
 import functools
 import random
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any, TypeVar
 
 import structlog
 
+from data_fetcher_core.exceptions import (
+    CircuitOpenError,
+    ConfigurationError,
+    FatalError,
+    ValidationError,
+)
+from data_fetcher_core.metrics import RETRIES_TOTAL
+
 # Type variables for generic retry functions
 T = TypeVar("T")
 AsyncFunc = Callable[..., Any]
 SyncFunc = Callable[..., Any]
 
+# HTTP statuses worth retrying: timeouts, throttling and server errors
+_RETRYABLE_STATUS_CODES = frozenset({408, 425, 429})
+_SERVER_ERROR_STATUS = 500
+
+# Set while a retry loop runs so nested retry loops make a single attempt
+_retry_active: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "retry_active", default=False
+)
+
+
+def background_task_context() -> contextvars.Context:
+    """Copy the current context for a long-lived background task.
+
+    Tasks inherit the context of the code creating them. A background task
+    started inside a retry loop (e.g. pool maintenance started by the first
+    acquire) would otherwise see the loop as active for its whole life and make
+    a single attempt wherever it uses a retry engine.
+
+    Returns:
+        A copy of the current context with no retry loop active, for
+        ``asyncio.create_task(..., context=...)``.
+    """
+    context = contextvars.copy_context()
+    context.run(_retry_active.set, False)  # noqa: FBT003
+    return context
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Default classification of errors worth retrying.
+
+    Configuration, validation and fatal errors, open circuits and programming
+    errors are permanent. Errors carrying an HTTP response (such as
+    ``httpx.HTTPStatusError``) are retried only for timeouts, throttling and
+    5xx statuses. Everything else, notably network and socket errors, is
+    retried.
+    """
+    if isinstance(
+        exc,
+        ConfigurationError
+        | ValidationError
+        | FatalError
+        | CircuitOpenError
+        | NotImplementedError
+        | TypeError
+        | AttributeError,
+    ):
+        return False
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return (
+            status_code in _RETRYABLE_STATUS_CODES
+            or status_code >= _SERVER_ERROR_STATUS
+        )
+    return True
+
+
+class RetryBudget:
+    """Token bucket capping retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, so
+    over time retries stay below ``ratio`` times the request count. The
+    bucket starts with ``min_tokens`` so a few retries are possible before
+    any request has succeeded, and holds at most ``max_tokens``. When a
+    provider fails every request, the budget runs dry and the extra load from
+    retries stops instead of multiplying it.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0
+    ) -> None:
+        """Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per request.
+            min_tokens: Tokens available at the start.
+            max_tokens: Maximum tokens the bucket holds.
+        """
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")  # noqa: TRY003
+        if max_tokens < min_tokens:
+            raise ValueError("max_tokens must be at least min_tokens")  # noqa: TRY003
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit the tokens earned by a request."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one token for a retry.
+
+        Returns:
+            True if the retry may go ahead.
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def create_retry_budget(ratio: float | None = 0.2) -> RetryBudget | None:
+    """Create a retry budget, or None when ``ratio`` is None."""
+    if ratio is None:
+        return None
+    return RetryBudget(ratio=ratio)
+
 
 @dataclass
 class RetryConfig:
@@ -47,18 +169,258 @@ class RetryConfig:
             )
 
 
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker failing fast while a host or service is down.
+
+    The circuit starts closed and counts consecutive failures. After
+    ``failure_threshold`` of them it opens: calls are rejected immediately
+    with ``CircuitOpenError`` instead of waiting through connection timeouts
+    and backoff. Once ``recovery_timeout`` has passed the circuit is
+    half-open and lets ``half_open_max_calls`` probe calls through; a
+    successful probe closes it again and a failed one re-opens it.
+
+    Only exceptions for which ``is_failure`` returns True count as failures,
+    so application errors such as a missing file do not trip the circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Callable[[BaseException], bool] | None = None,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            name: Name of the protected pool or host, used in logs and errors.
+            failure_threshold: Consecutive failures that open the circuit.
+            recovery_timeout: Seconds the circuit stays open before probing.
+            half_open_max_calls: Concurrent probe calls while half-open.
+            is_failure: Predicate selecting the exceptions that count as
+                failures. Defaults to every exception.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")  # noqa: TRY003
+        if recovery_timeout <= 0:
+            raise ValueError("recovery_timeout must be positive")  # noqa: TRY003
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")  # noqa: TRY003
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._is_failure = is_failure or (lambda _exc: True)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._logger = structlog.get_logger(__name__).bind(
+            component="circuit_breaker", circuit=name
+        )
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open after the timeout."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._logger.info("CIRCUIT_HALF_OPEN")
+        return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or reject it when the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probe slots taken.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if (
+            state is CircuitState.HALF_OPEN
+            and self._probes_in_flight < self.half_open_max_calls
+        ):
+            self._probes_in_flight += 1
+            return
+        retry_after = max(
+            0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)
+        )
+        error_message = f"Circuit {self.name!r} is open"
+        raise CircuitOpenError(error_message, self.name, retry_after)
+
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open circuit."""
+        if self._state is CircuitState.HALF_OPEN:
+            self._logger.info("CIRCUIT_CLOSED")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or (
+            self._state is CircuitState.CLOSED
+            and self._failures >= self.failure_threshold
+        ):
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probes_in_flight = 0
+            self._logger.warning(
+                "CIRCUIT_OPENED",
+                consecutive_failures=self._failures,
+                recovery_timeout=self.recovery_timeout,
+            )
+
+    def record_cancelled(self) -> None:
+        """Release the probe slot of a call abandoned before it completed."""
+        if self._state is CircuitState.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Record a call that raised, counting it only if it is a failure."""
+        if self._is_failure(exc):
+            self.record_failure()
+        else:
+            # The service answered; only the request itself was rejected
+            self.record_success()
+
+    async def call(self, func: AsyncFunc, *args: object, **kwargs: object) -> Any:  # noqa: ANN401
+        """Run an async function through the circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call.
+        """
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.record_exception(e)
+            raise
+        self.record_success()
+        return result
+
+
+def create_circuit_breaker(
+    name: str,
+    failure_threshold: int | None = 5,
+    recovery_timeout: float = 30.0,
+    is_failure: Callable[[BaseException], bool] | None = None,
+) -> CircuitBreaker | None:
+    """Create a circuit breaker, or None when ``failure_threshold`` is None.
+
+    Args:
+        name: Name of the protected pool or host.
+        failure_threshold: Consecutive failures that open the circuit; None
+            disables the breaker.
+        recovery_timeout: Seconds the circuit stays open before probing.
+        is_failure: Predicate selecting the exceptions that count as failures.
+
+    Returns:
+        Configured CircuitBreaker instance, or None.
+    """
+    if failure_threshold is None:
+        return None
+    return CircuitBreaker(
+        name,
+        failure_threshold=failure_threshold,
+        recovery_timeout=recovery_timeout,
+        is_failure=is_failure,
+    )
+
+
 class RetryEngine:
-    """Core retry engine that handles retry logic and backoff calculations."""
+    """Core retry engine that handles retry logic and backoff calculations.
 
-    def __init__(self, config: RetryConfig) -> None:
+    Only errors classified as retryable by ``is_retryable`` are retried;
+    ``CircuitOpenError`` never is, so callers fail fast against a target known
+    to be down. With a ``circuit_breaker`` every attempt goes through it, and
+    with a ``retry_budget`` retries stop once the budget is spent.
+
+    Retry loops do not nest: a retry executed while another retry loop is
+    running in the same task makes a single attempt and leaves retrying to
+    the outer loop, so attempts are not multiplied.
+    """
+
+    def __init__(
+        self,
+        config: RetryConfig,
+        circuit_breaker: CircuitBreaker | None = None,
+        *,
+        retry_budget: RetryBudget | None = None,
+        is_retryable: Callable[[BaseException], bool] | None = None,
+    ) -> None:
         """Initialize the retry engine with configuration.
 
         Args:
             config: Retry configuration parameters.
+            circuit_breaker: Optional circuit breaker guarding every attempt.
+            retry_budget: Optional budget capping retries to a fraction of
+                requests.
+            is_retryable: Classification of retryable errors. Defaults to
+                ``is_retryable_error``.
         """
         self.config = config
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.is_retryable = is_retryable or is_retryable_error
         self._logger = structlog.get_logger(__name__).bind(component="retry_engine")
 
+    def _should_retry(self, attempt: int, exc: Exception) -> bool:
+        """Whether a failed attempt is retried (spending budget if it is)."""
+        if attempt >= self.config.max_retries:
+            return False
+        if not self.is_retryable(exc):
+            RETRIES_TOTAL.labels(outcome="not_retryable").inc()
+            self._logger.debug(
+                "RETRY_SKIPPED_NOT_RETRYABLE",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            return False
+        if self.retry_budget is not None and not self.retry_budget.try_spend():
+            RETRIES_TOTAL.labels(outcome="budget_exhausted").inc()
+            self._logger.warning(
+                "RETRY_BUDGET_EXHAUSTED",
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+            return False
+        return True
+
+    def _attempt_sync(self, func: SyncFunc, *args: object, **kwargs: object) -> Any:  # noqa: ANN401
+        if self.circuit_breaker is None:
+            return func(*args, **kwargs)
+        self.circuit_breaker.before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.circuit_breaker.record_exception(e)
+            raise
+        self.circuit_breaker.record_success()
+        return result
+
+    async def _attempt_async(
+        self, func: AsyncFunc, *args: object, **kwargs: object
+    ) -> Any:  # noqa: ANN401
+        if self.circuit_breaker is not None:
+            return await self.circuit_breaker.call(func, *args, **kwargs)
+        return await func(*args, **kwargs)
+
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay for a specific retry attempt.
 
@@ -97,15 +459,34 @@ class RetryEngine:
         Raises:
             The last exception encountered if all retries fail.
         """
+        if _retry_active.get():
+            # Nested inside another retry loop: that loop owns the retries
+            return await self._attempt_async(func, *args, **kwargs)
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+
+        token = _retry_active.set(True)
+        try:
+            return await self._retry_async(func, *args, **kwargs)
+        finally:
+            _retry_active.reset(token)
+
+    async def _retry_async(
+        self, func: AsyncFunc, *args: object, **kwargs: object
+    ) -> object:
         last_exception: Exception | None = None
 
         for attempt in range(self.config.max_retries + 1):
             try:
-                return await func(*args, **kwargs)
+                return await self._attempt_async(func, *args, **kwargs)
+            except CircuitOpenError:
+                RETRIES_TOTAL.labels(outcome="circuit_open").inc()
+                raise
             except Exception as e:
                 last_exception = e
-                if attempt < self.config.max_retries:
+                if self._should_retry(attempt, e):
                     delay = self.calculate_delay(attempt)
+                    RETRIES_TOTAL.labels(outcome="retry").inc()
                     self._logger.warning(
                         "RETRY_ASYNC",
                         attempt=attempt + 1,
@@ -118,6 +499,7 @@ class RetryEngine:
                     continue
                 if attempt == self.config.max_retries:
                     # Final attempt failed, log with exception details and re-raise
+                    RETRIES_TOTAL.labels(outcome="gave_up").inc()
                     self._logger.exception(
                         "RETRY_ASYNC_GAVE_UP",
                         attempts=self.config.max_retries + 1,
@@ -125,6 +507,8 @@ class RetryEngine:
                         error_type=type(e).__name__,
                     )
                     raise last_exception from e
+                # Not retryable or out of retry budget
+                raise
 
         # This should never be reached, but just in case
         if last_exception:
@@ -147,15 +531,32 @@ class RetryEngine:
         Raises:
             The last exception encountered if all retries fail.
         """
+        if _retry_active.get():
+            # Nested inside another retry loop: that loop owns the retries
+            return self._attempt_sync(func, *args, **kwargs)
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+
+        token = _retry_active.set(True)
+        try:
+            return self._retry_sync(func, *args, **kwargs)
+        finally:
+            _retry_active.reset(token)
+
+    def _retry_sync(self, func: SyncFunc, *args: object, **kwargs: object) -> object:
         last_exception: Exception | None = None
 
         for attempt in range(self.config.max_retries + 1):
             try:
-                return func(*args, **kwargs)
+                return self._attempt_sync(func, *args, **kwargs)
+            except CircuitOpenError:
+                RETRIES_TOTAL.labels(outcome="circuit_open").inc()
+                raise
             except Exception as e:
                 last_exception = e
-                if attempt < self.config.max_retries:
+                if self._should_retry(attempt, e):
                     delay = self.calculate_delay(attempt)
+                    RETRIES_TOTAL.labels(outcome="retry").inc()
                     self._logger.warning(
                         "RETRY_SYNC",
                         attempt=attempt + 1,
@@ -168,6 +569,7 @@ class RetryEngine:
                     continue
                 if attempt == self.config.max_retries:
                     # Final attempt failed, log with exception details and re-raise
+                    RETRIES_TOTAL.labels(outcome="gave_up").inc()
                     self._logger.exception(
                         "RETRY_SYNC_GAVE_UP",
                         attempts=self.config.max_retries + 1,
@@ -175,6 +577,8 @@ class RetryEngine:
                         error_type=type(e).__name__,
                     )
                     raise last_exception from e
+                # Not retryable or out of retry budget
+                raise
 
         # This should never be reached, but just in case
         if last_exception:
@@ -190,6 +594,9 @@ def create_retry_engine(
     *,
     jitter: bool = True,
     jitter_range: tuple[float, float] = (0.5, 1.5),
+    circuit_breaker: CircuitBreaker | None = None,
+    retry_budget: RetryBudget | None = None,
+    is_retryable: Callable[[BaseException], bool] | None = None,
 ) -> RetryEngine:
     """Create a retry engine with the specified configuration.
 
@@ -200,6 +607,10 @@ def create_retry_engine(
         exponential_base: Base for exponential backoff calculation.
         jitter: Whether to add random jitter to delays.
         jitter_range: Range for jitter factor (min, max).
+        circuit_breaker: Optional circuit breaker guarding every attempt.
+        retry_budget: Optional budget capping retries to a fraction of requests.
+        is_retryable: Classification of retryable errors. Defaults to
+            ``is_retryable_error``.
 
     Returns:
         Configured RetryEngine instance.
@@ -212,7 +623,19 @@ def create_retry_engine(
         jitter=jitter,
         jitter_range=jitter_range,
     )
-    return RetryEngine(config)
+    return RetryEngine(
+        config,
+        circuit_breaker,
+        retry_budget=retry_budget,
+        is_retryable=is_retryable,
+    )
+
+
+def _is_retryable_of(
+    retry_exceptions: tuple[type[Exception], ...], exc: BaseException
+) -> bool:
+    """Retry only the given exception types, still honouring classification."""
+    return isinstance(exc, retry_exceptions) and is_retryable_error(exc)
 
 
 def async_retry_with_backoff(
@@ -223,7 +646,7 @@ def async_retry_with_backoff(
     *,
     jitter: bool = True,
     jitter_range: tuple[float, float] = (0.5, 1.5),
-    retry_exceptions: tuple[type[Exception], ...] = (Exception,),  # noqa: ARG001
+    retry_exceptions: tuple[type[Exception], ...] = (Exception,),
 ) -> Callable[[AsyncFunc], AsyncFunc]:
     """Decorator for async functions with exponential backoff retry logic.
 
@@ -254,6 +677,7 @@ def async_retry_with_backoff(
                 exponential_base=exponential_base,
                 jitter=jitter,
                 jitter_range=jitter_range,
+                is_retryable=functools.partial(_is_retryable_of, retry_exceptions),
             )
 
             # Execute with retry logic
@@ -272,7 +696,7 @@ def sync_retry_with_backoff(
     *,
     jitter: bool = True,
     jitter_range: tuple[float, float] = (0.5, 1.5),
-    retry_exceptions: tuple[type[Exception], ...] = (Exception,),  # noqa: ARG001
+    retry_exceptions: tuple[type[Exception], ...] = (Exception,),
 ) -> Callable[[SyncFunc], SyncFunc]:
     """Decorator for sync functions with exponential backoff retry logic.
 
@@ -303,6 +727,7 @@ def sync_retry_with_backoff(
                 exponential_base=exponential_base,
                 jitter=jitter,
                 jitter_range=jitter_range,
+                is_retryable=functools.partial(_is_retryable_of, retry_exceptions),
             )
 
             # Execute with retry logic
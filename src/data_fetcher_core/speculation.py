@@ -0,0 +1,228 @@
+"""Speculative re-execution of straggler bundles.
+
+Toward the end of a run most workers are idle while a few large bundles are
+still transferring. `StragglerMonitor` tracks the bundles being loaded and
+lets an idle worker start a duplicate attempt of the bundle furthest behind
+its expected completion time. The attempts race: the first one to complete
+commits the bundle in storage (see `BundleAttempt`) and the others are
+cancelled, aborting the bundles they started in storage.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+from data_fetcher_core.core import BundleLoadResult, BundleRef
+from data_fetcher_core.metrics import SPECULATIVE_ATTEMPTS
+from data_fetcher_core.storage.bundle_storage_context import (
+    BundleAttempt,
+    current_attempt,
+)
+from data_fetcher_core.watchdog import TransferProgress, tracking_progress
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Number of recent bundle durations the expected duration is estimated from
+DURATION_WINDOW = 200
+
+
+class InFlightBundle:
+    """A bundle being loaded, possibly by several concurrent attempts."""
+
+    def __init__(
+        self,
+        bundle: BundleRef,
+        load: Callable[[], Awaitable[BundleLoadResult]],
+    ) -> None:
+        """Initialize the in-flight bundle.
+
+        Args:
+            bundle: The bundle being loaded.
+            load: Loads the bundle once; called for every attempt.
+        """
+        self.bundle = bundle
+        self.started = time.monotonic()
+        size = bundle.request_meta.get("size")
+        self.size = size if isinstance(size, int) else None
+        self._load = load
+        self._tasks: dict[int, asyncio.Task[BundleLoadResult]] = {}
+        self._progress: dict[int, TransferProgress] = {}
+        self._winner: int | None = None
+        self._result: asyncio.Future[BundleLoadResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    @property
+    def attempts(self) -> int:
+        """Number of attempts started."""
+        return len(self._tasks)
+
+    @property
+    def bytes(self) -> int:
+        """Bytes transferred by the attempt that got furthest."""
+        return max((p.bytes for p in self._progress.values()), default=0)
+
+    def start_attempt(self) -> asyncio.Task[BundleLoadResult]:
+        """Start another attempt at loading the bundle."""
+        number = len(self._tasks)
+        progress = TransferProgress()
+        token = current_attempt.set(BundleAttempt(number, self._claim))
+        try:
+            with tracking_progress(progress):
+                task = asyncio.create_task(_run(self._load))
+        finally:
+            current_attempt.reset(token)
+        self._tasks[number] = task
+        self._progress[number] = progress
+        task.add_done_callback(self._attempt_done)
+        return task
+
+    async def wait(self) -> BundleLoadResult:
+        """Wait for the first attempt to succeed, or for all of them to fail."""
+        try:
+            return await self._result
+        finally:
+            for task in self._tasks.values():
+                task.cancel()
+
+    async def _claim(self, number: int) -> bool:
+        """Let the first attempt to complete commit, after aborting the others."""
+        if self._winner is not None:
+            return self._winner == number
+        self._winner = number
+        others = [
+            task for n, task in self._tasks.items() if n != number and not task.done()
+        ]
+        for task in others:
+            task.cancel()
+        if others:
+            await asyncio.wait(others)
+        return True
+
+    def _attempt_done(self, task: asyncio.Task[BundleLoadResult]) -> None:
+        if self._result.done():
+            return
+        if not task.cancelled() and task.exception() is None:
+            number = next(n for n, t in self._tasks.items() if t is task)
+            if number > 0:
+                SPECULATIVE_ATTEMPTS.labels(outcome="won").inc()
+            self._result.set_result(task.result())
+            return
+        if not all(t.done() for t in self._tasks.values()):
+            return
+        # Every attempt failed: report the committing attempt's error first,
+        # then the original attempt's
+        order = sorted(self._tasks, key=lambda n: (n != self._winner, n))
+        for n in order:
+            failed = self._tasks[n]
+            if not failed.cancelled():
+                self._result.set_exception(failed.exception())  # type: ignore[arg-type]
+                return
+        self._result.cancel()
+
+
+async def _run(
+    load: Callable[[], Awaitable[BundleLoadResult]],
+) -> BundleLoadResult:
+    try:
+        return await load()
+    except BaseException:
+        # A cancelled, superseded or failed attempt must not leave its
+        # uncommitted copy of the bundle behind in storage
+        attempt = current_attempt.get()
+        if attempt is not None:
+            await attempt.abort()
+        raise
+
+
+class StragglerMonitor:
+    """Tracks bundle loads in flight and picks stragglers to duplicate."""
+
+    def __init__(self, slowdown: float = 2.0, min_seconds: float = 10.0) -> None:
+        """Initialize the straggler monitor.
+
+        Args:
+            slowdown: How many times its expected duration a bundle must have
+                been running for before it is duplicated.
+            min_seconds: Minimum time a bundle must have been running for.
+        """
+        self.slowdown = slowdown
+        self.min_seconds = min_seconds
+        self.in_flight: dict[str, InFlightBundle] = {}
+        self._durations: deque[float] = deque(maxlen=DURATION_WINDOW)
+        self._bytes = 0
+        self._seconds = 0.0
+
+    async def load(
+        self,
+        bundle: BundleRef,
+        load: Callable[[], Awaitable[BundleLoadResult]],
+    ) -> BundleLoadResult:
+        """Load a bundle, letting idle workers duplicate it if it straggles."""
+        in_flight = InFlightBundle(bundle, load)
+        bid = str(bundle.bid)
+        self.in_flight[bid] = in_flight
+        in_flight.start_attempt()
+        try:
+            result = await in_flight.wait()
+        finally:
+            del self.in_flight[bid]
+        duration = time.monotonic() - in_flight.started
+        self._durations.append(duration)
+        self._bytes += in_flight.bytes
+        self._seconds += duration
+        return result
+
+    def expected_seconds(self, in_flight: InFlightBundle) -> float | None:
+        """Expected duration of a bundle, from the loads completed so far.
+
+        Bundles with a known ``size`` are estimated from the observed
+        throughput, others from the median duration.
+        """
+        if in_flight.size is not None and self._bytes > 0:
+            return in_flight.size / (self._bytes / self._seconds)
+        if self._durations:
+            return statistics.median(self._durations)
+        return None
+
+    def pick_straggler(self) -> InFlightBundle | None:
+        """The not yet duplicated bundle furthest behind its expected duration."""
+        now = time.monotonic()
+        straggler: InFlightBundle | None = None
+        worst = self.slowdown
+        for in_flight in self.in_flight.values():
+            elapsed = now - in_flight.started
+            expected = self.expected_seconds(in_flight)
+            if in_flight.attempts > 1 or expected is None:
+                continue
+            if elapsed < self.min_seconds:
+                continue
+            behind = elapsed / expected if expected > 0 else float("inf")
+            if behind >= worst:
+                straggler, worst = in_flight, behind
+        return straggler
+
+    async def speculate(self) -> bool:
+        """Run a duplicate attempt of the worst straggler, if there is one.
+
+        Returns:
+            Whether a duplicate attempt was run.
+        """
+        straggler = self.pick_straggler()
+        if straggler is None:
+            return False
+        SPECULATIVE_ATTEMPTS.labels(outcome="started").inc()
+        logger.info(
+            "STRAGGLER_DUPLICATED",
+            bid=str(straggler.bundle.bid),
+            elapsed_seconds=round(time.monotonic() - straggler.started, 3),
+            expected_seconds=round(self.expected_seconds(straggler) or 0.0, 3),
+        )
+        # The original attempt's worker reports the outcome
+        await asyncio.wait({straggler.start_attempt()})
+        return True
@@ -5,11 +5,16 @@ of a bundle during storage operations, including resource uploads and completion
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from data_fetcher_core.exceptions import BundleSupersededError
+from data_fetcher_core.tracing import get_tracer
+
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
     from data_fetcher_core.storage import Storage
@@ -18,6 +23,46 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class BundleAttempt:
+    """One of several concurrent attempts at loading the same bundle.
+
+    Storage keeps the resources of each attempt apart and only lets the first
+    attempt to complete commit the bundle. ``claim`` is called with the attempt
+    number on completion and returns whether this attempt won; the winner's
+    claim returns once the other attempts have been aborted.
+
+    Bundle contexts started by the attempt are recorded in ``started`` so the
+    ones it did not commit can be aborted when the attempt ends.
+    """
+
+    number: int
+    claim: Callable[[int], Awaitable[bool]]
+    started: list["BundleStorageContext"] = field(default_factory=list)
+
+    async def abort(self) -> None:
+        """Abort every bundle this attempt started but did not commit."""
+        for context in self.started:
+            await context.abort()
+
+
+current_attempt: ContextVar[BundleAttempt | None] = ContextVar(
+    "bundle_attempt", default=None
+)
+
+
+def attempt_number() -> int:
+    """Number of the bundle attempt running in this context (0 if not duplicated)."""
+    attempt = current_attempt.get()
+    return attempt.number if attempt is not None else 0
+
+
+def bundle_storage_key(bundle_ref: "BundleRef") -> str:
+    """Key an in-progress bundle is stored under by the current attempt."""
+    number = attempt_number()
+    return str(bundle_ref.bid) if number == 0 else f"{bundle_ref.bid}.attempt{number}"
+
+
 class BundleStorageContext:
     """Context for managing bundle lifecycle and resource uploads.
 
@@ -47,8 +92,12 @@ class BundleStorageContext:
         self._upload_lock = asyncio.Lock()
         self._completion_event = asyncio.Event()
         self._is_completed = False
+        self._is_aborted = False
         # Set the event initially since there are no pending uploads
         self._completion_event.set()
+        attempt = current_attempt.get()
+        if attempt is not None:
+            attempt.started.append(self)
 
     async def add_resource(
         self,
@@ -77,9 +126,10 @@ class BundleStorageContext:
 
         try:
             # Delegate to storage implementation
-            await self.storage._add_resource_to_bundle(  # type: ignore[attr-defined]  # noqa: SLF001
-                self.bundle_ref, resource_name, metadata, stream
-            )
+            with get_tracer().span("store_resource", resource=resource_name):
+                await self.storage._add_resource_to_bundle(  # type: ignore[attr-defined]  # noqa: SLF001
+                    self.bundle_ref, resource_name, metadata, stream
+                )
 
             # Mark upload as completed
             async with self._upload_lock:
@@ -109,6 +159,7 @@ class BundleStorageContext:
             metadata: Additional metadata to include with the bundle.
 
         Raises:
+            BundleSupersededError: If another attempt at the bundle committed it.
             Exception: If bundle completion fails.
         """
         # Wait for all pending uploads to complete using proper synchronization
@@ -118,10 +169,39 @@ class BundleStorageContext:
         if self._is_completed:
             return
 
+        # Only the first of several duplicate attempts may commit the bundle
+        attempt = current_attempt.get()
+        if attempt is not None and not await attempt.claim(attempt.number):
+            error_message = (
+                f"Bundle {self.bundle_ref.bid} was committed by another attempt"
+            )
+            raise BundleSupersededError(error_message, str(self.bundle_ref.bid))
+
         # Mark as completed before calling storage method
         self._is_completed = True
 
         # Delegate completion to storage (including callbacks)
-        await self.storage.complete_bundle_with_callbacks_hook(  # type: ignore[attr-defined]
-            self.bundle_ref, self.recipe, metadata
-        )
+        with get_tracer().span("bundle_complete"):
+            await self.storage.complete_bundle_with_callbacks_hook(  # type: ignore[attr-defined]
+                self.bundle_ref, self.recipe, metadata
+            )
+
+    async def abort(self) -> None:
+        """Discard the bundle if it was not committed.
+
+        Delegates to the storage's ``_abort_bundle`` hook, when it has one, so
+        it can release what it holds for the bundle. Does nothing once the
+        bundle is completed or already aborted.
+        """
+        if self._is_completed or self._is_aborted:
+            return
+        self._is_aborted = True
+        abort_bundle = getattr(self.storage, "_abort_bundle", None)
+        if abort_bundle is None:
+            return
+        try:
+            await abort_bundle(self.bundle_ref)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "BUNDLE_ABORT_FAILED", bid=str(self.bundle_ref.bid), error=str(e)
+            )
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from data_fetcher_core.storage.streaming.tee_stream import TeeStream
+from data_fetcher_core.tracing import get_tracer
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
@@ -330,11 +331,13 @@ class TarGzResourceBundleStorageContext:
             decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)  # GZIP format
 
             async def decompressed_stream() -> AsyncGenerator[bytes]:
+                decompression = get_tracer().stage("decompression", format="gz")
                 # Process the stream in chunks
                 async for chunk in gz_stream_with_header():
                     try:
                         # Decompress the chunk
-                        decompressed_chunk = decompressor.decompress(chunk)
+                        with decompression:
+                            decompressed_chunk = decompressor.decompress(chunk)
                         if decompressed_chunk:
                             yield decompressed_chunk
                     except zlib.error as e:
@@ -344,7 +347,9 @@ class TarGzResourceBundleStorageContext:
                         )
 
                 # Flush any remaining data
-                final_chunk = decompressor.flush()
+                with decompression:
+                    final_chunk = decompressor.flush()
+                decompression.finish()
                 if final_chunk:
                     yield final_chunk
 
@@ -372,12 +377,15 @@ class TarGzResourceBundleStorageContext:
         try:
             # Stream decompressed content directly (no temp file needed)
             async def gz_stream() -> AsyncGenerator[bytes]:
+                decompression = get_tracer().stage("decompression", format="gz")
                 with gzip.open(filepath, "rb") as gz_file:
                     while True:
-                        chunk = gz_file.read(8192)  # 8KB chunks
+                        with decompression:
+                            chunk = gz_file.read(8192)  # 8KB chunks
                         if not chunk:
                             break
                         yield chunk
+                decompression.finish()
 
             decompressed_metadata = {
                 **metadata,  # Include all original metadata
@@ -463,12 +471,17 @@ class TarGzResourceBundleStorageContext:
                                 tf = tar_file.extractfile(tar_info)
                                 if tf is None:
                                     return
+                                decompression = get_tracer().stage(
+                                    "decompression", format="tar.gz"
+                                )
                                 with tf as file_obj:
                                     while True:
-                                        chunk = file_obj.read(8192)  # 8KB chunks
+                                        with decompression:
+                                            chunk = file_obj.read(8192)  # 8KB chunks
                                         if not chunk:
                                             break
                                         yield chunk
+                                decompression.finish()
 
                             # Add extracted file
                             extracted_url = f"{self.decorator._strip_compression_suffix(resource_name)}/{tar_info.name}"  # noqa: SLF001
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any
 import structlog
 
 from data_fetcher_core.storage.streaming.tee_stream import StreamingZipReader, TeeStream
+from data_fetcher_core.tracing import get_tracer
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
@@ -295,12 +296,15 @@ class UnzipResourceBundleStorageContext:
         try:
             # Stream decompressed content
             async def gzip_stream() -> AsyncGenerator[bytes]:
+                decompression = get_tracer().stage("decompression", format="gzip")
                 with gzip.open(filepath, "rb") as gz_file:
                     while True:
-                        chunk = gz_file.read(8192)  # 8KB chunks
+                        with decompression:
+                            chunk = gz_file.read(8192)  # 8KB chunks
                         if not chunk:
                             break
                         yield chunk
+                decompression.finish()
 
             await self.base_context.add_resource(
                 resource_name=self.decorator._strip_compression_suffix(resource_name),  # noqa: SLF001
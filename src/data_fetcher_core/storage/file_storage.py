@@ -5,7 +5,9 @@ systems, including directory management and file operations.
 """
 
 import importlib.util
+import itertools
 import re
+import shutil
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,7 +16,11 @@ from urllib.parse import urlparse
 
 import structlog
 
-from data_fetcher_core.storage.bundle_storage_context import BundleStorageContext
+from data_fetcher_core.storage.bundle_storage_context import (
+    BundleStorageContext,
+    attempt_number,
+    bundle_storage_key,
+)
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
@@ -42,8 +48,8 @@ class FileStorage:
     ) -> "BundleStorageContext":
         """Initialize a new bundle and return a BundleStorageContext."""
         # Create file bundle
-        bundle = FileStorageBundle(self.output_dir, bundle_ref)
-        self._active_bundles[str(bundle_ref.bid)] = bundle
+        bundle = FileStorageBundle(self.output_dir, bundle_ref, attempt_number())
+        self._active_bundles[bundle_storage_key(bundle_ref)] = bundle
 
         # Create and return BundleStorageContext
         context = BundleStorageContext(bundle_ref, recipe, self)
@@ -71,7 +77,7 @@ class FileStorage:
         stream: AsyncGenerator[bytes],
     ) -> None:
         """Internal method to add a resource to a bundle."""
-        bundle = self._active_bundles.get(str(bundle_ref.bid))
+        bundle = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bundle:
             error_message = "Bundle not found"
             raise ValueError(error_message)
@@ -100,7 +106,7 @@ class FileStorage:
         bundle_ref: "BundleRef",
     ) -> None:
         """Internal method to finalize a bundle."""
-        bundle = self._active_bundles.get(str(bundle_ref.bid))
+        bundle = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bundle:
             error_message = "Bundle not found"
             raise ValueError(error_message)
@@ -109,7 +115,14 @@ class FileStorage:
         await bundle.close()
 
         # Clean up
-        del self._active_bundles[str(bundle_ref.bid)]
+        del self._active_bundles[bundle_storage_key(bundle_ref)]
+
+    async def _abort_bundle(self, bundle_ref: "BundleRef") -> None:
+        """Internal method to drop a bundle that will not be completed."""
+        bundle = self._active_bundles.pop(bundle_storage_key(bundle_ref), None)
+        if bundle is not None:
+            bundle.discard()
+            logger.debug("Bundle aborted", bid=str(bundle_ref.bid))
 
     async def _execute_completion_callbacks(
         self, bundle_ref: "BundleRef", recipe: "DataRegistryFetcherConfig"
@@ -165,25 +178,53 @@ class FileStorage:
 class FileStorageBundle:
     """File bundle for writing resources to disk."""
 
-    def __init__(self, output_dir: str, bundle_ref: "BundleRef") -> None:
+    def __init__(
+        self, output_dir: str, bundle_ref: "BundleRef", attempt: int = 0
+    ) -> None:
         """Initialize the file bundle with output directory and bundle reference.
 
         Args:
             output_dir: Directory where the bundle will be stored.
             bundle_ref: Reference to the bundle being created.
+            attempt: Number of a duplicate attempt at the bundle. Duplicates
+                are written to their own directory and moved into place when
+                they commit.
         """
         self.output_dir = output_dir
         self.bundle_ref = bundle_ref
+        self.attempt = attempt
+        # Use BID for directory naming to enable time-based organization
+        # BID contains timestamp information for chronological sorting
+        self.final_dir = str(Path(output_dir) / f"bundle_{bundle_ref.bid}")
         self.bundle_dir = self._create_bundle_dir()
 
     def _create_bundle_dir(self) -> str:
         """Create a directory for this bundle."""
-        # Use BID for directory naming to enable time-based organization
-        # BID contains timestamp information for chronological sorting
-        bundle_dir = str(Path(self.output_dir) / f"bundle_{self.bundle_ref.bid}")
+        bundle_dir = self.final_dir
+        if self.attempt:
+            bundle_dir = f"{self.final_dir}.attempt{self.attempt}"
         Path(bundle_dir).mkdir(parents=True, exist_ok=True)
         return bundle_dir
 
+    def _promote(self) -> None:
+        """Keep only this attempt's copy of the bundle, in the final directory."""
+        # Drop the copies of duplicate attempts that lost (numbered from 1)
+        for number in itertools.count(1):
+            if number == self.attempt:
+                continue
+            other = Path(f"{self.final_dir}.attempt{number}")
+            if not other.exists():
+                break
+            shutil.rmtree(other, ignore_errors=True)
+        if self.bundle_dir != self.final_dir:
+            shutil.rmtree(self.final_dir, ignore_errors=True)
+            Path(self.bundle_dir).rename(self.final_dir)
+            self.bundle_dir = self.final_dir
+
+    def discard(self) -> None:
+        """Delete what this attempt wrote for the bundle."""
+        shutil.rmtree(self.bundle_dir, ignore_errors=True)
+
     async def write_resource(
         self,
         resource_name: str,
@@ -237,6 +278,7 @@ class FileStorageBundle:
 
     async def close(self) -> None:
         """Close the bundle."""
+        self._promote()
         # Update bundle metadata
         meta_filepath = str(Path(self.bundle_dir) / "bundle.meta")
         metadata = {
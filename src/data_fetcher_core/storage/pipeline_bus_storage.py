@@ -14,7 +14,10 @@ from urllib.parse import urlparse
 import structlog
 from oc_pipeline_bus import DataPipelineBus
 
-from data_fetcher_core.storage.bundle_storage_context import BundleStorageContext
+from data_fetcher_core.storage.bundle_storage_context import (
+    BundleStorageContext,
+    bundle_storage_key,
+)
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
@@ -52,7 +55,7 @@ class DataPipelineBusStorage:
         bid = self.pipeline_bus.bundle_found(bundle_metadata)
 
         # Store the mapping between our bundle_ref.bid and the pipeline bus bid
-        self._active_bundles[str(bundle_ref.bid)] = bid
+        self._active_bundles[bundle_storage_key(bundle_ref)] = bid
 
         # Create and return BundleStorageContext
         context = BundleStorageContext(bundle_ref, recipe, self)
@@ -79,7 +82,7 @@ class DataPipelineBusStorage:
         stream: AsyncGenerator[bytes],
     ) -> None:
         """Internal method to add a resource to a bundle."""
-        bid = self._active_bundles.get(str(bundle_ref.bid))
+        bid = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bid:
             error_message = "Bundle not found in active bundles"
             raise ValueError(error_message)
@@ -117,7 +120,7 @@ class DataPipelineBusStorage:
         metadata: dict[str, Any],
     ) -> None:
         """Complete bundle and execute all completion callbacks."""
-        bid = self._active_bundles.get(str(bundle_ref.bid))
+        bid = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bid:
             error_message = "Bundle not found in active bundles"
             raise ValueError(error_message)
@@ -129,7 +132,7 @@ class DataPipelineBusStorage:
         self.pipeline_bus.complete_bundle(bid, metadata)
 
         # Clean up
-        del self._active_bundles[str(bundle_ref.bid)]
+        del self._active_bundles[bundle_storage_key(bundle_ref)]
 
         logger.debug(
             "Bundle completed with pipeline bus",
@@ -138,6 +141,28 @@ class DataPipelineBusStorage:
             config_id=recipe.config_id,
         )
 
+    async def _abort_bundle(self, bundle_ref: "BundleRef") -> None:
+        """Internal method to abort a bundle that will not be completed.
+
+        Every attempt at a bundle mints its own pipeline bundle, so the ones
+        that lose are aborted on the pipeline bus when it supports it.
+        """
+        bid = self._active_bundles.pop(bundle_storage_key(bundle_ref), None)
+        if not bid:
+            return
+        abort_bundle = getattr(self.pipeline_bus, "abort_bundle", None)
+        if abort_bundle is None:
+            logger.warning(
+                "PIPELINE_BUNDLE_ABANDONED", bid=str(bundle_ref.bid), pipeline_bid=bid
+            )
+            return
+        abort_bundle(bid)
+        logger.debug(
+            "Bundle aborted with pipeline bus",
+            bid=str(bundle_ref.bid),
+            pipeline_bid=bid,
+        )
+
     async def _execute_completion_callbacks(
         self, bundle_ref: "BundleRef", recipe: "DataRegistryFetcherConfig"
     ) -> None:
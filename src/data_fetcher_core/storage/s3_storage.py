@@ -8,6 +8,7 @@ import hashlib
 import json
 import os
 from collections.abc import AsyncGenerator
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -16,7 +17,12 @@ from urllib.parse import urlparse
 import boto3
 import structlog
 
-from data_fetcher_core.storage.bundle_storage_context import BundleStorageContext
+from data_fetcher_core.metrics import S3_PART_UPLOAD_LATENCY
+from data_fetcher_core.storage.bundle_storage_context import (
+    BundleStorageContext,
+    bundle_storage_key,
+)
+from data_fetcher_core.tracing import get_tracer
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig
@@ -88,10 +94,8 @@ class S3Storage:
     ) -> "BundleStorageContext":
         """Initialize a new bundle and return a BundleStorageContext."""
         # Create S3 bundle
-        bundle = S3StorageBundle(
-            self.s3_client, self.bucket_name, self.prefix, bundle_ref
-        )
-        self._active_bundles[str(bundle_ref.bid)] = bundle
+        bundle = self._create_bundle(bundle_ref)
+        self._active_bundles[bundle_storage_key(bundle_ref)] = bundle
 
         # Create and return BundleStorageContext
         context = BundleStorageContext(bundle_ref, config, self)
@@ -100,6 +104,11 @@ class S3Storage:
         )
         return context
 
+    def _create_bundle(self, bundle_ref: "BundleRef") -> "S3StorageBundle":
+        return S3StorageBundle(
+            self.s3_client, self.bucket_name, self.prefix, bundle_ref
+        )
+
     def bundle_found(self, metadata: dict[str, Any]) -> str:
         """Return a stub/mock BID value for S3 storage (no event emission)."""
         from datetime import UTC, datetime
@@ -118,7 +127,7 @@ class S3Storage:
         stream: AsyncGenerator[bytes],
     ) -> None:
         """Internal method to add a resource to a bundle."""
-        bundle = self._active_bundles.get(str(bundle_ref.bid))
+        bundle = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bundle:
             error_message = "Bundle not found"
             raise ValueError(error_message)
@@ -147,7 +156,7 @@ class S3Storage:
         bundle_ref: "BundleRef",
     ) -> None:
         """Internal method to finalize a bundle."""
-        bundle = self._active_bundles.get(str(bundle_ref.bid))
+        bundle = self._active_bundles.get(bundle_storage_key(bundle_ref))
         if not bundle:
             error_message = "Bundle not found"
             raise ValueError(error_message)
@@ -156,7 +165,16 @@ class S3Storage:
         await bundle.close()
 
         # Clean up
-        del self._active_bundles[str(bundle_ref.bid)]
+        del self._active_bundles[bundle_storage_key(bundle_ref)]
+
+    async def _abort_bundle(self, bundle_ref: "BundleRef") -> None:
+        """Internal method to drop a bundle that will not be completed.
+
+        Resource keys are shared by every attempt at a bundle, so nothing is
+        deleted; unfinished multipart uploads are aborted as they fail.
+        """
+        if self._active_bundles.pop(bundle_storage_key(bundle_ref), None):
+            logger.debug("Bundle aborted", bid=str(bundle_ref.bid))
 
     async def _execute_completion_callbacks(
         self, bundle_ref: "BundleRef", config: "DataRegistryFetcherConfig"
@@ -288,10 +306,7 @@ class S3StorageBundle:
         - Uploads each part immediately when chunk_size is reached
         - Memory usage is bounded by chunk_size, not total file size
         """
-        import aioboto3
-
-        session = aioboto3.Session()
-        async with session.client("s3") as s3:
+        async with self._async_client() as s3:
             # Initialize multipart upload
             response = await s3.create_multipart_upload(
                 Bucket=self.bucket_name,
@@ -308,6 +323,7 @@ class S3StorageBundle:
             current_part_chunks = []
             current_part_size = 0
 
+            upload = get_tracer().stage("upload", key=key)
             try:
                 async for chunk in stream:
                     # Add chunk to current part
@@ -320,13 +336,14 @@ class S3StorageBundle:
                         part_data = b"".join(current_part_chunks)
 
                         # Upload the part to S3
-                        response = await s3.upload_part(
-                            Bucket=self.bucket_name,
-                            Key=key,
-                            PartNumber=part_number,
-                            UploadId=upload_id,
-                            Body=part_data,
-                        )
+                        with upload, S3_PART_UPLOAD_LATENCY.time():
+                            response = await s3.upload_part(
+                                Bucket=self.bucket_name,
+                                Key=key,
+                                PartNumber=part_number,
+                                UploadId=upload_id,
+                                Body=part_data,
+                            )
 
                         parts.append(
                             {"ETag": response["ETag"], "PartNumber": part_number}
@@ -341,31 +358,41 @@ class S3StorageBundle:
                 if current_part_size > 0:
                     part_data = b"".join(current_part_chunks)
 
-                    response = await s3.upload_part(
-                        Bucket=self.bucket_name,
-                        Key=key,
-                        PartNumber=part_number,
-                        UploadId=upload_id,
-                        Body=part_data,
-                    )
+                    with upload, S3_PART_UPLOAD_LATENCY.time():
+                        response = await s3.upload_part(
+                            Bucket=self.bucket_name,
+                            Key=key,
+                            PartNumber=part_number,
+                            UploadId=upload_id,
+                            Body=part_data,
+                        )
 
                     parts.append({"ETag": response["ETag"], "PartNumber": part_number})
 
                 # Complete multipart upload
-                await s3.complete_multipart_upload(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    UploadId=upload_id,
-                    MultipartUpload={"Parts": parts},
-                )
+                with upload:
+                    await s3.complete_multipart_upload(
+                        Bucket=self.bucket_name,
+                        Key=key,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts},
+                    )
+                upload.finish()
 
-            except Exception:
-                # Abort multipart upload on error
+            except BaseException:
+                # Abort multipart upload on error or cancellation
                 await s3.abort_multipart_upload(
                     Bucket=self.bucket_name, Key=key, UploadId=upload_id
                 )
                 raise
 
+    def _async_client(self) -> AbstractAsyncContextManager[Any]:
+        """Create the async S3 client context manager used for uploads."""
+        import aioboto3
+
+        client: AbstractAsyncContextManager[Any] = aioboto3.Session().client("s3")
+        return client
+
     def _create_s3_key(self, url: str) -> str:
         """Create an S3 key from a URL using BID for time-based organization."""
         # Parse URL
@@ -0,0 +1,353 @@
+"""Per-bundle tracing spans on the OpenTelemetry SDK.
+
+This module records nested timings for the stages of a bundle (queue wait,
+connection acquire, remote stat, first byte, transfer, decompression, upload
+and completion callbacks) as OpenTelemetry spans. Spans propagate through the
+OpenTelemetry context, so nested stages in the same task are parented
+automatically. Finished spans are aggregated into a per-stage summary logged at
+the end of a run and can optionally be exported: appended to a file as OTLP/JSON
+lines, and sent to the collector configured through the standard
+``OTEL_EXPORTER_OTLP_*`` environment variables.
+
+Each process has its own tracer. In multi-process mode every worker process
+configures a tracer with the coordinator's export settings (see
+``Tracer.settings``), appends its spans to the same export file and logs its
+own summary.
+"""
+
+import base64
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+from google.protobuf.json_format import MessageToDict
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.util.types import AttributeValue
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+ROOT_SPAN_NAME = "bundle"
+
+# Attribute holding the busy time of a stage interleaved with other work
+BUSY_SECONDS_ATTRIBUTE = "busy_seconds"
+
+_OTLP_ENDPOINT_ENV_VARS = (
+    "OTEL_EXPORTER_OTLP_TRACES_ENDPOINT",
+    "OTEL_EXPORTER_OTLP_ENDPOINT",
+)
+
+
+def span_duration_seconds(span: ReadableSpan) -> float:
+    """Time attributed to a finished span: busy time if set, else wall time."""
+    busy = (span.attributes or {}).get(BUSY_SECONDS_ATTRIBUTE)
+    if isinstance(busy, int | float):
+        return max(0.0, float(busy))
+    return max(0, (span.end_time or 0) - (span.start_time or 0)) / 1e9
+
+
+class OtlpJsonFileExporter(SpanExporter):
+    """Append finished spans to a file as OTLP/JSON lines.
+
+    Every export writes one ``ExportTraceServiceRequest`` per line (the layout
+    of the OpenTelemetry Collector file exporter) in a single ``O_APPEND``
+    write, so the worker processes of a run can share the file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the exporter.
+
+        Args:
+            path: File the spans are appended to.
+        """
+        self.path = Path(path)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Append a batch of spans to the file."""
+        request = MessageToDict(encode_spans(spans), use_integers_for_enums=True)
+        # The protobuf JSON mapping encodes ids as base64; OTLP/JSON uses hex
+        for resource_spans in request.get("resourceSpans", []):
+            for scope_spans in resource_spans.get("scopeSpans", []):
+                for otlp_span in scope_spans.get("spans", []):
+                    for key in ("traceId", "spanId", "parentSpanId"):
+                        if key in otlp_span:
+                            otlp_span[key] = base64.b64decode(otlp_span[key]).hex()
+        line = (json.dumps(request, separators=(",", ":")) + "\n").encode()
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            logger.exception("TRACE_EXPORT_FAILED", path=str(self.path))
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        """Nothing to release; the file is opened per export."""
+
+
+@dataclass
+class _StageStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class _StageStatsProcessor(SpanProcessor):
+    """Aggregates finished spans into per-stage statistics."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, span: ReadableSpan) -> None:
+        duration = span_duration_seconds(span)
+        with self._lock:
+            stats = self.stats.get(span.name)
+            if stats is None:
+                stats = self.stats[span.name] = _StageStats()
+            stats.count += 1
+            stats.total_seconds += duration
+            stats.max_seconds = max(stats.max_seconds, duration)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.stats.clear()
+
+
+class StageTimer:
+    """Accumulates time of a stage interleaved with other work.
+
+    Used for streams, where reading, decompressing and uploading chunks are
+    interleaved: wrap only the stage's own work in ``with timer:`` and call
+    ``finish`` once the stream ends. The span covers the first to the last
+    timed block and reports the accumulated busy time.
+    """
+
+    def __init__(
+        self, tracer: "Tracer", name: str, **attributes: AttributeValue
+    ) -> None:
+        """Initialize the timer under the caller's current span."""
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._parent = trace.get_current_span()
+        self._first_ns: int | None = None
+        self._last_ns = 0
+        self._busy_ns = 0
+        self._entered_ns = 0
+
+    def __enter__(self) -> "StageTimer":
+        """Start timing a block."""
+        self._entered_ns = time.time_ns()
+        if self._first_ns is None:
+            self._first_ns = self._entered_ns
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Stop timing a block."""
+        self._last_ns = time.time_ns()
+        self._busy_ns += self._last_ns - self._entered_ns
+
+    def finish(self) -> None:
+        """Record the accumulated span (no-op if no block was timed)."""
+        if self._first_ns is None:
+            return
+        self._tracer.record(
+            self._name,
+            self._first_ns,
+            self._last_ns,
+            busy_ns=self._busy_ns,
+            parent=self._parent,
+            **self._attributes,
+        )
+        self._first_ns = None
+
+
+class Tracer:
+    """Records OpenTelemetry spans and aggregates per-stage statistics."""
+
+    def __init__(
+        self,
+        service_name: str = "data-fetcher",
+        *,
+        export_path: str | Path | None = None,
+        span_processors: Sequence[SpanProcessor] = (),
+    ) -> None:
+        """Initialize the tracer.
+
+        Args:
+            service_name: Service name reported in exported traces.
+            export_path: Append finished spans to this file as OTLP/JSON lines.
+            span_processors: Additional processors receiving finished spans.
+                Only the summary is kept when none is configured.
+        """
+        self.service_name = service_name
+        self.export_path = str(export_path) if export_path is not None else None
+        self._stats = _StageStatsProcessor()
+        self._provider = TracerProvider(
+            resource=Resource.create({"service.name": service_name})
+        )
+        self._provider.add_span_processor(self._stats)
+        if self.export_path is not None:
+            self._provider.add_span_processor(
+                BatchSpanProcessor(OtlpJsonFileExporter(self.export_path))
+            )
+        for processor in span_processors:
+            self._provider.add_span_processor(processor)
+        self._tracer = self._provider.get_tracer(__name__)
+
+    @property
+    def settings(self) -> dict[str, Any]:
+        """Picklable arguments recreating this tracer's file export elsewhere."""
+        return {"service_name": self.service_name, "export_path": self.export_path}
+
+    @staticmethod
+    def current_span() -> trace.Span | None:
+        """Get the span active in the current context."""
+        span = trace.get_current_span()
+        return span if span.get_span_context().is_valid else None
+
+    @contextmanager
+    def span(self, name: str, **attributes: AttributeValue) -> Iterator[trace.Span]:
+        """Time the enclosed block as a child of the current span.
+
+        A span opened with no current span starts a new trace. A block that
+        raises is recorded with an error status and exception event.
+        """
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    def stage(self, name: str, **attributes: AttributeValue) -> StageTimer:
+        """Create a timer accumulating an interleaved stage (see StageTimer)."""
+        return StageTimer(self, name, **attributes)
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        busy_ns: int | None = None,
+        parent: trace.Span | None = None,
+        **attributes: AttributeValue,
+    ) -> trace.Span:
+        """Record a span whose timing was measured elsewhere (e.g. queue wait)."""
+        if busy_ns is not None:
+            attributes[BUSY_SECONDS_ATTRIBUTE] = busy_ns / 1e9
+        context = trace.set_span_in_context(parent) if parent is not None else None
+        span = self._tracer.start_span(
+            name, context=context, attributes=attributes, start_time=start_ns
+        )
+        span.end(end_time=end_ns)
+        return span
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Get per-stage statistics, slowest total first.
+
+        ``share`` is the stage's total time relative to the total time of
+        bundle spans, so it shows which stages dominate bundle processing.
+        """
+        stats_by_name = dict(self._stats.stats)
+        root = stats_by_name.get(ROOT_SPAN_NAME)
+        root_total = root.total_seconds if root else 0.0
+        ordered = sorted(
+            stats_by_name.items(), key=lambda item: item[1].total_seconds, reverse=True
+        )
+        return {
+            name: {
+                "count": stats.count,
+                "total_seconds": round(stats.total_seconds, 6),
+                "avg_seconds": round(stats.total_seconds / stats.count, 6),
+                "max_seconds": round(stats.max_seconds, 6),
+                "share": round(stats.total_seconds / root_total, 4)
+                if root_total
+                else 0.0,
+            }
+            for name, stats in ordered
+        }
+
+    def log_summary(self) -> None:
+        """Log the per-stage summary (nothing if no span was recorded)."""
+        if self._stats.stats:
+            logger.info("TRACE_SUMMARY", stages=self.summary())
+
+    def force_flush(self) -> bool:
+        """Export the spans still buffered by the span processors."""
+        return self._provider.force_flush()
+
+    def shutdown(self) -> None:
+        """Flush buffered spans and shut the span processors down."""
+        self._provider.shutdown()
+        if self.export_path is not None:
+            logger.info("TRACE_EXPORTED", path=self.export_path)
+
+    def reset(self) -> None:
+        """Drop the per-stage statistics."""
+        self._stats.clear()
+
+
+def _environment_span_processors() -> list[SpanProcessor]:
+    """Get the OTLP export processor when a collector endpoint is configured."""
+    if not any(os.environ.get(name) for name in _OTLP_ENDPOINT_ENV_VARS):
+        return []
+    return [BatchSpanProcessor(OTLPSpanExporter())]
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def configure_tracer(
+    service_name: str = "data-fetcher",
+    *,
+    export_path: str | Path | None = None,
+    append: bool = False,
+    span_processors: Sequence[SpanProcessor] = (),
+) -> Tracer:
+    """Replace the process-wide tracer.
+
+    Spans are also sent to an OTLP collector when ``OTEL_EXPORTER_OTLP_ENDPOINT``
+    (or ``OTEL_EXPORTER_OTLP_TRACES_ENDPOINT``) is set.
+
+    Args:
+        service_name: Service name reported in exported traces.
+        export_path: Append finished spans to this file as OTLP/JSON lines.
+        append: Keep spans already in ``export_path``. The file is truncated
+            otherwise, so a run does not mix its spans with an earlier run's.
+        span_processors: Additional processors receiving finished spans.
+
+    Returns:
+        The new process-wide tracer.
+    """
+    global _tracer  # noqa: PLW0603
+    if export_path is not None and not append:
+        Path(export_path).write_bytes(b"")
+    _tracer.shutdown()
+    _tracer = Tracer(
+        service_name,
+        export_path=export_path,
+        span_processors=[*span_processors, *_environment_span_processors()],
+    )
+    return _tracer
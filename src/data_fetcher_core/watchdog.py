@@ -0,0 +1,157 @@
+"""Per-bundle deadlines and stall detection.
+
+This module runs a bundle load as a separate task and cancels it when it runs
+longer than its deadline or transfers fewer than a minimum number of bytes per
+second over a window. Loaders report transferred bytes with `record_progress`;
+the count is carried to the load task through ``contextvars``.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, TypeVar
+
+import structlog
+
+from data_fetcher_core.exceptions import BundleTimeoutError
+from data_fetcher_core.metrics import BUNDLE_TIMEOUTS
+
+if TYPE_CHECKING:
+    from data_fetcher_core.core import (
+        BundleLoadResult,
+        BundleRef,
+        DataRegistryFetcherConfig,
+        FetchRunContext,
+    )
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class TransferProgress:
+    """Bytes transferred by one bundle load."""
+
+    def __init__(self) -> None:
+        """Initialize the progress counter."""
+        self.bytes = 0
+
+
+_current_progress: ContextVar[TransferProgress | None] = ContextVar(
+    "bundle_transfer_progress", default=None
+)
+
+
+@contextmanager
+def tracking_progress(progress: TransferProgress) -> Iterator[TransferProgress]:
+    """Count bytes reported in this context (and tasks started in it) in ``progress``."""
+    token = _current_progress.set(progress)
+    try:
+        yield progress
+    finally:
+        _current_progress.reset(token)
+
+
+def record_progress(nbytes: int) -> None:
+    """Count bytes transferred by the bundle load running in this context."""
+    progress = _current_progress.get()
+    if progress is not None:
+        progress.bytes += nbytes
+
+
+async def run_with_watchdog(  # noqa: UP047
+    operation: Callable[[], Awaitable[T]],
+    *,
+    bid: str,
+    deadline_seconds: float | None = None,
+    min_bytes_per_second: float | None = None,
+    window_seconds: float = 60.0,
+) -> T:
+    """Run an operation, cancelling it when it overruns or stalls.
+
+    Args:
+        operation: Loads the bundle.
+        bid: Bundle id, for errors and logs.
+        deadline_seconds: Maximum run time, or None for no deadline.
+        min_bytes_per_second: Minimum throughput over each window, or None to
+            disable stall detection.
+        window_seconds: Window the throughput is measured over.
+
+    Returns:
+        The result of the operation.
+
+    Raises:
+        BundleTimeoutError: If the operation was cancelled.
+    """
+    if deadline_seconds is None and min_bytes_per_second is None:
+        return await operation()
+
+    # Reuse a counter set up by the caller, so bytes are not counted twice
+    progress = _current_progress.get() or TransferProgress()
+    with tracking_progress(progress):
+        # The task copies the current context, so it reports to ``progress``
+        task = asyncio.create_task(_run(operation))
+
+    started = window_started = time.monotonic()
+    window_bytes = 0
+    try:
+        while True:
+            now = time.monotonic()
+            waits: list[float] = []
+            if deadline_seconds is not None:
+                waits.append(started + deadline_seconds - now)
+            if min_bytes_per_second is not None:
+                waits.append(window_started + window_seconds - now)
+            done, _ = await asyncio.wait({task}, timeout=max(0.0, min(waits)))
+            if done:
+                return task.result()
+
+            now = time.monotonic()
+            if deadline_seconds is not None and now - started >= deadline_seconds:
+                _raise_timeout(
+                    bid, "deadline", f"exceeded its {deadline_seconds}s deadline"
+                )
+            elapsed = now - window_started
+            if min_bytes_per_second is not None and elapsed >= window_seconds:
+                rate = (progress.bytes - window_bytes) / elapsed
+                if rate < min_bytes_per_second:
+                    _raise_timeout(
+                        bid,
+                        "stalled",
+                        f"stalled at {rate:.0f} bytes/s over {window_seconds}s",
+                    )
+                window_started, window_bytes = now, progress.bytes
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+
+
+async def _run(operation: Callable[[], Awaitable[T]]) -> T:  # noqa: UP047
+    return await operation()
+
+
+def _raise_timeout(bid: str, reason: str, detail: str) -> None:
+    BUNDLE_TIMEOUTS.labels(reason=reason).inc()
+    logger.warning("BUNDLE_LOAD_CANCELLED", bid=bid, reason=reason, detail=detail)
+    error_message = f"Bundle {bid} load {detail}"
+    raise BundleTimeoutError(error_message, bid, reason)
+
+
+async def load_with_watchdog(
+    bundle: "BundleRef",
+    storage: object,
+    run_ctx: "FetchRunContext",
+    config: "DataRegistryFetcherConfig",
+) -> "BundleLoadResult":
+    """Load a bundle with the deadline and stall detection of the config."""
+    return await run_with_watchdog(
+        lambda: config.loader.load(bundle, storage, run_ctx, config),
+        bid=str(bundle.bid),
+        deadline_seconds=config.bundle_deadline_seconds,
+        min_bytes_per_second=config.stall_min_bytes_per_second,
+        window_seconds=config.stall_window_seconds,
+    )
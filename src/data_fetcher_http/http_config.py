@@ -26,6 +26,25 @@ class HttpProtocolConfig(ProtocolConfig):
     # Pool configuration and baseline
     pool_min_size: int = 0
     pool_max_size: int = 10
+    # Idle clients beyond pool_min_size are closed after this many seconds
+    pool_idle_timeout_seconds: float = 300.0
+    # Interval of keep-alive requests to base_url on idle clients. Disabled by
+    # default since keep-alive requests count against the API's rate limit.
+    pool_keepalive_seconds: float | None = None
+    # Consecutive connection failures or 5xx responses that open the pool's circuit breaker
+    # (None disables it) and seconds before a probe is let through
+    circuit_failure_threshold: int | None = 5
+    circuit_recovery_seconds: float = 30.0
+    # Retries allowed per request across the pool (None: no retry budget)
+    retry_budget_ratio: float | None = 0.2
+    # Hedging of GET/HEAD requests: when a request is slower than the
+    # hedge_quantile of recent latencies, a second one is sent and the first
+    # response wins. Hedges go through the rate limiter and are capped to
+    # hedge_max_ratio of requests.
+    hedge_requests: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_max_ratio: float = 0.05
     base_url: str | None = None
 
     def __post_init__(self) -> None:
@@ -0,0 +1,145 @@
+"""Hedged HTTP requests.
+
+This module provides the latency tracker and the hedging helper used by
+`HttpConnectionPool`: when an idempotent request has not completed within the
+observed tail latency, a second identical request is sent and the first
+successful response wins.
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import httpx
+import structlog
+
+from data_fetcher_core.metrics import HTTP_HEDGED_REQUESTS
+from data_fetcher_core.retry import RetryBudget
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Requests that can be sent twice without side effects
+HEDGEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Number of recent latencies the hedge delay is computed from
+LATENCY_WINDOW = 200
+
+
+class LatencyTracker:
+    """Bounded window of recent request latencies."""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """Initialize the latency tracker.
+
+        Args:
+            window: Number of recent samples kept.
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Latency below which a fraction ``q`` of the samples fall.
+
+        Returns:
+            The quantile in seconds, or None without samples.
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+async def _first_success(
+    tasks: set[asyncio.Task[httpx.Response]],
+) -> asyncio.Task[httpx.Response]:
+    """Wait for the first task that returns a response.
+
+    Raises:
+        The error of the last task to fail if none succeeds.
+    """
+    pending = set(tasks)
+    while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task
+        if not pending:
+            failed = done.pop()
+            raise failed.exception()  # type: ignore[misc]
+
+
+async def _discard(tasks: set[asyncio.Task[httpx.Response]]) -> None:
+    """Cancel unfinished tasks and close responses that lost the race."""
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(BaseException):
+            response = await task
+            await response.aclose()
+
+
+async def send_hedged(
+    send: Callable[[], Coroutine[Any, Any, httpx.Response]],
+    latencies: LatencyTracker,
+    budget: RetryBudget,
+    *,
+    quantile: float,
+    min_samples: int,
+) -> httpx.Response:
+    """Send a request, hedging it if it is slower than usual.
+
+    If the request has not completed after the ``quantile`` of recent
+    latencies, ``send`` is called a second time when the hedge ``budget``
+    allows it. The first successful response is returned and the other
+    request is cancelled. Until ``min_samples`` latencies have been observed
+    no hedges are sent.
+
+    Args:
+        send: Sends the request once (including rate limiting).
+        latencies: Recent latencies of hedgeable requests of the pool.
+        budget: Budget capping hedges to a fraction of requests.
+        quantile: Latency quantile after which a hedge is sent.
+        min_samples: Samples needed before hedging starts.
+
+    Returns:
+        The first successful response.
+    """
+    HTTP_HEDGED_REQUESTS.labels(outcome="eligible").inc()
+    budget.record_request()
+    delay = latencies.quantile(quantile) if len(latencies) >= min_samples else None
+
+    started = time.monotonic()
+    primary: asyncio.Task[httpx.Response] = asyncio.create_task(send())
+    tasks = {primary}
+    winner: asyncio.Task[httpx.Response] | None = None
+    try:
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                if budget.try_spend():
+                    HTTP_HEDGED_REQUESTS.labels(outcome="sent").inc()
+                    logger.debug("HTTP_HEDGE_SENT", delay_seconds=round(delay, 3))
+                    tasks.add(asyncio.create_task(send()))
+                else:
+                    HTTP_HEDGED_REQUESTS.labels(outcome="budget_exhausted").inc()
+        winner = await _first_success(tasks)
+    finally:
+        await _discard(tasks - {winner})
+
+    if winner is not primary:
+        HTTP_HEDGED_REQUESTS.labels(outcome="won").inc()
+    latencies.record(time.monotonic() - started)
+    return winner.result()
@@ -38,6 +38,14 @@ class StreamingHttpBundleLoader:
     follow_redirects: bool = True
     max_redirects: int = 5
 
+    async def on_run_start(self, _ctx: FetchRunContext) -> None:
+        """Pre-warm the HTTP connection pool to its minimum size."""
+        await self.http_manager.warm_up(self.http_config)
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        """Close pooled HTTP clients and stop their maintenance."""
+        await self.http_manager.close_all()
+
     async def load(
         self,
         bundle: BundleRef,
@@ -49,6 +49,18 @@ class HttpManager:
         pool = self._get_or_create_pool(config)
         return await pool.acquire(app_config)
 
+    async def warm_up(self, config: HttpProtocolConfig) -> int:
+        """Open the configuration's pool up to its minimum size.
+
+        Args:
+            config: The HTTP protocol configuration.
+
+        Returns:
+            The number of clients opened.
+        """
+        pool = self._get_or_create_pool(config)
+        return await pool.warm_up()
+
     async def close_all(self) -> None:
         for pool in self._connection_pools.values():
             await pool.close()
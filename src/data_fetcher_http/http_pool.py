@@ -1,17 +1,51 @@
 import asyncio
+import contextlib
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 import httpx
+import structlog
 
-from data_fetcher_core.retry import create_retry_engine
+from data_fetcher_core.metrics import (
+    BYTES_TRANSFERRED,
+    LOADER_TTFB,
+    POOL_CONNECTIONS_IN_USE,
+    POOL_CONNECTIONS_OPEN,
+    RATE_LIMIT_WAIT,
+)
+from data_fetcher_core.retry import (
+    CircuitBreaker,
+    RetryBudget,
+    background_task_context,
+    create_circuit_breaker,
+    create_retry_budget,
+    create_retry_engine,
+)
+from data_fetcher_core.tracing import get_tracer
+from data_fetcher_core.watchdog import record_progress
 from data_fetcher_http.http_config import HttpProtocolConfig
 from data_fetcher_http.http_connection import HttpConnection
+from data_fetcher_http.http_hedging import (
+    HEDGEABLE_METHODS,
+    LatencyTracker,
+    send_hedged,
+)
 
 if TYPE_CHECKING:
     from data_fetcher_app.app_config import FetcherConfig
 
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Responses with this status or above count as failures of the host
+_SERVER_ERROR_STATUS = 500
+
+
+def _is_host_failure(exc: BaseException) -> bool:
+    """Whether an error means the host is unreachable (not a bad request)."""
+    return isinstance(exc, httpx.TransportError)
+
 
 @dataclass
 class HttpConnectionPool:
@@ -23,6 +57,14 @@ class HttpConnectionPool:
     _retry_engine: Any = None
     _idle: asyncio.Queue[httpx.AsyncClient] | None = None
     _total: int = 0
+    # When each idle client was returned to the pool (monotonic seconds)
+    _idle_since: dict[int, float] | None = None
+    _maintenance_task: asyncio.Task[None] | None = None
+    # Circuit breakers by request host
+    _circuit_breakers: dict[str, CircuitBreaker] | None = None
+    # Recent latencies of hedgeable requests and the budget capping hedges
+    _latencies: LatencyTracker | None = None
+    _hedge_budget: RetryBudget | None = None
 
     def __post_init__(self) -> None:
         """Initialize the connection pool."""
@@ -31,10 +73,21 @@ class HttpConnectionPool:
 
         if self._retry_engine is None:
             self._retry_engine = create_retry_engine(
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                retry_budget=create_retry_budget(self.config.retry_budget_ratio),
             )
         if self._idle is None:
             self._idle = asyncio.Queue()
+        if self._idle_since is None:
+            self._idle_since = {}
+        if self._circuit_breakers is None:
+            self._circuit_breakers = {}
+        if self._latencies is None:
+            self._latencies = LatencyTracker()
+        if self._hedge_budget is None:
+            self._hedge_budget = RetryBudget(
+                ratio=self.config.hedge_max_ratio, min_tokens=0.0
+            )
 
     async def _create_client(self) -> httpx.AsyncClient:
         return httpx.AsyncClient(
@@ -63,7 +116,71 @@ class HttpConnectionPool:
         url: str,
         **kwargs: object,
     ) -> httpx.Response:
+        breaker = self._circuit_breaker_for(client.base_url.join(url).host)
+
+        async def _send() -> httpx.Response:
+            await self._wait_for_rate_limit()
+            if breaker is not None:
+                breaker.before_call()
+
+            try:
+                with (
+                    LOADER_TTFB.labels(protocol="http").time(),
+                    get_tracer().span("http_request", method=method),
+                ):
+                    response = await client.request(
+                        method,
+                        url,
+                        **kwargs,  # type: ignore[arg-type]
+                    )
+            except asyncio.CancelledError:
+                # e.g. a hedged request that lost the race
+                if breaker is not None:
+                    breaker.record_cancelled()
+                raise
+            except Exception as e:
+                if breaker is not None:
+                    breaker.record_exception(e)
+                raise
+            if breaker is not None:
+                if response.status_code >= _SERVER_ERROR_STATUS:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            BYTES_TRANSFERRED.labels(protocol="http").inc(response.num_bytes_downloaded)
+            record_progress(response.num_bytes_downloaded)
+            return response
+
         async def _make_request() -> httpx.Response:
+            if self.config.hedge_requests and method.upper() in HEDGEABLE_METHODS:
+                return await send_hedged(
+                    _send,
+                    self._latencies,  # type: ignore[arg-type]
+                    self._hedge_budget,  # type: ignore[arg-type]
+                    quantile=self.config.hedge_quantile,
+                    min_samples=self.config.hedge_min_samples,
+                )
+            return await _send()
+
+        result = await self._retry_engine.execute_with_retry_async(_make_request)
+        return cast("httpx.Response", result)
+
+    def _circuit_breaker_for(self, host: str) -> CircuitBreaker | None:
+        """Get the circuit breaker of a host, creating it on first use."""
+        breaker = self._circuit_breakers.get(host)  # type: ignore[union-attr]
+        if breaker is None:
+            breaker = create_circuit_breaker(
+                f"http:{host}",
+                failure_threshold=self.config.circuit_failure_threshold,
+                recovery_timeout=self.config.circuit_recovery_seconds,
+                is_failure=_is_host_failure,
+            )
+            if breaker is not None:
+                self._circuit_breakers[host] = breaker  # type: ignore[index]
+        return breaker
+
+    async def _wait_for_rate_limit(self) -> None:
+        with RATE_LIMIT_WAIT.labels(protocol="http").time():
             async with self._rate_limit_lock:  # type: ignore[union-attr]
                 now = time.time()
                 time_since_last = now - self._last_request_time
@@ -72,12 +189,118 @@ class HttpConnectionPool:
                     await asyncio.sleep(min_interval - time_since_last)
                 self._last_request_time = time.time()
 
-            return await client.request(method, url, **kwargs)  # type: ignore[arg-type]
+    async def _ping(self, client: httpx.AsyncClient) -> None:
+        """Send a HEAD request to base_url to open or keep the connection alive."""
+        if not self.config.base_url:
+            return
+        await self._wait_for_rate_limit()
+        try:
+            await client.head("/")
+        except httpx.HTTPError as e:
+            # Only the TCP/TLS connection matters here, not the response
+            logger.debug("HTTP_POOL_PING_FAILED", error=str(e))
 
-        result = await self._retry_engine.execute_with_retry_async(_make_request)
-        return cast("httpx.Response", result)
+    def _lease(
+        self, client: httpx.AsyncClient, app_config: "FetcherConfig"
+    ) -> HttpConnection:
+        self._idle_since.pop(id(client), None)  # type: ignore[union-attr]
+        POOL_CONNECTIONS_IN_USE.labels(protocol="http").inc()
+        return HttpConnection(self, client, app_config)
+
+    async def _put_idle(self, client: httpx.AsyncClient) -> None:
+        self._idle_since[id(client)] = time.monotonic()  # type: ignore[index]
+        await self._idle.put(client)  # type: ignore[union-attr]
+
+    async def _close_idle(self, client: httpx.AsyncClient) -> None:
+        self._idle_since.pop(id(client), None)  # type: ignore[union-attr]
+        with contextlib.suppress(Exception):
+            await client.aclose()
+        self._discard()
+
+    async def warm_up(self) -> int:
+        """Open clients up to ``pool_min_size`` concurrently.
+
+        When ``base_url`` is set each new client sends a HEAD request so its
+        TCP/TLS connection is established before the first real request. Also
+        starts the background task that closes clients idle for longer than
+        ``pool_idle_timeout_seconds`` (down to the minimum), sends keep-alive
+        requests when ``pool_keepalive_seconds`` is set and refills the pool
+        to the minimum.
+
+        Returns:
+            The number of clients opened.
+        """
+        missing = self.config.pool_min_size - self._total
+        if missing > 0:
+            clients = [await self._create_client() for _ in range(missing)]
+            self._total += missing
+            POOL_CONNECTIONS_OPEN.labels(protocol="http").inc(missing)
+            await asyncio.gather(*(self._ping(client) for client in clients))
+            for client in clients:
+                await self._put_idle(client)
+            logger.info(
+                "HTTP_POOL_WARMED_UP",
+                base_url=self.config.base_url,
+                opened=missing,
+                pool_min_size=self.config.pool_min_size,
+            )
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(
+                self._maintain(), context=background_task_context()
+            )
+        return max(missing, 0)
+
+    async def _maintain(self) -> None:
+        interval = (
+            self.config.pool_keepalive_seconds
+            or self.config.pool_idle_timeout_seconds / 2
+        )
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.maintain_idle()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("HTTP_POOL_MAINTENANCE_FAILED", error=str(e))
+
+    async def maintain_idle(self) -> None:
+        """Reap, keep alive and refill idle clients once."""
+        now = time.monotonic()
+        idle: list[httpx.AsyncClient] = []
+        while not self._idle.empty():  # type: ignore[union-attr]
+            idle.append(self._idle.get_nowait())  # type: ignore[union-attr]
+
+        keep: list[httpx.AsyncClient] = []
+        for client in idle:
+            idle_since = self._idle_since.get(id(client), now)  # type: ignore[union-attr]
+            if client.is_closed:
+                self._idle_since.pop(id(client), None)  # type: ignore[union-attr]
+                self._discard()
+            elif (
+                now - idle_since >= self.config.pool_idle_timeout_seconds
+                and self._total > self.config.pool_min_size
+            ):
+                await self._close_idle(client)
+            else:
+                keep.append(client)
+
+        if self.config.pool_keepalive_seconds:
+            await asyncio.gather(*(self._ping(client) for client in keep))
+        for client in keep:
+            # Put back without resetting the idle clock
+            await self._idle.put(client)  # type: ignore[union-attr]
+
+        if self._total < self.config.pool_min_size:
+            await self.warm_up()
+
+    def _discard(self) -> None:
+        self._total = max(0, self._total - 1)
+        POOL_CONNECTIONS_OPEN.labels(protocol="http").dec()
 
     async def acquire(self, app_config: "FetcherConfig") -> HttpConnection:
+        with get_tracer().span("connection_acquire", protocol="http"):
+            return await self._acquire(app_config)
+
+    async def _acquire(self, app_config: "FetcherConfig") -> HttpConnection:
         while True:
             try:
                 client = self._idle.get_nowait()  # type: ignore[union-attr]
@@ -86,34 +309,41 @@ class HttpConnectionPool:
 
             if client is not None:
                 if client.is_closed:
-                    self._total = max(0, self._total - 1)
+                    self._discard()
                     continue
-                return HttpConnection(self, client, app_config)
+                return self._lease(client, app_config)
 
             if self._total < self.config.pool_max_size:
                 client = await self._create_client()
                 self._total += 1
-                return HttpConnection(self, client, app_config)
+                POOL_CONNECTIONS_OPEN.labels(protocol="http").inc()
+                return self._lease(client, app_config)
 
             client = await self._idle.get()  # type: ignore[union-attr]
             if client.is_closed:
-                self._total = max(0, self._total - 1)
+                self._discard()
                 continue
-            return HttpConnection(self, client, app_config)
+            return self._lease(client, app_config)
 
     async def release(self, client: httpx.AsyncClient) -> None:
+        POOL_CONNECTIONS_IN_USE.labels(protocol="http").dec()
         if client.is_closed:
-            self._total = max(0, self._total - 1)
+            self._discard()
             return
-        await self._idle.put(client)  # type: ignore[union-attr]
+        await self._put_idle(client)
 
     async def close(self) -> None:
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
         try:
             while True:
                 client = self._idle.get_nowait()  # type: ignore[union-attr]
                 try:
                     await client.aclose()
                 finally:
-                    self._total = max(0, self._total - 1)
+                    self._discard()
         except asyncio.QueueEmpty:
             pass
@@ -5,17 +5,20 @@ including support for pagination, filtering, and dynamic data discovery.
 """
 
 import asyncio
-from collections.abc import Callable
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 import structlog
 
+from data_fetcher_core.bloom_filter import BloomFilter
 from data_fetcher_core.core import BundleRef, FetchRunContext, RequestMeta
-from data_fetcher_core.kv_store import KeyValueStore
+from data_fetcher_core.kv_store import KeyValueStore, ProcessedItemSet
 from data_fetcher_http.http_config import HttpProtocolConfig
 from data_fetcher_http.http_manager import HttpManager
+from data_fetcher_http_api.url_source import UrlSource
 
 # Get logger for this module
 logger = structlog.get_logger(__name__)
@@ -52,11 +55,25 @@ class PaginationHttpBundleLocator:
     headers: dict[str, str] | None = None
     query_builder: Callable[[str], str] | None = None
     state_management_prefix: str = "api_provider"
+    processed_urls_batch_size: int = 100
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
+    checkpoint_interval_seconds: float = 5.0
 
     def __post_init__(self) -> None:
         """Initialize the bundle locator state and internal variables."""
-        self._processed_urls: set[str] = set()
-        self._url_queue: list[str] = []
+        self._processed_urls = ProcessedItemSet(
+            f"{self.state_management_prefix}:processed_urls:{self.base_url}",
+            batch_size=self.processed_urls_batch_size,
+            ttl=timedelta(days=7),
+            seen_filter=BloomFilter(
+                self.seen_filter_capacity, self.seen_filter_error_rate
+            )
+            if self.seen_filter_capacity
+            else None,
+        )
+        self._last_checkpoint: float = 0.0
+        self._url_queue = UrlSource()
         self._current_date: date | None = None
         self._current_cursor: str = "*"
         self._initialized: bool = False
@@ -70,14 +87,7 @@ class PaginationHttpBundleLocator:
         store = self.store
 
         # Load processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        processed_urls_data = await store.get(processed_urls_key, [])
-        if isinstance(processed_urls_data, list):
-            self._processed_urls = set(processed_urls_data)
-        else:
-            self._processed_urls = set()
+        await self._processed_urls.load(store)
 
         # Load current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -92,19 +102,30 @@ class PaginationHttpBundleLocator:
             self._initialized = state_data.get("initialized", False)  # type: ignore[attr-defined]
             self._last_request_time = state_data.get("last_request_time", 0.0)  # type: ignore[attr-defined]
 
-    async def _save_persistence_state(self, context: FetchRunContext) -> None:  # noqa: ARG002
-        """Save persistence state to kvstore."""
+    async def _save_persistence_state(
+        self,
+        context: FetchRunContext,  # noqa: ARG002
+        *,
+        force: bool = False,
+    ) -> None:
+        """Save persistence state to kvstore.
+
+        Processed URLs are appended in batches and the cursor state is
+        checkpointed at most every ``checkpoint_interval_seconds`` unless
+        ``force`` is set.
+        """
         if not self.store:
             raise NoKeyValueStoreError
         store = self.store
 
-        # Save processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        await store.put(
-            processed_urls_key, list(self._processed_urls), ttl=timedelta(days=7)
-        )
+        # Append newly processed URLs in batches
+        await self._processed_urls.flush(store, force=force)
+
+        # Checkpoint the cursor state periodically rather than on every call
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval_seconds:
+            return
+        await self._processed_urls.flush(store, force=True)
 
         # Save current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -120,6 +141,7 @@ class PaginationHttpBundleLocator:
             "last_updated": datetime.now(UTC).isoformat(),
         }
         await store.put(state_key, state_data, ttl=timedelta(days=7))
+        self._last_checkpoint = now
 
     async def _save_processing_result(
         self,
@@ -173,14 +195,16 @@ class PaginationHttpBundleLocator:
             await self._initialize()
 
         urls: list[RequestMeta] = []
-        while self._url_queue and len(urls) < bundle_refs_needed:
-            url = self._url_queue.pop(0)
+        while len(urls) < bundle_refs_needed:
+            url = await self._url_queue.pop()
+            if url is None:
+                break
             if url not in self._processed_urls:
                 urls.append({"url": url, "headers": self.headers or {}})
                 self._processed_urls.add(url)
 
-        # Save state after generating URLs
-        await self._save_persistence_state(ctx)
+        # Save state after generating URLs, checkpointing once exhausted
+        await self._save_persistence_state(ctx, force=not urls)
         return urls
 
     async def handle_bundle_processed(
@@ -220,7 +244,11 @@ class PaginationHttpBundleLocator:
     ) -> None:
         """Handle when a bundle processing fails."""
         await self._save_error_state(request, error, context)
-        await self._save_persistence_state(context)
+        await self._save_persistence_state(context, force=True)
+
+    async def on_run_end(self, ctx: FetchRunContext) -> None:
+        """Flush buffered processed URLs and checkpoint state at the end of a run."""
+        await self._save_persistence_state(ctx, force=True)
 
     async def _initialize(self) -> None:
         """Initialize the provider with the date range."""
@@ -316,49 +344,65 @@ class PaginationHttpBundleLocator:
 
 @dataclass
 class SingleHttpBundleLocator:
-    """Bundle locator for single API endpoints."""
+    """Bundle locator for single API endpoints.
+
+    URLs are consumed lazily from ``urls``, then ``urls_file`` (one URL per
+    line) and then the values stored under ``urls_kv_prefix``, so large URL
+    lists never need to be held in memory or inlined in configuration.
+    """
 
     http_config: HttpProtocolConfig
-    store: KeyValueStore
-    urls: list[str]
+    store: KeyValueStore | None
+    urls: Iterable[str] = field(default_factory=list)
+    urls_file: str | None = None
+    urls_kv_prefix: str | None = None
     headers: dict[str, str] | None = None
     persistence_prefix: str = "single_api_provider"
+    processed_urls_batch_size: int = 100
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
 
     def __post_init__(self) -> None:
         """Initialize the single API bundle locator state and internal variables."""
-        self._processed_urls: set[str] = set()
-        self._url_queue: list[str] = self.urls.copy()
+        self._processed_urls = ProcessedItemSet(
+            f"{self.persistence_prefix}:processed_urls",
+            batch_size=self.processed_urls_batch_size,
+            ttl=timedelta(days=7),
+            seen_filter=BloomFilter(
+                self.seen_filter_capacity, self.seen_filter_error_rate
+            )
+            if self.seen_filter_capacity
+            else None,
+        )
+        self._url_queue = UrlSource(self.urls)
+        if self.urls_file:
+            self._url_queue.extend(UrlSource.iter_file(self.urls_file))
 
-    async def _load_persistence_state(self, context: FetchRunContext) -> None:  # noqa: ARG002
+    async def _load_persistence_state(self, context: FetchRunContext) -> None:
         """Load persistence state from kvstore."""
+        if not self.store and context.app_config and context.app_config.kv_store:
+            self.store = context.app_config.kv_store
         if not self.store:
             raise NoKeyValueStoreError
         store = self.store
 
-        # Load processed URLs
-        processed_urls_key = f"{self.persistence_prefix}:processed_urls"
-        processed_urls_data = await store.get(processed_urls_key, [])
-        if isinstance(processed_urls_data, list):
-            self._processed_urls = set(processed_urls_data)
-        else:
-            self._processed_urls = set()
+        # Load processed URLs; already processed URLs are skipped as the
+        # queue is drained rather than filtered up front
+        await self._processed_urls.load(store)
 
-        # Filter out already processed URLs from queue
-        self._url_queue = [
-            url for url in self._url_queue if url not in self._processed_urls
-        ]
+        if self.urls_kv_prefix:
+            self._url_queue.extend(UrlSource.iter_kv_range(store, self.urls_kv_prefix))
 
-    async def _save_persistence_state(self, context: FetchRunContext) -> None:  # noqa: ARG002
-        """Save persistence state to kvstore."""
+    async def _save_persistence_state(
+        self,
+        context: FetchRunContext,  # noqa: ARG002
+        *,
+        force: bool = False,
+    ) -> None:
+        """Append newly processed URLs to kvstore in batches."""
         if not self.store:
             raise NoKeyValueStoreError
-        store = self.store
-
-        # Save processed URLs
-        processed_urls_key = f"{self.persistence_prefix}:processed_urls"
-        await store.put(
-            processed_urls_key, list(self._processed_urls), ttl=timedelta(days=7)
-        )
+        await self._processed_urls.flush(self.store, force=force)
 
     async def _save_processing_result(
         self,
@@ -388,18 +432,20 @@ class SingleHttpBundleLocator:
     ) -> list[RequestMeta]:
         """Get the next batch of API URLs to process."""
         # Load persistence state on first call
-        if not self._processed_urls:
+        if not self._processed_urls.loaded:
             await self._load_persistence_state(ctx)
 
         urls: list[RequestMeta] = []
-        while self._url_queue and len(urls) < bundle_refs_needed:
-            url = self._url_queue.pop(0)
+        while len(urls) < bundle_refs_needed:
+            url = await self._url_queue.pop()
+            if url is None:
+                break
             if url not in self._processed_urls:
                 urls.append(RequestMeta(url=url, headers=self.headers or {}))
                 self._processed_urls.add(url)
 
-        # Save state after generating URLs
-        await self._save_persistence_state(ctx)
+        # Save state after generating URLs, checkpointing once exhausted
+        await self._save_persistence_state(ctx, force=not urls)
         return urls
 
     async def handle_bundle_processed(
@@ -419,7 +465,7 @@ class SingleHttpBundleLocator:
         self,
         request: RequestMeta,
         error: str,
-        context: FetchRunContext,  # noqa: ARG002
+        context: FetchRunContext,
     ) -> None:
         """Handle when a bundle processing fails."""
         if not self.store:
@@ -434,3 +480,8 @@ class SingleHttpBundleLocator:
             "retry_count": 0,
         }
         await store.put(error_key, error_data, ttl=timedelta(hours=24))
+        await self._save_persistence_state(context, force=True)
+
+    async def on_run_end(self, ctx: FetchRunContext) -> None:
+        """Flush buffered processed URLs at the end of a run."""
+        await self._save_persistence_state(ctx, force=True)
@@ -28,6 +28,9 @@ if TYPE_CHECKING:
     from data_fetcher_core.storage.file_storage import FileStorage
     from data_fetcher_core.storage.pipeline_bus_storage import DataPipelineBusStorage
     from data_fetcher_core.storage.s3_storage import S3Storage
+    from data_fetcher_http_api.api_pagination_bundle_locators import (
+        PaginationStrategy,
+    )
 
 # Type alias for storage classes
 Storage = Union["FileStorage", "S3Storage", "DataPipelineBusStorage"]
@@ -46,6 +49,41 @@ class HttpBundleLoader:
     follow_redirects: bool = True
     max_redirects: int = 5
     error_handler: Callable[[str, int], bool] | None = None
+    pagination_strategy: "PaginationStrategy | None" = None
+
+    async def on_run_start(self, _ctx: FetchRunContext) -> None:
+        """Pre-warm the HTTP connection pool to its minimum size."""
+        await self.http_manager.warm_up(self.http_config)
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        """Close pooled HTTP clients and stop their maintenance."""
+        await self.http_manager.close_all()
+
+    def _pagination_meta(self, response: object, url: str) -> dict[str, object]:
+        """Extract the next cursor from a paginated JSON response.
+
+        The result is merged into ``bundle_meta`` so that cursor-paginated
+        locators can advance without re-reading the stored resource.
+        """
+        if self.pagination_strategy is None:
+            return {}
+        try:
+            data = response.json()  # type: ignore[attr-defined]
+        except ValueError:
+            logger.warning("PAGINATION_RESPONSE_NOT_JSON", url=url)
+            return {"next_cursor": None, "should_narrow": False}
+        if not isinstance(data, dict):
+            return {"next_cursor": None, "should_narrow": False}
+
+        next_cursor = (
+            self.pagination_strategy.get_next_cursor(data)
+            if self.pagination_strategy.should_continue_pagination(data)
+            else None
+        )
+        return {
+            "next_cursor": next_cursor,
+            "should_narrow": self.pagination_strategy.should_narrow_search(data),
+        }
 
     async def load(
         self,
@@ -108,6 +146,7 @@ class HttpBundleLoader:
                 "content_type": response.headers.get("content-type"),
                 "content_length": response.headers.get("content-length"),
                 "resources_count": 1,
+                **self._pagination_meta(response, url),
             }
 
             # Create logger with BID context for tracing
@@ -5,6 +5,7 @@ including support for various pagination strategies and cursor-based navigation.
 """
 
 import asyncio
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
@@ -13,9 +14,11 @@ from typing import Any
 import structlog
 
 from data_fetcher_app.app_config import AppConfig
+from data_fetcher_core.bloom_filter import BloomFilter
 from data_fetcher_core.core import BundleRef, FetchRunContext, RequestMeta
-from data_fetcher_core.kv_store import KeyValueStore
+from data_fetcher_core.kv_store import KeyValueStore, ProcessedItemSet
 from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http_api.url_source import UrlSource
 
 # Get logger for this module
 logger = structlog.get_logger(__name__)
@@ -103,11 +106,25 @@ class ComplexPaginationHttpBundleLocator:
     pagination_strategy: PaginationStrategy | None = None
     narrowing_strategy: Callable[[str], str] | None = None
     state_management_prefix: str = "complex_pagination_provider"
+    processed_urls_batch_size: int = 100
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
+    checkpoint_interval_seconds: float = 5.0
 
     def __post_init__(self) -> None:
         """Initialize the complex pagination bundle locator state and internal variables."""
-        self._processed_urls: set[str] = set()
-        self._url_queue: list[str] = []
+        self._processed_urls = ProcessedItemSet(
+            f"{self.state_management_prefix}:processed_urls:{self.base_url}",
+            batch_size=self.processed_urls_batch_size,
+            ttl=timedelta(days=7),
+            seen_filter=BloomFilter(
+                self.seen_filter_capacity, self.seen_filter_error_rate
+            )
+            if self.seen_filter_capacity
+            else None,
+        )
+        self._last_checkpoint: float = 0.0
+        self._url_queue = UrlSource()
         self._current_date: date | None = None
         self._current_cursor: str = "*"
         self._current_narrowing: str | None = None
@@ -133,14 +150,7 @@ class ComplexPaginationHttpBundleLocator:
         store = app_config.kv_store
 
         # Load processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        processed_urls_data = await store.get(processed_urls_key, [])
-        if isinstance(processed_urls_data, list):
-            self._processed_urls = set(processed_urls_data)
-        else:
-            self._processed_urls = set()
+        await self._processed_urls.load(store)
 
         # Load current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -155,21 +165,29 @@ class ComplexPaginationHttpBundleLocator:
             self._initialized = state_data.get("initialized", False)
             self._last_request_time = state_data.get("last_request_time", 0.0)
 
-    async def _save_persistence_state(self, context: FetchRunContext) -> None:
-        """Save persistence state to kvstore."""
+    async def _save_persistence_state(
+        self, context: FetchRunContext, *, force: bool = False
+    ) -> None:
+        """Save persistence state to kvstore.
+
+        Processed URLs are appended in batches and the cursor state is
+        checkpointed at most every ``checkpoint_interval_seconds`` unless
+        ``force`` is set.
+        """
         # Use app_config from context if available, otherwise use stored app_config
         app_config = context.app_config or self._app_config
         if not app_config or not app_config.kv_store:
             raise NoKeyValueStoreError
         store = app_config.kv_store
 
-        # Save processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        await store.put(
-            processed_urls_key, list(self._processed_urls), ttl=timedelta(days=7)
-        )
+        # Append newly processed URLs in batches
+        await self._processed_urls.flush(store, force=force)
+
+        # Checkpoint the cursor state periodically rather than on every call
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval_seconds:
+            return
+        await self._processed_urls.flush(store, force=True)
 
         # Save current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -186,6 +204,7 @@ class ComplexPaginationHttpBundleLocator:
             "last_updated": datetime.now(UTC).isoformat(),
         }
         await store.put(state_key, state_data, ttl=timedelta(days=7))
+        self._last_checkpoint = now
 
     async def _save_processing_result(
         self,
@@ -240,14 +259,16 @@ class ComplexPaginationHttpBundleLocator:
             await self._initialize()
 
         urls: list[RequestMeta] = []
-        while self._url_queue and len(urls) < bundle_refs_needed:
-            url = self._url_queue.pop(0)
+        while len(urls) < bundle_refs_needed:
+            url = await self._url_queue.pop()
+            if url is None:
+                break
             if url not in self._processed_urls:
                 urls.append({"url": url, "headers": self.headers or {}})
                 self._processed_urls.add(url)
 
-        # Save state after generating URLs
-        await self._save_persistence_state(ctx)
+        # Save state after generating URLs, checkpointing once exhausted
+        await self._save_persistence_state(ctx, force=not urls)
         return urls
 
     async def handle_bundle_processed(
@@ -284,7 +305,11 @@ class ComplexPaginationHttpBundleLocator:
     ) -> None:
         """Handle when a bundle processing fails."""
         await self._save_error_state(request, error, ctx)
-        await self._save_persistence_state(ctx)
+        await self._save_persistence_state(ctx, force=True)
+
+    async def on_run_end(self, ctx: FetchRunContext) -> None:
+        """Flush buffered processed URLs and checkpoint state at the end of a run."""
+        await self._save_persistence_state(ctx, force=True)
 
     async def _initialize(self) -> None:
         """Initialize the provider with the date range."""
@@ -400,11 +425,25 @@ class ReversePaginationHttpBundleLocator:
     pagination_strategy: PaginationStrategy | None = None
     narrowing_strategy: Callable[[str], str] | None = None
     state_management_prefix: str = "reverse_pagination_provider"
+    processed_urls_batch_size: int = 100
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
+    checkpoint_interval_seconds: float = 5.0
 
     def __post_init__(self) -> None:
         """Initialize the reverse pagination bundle locator state and internal variables."""
-        self._processed_urls: set[str] = set()
-        self._url_queue: list[str] = []
+        self._processed_urls = ProcessedItemSet(
+            f"{self.state_management_prefix}:processed_urls:{self.base_url}",
+            batch_size=self.processed_urls_batch_size,
+            ttl=timedelta(days=7),
+            seen_filter=BloomFilter(
+                self.seen_filter_capacity, self.seen_filter_error_rate
+            )
+            if self.seen_filter_capacity
+            else None,
+        )
+        self._last_checkpoint: float = 0.0
+        self._url_queue = UrlSource()
         self._current_date: date | None = None
         self._current_cursor: str = "*"
         self._current_narrowing: str | None = None
@@ -430,14 +469,7 @@ class ReversePaginationHttpBundleLocator:
         store = app_config.kv_store
 
         # Load processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        processed_urls_data = await store.get(processed_urls_key, [])
-        if isinstance(processed_urls_data, list):
-            self._processed_urls = set(processed_urls_data)
-        else:
-            self._processed_urls = set()
+        await self._processed_urls.load(store)
 
         # Load current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -456,21 +488,29 @@ class ReversePaginationHttpBundleLocator:
             self._initialized = state_data.get("initialized", False)
             self._last_request_time = state_data.get("last_request_time", 0.0)
 
-    async def _save_persistence_state(self, context: FetchRunContext) -> None:
-        """Save persistence state to kvstore."""
+    async def _save_persistence_state(
+        self, context: FetchRunContext, *, force: bool = False
+    ) -> None:
+        """Save persistence state to kvstore.
+
+        Processed URLs are appended in batches and the cursor state is
+        checkpointed at most every ``checkpoint_interval_seconds`` unless
+        ``force`` is set.
+        """
         # Use app_config from context if available, otherwise use stored app_config
         app_config = context.app_config or self._app_config
         if not app_config or not app_config.kv_store:
             raise NoKeyValueStoreError
         store = app_config.kv_store
 
-        # Save processed URLs
-        processed_urls_key = (
-            f"{self.state_management_prefix}:processed_urls:{self.base_url}"
-        )
-        await store.put(
-            processed_urls_key, list(self._processed_urls), ttl=timedelta(days=7)
-        )
+        # Append newly processed URLs in batches
+        await self._processed_urls.flush(store, force=force)
+
+        # Checkpoint the cursor state periodically rather than on every call
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval_seconds:
+            return
+        await self._processed_urls.flush(store, force=True)
 
         # Save current state
         state_key = f"{self.state_management_prefix}:state:{self.base_url}"
@@ -487,6 +527,7 @@ class ReversePaginationHttpBundleLocator:
             "last_updated": datetime.now(UTC).isoformat(),
         }
         await store.put(state_key, state_data, ttl=timedelta(days=7))
+        self._last_checkpoint = now
 
     async def _save_processing_result(
         self,
@@ -522,14 +563,16 @@ class ReversePaginationHttpBundleLocator:
             await self._initialize()
 
         urls: list[RequestMeta] = []
-        while self._url_queue and len(urls) < bundle_refs_needed:
-            url = self._url_queue.pop(0)
+        while len(urls) < bundle_refs_needed:
+            url = await self._url_queue.pop()
+            if url is None:
+                break
             if url not in self._processed_urls:
                 urls.append(RequestMeta(url=url, headers=self.headers or {}))
                 self._processed_urls.add(url)
 
-        # Save state after generating URLs
-        await self._save_persistence_state(ctx)
+        # Save state after generating URLs, checkpointing once exhausted
+        await self._save_persistence_state(ctx, force=not urls)
         return urls
 
     async def handle_bundle_processed(
@@ -581,7 +624,11 @@ class ReversePaginationHttpBundleLocator:
             "retry_count": 0,
         }
         await store.put(error_key, error_data, ttl=timedelta(hours=24))
-        await self._save_persistence_state(context)
+        await self._save_persistence_state(context, force=True)
+
+    async def on_run_end(self, ctx: FetchRunContext) -> None:
+        """Flush buffered processed URLs and checkpoint state at the end of a run."""
+        await self._save_persistence_state(ctx, force=True)
 
     async def _initialize(self) -> None:
         """Initialize the provider with the date range."""
@@ -0,0 +1,432 @@
+"""Partitioned cursor-pagination bundle locator.
+
+This module provides a bundle locator that fans cursor-paginated API requests
+out across independent partitions (one per date and, when a date holds too
+many records, one per narrowing value such as a SIREN prefix). Each partition
+keeps its own cursor so several partitions can be fetched concurrently while
+pages within a partition are still requested strictly in cursor order.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+import structlog
+
+from data_fetcher_core.core import BundleLoadResult, BundleRef, FetchRunContext
+from data_fetcher_core.kv_store import KeyValueStore
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http_api.api_pagination_bundle_locators import NoKeyValueStoreError
+
+# Get logger for this module
+logger = structlog.get_logger(__name__)
+
+# Upper bound on the number of values enumerated from a narrowing strategy
+MAX_NARROWING_VALUES = 1000
+
+
+class NoStorageError(ValueError):
+    """Raised when no storage is available in context to mint bundle IDs."""
+
+    def __init__(self) -> None:
+        """Initialize the no storage error."""
+        super().__init__(
+            "No storage available in context - required to mint bundle IDs"
+        )
+
+
+@dataclass
+class PartitionState:
+    """Cursor state for a single pagination partition.
+
+    A partition is identified by the date it covers and an optional narrowing
+    value. At most one page per partition is in flight at any time, which is
+    what preserves cursor order within the partition.
+    """
+
+    date: str
+    narrowing: str | None = None
+    cursor: str = "*"
+    in_flight: bool = False
+    pages: int = 0
+    failures: int = 0
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to route processed pages back to the partition."""
+        return f"{self.date}|{self.narrowing or '*'}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the partition state for persistence."""
+        return {
+            "date": self.date,
+            "narrowing": self.narrowing,
+            "cursor": self.cursor,
+            "pages": self.pages,
+            "failures": self.failures,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PartitionState":
+        """Restore a partition from persisted state.
+
+        In-flight pages are not persisted: a page that was handed out but never
+        acknowledged is simply requested again after a restart.
+        """
+        return cls(
+            date=str(data["date"]),
+            narrowing=data.get("narrowing"),
+            cursor=str(data.get("cursor", "*")),
+            pages=int(data.get("pages", 0)),
+            failures=int(data.get("failures", 0)),
+        )
+
+
+@dataclass
+class PartitionedPaginationHttpBundleLocator:
+    """Cursor-pagination locator that fetches several partitions concurrently.
+
+    Dates in ``[date_start, date_end]`` are opened as partitions lazily, keeping
+    at most ``max_active_partitions`` open at once. When the first page of a
+    date reports that the search must be narrowed, the date partition is
+    replaced by one partition per value of ``narrowing_strategy``; these are
+    queued and opened ahead of new dates as the active window allows.
+
+    The next cursor of a partition is read from the ``next_cursor`` and
+    ``should_narrow`` entries of the loader's ``bundle_meta``, which
+    ``HttpBundleLoader`` populates when configured with a pagination strategy.
+    """
+
+    http_config: HttpProtocolConfig
+    base_url: str
+    date_start: str
+    date_end: str | None = None
+    max_records_per_page: int = 1000
+    rate_limit_requests_per_second: float = 2.0
+    max_active_partitions: int = 8
+    max_partition_failures: int = 3
+    date_filter: Callable[[str], bool] | None = None
+    query_params: dict[str, Any] | None = None
+    headers: dict[str, str] | None = None
+    query_builder: Callable[[str, str | None], str] | None = None
+    narrowing_strategy: Callable[[str | None], str] | None = None
+    state_management_prefix: str = "partitioned_pagination_provider"
+    state_ttl: timedelta = field(default_factory=lambda: timedelta(days=7))
+
+    def __post_init__(self) -> None:
+        """Initialize the partition bookkeeping."""
+        if self.max_active_partitions < 1:
+            raise ValueError("max_active_partitions must be at least 1")
+        self._partitions: dict[str, PartitionState] = {}
+        # Narrowed partitions waiting for a slot in the active window
+        self._queued: deque[PartitionState] = deque()
+        self._next_date: date | None = None
+        self._end_date: date | None = None
+        self._rotation: int = 0
+        self._initialized: bool = False
+        self._last_request_time: float = 0.0
+        self._rate_limit_lock: asyncio.Lock = asyncio.Lock()
+
+    def _get_store(self, ctx: FetchRunContext) -> KeyValueStore:
+        if not ctx.app_config or not ctx.app_config.kv_store:
+            raise NoKeyValueStoreError
+        store: KeyValueStore = ctx.app_config.kv_store
+        return store
+
+    @property
+    def _state_key(self) -> str:
+        return f"{self.state_management_prefix}:partitions:{self.base_url}"
+
+    async def _initialize(self, ctx: FetchRunContext) -> None:
+        """Restore partition state from the KV store or start a fresh run."""
+        store = self._get_store(ctx)
+        self._end_date = (
+            datetime.strptime(self.date_end, "%Y-%m-%d").date()  # noqa: DTZ007
+            if self.date_end
+            else datetime.now(tz=UTC).date()
+        )
+
+        state = await store.get(self._state_key, {})
+        if state and isinstance(state, dict):
+            for item in state.get("partitions", []):
+                partition = PartitionState.from_dict(item)
+                self._partitions[partition.key] = partition
+            self._queued.extend(
+                PartitionState.from_dict(item)
+                for item in state.get("queued_partitions", [])
+            )
+            next_date = state.get("next_date")
+            self._next_date = (
+                datetime.strptime(next_date, "%Y-%m-%d").date()  # noqa: DTZ007
+                if next_date
+                else None
+            )
+        else:
+            self._next_date = datetime.strptime(  # noqa: DTZ007
+                self.date_start, "%Y-%m-%d"
+            ).date()
+
+        self._initialized = True
+        logger.info(
+            "INITIALIZED_PARTITIONED_PAGINATION_PROVIDER",
+            base_url=self.base_url,
+            date_start=self.date_start,
+            date_end=str(self._end_date),
+            restored_partitions=len(self._partitions),
+            queued_partitions=len(self._queued),
+            max_active_partitions=self.max_active_partitions,
+        )
+
+    async def _save_state(self, ctx: FetchRunContext) -> None:
+        """Persist the open partitions and the next date to open."""
+        store = self._get_store(ctx)
+        state = {
+            "next_date": self._next_date.strftime("%Y-%m-%d")
+            if self._next_date
+            else None,
+            "partitions": [p.to_dict() for p in self._partitions.values()],
+            "queued_partitions": [p.to_dict() for p in self._queued],
+            "last_updated": datetime.now(UTC).isoformat(),
+        }
+        await store.put(self._state_key, state, ttl=self.state_ttl)
+
+    def _open_partitions(self) -> None:
+        """Open queued, then date partitions until the active window is full."""
+        while self._queued and len(self._partitions) < self.max_active_partitions:
+            partition = self._queued.popleft()
+            self._partitions[partition.key] = partition
+
+        while (
+            len(self._partitions) < self.max_active_partitions
+            and self._next_date is not None
+            and self._end_date is not None
+            and self._next_date <= self._end_date
+        ):
+            date_str = self._next_date.strftime("%Y-%m-%d")
+            self._next_date += timedelta(days=1)
+            if self.date_filter and not self.date_filter(date_str):
+                continue
+            partition = PartitionState(date=date_str)
+            self._partitions[partition.key] = partition
+
+        if (
+            self._next_date is not None
+            and self._end_date is not None
+            and self._next_date > self._end_date
+        ):
+            self._next_date = None
+
+    def _narrowing_values(self) -> list[str]:
+        """Enumerate every narrowing value produced by the narrowing strategy."""
+        if not self.narrowing_strategy:
+            return []
+        values: list[str] = []
+        value = self.narrowing_strategy(None)
+        while value not in values and len(values) < MAX_NARROWING_VALUES:
+            values.append(value)
+            value = self.narrowing_strategy(value)
+        return values
+
+    def _build_url(self, partition: PartitionState) -> str:
+        params = {
+            "nombre": str(self.max_records_per_page),
+            "curseur": partition.cursor,
+        }
+        if self.query_builder:
+            params["q"] = self.query_builder(partition.date, partition.narrowing)
+        else:
+            params["q"] = (
+                f"date:[{partition.date}T00:00:00%20TO%20{partition.date}T23:59:59]"
+            )
+        if self.query_params:
+            params.update(self.query_params)
+
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        return f"{self.base_url}?{query_string}"
+
+    def has_pending_work(self) -> bool:
+        """Return True while partitions are open, queued or yet to be opened.
+
+        The fetcher uses this to keep polling the locator while every open
+        partition is waiting for its in-flight page to be processed.
+        """
+        if not self._initialized:
+            return True
+        return (
+            bool(self._partitions) or bool(self._queued) or self._next_date is not None
+        )
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Space out emitted pages to honour the requests-per-second limit."""
+        async with self._rate_limit_lock:
+            loop = asyncio.get_running_loop()
+            time_since_last = loop.time() - self._last_request_time
+            min_interval = 1.0 / self.rate_limit_requests_per_second
+
+            if time_since_last < min_interval:
+                await asyncio.sleep(min_interval - time_since_last)
+
+            self._last_request_time = loop.time()
+
+    async def get_next_bundle_refs(
+        self, ctx: FetchRunContext, bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        """Emit the next page of every idle partition, up to the requested count."""
+        if not self._initialized:
+            await self._initialize(ctx)
+
+        if not ctx.app_config or not ctx.app_config.storage:
+            raise NoStorageError
+
+        self._open_partitions()
+
+        partitions = list(self._partitions.values())
+        if not partitions:
+            return []
+
+        # Rotate the starting point so every partition gets a fair share
+        start = self._rotation % len(partitions)
+        self._rotation += 1
+        ordered = partitions[start:] + partitions[:start]
+
+        bundle_refs: list[BundleRef] = []
+        for partition in ordered:
+            if len(bundle_refs) >= bundle_refs_needed:
+                break
+            if partition.in_flight:
+                continue
+
+            await self._wait_for_rate_limit()
+            url = self._build_url(partition)
+            request_meta = {
+                "url": url,
+                "headers": self.headers or {},
+                "partition": partition.key,
+                "cursor": partition.cursor,
+            }
+            bid = ctx.app_config.storage.bundle_found(request_meta)
+            bundle_refs.append(BundleRef(bid=bid, request_meta=request_meta))
+            partition.in_flight = True
+
+        if bundle_refs:
+            logger.debug(
+                "PARTITION_PAGES_EMITTED",
+                base_url=self.base_url,
+                count=len(bundle_refs),
+                active_partitions=len(partitions),
+            )
+            await self._save_state(ctx)
+        return bundle_refs
+
+    def _partition_for(self, bundle: BundleRef) -> PartitionState | None:
+        key = bundle.request_meta.get("partition")
+        if not isinstance(key, str):
+            return None
+        partition = self._partitions.get(key)
+        if partition is None or not partition.in_flight:
+            return None
+        if bundle.request_meta.get("cursor") != partition.cursor:
+            return None
+        return partition
+
+    async def handle_bundle_processed(
+        self, bundle: BundleRef, result: BundleLoadResult, ctx: FetchRunContext
+    ) -> None:
+        """Advance the cursor of the partition that produced this page."""
+        partition = self._partition_for(bundle)
+        if partition is None:
+            return
+
+        meta = result.bundle_meta or {}
+        if "next_cursor" not in meta:
+            # Without a cursor the partition cannot advance; the loader must be
+            # configured with a pagination strategy
+            logger.error(
+                "PARTITION_CURSOR_MISSING",
+                base_url=self.base_url,
+                partition=partition.key,
+                cursor=partition.cursor,
+            )
+            self._record_failure(partition, "next_cursor missing from bundle_meta")
+            await self._save_state(ctx)
+            return
+
+        partition.in_flight = False
+        partition.pages += 1
+        partition.failures = 0
+        next_cursor = meta.get("next_cursor")
+
+        if meta.get("should_narrow"):
+            self._narrow(partition)
+        elif isinstance(next_cursor, str) and next_cursor != partition.cursor:
+            partition.cursor = next_cursor
+        else:
+            del self._partitions[partition.key]
+            logger.debug(
+                "PARTITION_COMPLETED",
+                base_url=self.base_url,
+                partition=partition.key,
+                pages=partition.pages,
+            )
+
+        await self._save_state(ctx)
+
+    def _narrow(self, partition: PartitionState) -> None:
+        """Replace a date partition holding too many records by narrower ones."""
+        del self._partitions[partition.key]
+        if (
+            partition.narrowing is not None
+            or partition.cursor != "*"
+            or not self.narrowing_strategy
+        ):
+            # The API will not page past its record limit, so the rest of this
+            # partition cannot be fetched
+            logger.error(
+                "PARTITION_TRUNCATED_TOO_MANY_RECORDS",
+                base_url=self.base_url,
+                partition=partition.key,
+                pages=partition.pages,
+            )
+            return
+
+        children = [
+            PartitionState(date=partition.date, narrowing=value)
+            for value in self._narrowing_values()
+        ]
+        # Children wait for a slot behind the active-partition cap
+        self._queued.extend(children)
+        logger.info(
+            "PARTITION_NARROWED",
+            base_url=self.base_url,
+            date=partition.date,
+            children=len(children),
+        )
+
+    def _record_failure(self, partition: PartitionState, error: str) -> None:
+        """Release the partition so its page is retried, or give up on it."""
+        partition.in_flight = False
+        partition.failures += 1
+        if partition.failures >= self.max_partition_failures:
+            del self._partitions[partition.key]
+            logger.error(
+                "PARTITION_ABANDONED_AFTER_FAILURES",
+                base_url=self.base_url,
+                partition=partition.key,
+                cursor=partition.cursor,
+                failures=partition.failures,
+                error=error,
+            )
+
+    async def handle_bundle_error(
+        self, bundle: BundleRef, error: str, ctx: FetchRunContext
+    ) -> None:
+        """Release the partition so its page is retried, or give up on it."""
+        partition = self._partition_for(bundle)
+        if partition is None:
+            return
+
+        self._record_failure(partition, error)
+        await self._save_state(ctx)
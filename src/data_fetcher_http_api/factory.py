@@ -4,7 +4,7 @@ This module provides factory functions to create and configure HTTP API
 components including bundle locators and loaders.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from data_fetcher_core.kv_store import KeyValueStore
@@ -20,6 +20,9 @@ from data_fetcher_http_api.api_pagination_bundle_locators import (
     CursorPaginationStrategy,
     ReversePaginationHttpBundleLocator,
 )
+from data_fetcher_http_api.api_partitioned_bundle_locators import (
+    PartitionedPaginationHttpBundleLocator,
+)
 
 
 def create_pagination_http_bundle_locator(
@@ -67,19 +70,23 @@ def create_pagination_http_bundle_locator(
 
 def create_single_http_bundle_locator(
     http_config: HttpProtocolConfig,
-    urls: list[str],
+    urls: Iterable[str],
     headers: dict[str, str] | None = None,
     state_management_prefix: str = "single_http_bundle_locator",
     store: KeyValueStore | None = None,
+    urls_file: str | None = None,
+    urls_kv_prefix: str | None = None,
 ) -> SingleHttpBundleLocator:
     """Create a single HTTP bundle locator for processing specific URLs.
 
     Args:
         http_config: HTTP protocol configuration.
-        urls: List of URLs to process.
+        urls: URLs to process, consumed lazily.
         headers: HTTP headers. Defaults to None.
         state_management_prefix: Prefix for state management. Defaults to "single_http_bundle_locator".
         store: Key-value store for state management. Defaults to None.
+        urls_file: Optional file of additional URLs, one per line.
+        urls_kv_prefix: Optional KV key prefix holding additional URLs.
 
     Returns:
         Configured SingleHttpBundleLocator instance.
@@ -91,6 +98,8 @@ def create_single_http_bundle_locator(
     return SingleHttpBundleLocator(
         http_config=http_config,
         urls=urls,
+        urls_file=urls_file,
+        urls_kv_prefix=urls_kv_prefix,
         headers=headers,
         store=store,
         persistence_prefix=state_management_prefix,
@@ -209,6 +218,52 @@ def create_reverse_pagination_http_bundle_locator(
     )
 
 
+def create_partitioned_pagination_http_bundle_locator(
+    http_config: HttpProtocolConfig,
+    base_url: str,
+    date_start: str,
+    date_end: str | None = None,
+    max_records_per_page: int = 1000,
+    max_active_partitions: int = 8,
+    query_params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    query_builder: Callable[[str, str | None], str] | None = None,
+    narrowing_strategy: Callable[[str | None], str] | None = None,
+    state_management_prefix: str = "partitioned_pagination_http_bundle_locator",
+) -> PartitionedPaginationHttpBundleLocator:
+    """Create a pagination bundle locator that fetches partitions concurrently.
+
+    Args:
+        http_config: HTTP protocol configuration.
+        base_url: Base URL for the API.
+        date_start: Start date for data fetching.
+        date_end: End date for data fetching. Defaults to None.
+        max_records_per_page: Maximum records per page. Defaults to 1000.
+        max_active_partitions: Maximum number of date partitions open at once. Defaults to 8.
+        query_params: Additional query parameters. Defaults to None.
+        headers: HTTP headers. Defaults to None.
+        query_builder: Function to build query strings. Defaults to None.
+        narrowing_strategy: Narrowing strategy used to split large dates. Defaults to None.
+        state_management_prefix: Prefix for state management. Defaults to "partitioned_pagination_http_bundle_locator".
+
+    Returns:
+        Configured PartitionedPaginationHttpBundleLocator instance.
+    """
+    return PartitionedPaginationHttpBundleLocator(
+        http_config=http_config,
+        base_url=base_url,
+        date_start=date_start,
+        date_end=date_end,
+        max_records_per_page=max_records_per_page,
+        max_active_partitions=max_active_partitions,
+        query_params=query_params,
+        headers=headers,
+        query_builder=query_builder,
+        narrowing_strategy=narrowing_strategy,
+        state_management_prefix=state_management_prefix,
+    )
+
+
 def create_http_bundle_loader(
     http_config: HttpProtocolConfig,
     meta_load_name: str = "http_bundle_loader",
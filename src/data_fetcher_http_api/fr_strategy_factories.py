@@ -5,7 +5,7 @@ like complex pagination locators, reverse pagination locators, and single URL lo
 """
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Annotated, Any
 
 from oc_pipeline_bus.strategy_registry import (
@@ -18,10 +18,14 @@ from data_fetcher_http.http_config import HttpProtocolConfig
 from data_fetcher_http.http_manager import HttpManager
 from data_fetcher_http_api.api_bundle_locators import (
     PaginationHttpBundleLocator,
+    SingleHttpBundleLocator,
 )
 from data_fetcher_http_api.api_pagination_bundle_locators import (
     CursorPaginationStrategy,
 )
+from data_fetcher_http_api.api_partitioned_bundle_locators import (
+    PartitionedPaginationHttpBundleLocator,
+)
 
 
 @dataclass
@@ -40,6 +44,8 @@ class SirenProviderConfig:
     query_params: dict[str, Any] | None = None
     headers: dict[str, str] | None = None
     state_management_prefix: str = "siren_provider"
+    # Values above 1 fetch several date/SIREN-prefix partitions concurrently
+    max_active_partitions: int = 1
 
 
 @dataclass
@@ -68,12 +74,10 @@ class FailedCompaniesProviderConfig:
     http_config: Annotated[
         HttpProtocolConfig, "path:protocols.http.{value}", "relative_config"
     ]
-    base_url: str
-    date_start: str
-    date_end: str | None = None
-    max_records_per_page: int = 1000
-    rate_limit_requests_per_second: float = 2.0
-    query_params: dict[str, Any] | None = None
+    urls: list[str] = field(default_factory=list)
+    # Large URL lists are streamed from a file or KV range instead of YAML
+    urls_file: str | None = None
+    urls_kv_prefix: str | None = None
     headers: dict[str, str] | None = None
     state_management_prefix: str = "failed_companies_provider"
 
@@ -90,16 +94,18 @@ class SirenProviderFactory(StrategyFactory):
         """Validate parameters for SIREN provider creation."""
         required_fields = ["http_config", "base_url", "date_start"]
 
-        for field in required_fields:
-            if field not in params:
+        for required_field in required_fields:
+            if required_field not in params:
                 raise InvalidArgumentStrategyException(
-                    f"Missing required parameter: {field}",
+                    f"Missing required parameter: {required_field}",
                     PaginationHttpBundleLocator,
                     "siren_provider",
                     params,
                 )
 
-    def create(self, params: Any) -> PaginationHttpBundleLocator:
+    def create(
+        self, params: Any
+    ) -> PaginationHttpBundleLocator | PartitionedPaginationHttpBundleLocator:
         """Create a SIREN provider locator."""
         # The http_config parameter will be resolved by DataPipelineConfig
         # and passed as an actual HttpProtocolConfig object
@@ -112,6 +118,10 @@ class SirenProviderFactory(StrategyFactory):
             max_records_per_page = getattr(params, 'max_records_per_page', 1000)
             rate_limit_requests_per_second = getattr(params, 'rate_limit_requests_per_second', 2.0)
             headers = getattr(params, 'headers', {})
+            max_active_partitions = getattr(params, 'max_active_partitions', 1)
+            state_management_prefix = getattr(
+                params, "state_management_prefix", "siren_provider"
+            )
         else:
             # params is a dictionary
             http_config = params["http_config"]
@@ -121,10 +131,32 @@ class SirenProviderFactory(StrategyFactory):
             max_records_per_page = params.get("max_records_per_page", 1000)
             rate_limit_requests_per_second = params.get("rate_limit_requests_per_second", 2.0)
             headers = params.get("headers", {})
+            max_active_partitions = params.get("max_active_partitions", 1)
+            state_management_prefix = params.get(
+                "state_management_prefix", "siren_provider"
+            )
 
         # Create query builder
         query_builder = self._create_sirene_query_builder()
 
+        if max_active_partitions > 1:
+            # Partitioned mode: each date/SIREN prefix keeps its own cursor.
+            # The HTTP loader must be configured with a pagination strategy so
+            # the next cursor is reported back in bundle_meta.
+            return PartitionedPaginationHttpBundleLocator(
+                http_config=http_config,
+                base_url=base_url,
+                date_start=date_start,
+                date_end=date_end,
+                max_records_per_page=max_records_per_page,
+                rate_limit_requests_per_second=rate_limit_requests_per_second,
+                max_active_partitions=max_active_partitions,
+                headers=headers,
+                query_builder=query_builder,
+                narrowing_strategy=self._create_siren_narrowing_strategy(),
+                state_management_prefix=state_management_prefix,
+            )
+
         # Create pagination strategy
         pagination_strategy = CursorPaginationStrategy(
             cursor_field="curseurSuivant",
@@ -211,10 +243,10 @@ class GapProviderFactory(StrategyFactory):
         """Validate parameters for gap provider creation."""
         required_fields = ["http_config", "base_url", "date_start"]
 
-        for field in required_fields:
-            if field not in params:
+        for required_field in required_fields:
+            if required_field not in params:
                 raise InvalidArgumentStrategyException(
-                    f"Missing required parameter: {field}",
+                    f"Missing required parameter: {required_field}",
                     PaginationHttpBundleLocator,
                     "gap_provider",
                     params,
@@ -332,16 +364,16 @@ class FailedCompaniesProviderFactory(StrategyFactory):
         """Validate parameters for failed companies provider creation."""
         required_fields = ["http_config"]
 
-        for field in required_fields:
-            if field not in params:
+        for field_name in required_fields:
+            if field_name not in params:
                 raise InvalidArgumentStrategyException(
-                    f"Missing required parameter: {field}",
-                    PaginationHttpBundleLocator,
+                    f"Missing required parameter: {field_name}",
+                    SingleHttpBundleLocator,
                     "failed_companies_provider",
                     params,
                 )
 
-    def create(self, params: Any) -> PaginationHttpBundleLocator:
+    def create(self, params: Any) -> SingleHttpBundleLocator:
         """Create a failed companies provider locator."""
         # The http_config parameter will be resolved by DataPipelineConfig
         # and passed as an actual HttpProtocolConfig object
@@ -349,21 +381,31 @@ class FailedCompaniesProviderFactory(StrategyFactory):
             # params is a dataclass instance
             http_config = params.http_config
             urls = getattr(params, 'urls', [])
+            urls_file = getattr(params, 'urls_file', None)
+            urls_kv_prefix = getattr(params, 'urls_kv_prefix', None)
             headers = getattr(params, 'headers', {})
+            state_management_prefix = getattr(
+                params, 'state_management_prefix', "failed_companies_provider"
+            )
         else:
             # params is a dictionary
             http_config = params["http_config"]
             urls = params.get("urls", [])
+            urls_file = params.get("urls_file")
+            urls_kv_prefix = params.get("urls_kv_prefix")
             headers = params.get("headers", {})
+            state_management_prefix = params.get(
+                "state_management_prefix", "failed_companies_provider"
+            )
 
-        return PaginationHttpBundleLocator(
-            http_manager=self.http_manager,
+        return SingleHttpBundleLocator(
             http_config=http_config,
             store=None,  # Will be set from context
-            base_url="",  # Not used for single URL locators
-            date_start="",  # Not used for single URL locators
             urls=urls,
+            urls_file=urls_file,
+            urls_kv_prefix=urls_kv_prefix,
             headers=headers,
+            persistence_prefix=state_management_prefix,
         )
 
     def get_config_type(self, params: dict[str, Any]) -> type | None:
@@ -19,6 +19,9 @@ from data_fetcher_http_api.api_bundle_locators import (
     PaginationHttpBundleLocator,
 )
 from data_fetcher_http_api.api_loader import HttpBundleLoader
+from data_fetcher_http_api.api_pagination_bundle_locators import (
+    CursorPaginationStrategy,
+)
 
 
 @dataclass
@@ -33,6 +36,8 @@ class HttpLoaderConfig:
     follow_redirects: bool = True
     max_redirects: int = 5
     error_handler: Any = None
+    # Header field holding the next cursor; enables cursor reporting in bundle_meta
+    pagination_cursor_field: str | None = None
 
 
 @dataclass
@@ -112,6 +117,7 @@ class HttpBundleLoaderFactory(StrategyFactory):
             follow_redirects = getattr(params, 'follow_redirects', True)
             max_redirects = getattr(params, 'max_redirects', 5)
             error_handler = getattr(params, 'error_handler', None)
+            pagination_cursor_field = getattr(params, 'pagination_cursor_field', None)
         else:
             # params is a dictionary
             http_config = params["http_config"]
@@ -119,6 +125,7 @@ class HttpBundleLoaderFactory(StrategyFactory):
             follow_redirects = params.get("follow_redirects", True)
             max_redirects = params.get("max_redirects", 5)
             error_handler = params.get("error_handler")
+            pagination_cursor_field = params.get("pagination_cursor_field")
 
         return HttpBundleLoader(
             http_manager=self.http_manager,
@@ -127,6 +134,11 @@ class HttpBundleLoaderFactory(StrategyFactory):
             follow_redirects=follow_redirects,
             max_redirects=max_redirects,
             error_handler=error_handler,
+            pagination_strategy=(
+                CursorPaginationStrategy(cursor_field=pagination_cursor_field)
+                if pagination_cursor_field
+                else None
+            ),
         )
 
     def get_config_type(self, params: dict[str, Any]) -> type | None:
@@ -0,0 +1,118 @@
+"""Lazily consumed FIFO source of URLs for API bundle locators.
+
+This module provides UrlSource, a queue of URLs that pops in O(1) and can be fed
+from iterators that are only consumed as URLs are needed. URL lists can be
+streamed from a file or from a key-value store range, so very large inputs
+(e.g. hundreds of thousands of failed company URLs) are never materialized in
+memory or inlined into YAML configuration.
+"""
+
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+
+import aiofiles
+
+from data_fetcher_core.kv_store import KeyValueStore
+
+
+class UrlSource:
+    """FIFO of URLs backed by a deque and a chain of lazy iterators.
+
+    URLs added with ``append`` are served first, then each iterable passed to
+    ``extend`` is drained in order. Iterables may be synchronous or
+    asynchronous; they are only advanced when ``pop`` needs another URL.
+    """
+
+    def __init__(self, urls: Iterable[str] | AsyncIterable[str] | None = None) -> None:
+        """Initialize the URL source.
+
+        Args:
+            urls: Optional initial URLs, consumed lazily.
+        """
+        self._buffer: deque[str] = deque()
+        self._sources: deque[Iterator[str] | AsyncIterator[str]] = deque()
+        if urls is not None:
+            self.extend(urls)
+
+    def __bool__(self) -> bool:
+        """Return True while URLs are buffered or iterators are not yet drained.
+
+        An iterator that turns out to be empty still counts until ``pop``
+        reaches it, so a true value means more URLs *may* be available.
+        """
+        return bool(self._buffer or self._sources)
+
+    def append(self, url: str) -> None:
+        """Queue a single URL."""
+        self._buffer.append(url)
+
+    def extend(self, urls: Iterable[str] | AsyncIterable[str]) -> None:
+        """Queue every URL produced by an iterable, without consuming it now."""
+        if isinstance(urls, AsyncIterable):
+            self._sources.append(aiter(urls))
+        else:
+            self._sources.append(iter(urls))
+
+    async def pop(self) -> str | None:
+        """Return the next URL, or None once every source is exhausted."""
+        if self._buffer:
+            return self._buffer.popleft()
+
+        while self._sources:
+            source = self._sources[0]
+            try:
+                if isinstance(source, AsyncIterator):
+                    return await anext(source)
+                return next(source)
+            except (StopIteration, StopAsyncIteration):
+                self._sources.popleft()
+        return None
+
+    @staticmethod
+    async def iter_file(path: str | Path) -> AsyncIterator[str]:
+        """Stream URLs from a text file, one per line.
+
+        Blank lines and lines starting with ``#`` are skipped.
+
+        Args:
+            path: Path to the URL list file.
+
+        Yields:
+            Each URL in file order.
+        """
+        async with aiofiles.open(path) as f:
+            async for line in f:
+                url = line.strip()
+                if url and not url.startswith("#"):
+                    yield url
+
+    @staticmethod
+    async def iter_kv_range(
+        store: KeyValueStore, prefix: str, batch_size: int = 100
+    ) -> AsyncIterator[str]:
+        """Stream URLs stored under a key prefix.
+
+        The range is read in batches of about ``batch_size`` keys with
+        ``KeyValueStore.iter_range``, so only one batch is held in memory at a
+        time. Each value may be the URL itself or a dict with a ``url`` entry;
+        any other value is skipped.
+
+        Args:
+            store: The key-value store to read from.
+            prefix: Key prefix the URLs are stored under.
+            batch_size: Approximate number of keys read per batch.
+
+        Yields:
+            Each URL, in the store's range order (SCAN order on Redis).
+        """
+        # The character after the last one of the prefix bounds the range
+        end_key = prefix[:-1] + chr(ord(prefix[-1]) + 1) if prefix else None
+        async for batch in store.iter_range(
+            prefix, end_key=end_key, batch_size=batch_size
+        ):
+            for _key, value in batch:
+                if isinstance(value, str):
+                    yield value
+                elif isinstance(value, dict) and isinstance(value.get("url"), str):
+                    yield value["url"]
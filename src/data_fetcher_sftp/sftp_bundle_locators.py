@@ -7,9 +7,11 @@ file pattern matching, date-based filtering, and remote directory traversal.
 import fnmatch
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import structlog
 
+from data_fetcher_core.bloom_filter import BloomFilter
 from data_fetcher_core.core import BundleRef, FetchRunContext
 from data_fetcher_core.queue import BundleRefSerializer, KVStoreQueue
 from data_fetcher_core.strategy_types import (
@@ -40,7 +42,12 @@ class NoKeyValueStoreError(ValueError):
 
 @dataclass
 class DirectorySftpBundleLocator(LocatorStrategy):
-    """Directory bundle locator for SFTP directories with custom filtering."""
+    """Directory bundle locator for SFTP directories with custom filtering.
+
+    When ``seen_filter_capacity`` is set, a persisted Bloom filter of every
+    path ever queued lets directory listings skip the per-file KV and queue
+    lookups for paths that have definitely never been seen.
+    """
 
     sftp_manager: SftpManager
     sftp_config: SftpProtocolConfig
@@ -54,10 +61,58 @@ class DirectorySftpBundleLocator(LocatorStrategy):
     processing_results_ttl: timedelta | None = None
     error_state_ttl: timedelta | None = None
     in_flight_ttl: timedelta | None = None
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
 
     def __post_init__(self) -> None:
         """Initialize the directory SFTP bundle locator state and internal variables."""
         # No longer using in-memory queue - using kvstore instead
+        self._seen_filter: BloomFilter | None = None
+        # A negative lookup is only conclusive once the filter has seen a full
+        # listing; until then every path falls back to the exact checks
+        self._seen_filter_complete: bool = False
+
+    @property
+    def _seen_filter_key(self) -> str:
+        return f"{self.state_management_prefix}:seen_filter:{self.remote_dir}"
+
+    async def _load_seen_filter(self, context: FetchRunContext) -> None:
+        """Load the persisted seen-path filter, or start an empty one."""
+        if self.seen_filter_capacity is None or self._seen_filter is not None:
+            return
+        if not context.app_config or not context.app_config.kv_store:
+            return
+
+        bloom = await BloomFilter.load(
+            context.app_config.kv_store, self._seen_filter_key
+        )
+        if bloom is not None:
+            self._seen_filter = bloom
+            self._seen_filter_complete = True
+        else:
+            self._seen_filter = BloomFilter(
+                self.seen_filter_capacity, self.seen_filter_error_rate
+            )
+        logger.info(
+            "SEEN_FILTER_LOADED",
+            directory=self.remote_dir,
+            restored=bloom is not None,
+            items=len(self._seen_filter),
+            size_bytes=self._seen_filter.size_bytes,
+        )
+
+    async def _save_seen_filter(self, context: FetchRunContext) -> None:
+        """Persist the seen-path filter."""
+        if self._seen_filter is None:
+            return
+        if not context.app_config or not context.app_config.kv_store:
+            return
+        await self._seen_filter.save(
+            context.app_config.kv_store,
+            self._seen_filter_key,
+            ttl=self.processed_files_ttl,
+        )
+        self._seen_filter_complete = True
 
     def _get_queue(self, context: FetchRunContext) -> KVStoreQueue:
         """Get or create the KVStoreQueue for this locator."""
@@ -76,6 +131,14 @@ class DirectorySftpBundleLocator(LocatorStrategy):
         if not context.app_config or not context.app_config.kv_store:
             return False
 
+        # Paths the filter has never seen cannot be processed, queued or in-flight
+        if (
+            self._seen_filter is not None
+            and self._seen_filter_complete
+            and file_path not in self._seen_filter
+        ):
+            return False
+
         store = context.app_config.kv_store
         # Check if file is processed
         processed_key = f"{self.state_management_prefix}:processed:{self.remote_dir}:{file_path}"
@@ -136,8 +199,10 @@ class DirectorySftpBundleLocator(LocatorStrategy):
         store = context.app_config.kv_store
         in_flight_prefix = f"{self.state_management_prefix}:in_flight:{self.remote_dir}:"
 
-        # Get all in-flight items
-        in_flight_items = await store.range_get(in_flight_prefix)
+        # Get all in-flight items (the end key bounds the scan to the prefix)
+        in_flight_items = await store.range_get(
+            in_flight_prefix, end_key=in_flight_prefix[:-1] + ";"
+        )
 
         if in_flight_items:
             logger.info("RECOVERING_IN_FLIGHT_BUNDLES", count=len(in_flight_items))
@@ -315,6 +380,7 @@ class DirectorySftpBundleLocator(LocatorStrategy):
         try:
             # First, recover any in-flight bundles
             await self._recover_in_flight_bundles(context)
+            await self._load_seen_filter(context)
 
             # List files in directory using SFTP manager
             async with await self.sftp_manager.get_connection(
@@ -324,6 +390,7 @@ class DirectorySftpBundleLocator(LocatorStrategy):
 
             # Collect file information
             file_info: list[tuple[str, float | int | None]] = []
+            file_stats: dict[str, Any] = {}
             for filename in files:
                 if filename in [".", ".."]:
                     continue
@@ -343,6 +410,7 @@ class DirectorySftpBundleLocator(LocatorStrategy):
                 # Get file stats for sorting using SFTP manager
                 stat = await conn.stat(file_path)
                 file_info.append((file_path, stat.st_mtime))
+                file_stats[file_path] = stat
 
             # Sort files using strategy if provided
             if self.file_sort is not None:
@@ -353,7 +421,10 @@ class DirectorySftpBundleLocator(LocatorStrategy):
             bundle_refs_to_enqueue = []
 
             for file_path, _ in file_info:
-                if not await self._is_known(file_path, context):
+                is_known = await self._is_known(file_path, context)
+                if self._seen_filter is not None:
+                    self._seen_filter.add(file_path)
+                if not is_known:
                     # Create bundle ref
                     def _raise_storage_error() -> None:
                         msg = "Storage is required in app_config for BID minting"
@@ -369,16 +440,25 @@ class DirectorySftpBundleLocator(LocatorStrategy):
                             "config_id": getattr(context.app_config, "config_id", "sftp"),
                         }
                     )
+                    stat = file_stats[file_path]
                     bundle_ref = BundleRef(
                         bid=bid_str,
                         request_meta={
                             "url": f"sftp://{file_path}",
                             "resources_count": 0,
+                            # Listing attributes let the loader skip its stat
+                            "size": stat.st_size,
+                            "mtime": stat.st_mtime,
+                            "mode": stat.st_mode,
                         },
                     )
 
                     bundle_refs_to_enqueue.append(bundle_ref)
 
+            # Persist the filter before enqueueing: a crash in between leaves a
+            # positive filter entry, which falls back to the exact checks
+            await self._save_seen_filter(context)
+
             # Enqueue all bundle refs at once
             if bundle_refs_to_enqueue:
                 await queue.enqueue(bundle_refs_to_enqueue)
@@ -465,8 +545,7 @@ class FileSftpBundleLocator(LocatorStrategy):
             return False
         store = context.app_config.kv_store
         in_flight_key = f"{self.state_management_prefix}:in_flight:{file_path}"
-        in_flight_data = await store.get(in_flight_key)
-        if in_flight_data is not None:
+        if await store.exists(in_flight_key):
             return True
 
         # Check if file is in queue by peeking
@@ -492,7 +571,12 @@ class FileSftpBundleLocator(LocatorStrategy):
         store = context.app_config.kv_store
         file_path = bundle_ref.request_meta["url"].replace("sftp://", "")
         in_flight_key = f"{self.state_management_prefix}:in_flight:{file_path}"
-        await store.put(in_flight_key, bundle_ref, ttl=self.in_flight_ttl)
+        # Stored raw so the bundle ref is JSON-encoded once, by its serializer
+        await store.put_raw(
+            in_flight_key,
+            BundleRefSerializer().dumps(bundle_ref),
+            ttl=self.in_flight_ttl,
+        )
 
     async def _remove_bundle_ref_from_in_flight(self, bundle_ref: BundleRef, context: FetchRunContext) -> None:
         """Remove a bundle ref from the in-flight tracking."""
@@ -514,7 +598,9 @@ class FileSftpBundleLocator(LocatorStrategy):
         
         # Get all in-flight keys
         in_flight_prefix = f"{self.state_management_prefix}:in_flight:"
-        in_flight_keys = await store.range_get(in_flight_prefix)
+        in_flight_keys = await store.range_get(
+            in_flight_prefix, end_key=in_flight_prefix[:-1] + ";", raw=True
+        )
         
         if not in_flight_keys:
             return
@@ -522,11 +608,17 @@ class FileSftpBundleLocator(LocatorStrategy):
         logger.info("RECOVERING_IN_FLIGHT_BUNDLES", count=len(in_flight_keys))
         
         # Re-queue in-flight bundles
-        for key, bundle_ref_data in in_flight_keys.items():
+        serializer = BundleRefSerializer()
+        for key, bundle_ref_data in in_flight_keys:
             try:
-                if isinstance(bundle_ref_data, BundleRef):
-                    await queue.enqueue([bundle_ref_data])
-                    logger.debug("RE_QUEUED_IN_FLIGHT_BUNDLE", file_path=bundle_ref_data.request_meta.get("url", ""))
+                serialized = (
+                    bundle_ref_data.decode("utf-8")
+                    if isinstance(bundle_ref_data, bytes)
+                    else bundle_ref_data
+                )
+                bundle_ref = serializer.loads(serialized)
+                await queue.enqueue([bundle_ref])
+                logger.debug("RE_QUEUED_IN_FLIGHT_BUNDLE", file_path=bundle_ref.request_meta.get("url", ""))
             except Exception as e:
                 logger.exception("FAILED_TO_RE_QUEUE_IN_FLIGHT_BUNDLE", key=key, error=str(e))
 
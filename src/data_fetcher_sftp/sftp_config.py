@@ -34,6 +34,19 @@ class SftpProtocolConfig(ProtocolConfig):
     # Connection pool configuration
     pool_min_size: int = 0
     pool_max_size: int = 5
+    # Idle connections beyond pool_min_size are closed after this many seconds
+    pool_idle_timeout_seconds: float = 300.0
+    # Interval of keep-alive checks on idle connections (None disables them)
+    pool_keepalive_seconds: float | None = 30.0
+    # Connections used successfully within this many seconds skip the health
+    # check on acquire/release; longer-idle ones are validated in the background
+    health_check_skip_seconds: float = 10.0
+    # Consecutive connection failures that open the pool's circuit breaker
+    # (None disables it) and seconds before a probe is let through
+    circuit_failure_threshold: int | None = 5
+    circuit_recovery_seconds: float = 30.0
+    # Retries allowed per request across the pool (None: no retry budget)
+    retry_budget_ratio: float | None = 0.2
 
     # Optional baseline remote directory to reset to on acquire/release
     base_dir: str | None = None
@@ -4,6 +4,7 @@ This module provides SFTP credential classes and wrappers for managing
 authentication to SFTP servers, including key-based and password authentication.
 """
 
+import asyncio
 from dataclasses import dataclass
 
 from data_fetcher_core.credentials.base import CredentialProvider
@@ -20,7 +21,12 @@ class SftpCredentials:
 
 
 class SftpCredentialsWrapper:
-    """Wrapper that provides SFTP credentials using a credential provider."""
+    """Wrapper that provides SFTP credentials using a credential provider.
+
+    Resolved credentials are cached until ``refresh`` is called, so one wrapper
+    shared by a connection pool resolves credentials once for every connection
+    it opens. Concurrent callers share a single resolution.
+    """
 
     def __init__(
         self, config_name: str, credential_provider: CredentialProvider | None = None
@@ -34,48 +40,67 @@ class SftpCredentialsWrapper:
         self.config_name = config_name
         self.credential_provider = credential_provider
         self._cached_credentials: SftpCredentials | None = None
+        self._resolve_lock: asyncio.Lock | None = None
 
     async def get_credentials(self) -> SftpCredentials:
         """Get SFTP credentials, using cache if available."""
         if self._cached_credentials is None:
-            # Check if credential provider is available
-            if self.credential_provider is None:
-                raise RuntimeError("No credential provider")  # noqa: TRY003
+            if self._resolve_lock is None:
+                self._resolve_lock = asyncio.Lock()
+            async with self._resolve_lock:
+                # Another caller may have resolved them while we waited
+                if self._cached_credentials is None:
+                    self._cached_credentials = await self._resolve_credentials()
 
-            # Get credentials from provider
-            host = await self.credential_provider.get_credential(
-                self.config_name, "host"
-            )
-            username = await self.credential_provider.get_credential(
-                self.config_name, "username"
-            )
-            password = await self.credential_provider.get_credential(
-                self.config_name, "password"
-            )
+        return self._cached_credentials
 
-            # Try to get port, default to 22 if not provided
-            try:
-                port_str = await self.credential_provider.get_credential(
-                    self.config_name, "port"
-                )
-                port = int(port_str)
-            except (ValueError, TypeError) as err:
-                raise ValueError(  # noqa: TRY003
-                    "Port not found in credentials"
-                ) from err
-            except Exception as err:
-                raise ValueError(f"Error getting port: {err}") from err  # noqa: TRY003
-
-            self._cached_credentials = SftpCredentials(
-                host=host, username=username, password=password, port=port
+    async def _resolve_credentials(self) -> SftpCredentials:
+        """Get credentials from the credential provider."""
+        # Check if credential provider is available
+        if self.credential_provider is None:
+            raise RuntimeError("No credential provider")  # noqa: TRY003
+
+        # Get credentials from provider
+        host = await self.credential_provider.get_credential(self.config_name, "host")
+        username = await self.credential_provider.get_credential(
+            self.config_name, "username"
+        )
+        password = await self.credential_provider.get_credential(
+            self.config_name, "password"
+        )
+
+        # Try to get port, default to 22 if not provided
+        try:
+            port_str = await self.credential_provider.get_credential(
+                self.config_name, "port"
             )
-
-        return self._cached_credentials
+            port = int(port_str)
+        except (ValueError, TypeError) as err:
+            raise ValueError(  # noqa: TRY003
+                "Port not found in credentials"
+            ) from err
+        except Exception as err:
+            raise ValueError(f"Error getting port: {err}") from err  # noqa: TRY003
+
+        return SftpCredentials(
+            host=host, username=username, password=password, port=port
+        )
 
     def clear(self) -> None:
         """Clear the cached credentials."""
         self._cached_credentials = None
 
+    def refresh(self) -> None:
+        """Discard cached credentials so the next lookup fetches fresh ones.
+
+        Used after an authentication failure (e.g. a rotated password): the
+        provider's own cached copy is invalidated too when it supports it.
+        """
+        self._cached_credentials = None
+        invalidate = getattr(self.credential_provider, "invalidate", None)
+        if callable(invalidate):
+            invalidate(self.config_name)
+
     def update_credential_provider(
         self, credential_provider: CredentialProvider
     ) -> None:
@@ -84,6 +109,8 @@ class SftpCredentialsWrapper:
         Args:
             credential_provider: The credential provider to use for authentication.
         """
+        if credential_provider is self.credential_provider:
+            return
         self.credential_provider = credential_provider
         # Clear cached credentials when provider changes
         self._cached_credentials = None
@@ -1,9 +1,12 @@
 """SFTP data loader implementation."""
 
+import asyncio
 import fnmatch
-from collections.abc import AsyncGenerator
+import stat as stat_module
+import time
+from collections.abc import AsyncGenerator, Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, Union
+from typing import TYPE_CHECKING, Any, Protocol, Union, cast
 
 import structlog
 
@@ -13,9 +16,13 @@ from data_fetcher_core.core import (
     DataRegistryFetcherConfig,
     FetchRunContext,
 )
+from data_fetcher_core.metrics import BYTES_TRANSFERRED, LOADER_TTFB
 from data_fetcher_core.strategy_types import LoaderStrategy
+from data_fetcher_core.tracing import get_tracer
+from data_fetcher_core.watchdog import record_progress
 from data_fetcher_sftp.sftp_config import SftpProtocolConfig
 from data_fetcher_sftp.sftp_manager import SftpManager
+from data_fetcher_sftp.sftp_pool import SftpConnection
 
 
 class StorageRequiredError(Exception):
@@ -45,6 +52,43 @@ class ReadableFile(Protocol):
         """Read data from the file."""
 
 
+@dataclass(frozen=True)
+class RemoteFileAttributes:
+    """Size, modification time and mode of a remote path."""
+
+    size: int | None
+    mtime: float | None
+    mode: int | None
+
+    @property
+    def is_dir(self) -> bool:
+        """Whether the mode marks a directory."""
+        return self.mode is not None and stat_module.S_ISDIR(self.mode)
+
+    @classmethod
+    def from_stat(cls, stat: Any) -> "RemoteFileAttributes":  # noqa: ANN401
+        """Build from an ``os.stat_result`` or paramiko ``SFTPAttributes``."""
+        return cls(size=stat.st_size, mtime=stat.st_mtime, mode=stat.st_mode)
+
+    @classmethod
+    def from_request_meta(
+        cls, request_meta: Mapping[str, object]
+    ) -> "RemoteFileAttributes | None":
+        """Build from attributes a locator recorded while listing.
+
+        Returns:
+            The attributes, or None when the locator did not record them.
+        """
+        if "size" not in request_meta or "mtime" not in request_meta:
+            return None
+        mode = request_meta.get("mode")
+        return cls(
+            size=cast("int | None", request_meta["size"]),
+            mtime=cast("float | None", request_meta["mtime"]),
+            mode=mode if isinstance(mode, int) else None,
+        )
+
+
 """
 
 SFTP loader with enterprise features.
@@ -65,6 +109,14 @@ class SftpBundleLoader(LoaderStrategy):
     filename_pattern: str = "*"
     meta_load_name: str = "sftp_loader"
 
+    async def on_run_start(self, ctx: FetchRunContext) -> None:
+        """Pre-warm the SFTP connection pool to its minimum size."""
+        await self.sftp_manager.warm_up(self.sftp_config, ctx)
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        """Close pooled SFTP connections and stop their maintenance."""
+        await self.sftp_manager.close_all()
+
     async def load(
         self,
         bundle: BundleRef,
@@ -74,6 +126,11 @@ class SftpBundleLoader(LoaderStrategy):
     ) -> BundleLoadResult:
         """Load data from SFTP endpoint.
 
+        One pooled connection is leased for the whole bundle. When the locator
+        recorded the file's ``size``, ``mtime`` and ``mode`` in ``request_meta``
+        no ``stat`` is issued, so a single-file bundle costs one ``open`` plus
+        the transfer.
+
         Args:
             request: The request to process
             storage: Storage backend for saving data
@@ -94,27 +151,21 @@ class SftpBundleLoader(LoaderStrategy):
                 async with await self.sftp_manager.get_connection(
                     self.sftp_config, ctx
                 ) as conn:
-                    stat = await conn.stat(remote_path)
-                if stat.st_mode is not None and stat.st_mode & 0o40000:  # Directory
-                    return await self._load_directory(
-                        self.sftp_manager,
-                        self.sftp_config,
-                        remote_path,
-                        bundle,
-                        storage,
-                        ctx,
-                        recipe,
+                    attributes = RemoteFileAttributes.from_request_meta(
+                        bundle.request_meta
+                    )
+                    if attributes is None:
+                        with get_tracer().span("remote_stat"):
+                            attributes = RemoteFileAttributes.from_stat(
+                                await conn.stat(remote_path)
+                            )
+                    if attributes.is_dir:
+                        return await self._load_directory(
+                            conn, remote_path, bundle, storage, ctx, recipe
+                        )
+                    return await self._load_file(
+                        conn, remote_path, attributes, bundle, storage, ctx, recipe
                     )
-                # File
-                return await self._load_file(
-                    self.sftp_manager,
-                    self.sftp_config,
-                    remote_path,
-                    bundle,
-                    storage,
-                    ctx,
-                    recipe,
-                )
             except Exception as e:
                 logger.exception(
                     "ERROR_ACCESSING_REMOTE_PATH",
@@ -133,29 +184,25 @@ class SftpBundleLoader(LoaderStrategy):
 
     async def _load_file(
         self,
-        sftp_manager: SftpManager,
-        sftp_config: SftpProtocolConfig,
+        conn: SftpConnection,
         remote_path: str,
+        attributes: "RemoteFileAttributes",
         bundle: BundleRef,
         storage: Storage,
         _ctx: FetchRunContext,
         recipe: DataRegistryFetcherConfig,
     ) -> BundleLoadResult:
-        """Load a single file from SFTP."""
+        """Load a single file from SFTP over an already leased connection."""
         try:
-            # Get file info
-            async with await sftp_manager.get_connection(sftp_config, _ctx) as conn:
-                stat = await conn.stat(remote_path)
-
             # Build immutable bundle_meta for the result; do not mutate request_meta
             bundle_meta = {
                 **dict(bundle.request_meta),
                 "url": f"sftp://{self.remote_dir}/{remote_path}",
                 "resources_count": 1,
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
+                "size": attributes.size,
+                "modified": attributes.mtime,
                 "permissions": (
-                    oct(stat.st_mode) if stat.st_mode is not None else None
+                    oct(attributes.mode) if attributes.mode is not None else None
                 ),
             }
 
@@ -168,13 +215,19 @@ class SftpBundleLoader(LoaderStrategy):
 
             bid_logger.debug("STREAMING_FILE_TO_STORAGE", remote_path=remote_path)
 
+            # Only loads under a deadline or stall check need cancellable reads
+            watched = (
+                recipe.bundle_deadline_seconds is not None
+                or recipe.stall_min_bytes_per_second is not None
+            )
+
             # 1. Start bundle and get context
             bundle_context = await storage.start_bundle(bundle, recipe)
 
             try:
                 # 2. Add file resource
-                async with await sftp_manager.get_connection(sftp_config, _ctx) as conn:
-                    with await conn.open(remote_path, "rb") as remote_file:
+                with await conn.open(remote_path, "rb") as remote_file:
+                    try:
                         await bundle_context.add_resource(
                             resource_name=remote_path,  # Use the file path as resource name
                             metadata={
@@ -182,8 +235,15 @@ class SftpBundleLoader(LoaderStrategy):
                                 "content_type": "application/octet-stream",
                                 "status_code": 200,
                             },
-                            stream=self._stream_from_file(remote_file),
+                            stream=self._stream_from_file(
+                                remote_file, read_in_thread=watched
+                            ),
                         )
+                    except asyncio.CancelledError:
+                        # Drop the connection first, so closing the file does
+                        # not wait on a server that stopped responding
+                        await conn.discard()
+                        raise
 
                 # 3. Complete bundle
                 await bundle_context.complete(
@@ -221,23 +281,22 @@ class SftpBundleLoader(LoaderStrategy):
 
     async def _load_directory(
         self,
-        sftp_manager: SftpManager,
-        sftp_config: SftpProtocolConfig,
+        conn: SftpConnection,
         remote_path: str,
         bundle: BundleRef,
         storage: Storage,
         ctx: FetchRunContext,
         recipe: DataRegistryFetcherConfig,
     ) -> BundleLoadResult:
-        """Load all files in a directory from SFTP."""
+        """Load all files in a directory from SFTP over an already leased connection."""
         resources_meta: list[dict[str, object]] = []
 
         try:
-            # List files in directory
-            async with await sftp_manager.get_connection(sftp_config, ctx) as conn:
-                files = await conn.listdir(remote_path)
+            # List files with their attributes in one round trip
+            entries = await conn.listdir_attr(remote_path)
 
-            for filename in files:
+            for entry in entries:
+                filename = entry.filename
                 if filename in [".", ".."]:
                     continue
 
@@ -249,7 +308,13 @@ class SftpBundleLoader(LoaderStrategy):
 
                 # Load the file
                 file_result = await self._load_file(
-                    sftp_manager, sftp_config, file_path, bundle, storage, ctx, recipe
+                    conn,
+                    file_path,
+                    RemoteFileAttributes.from_stat(entry),
+                    bundle,
+                    storage,
+                    ctx,
+                    recipe,
                 )
                 resources_meta.extend(file_result.resources)
 
@@ -271,10 +336,38 @@ class SftpBundleLoader(LoaderStrategy):
         """Check if filename matches the pattern."""
         return fnmatch.fnmatch(filename, self.filename_pattern)
 
-    async def _stream_from_file(self, file_obj: ReadableFile) -> AsyncGenerator[bytes]:
-        """Create an async stream from a file object."""
-        while True:
-            chunk = file_obj.read(8192)  # 8KB chunks
-            if not chunk:
-                break
-            yield chunk
+    async def _stream_from_file(
+        self, file_obj: ReadableFile, *, read_in_thread: bool = False
+    ) -> AsyncGenerator[bytes]:
+        """Create an async stream from a file object.
+
+        Args:
+            file_obj: Remote file to read.
+            read_in_thread: Read off the event loop, so a stuck read can be
+                cancelled by the bundle deadline or stall detection. Reads
+                stay on the loop otherwise, saving a thread hop per chunk.
+        """
+        tracer = get_tracer()
+        transfer = tracer.stage("transfer", protocol="sftp")
+        started: float | None = time.perf_counter()
+        started_ns = time.time_ns()
+        try:
+            while True:
+                with transfer:
+                    if read_in_thread:
+                        chunk = await asyncio.to_thread(file_obj.read, 8192)
+                    else:
+                        chunk = file_obj.read(8192)  # 8KB chunks
+                if started is not None:
+                    LOADER_TTFB.labels(protocol="sftp").observe(
+                        time.perf_counter() - started
+                    )
+                    tracer.record("first_byte", started_ns, time.time_ns())
+                    started = None
+                if not chunk:
+                    break
+                BYTES_TRANSFERRED.labels(protocol="sftp").inc(len(chunk))
+                record_progress(len(chunk))
+                yield chunk
+        finally:
+            transfer.finish()
@@ -13,6 +13,7 @@ from data_fetcher_sftp.sftp_pool import SftpConnection, SftpConnectionPool
 
 if TYPE_CHECKING:
     from data_fetcher_core.core import FetchRunContext
+    from data_fetcher_core.credentials.base import CredentialProvider
 
 
 # SftpConnectionPool moved to data_fetcher_sftp.sftp_pool
@@ -24,6 +25,9 @@ class SftpManager:
     def __init__(self) -> None:
         """Initialize the SFTP manager with empty connection pools."""
         self._connection_pools: dict[str, SftpConnectionPool] = {}
+        # One credentials wrapper per pool, so every connection a pool opens
+        # shares the resolved credentials
+        self._credentials: dict[str, SftpCredentialsWrapper] = {}
 
     def _get_or_create_pool(
         self,
@@ -46,6 +50,31 @@ class SftpManager:
 
         return self._connection_pools[connection_key]
 
+    def _get_or_create_credentials(
+        self,
+        config: SftpProtocolConfig,
+        credential_provider: "CredentialProvider",
+    ) -> SftpCredentialsWrapper:
+        """Get or create the credentials wrapper shared by a pool.
+
+        Args:
+            config: The SFTP protocol configuration.
+            credential_provider: The run's credential provider.
+
+        Returns:
+            The credentials wrapper for this configuration's pool.
+        """
+        connection_key = config.get_connection_key()
+        credentials = self._credentials.get(connection_key)
+        if credentials is None:
+            credentials = SftpCredentialsWrapper(
+                config.config_name, credential_provider
+            )
+            self._credentials[connection_key] = credentials
+        else:
+            credentials.update_credential_provider(credential_provider)
+        return credentials
+
     async def get_connection(
         self,
         config: SftpProtocolConfig,
@@ -57,8 +86,8 @@ class SftpManager:
         context manager: `async with await manager.get_connection(...) as conn:`
         """
         pool = self._get_or_create_pool(config)
-        credentials_provider = SftpCredentialsWrapper(
-            config.config_name,
+        credentials_provider = self._get_or_create_credentials(
+            config,
             context.app_config.credential_provider,  # type: ignore[union-attr]
         )
         return await pool.acquire(
@@ -66,6 +95,26 @@ class SftpManager:
             credentials_provider,
         )
 
+    async def warm_up(
+        self,
+        config: SftpProtocolConfig,
+        context: "FetchRunContext",
+    ) -> int:
+        """Open the configuration's pool up to its minimum size.
+
+        Returns:
+            The number of connections opened.
+        """
+        pool = self._get_or_create_pool(config)
+        credentials_provider = self._get_or_create_credentials(
+            config,
+            context.app_config.credential_provider,  # type: ignore[union-attr]
+        )
+        return await pool.warm_up(
+            context.app_config,  # type: ignore[arg-type]
+            credentials_provider,
+        )
+
     async def close_all(self) -> None:
         """Close all SFTP connections."""
         for pool in self._connection_pools.values():
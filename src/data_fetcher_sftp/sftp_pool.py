@@ -8,14 +8,37 @@ along with an `SftpConnection` wrapper that callers can lease and release.
 import asyncio
 import contextlib
 import os
+import socket
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
 
 import pysftp
 import structlog
-
-from data_fetcher_core.retry import create_retry_engine
+from paramiko import SFTPAttributes
+from paramiko.ssh_exception import (
+    AuthenticationException,
+    BadAuthenticationType,
+    NoValidConnectionsError,
+    PasswordRequiredException,
+    SSHException,
+)
+
+from data_fetcher_core.metrics import (
+    POOL_CONNECTIONS_IN_USE,
+    POOL_CONNECTIONS_OPEN,
+    RATE_LIMIT_WAIT,
+)
+from data_fetcher_core.retry import (
+    CircuitBreaker,
+    background_task_context,
+    create_circuit_breaker,
+    create_retry_budget,
+    create_retry_engine,
+    is_retryable_error,
+)
+from data_fetcher_core.tracing import get_tracer
 from data_fetcher_sftp.sftp_config import SftpProtocolConfig
 
 if TYPE_CHECKING:
@@ -27,6 +50,47 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def _is_host_failure(exc: BaseException) -> bool:
+    """Whether an error means the SFTP host is unreachable or unhealthy.
+
+    Rejected credentials and errors about individual files (missing path,
+    permission denied) show the host is up and do not trip the circuit.
+    """
+    if isinstance(exc, AuthenticationException):
+        return False
+    return isinstance(
+        exc,
+        SSHException
+        | NoValidConnectionsError
+        | pysftp.ConnectionException
+        | EOFError
+        | ConnectionError
+        | TimeoutError
+        | socket.gaierror,
+    )
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether an SFTP error is worth retrying.
+
+    Socket and SSH transport errors are retried. Errors about individual
+    paths and authentication methods the server does not offer are
+    permanent. A plain authentication failure is retried because the
+    credentials are refreshed first.
+    """
+    if isinstance(
+        exc,
+        BadAuthenticationType
+        | PasswordRequiredException
+        | FileNotFoundError
+        | PermissionError
+        | IsADirectoryError
+        | NotADirectoryError,
+    ):
+        return False
+    return is_retryable_error(exc)
+
+
 class SftpConnection:
     """A leased SFTP connection wrapper.
 
@@ -37,15 +101,28 @@ class SftpConnection:
     def __init__(self, pool: "SftpConnectionPool", inner: pysftp.Connection) -> None:
         self._pool = pool
         self._inner = inner
+        self._discarded = False
 
     async def release(self) -> None:
         await self._pool.release(self._inner)
 
+    async def discard(self) -> None:
+        """Close the connection instead of returning it to the pool."""
+        if not self._discarded:
+            self._discarded = True
+            await self._pool.discard(self._inner)
+
     async def __aenter__(self) -> "SftpConnection":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
-        await self.release()
+        # A cancelled transfer may have left the channel mid-read
+        if self._discarded or (
+            exc_type is not None and issubclass(exc_type, asyncio.CancelledError)
+        ):
+            await self.discard()
+        else:
+            await self.release()
 
     async def request(self, operation: str, *args: object, **kwargs: object) -> object:
         return await self._pool.request_with_existing(
@@ -56,6 +133,9 @@ class SftpConnection:
     async def listdir(self, path: str) -> list[str]:
         return cast("list[str]", await self.request("listdir", path))
 
+    async def listdir_attr(self, path: str) -> list[SFTPAttributes]:
+        return cast("list[SFTPAttributes]", await self.request("listdir_attr", path))
+
     async def stat(self, path: str) -> os.stat_result:  # type: ignore[name-defined]
         return cast("os.stat_result", await self.request("stat", path))
 
@@ -82,6 +162,16 @@ class SftpConnectionPool:
     _retry_engine: Any = None
     _idle: asyncio.Queue[pysftp.Connection] | None = None
     _total: int = 0
+    # When each idle connection was returned to the pool (monotonic seconds)
+    _idle_since: dict[int, float] | None = None
+    _maintenance_task: asyncio.Task[None] | None = None
+    # Arguments used to open connections when refilling to pool_min_size
+    _warm_args: tuple[Any, Any] | None = None
+    # When each connection last completed an operation or health check
+    _validated_at: dict[int, float] | None = None
+    # Client-side view of each connection's working directory (None: unknown)
+    _cwd: dict[int, str | None] | None = None
+    _circuit_breaker: CircuitBreaker | None = None
 
     def __post_init__(self) -> None:
         """Initialize the connection pool."""
@@ -90,10 +180,25 @@ class SftpConnectionPool:
 
         if self._retry_engine is None:
             self._retry_engine = create_retry_engine(
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                retry_budget=create_retry_budget(self.config.retry_budget_ratio),
+                is_retryable=_is_retryable,
             )
         if self._idle is None:
             self._idle = asyncio.Queue()
+        if self._idle_since is None:
+            self._idle_since = {}
+        if self._validated_at is None:
+            self._validated_at = {}
+        if self._cwd is None:
+            self._cwd = {}
+        if self._circuit_breaker is None:
+            self._circuit_breaker = create_circuit_breaker(
+                f"sftp:{self.config.config_name}",
+                failure_threshold=self.config.circuit_failure_threshold,
+                recovery_timeout=self.config.circuit_recovery_seconds,
+                is_failure=_is_host_failure,
+            )
 
     async def _create_inner_connection(
         self,
@@ -111,17 +216,38 @@ class SftpConnectionPool:
             cnopts = pysftp.CnOpts()
             cnopts.hostkeys = None  # Disable host key checking for testing
 
-            return pysftp.Connection(
-                host=credentials.host,
-                username=credentials.username,
-                password=credentials.password,
-                port=credentials.port,
-                cnopts=cnopts,
-            )
+            try:
+                # The SSH handshake blocks; run it off the event loop so pool
+                # warm-up can open connections concurrently
+                return await asyncio.to_thread(
+                    pysftp.Connection,
+                    host=credentials.host,
+                    username=credentials.username,
+                    password=credentials.password,
+                    port=credentials.port,
+                    cnopts=cnopts,
+                )
+            except AuthenticationException:
+                # Credentials may have been rotated; the retry resolves them again
+                logger.warning(
+                    "SFTP_AUTHENTICATION_FAILED_REFRESHING_CREDENTIALS",
+                    config_name=self.config.config_name,
+                    host=credentials.host,
+                )
+                credentials_provider.refresh()
+                raise
 
-        result = await self._retry_engine.execute_with_retry_async(_create)
+        result = await self._retry_engine.execute_with_retry_async(
+            self._call_guarded, _create
+        )
         return cast("pysftp.Connection", result)
 
+    async def _call_guarded(self, func: Callable[[], Awaitable[object]]) -> object:
+        """Run one attempt through the pool's circuit breaker, if any."""
+        if self._circuit_breaker is None:
+            return await func()
+        return await self._circuit_breaker.call(func)
+
     async def wait_for_gates(self) -> None:
         """Wait for configured gates to allow execution."""
         gate: GatingStrategy | None = getattr(self.config, "gating_strategy", None)
@@ -151,35 +277,74 @@ class SftpConnectionPool:
         **kwargs: object,
     ) -> object:
         async def _make_request() -> object:
-            # Wait for gates
-            await self.wait_for_gates()
+            with RATE_LIMIT_WAIT.labels(protocol="sftp").time():
+                # Wait for gates
+                await self.wait_for_gates()
 
-            # Rate limiting
-            async with self._rate_limit_lock:  # type: ignore[union-attr]
-                now = time.time()
-                time_since_last = now - self._last_request_time
-                min_interval = 1.0 / self.config.rate_limit_requests_per_second
+                # Rate limiting
+                async with self._rate_limit_lock:  # type: ignore[union-attr]
+                    now = time.time()
+                    time_since_last = now - self._last_request_time
+                    min_interval = 1.0 / self.config.rate_limit_requests_per_second
 
-                if time_since_last < min_interval:
-                    await asyncio.sleep(min_interval - time_since_last)
+                    if time_since_last < min_interval:
+                        await asyncio.sleep(min_interval - time_since_last)
 
-                # Update last request time after any sleep
-                self._last_request_time = time.time()
+                    # Update last request time after any sleep
+                    self._last_request_time = time.time()
 
             method = getattr(inner, operation)
-            return method(*args, **kwargs)
+            try:
+                result = method(*args, **kwargs)
+            except Exception:
+                # A failed operation may have broken the connection, so the
+                # next health check must actually probe it
+                self._validated_at.pop(id(inner), None)  # type: ignore[union-attr]
+                raise
+            self._validated_at[id(inner)] = time.monotonic()  # type: ignore[index]
+            if operation in ("chdir", "cwd"):
+                self._track_chdir(inner, args[0] if args else kwargs.get("remotepath"))
+            return result
+
+        return await self._retry_engine.execute_with_retry_async(
+            self._call_guarded, _make_request
+        )
 
-        return await self._retry_engine.execute_with_retry_async(_make_request)
+    def _track_chdir(self, inner: pysftp.Connection, path: object) -> None:
+        # Only absolute paths are tracked; anything else makes the cwd unknown
+        tracked = path if isinstance(path, str) and path.startswith("/") else None
+        self._cwd[id(inner)] = tracked  # type: ignore[index]
 
     async def _health_check(self, inner: pysftp.Connection) -> bool:
+        # Connections that completed an operation recently are known to be alive
+        validated_at = self._validated_at.get(id(inner))  # type: ignore[union-attr]
+        if (
+            validated_at is not None
+            and time.monotonic() - validated_at < self.config.health_check_skip_seconds
+        ):
+            return True
         try:
             _ = inner.pwd  # access property to ensure connection is alive
         except Exception as e:  # noqa: BLE001
             logger.warning("SFTP connection health check failed", error=str(e))
             return False
         else:
+            self._validated_at[id(inner)] = time.monotonic()  # type: ignore[index]
             return True
 
+    def _track_new(self, inner: pysftp.Connection) -> None:
+        self._validated_at[id(inner)] = time.monotonic()  # type: ignore[index]
+        self._cwd[id(inner)] = None  # type: ignore[index]
+
+    def _chdir_to_baseline(self, inner: pysftp.Connection) -> None:
+        """Change to base_dir unless the connection is known to be there."""
+        if not self.config.base_dir:
+            return
+        if self._cwd.get(id(inner)) == self.config.base_dir:  # type: ignore[union-attr]
+            return
+        inner.chdir(self.config.base_dir)
+        self._cwd[id(inner)] = self.config.base_dir  # type: ignore[index]
+
     async def _ensure_baseline(
         self,
         inner: pysftp.Connection,
@@ -187,29 +352,160 @@ class SftpConnectionPool:
         credentials_provider: "SftpCredentialsWrapper",
     ) -> pysftp.Connection:
         # If base_dir configured, ensure we're in it
-        if self.config.base_dir:
+        try:
+            self._chdir_to_baseline(inner)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Failed to chdir to base_dir; attempting to recreate connection",
+                base_dir=self.config.base_dir,
+                error=str(e),
+            )
+            self._forget(inner)
+            with contextlib.suppress(Exception):
+                inner.close()
+            # Recreate fresh connection
+            inner = await self._create_inner_connection(
+                app_config, credentials_provider
+            )
+            self._track_new(inner)
+            self._chdir_to_baseline(inner)
+        return inner
+
+    def _lease(self, inner: pysftp.Connection) -> SftpConnection:
+        self._idle_since.pop(id(inner), None)  # type: ignore[union-attr]
+        POOL_CONNECTIONS_IN_USE.labels(protocol="sftp").inc()
+        return SftpConnection(self, inner)
+
+    async def _put_idle(self, inner: pysftp.Connection) -> None:
+        self._idle_since[id(inner)] = time.monotonic()  # type: ignore[index]
+        await self._idle.put(inner)  # type: ignore[union-attr]
+
+    def _forget(self, inner: pysftp.Connection) -> None:
+        self._idle_since.pop(id(inner), None)  # type: ignore[union-attr]
+        self._validated_at.pop(id(inner), None)  # type: ignore[union-attr]
+        self._cwd.pop(id(inner), None)  # type: ignore[union-attr]
+
+    def _close_inner(self, inner: pysftp.Connection) -> None:
+        self._forget(inner)
+        with contextlib.suppress(Exception):
+            inner.close()
+        self._discard()
+
+    async def warm_up(
+        self,
+        app_config: "FetcherConfig",
+        credentials_provider: "SftpCredentialsWrapper",
+    ) -> int:
+        """Open connections up to ``pool_min_size`` concurrently.
+
+        Also starts the background task that keeps idle connections alive,
+        closes connections idle for longer than ``pool_idle_timeout_seconds``
+        (down to the minimum) and refills the pool to the minimum.
+
+        Returns:
+            The number of connections opened.
+        """
+        self._warm_args = (app_config, credentials_provider)
+        missing = self.config.pool_min_size - self._total
+        opened = 0
+        if missing > 0:
+            # Reserve the slots so concurrent acquires do not overshoot the limit
+            self._total += missing
+            results = await asyncio.gather(
+                *(
+                    self._create_inner_connection(app_config, credentials_provider)
+                    for _ in range(missing)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    self._total -= 1
+                    logger.warning(
+                        "SFTP_POOL_WARM_UP_CONNECTION_FAILED", error=str(result)
+                    )
+                    continue
+                POOL_CONNECTIONS_OPEN.labels(protocol="sftp").inc()
+                self._track_new(result)
+                try:
+                    inner = await self._ensure_baseline(
+                        result, app_config, credentials_provider
+                    )
+                except Exception as e:  # noqa: BLE001
+                    logger.warning("SFTP_POOL_WARM_UP_CONNECTION_FAILED", error=str(e))
+                    self._close_inner(result)
+                    continue
+                await self._put_idle(inner)
+                opened += 1
+            logger.info(
+                "SFTP_POOL_WARMED_UP",
+                config_name=self.config.config_name,
+                opened=opened,
+                pool_min_size=self.config.pool_min_size,
+            )
+        self._start_maintenance()
+        return opened
+
+    def _start_maintenance(self) -> None:
+        if self._maintenance_task is None or self._maintenance_task.done():
+            self._maintenance_task = asyncio.create_task(
+                self._maintain(), context=background_task_context()
+            )
+
+    async def _maintain(self) -> None:
+        interval = (
+            self.config.pool_keepalive_seconds
+            or self.config.pool_idle_timeout_seconds / 2
+        )
+        while True:
+            await asyncio.sleep(interval)
             try:
-                inner.chdir(self.config.base_dir)
+                await self.maintain_idle()
             except Exception as e:  # noqa: BLE001
-                logger.warning(
-                    "Failed to chdir to base_dir; attempting to recreate connection",
-                    base_dir=self.config.base_dir,
-                    error=str(e),
-                )
-                with contextlib.suppress(Exception):
-                    inner.close()
-                # Recreate fresh connection
-                inner = await self._create_inner_connection(
-                    app_config, credentials_provider
-                )
-                if self.config.base_dir:
-                    inner.chdir(self.config.base_dir)
-        return inner
+                logger.warning("SFTP_POOL_MAINTENANCE_FAILED", error=str(e))
+
+    async def maintain_idle(self) -> None:
+        """Reap, keep alive and refill idle connections once."""
+        now = time.monotonic()
+        idle: list[pysftp.Connection] = []
+        while not self._idle.empty():  # type: ignore[union-attr]
+            idle.append(self._idle.get_nowait())  # type: ignore[union-attr]
+
+        for inner in idle:
+            idle_since = self._idle_since.get(id(inner), now)  # type: ignore[union-attr]
+            if (
+                now - idle_since >= self.config.pool_idle_timeout_seconds
+                and self._total > self.config.pool_min_size
+            ):
+                self._close_inner(inner)
+                continue
+            if self.config.pool_keepalive_seconds and not await self._health_check(
+                inner
+            ):
+                self._close_inner(inner)
+                continue
+            # Put back without resetting the idle clock
+            await self._idle.put(inner)  # type: ignore[union-attr]
+
+        if self._total < self.config.pool_min_size and self._warm_args is not None:
+            await self.warm_up(*self._warm_args)
+
+    def _discard(self) -> None:
+        self._total = max(0, self._total - 1)
+        POOL_CONNECTIONS_OPEN.labels(protocol="sftp").dec()
 
     async def acquire(
         self,
         app_config: "FetcherConfig",
         credentials_provider: "SftpCredentialsWrapper",
+    ) -> SftpConnection:
+        with get_tracer().span("connection_acquire", protocol="sftp"):
+            return await self._acquire(app_config, credentials_provider)
+
+    async def _acquire(
+        self,
+        app_config: "FetcherConfig",
+        credentials_provider: "SftpCredentialsWrapper",
     ) -> SftpConnection:
         # Fast path: try idle queue first
         while True:
@@ -221,68 +517,85 @@ class SftpConnectionPool:
             if inner is not None:
                 healthy = await self._health_check(inner)
                 if not healthy:
-                    with contextlib.suppress(Exception):
-                        inner.close()
-                    self._total = max(0, self._total - 1)
+                    self._close_inner(inner)
                     continue
                 inner = await self._ensure_baseline(
                     inner, app_config, credentials_provider
                 )
-                return SftpConnection(self, inner)
+                return self._lease(inner)
 
             # No idle connection available; create if under limit
             if self._total < self.config.pool_max_size:
-                inner = await self._create_inner_connection(
-                    app_config, credentials_provider
-                )
+                # Reserve the slot before the handshake so concurrent acquires
+                # do not overshoot the limit
                 self._total += 1
+                try:
+                    inner = await self._create_inner_connection(
+                        app_config, credentials_provider
+                    )
+                except BaseException:
+                    self._total -= 1
+                    raise
+                POOL_CONNECTIONS_OPEN.labels(protocol="sftp").inc()
+                self._track_new(inner)
+                # Idle connections are validated and reaped in the background
+                self._warm_args = (app_config, credentials_provider)
+                self._start_maintenance()
                 inner = await self._ensure_baseline(
                     inner, app_config, credentials_provider
                 )
-                return SftpConnection(self, inner)
+                return self._lease(inner)
 
             # At capacity; block until one is released
             inner = await self._idle.get()  # type: ignore[union-attr]
             healthy = await self._health_check(inner)
             if not healthy:
-                with contextlib.suppress(Exception):
-                    inner.close()
-                self._total = max(0, self._total - 1)
+                self._close_inner(inner)
                 continue
             inner = await self._ensure_baseline(inner, app_config, credentials_provider)
-            return SftpConnection(self, inner)
+            return self._lease(inner)
 
     async def release(self, inner: pysftp.Connection) -> None:
+        POOL_CONNECTIONS_IN_USE.labels(protocol="sftp").dec()
         # Cleanup to baseline and verify health before returning to queue
         ok = True
-        if self.config.base_dir:
-            try:
-                inner.chdir(self.config.base_dir)
-            except Exception as e:  # noqa: BLE001
-                logger.warning("Failed to reset chdir on release", error=str(e))
-                ok = False
+        try:
+            self._chdir_to_baseline(inner)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Failed to reset chdir on release", error=str(e))
+            ok = False
         if ok:
             ok = await self._health_check(inner)
 
         if ok:
-            await self._idle.put(inner)  # type: ignore[union-attr]
+            await self._put_idle(inner)
         else:
-            with contextlib.suppress(Exception):
-                inner.close()
-            self._total = max(0, self._total - 1)
+            self._close_inner(inner)
+
+    async def discard(self, inner: pysftp.Connection) -> None:
+        """Close a leased connection instead of returning it to the pool."""
+        POOL_CONNECTIONS_IN_USE.labels(protocol="sftp").dec()
+        logger.info("SFTP_CONNECTION_DISCARDED")
+        self._close_inner(inner)
 
     async def close(self) -> None:
         """Close all idle SFTP connections with retry logic."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
 
         async def _close_all() -> None:
             try:
                 # Drain queue
                 while True:
                     inner = self._idle.get_nowait()  # type: ignore[union-attr]
+                    self._forget(inner)
                     try:
                         inner.close()
                     finally:
-                        self._total = max(0, self._total - 1)
+                        self._discard()
             except asyncio.QueueEmpty:
                 pass
 
@@ -57,6 +57,8 @@ class SftpDirectoryLocatorConfig:
     processed_files_ttl: timedelta | None = None
     processing_results_ttl: timedelta | None = None
     error_state_ttl: timedelta | None = None
+    seen_filter_capacity: int | None = None
+    seen_filter_error_rate: float = 0.001
 
 
 @dataclass
@@ -291,6 +293,8 @@ class DirectorySftpBundleLocatorFactory(StrategyFactory):
             processed_files_ttl = getattr(params, "processed_files_ttl", None)
             processing_results_ttl = getattr(params, "processing_results_ttl", None)
             error_state_ttl = getattr(params, "error_state_ttl", None)
+            seen_filter_capacity = getattr(params, "seen_filter_capacity", None)
+            seen_filter_error_rate = getattr(params, "seen_filter_error_rate", 0.001)
         else:
             sftp_config = params["sftp_config"]
             remote_dir = params["remote_dir"]
@@ -304,6 +308,8 @@ class DirectorySftpBundleLocatorFactory(StrategyFactory):
             processed_files_ttl = params.get("processed_files_ttl", None)
             processing_results_ttl = params.get("processing_results_ttl", None)
             error_state_ttl = params.get("error_state_ttl", None)
+            seen_filter_capacity = params.get("seen_filter_capacity")
+            seen_filter_error_rate = params.get("seen_filter_error_rate", 0.001)
 
         return DirectorySftpBundleLocator(
             sftp_manager=self.sftp_manager,
@@ -317,6 +323,8 @@ class DirectorySftpBundleLocatorFactory(StrategyFactory):
             processed_files_ttl=processed_files_ttl,
             processing_results_ttl=processing_results_ttl,
             error_state_ttl=error_state_ttl,
+            seen_filter_capacity=seen_filter_capacity,
+            seen_filter_error_rate=seen_filter_error_rate,
         )
 
     def get_config_type(self, params: dict[str, Any]) -> type | None:
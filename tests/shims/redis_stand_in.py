@@ -0,0 +1,192 @@
+"""In-memory stand-in for the subset of redis.asyncio used by the leased queue.
+
+Behaves like a client created with ``decode_responses=True``. Several
+instances can share one ``RedisStandInServer`` to simulate replicas talking to
+the same Redis.
+"""
+
+import fnmatch
+import time
+from collections import deque
+from typing import Any
+
+
+class RedisStandInServer:
+    """Shared data of the stand-in."""
+
+    def __init__(self) -> None:
+        """Initialize empty keyspace."""
+        self.data: dict[str, Any] = {}
+        self.expires_at: dict[str, float] = {}
+
+    def purge_expired(self) -> None:
+        """Drop keys whose TTL has passed."""
+        now = time.monotonic()
+        for key in [k for k, exp in self.expires_at.items() if exp <= now]:
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+
+
+class RedisStandIn:
+    """Async client over a RedisStandInServer."""
+
+    def __init__(self, server: RedisStandInServer | None = None) -> None:
+        """Initialize the client, optionally sharing a server."""
+        self.server = server or RedisStandInServer()
+
+    def _get(self, key: str, factory: type) -> Any:
+        self.server.purge_expired()
+        return self.server.data.setdefault(key, factory())
+
+    def _drop_if_empty(self, key: str) -> None:
+        if not self.server.data.get(key):
+            self.server.data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = int(self.server.data.get(key, 0)) + 1
+        self.server.data[key] = str(value)
+        return value
+
+    async def hset(self, key: str, field: str, value: str) -> int:
+        mapping = self._get(key, dict)
+        is_new = field not in mapping
+        mapping[field] = value
+        return int(is_new)
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self._get(key, dict).get(field)
+
+    async def hdel(self, key: str, field: str) -> int:
+        removed = self._get(key, dict).pop(field, None) is not None
+        self._drop_if_empty(key)
+        return int(removed)
+
+    async def rpush(self, key: str, *values: str) -> int:
+        items = self._get(key, deque)
+        items.extend(values)
+        return len(items)
+
+    async def lmove(self, src: str, dst: str, wherefrom: str, whereto: str) -> Any:
+        items = self._get(src, deque)
+        if not items:
+            self._drop_if_empty(src)
+            return None
+        value = items.popleft() if wherefrom == "LEFT" else items.pop()
+        self._drop_if_empty(src)
+        target = self._get(dst, deque)
+        if whereto == "LEFT":
+            target.appendleft(value)
+        else:
+            target.append(value)
+        return value
+
+    async def lrem(self, key: str, count: int, value: str) -> int:
+        items = self._get(key, deque)
+        removed = 0
+        while value in items and (count == 0 or removed < count):
+            items.remove(value)
+            removed += 1
+        self._drop_if_empty(key)
+        return removed
+
+    async def llen(self, key: str) -> int:
+        return len(self._get(key, deque))
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        items = list(self._get(key, deque))
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def zadd(
+        self,
+        key: str,
+        mapping: dict[str, float],
+        *,
+        nx: bool = False,
+        xx: bool = False,
+        ch: bool = False,
+    ) -> int:
+        scores = self._get(key, dict)
+        changed = 0
+        for member, score in mapping.items():
+            exists = member in scores
+            if (nx and exists) or (xx and not exists):
+                continue
+            if not exists or (ch and scores[member] != score):
+                changed += 1
+            scores[member] = score
+        self._drop_if_empty(key)
+        return changed
+
+    async def zrem(self, key: str, member: str) -> int:
+        removed = self._get(key, dict).pop(member, None) is not None
+        self._drop_if_empty(key)
+        return int(removed)
+
+    async def zscore(self, key: str, member: str) -> float | None:
+        return self._get(key, dict).get(member)
+
+    async def zcard(self, key: str) -> int:
+        return len(self._get(key, dict))
+
+    async def zrangebyscore(self, key: str, low: Any, high: Any) -> list[str]:
+        lo = float(low)
+        hi = float(high)
+        scores = self._get(key, dict)
+        return sorted(
+            (m for m, s in scores.items() if lo <= s <= hi), key=lambda m: scores[m]
+        )
+
+    async def set(
+        self, key: str, value: str, *, nx: bool = False, px: int | None = None
+    ) -> bool | None:
+        self.server.purge_expired()
+        if nx and key in self.server.data:
+            return None
+        self.server.data[key] = value
+        self.server.expires_at.pop(key, None)
+        if px is not None:
+            self.server.expires_at[key] = time.monotonic() + px / 1000
+        return True
+
+    async def get(self, key: str) -> str | None:
+        self.server.purge_expired()
+        value = self.server.data.get(key)
+        return value if isinstance(value, str) else None
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [await self.get(key) for key in keys]
+
+    async def setex(self, key: str, seconds: int, value: str) -> bool | None:
+        return await self.set(key, value, px=seconds * 1000)
+
+    async def scan(
+        self, cursor: int = 0, match: str | None = None, count: int = 10
+    ) -> tuple[int, list[str]]:
+        # Hand out keys in insertion order, ``count`` at a time
+        self.server.purge_expired()
+        keys = [
+            k
+            for k in self.server.data
+            if match is None or fnmatch.fnmatchcase(k, match)
+        ]
+        batch = keys[cursor : cursor + count]
+        next_cursor = cursor + count
+        return (next_cursor if next_cursor < len(keys) else 0), batch
+
+    async def pexpire(self, key: str, px: int) -> bool:
+        self.server.purge_expired()
+        if key not in self.server.data:
+            return False
+        self.server.expires_at[key] = time.monotonic() + px / 1000
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            removed += int(self.server.data.pop(key, None) is not None)
+            self.server.expires_at.pop(key, None)
+        return removed
+
+    async def exists(self, *keys: str) -> int:
+        self.server.purge_expired()
+        return sum(1 for key in keys if key in self.server.data)
@@ -14,6 +14,7 @@ import redis.asyncio as redis
 
 from data_fetcher_core.kv_store import (
     RedisKeyValueStore,
+    StateTracker,
 )
 
 
@@ -426,3 +427,24 @@ class TestRedisIntegration:
         # Check Redis is empty
         keys = await redis_client.keys("test:*")
         assert len(keys) == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_state_tracker_merges_flushes(
+        self, redis_store: RedisKeyValueStore
+    ) -> None:
+        """Concurrent tracker flushes keep the overall minimum and maximum."""
+        # A timing written by an earlier version as a serialized value
+        await redis_store.put("stats:timing:load", {"count": 1, "total_time": 9.0})
+        trackers = [
+            StateTracker(redis_store, "stats", flush_interval=3600) for _ in range(4)
+        ]
+        for index, tracker in enumerate(trackers):
+            await tracker.record_processing_time("load", 0.1 * (index + 1))
+
+        await asyncio.gather(*(tracker.flush() for tracker in trackers))
+        stats = await trackers[0].get_processing_stats("load")
+
+        assert stats["count"] == 4
+        assert stats["min_time"] == pytest.approx(0.1)
+        assert stats["max_time"] == pytest.approx(0.4)
+        await asyncio.gather(*(tracker.close() for tracker in trackers))
@@ -0,0 +1 @@
+"""Unit tests for data_fetcher_sftp package."""
@@ -0,0 +1,52 @@
+"""Tests for the micro-benchmark harness."""
+
+import pytest
+
+from benchmarks.micro import BENCHMARKS, MicroContext, compare, run_benchmark
+
+
+class TestRunBenchmark:
+    """Test timing registered micro-benchmarks."""
+
+    @pytest.mark.parametrize(
+        "name", ["bundle_ref_serializer.loads", "kv_store_queue.memory.enqueue_dequeue"]
+    )
+    def test_reports_ops_per_sec(self, name: str) -> None:
+        """Sync and async operations are both timed."""
+        result = run_benchmark(BENCHMARKS[name], MicroContext(), rounds=2, scale=0.01)
+
+        assert result.rounds == 2
+        assert result.ops_per_sec >= result.median_ops_per_sec >= result.min_ops_per_sec
+        assert result.min_ops_per_sec > 0
+
+    def test_redis_benchmarks_are_marked(self) -> None:
+        """Redis benchmarks are skipped unless a host is configured."""
+        assert BENCHMARKS["kv_store_queue.redis.enqueue_dequeue"].requires_redis
+
+
+class TestCompare:
+    """Test regression detection against a baseline."""
+
+    def test_flags_drops_beyond_threshold(self) -> None:
+        """Only drops larger than the threshold regress."""
+        baseline = {
+            "benchmarks": {
+                "fast": {"ops_per_sec": 1000.0},
+                "slow": {"ops_per_sec": 1000.0},
+                "gone": {"ops_per_sec": 1000.0},
+            }
+        }
+        report = {
+            "benchmarks": {
+                "fast": {"ops_per_sec": 850.0},
+                "slow": {"ops_per_sec": 700.0},
+                "new": {"ops_per_sec": 5.0},
+            }
+        }
+
+        comparisons = {c.name: c for c in compare(report, baseline, threshold=0.2)}
+
+        assert set(comparisons) == {"fast", "slow"}
+        assert not comparisons["fast"].regressed
+        assert comparisons["slow"].regressed
+        assert comparisons["slow"].change == pytest.approx(-0.3)
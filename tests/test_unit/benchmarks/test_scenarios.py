@@ -0,0 +1,66 @@
+"""Smoke tests for the offline benchmark suite."""
+
+import httpx
+import pytest
+
+from benchmarks import run_scenario
+from benchmarks.scenarios import percentile
+from benchmarks.sirene_api import SireneApiStandIn
+
+
+class TestPercentile:
+    """Test the nearest-rank percentile."""
+
+    def test_nearest_rank(self) -> None:
+        """Percentiles pick an observed value."""
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+
+class TestSireneApiStandIn:
+    """Test the SIRENE pagination mimic."""
+
+    def test_pages_until_cursor_repeats(self) -> None:
+        """The last page repeats its cursor, like the INSEE API."""
+        with SireneApiStandIn(records_per_day=5) as api:
+            query = "dateDernierTraitementUniteLegale:[2024-01-01T00:00:00 TO 2024-01-01T23:59:59]"
+            first = httpx.get(
+                api.base_url, params={"q": query, "nombre": 3, "curseur": "*"}
+            ).json()
+            last = httpx.get(
+                api.base_url,
+                params={
+                    "q": query,
+                    "nombre": 3,
+                    "curseur": first["header"]["curseurSuivant"],
+                },
+            ).json()
+
+        assert first["header"]["total"] == 5
+        assert len(first["unitesLegales"]) == 3
+        assert len(last["unitesLegales"]) == 2
+        assert last["header"]["curseurSuivant"] == last["header"]["curseur"]
+
+
+class TestScenarios:
+    """Run scenarios end to end at a tiny scale."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["sftp_many_small_files", "sftp_compressed_archives", "http_paginated_api"],
+    )
+    def test_scenario_processes_every_bundle(self, name: str) -> None:
+        """Every bundle is stored and timed."""
+        result = run_scenario(name, scale=0.01)
+
+        assert result.bundles > 0
+        assert result.errors == 0
+        assert result.bytes_stored > 0
+        assert (
+            0 < result.bundle_latency_p50_seconds <= result.bundle_latency_p99_seconds
+        )
+        assert result.peak_rss_bytes > 0
+        assert result.stages["bundle"]["count"] == result.bundles
@@ -7,6 +7,8 @@ and WSGI router functionality.
 import json
 from unittest.mock import MagicMock, patch
 
+from prometheus_client import CollectorRegistry, Counter
+
 from data_fetcher_app.health import (
     HealthCheck,
     SimpleWSGIRouter,
@@ -360,6 +362,26 @@ class TestSimpleWSGIRouter:
             "404 Not Found", [("Content-Type", "text/plain")]
         )
 
+    def test_router_metrics_endpoint(self) -> None:
+        """Test metrics endpoint renders the registry in Prometheus format."""
+        registry = CollectorRegistry()
+        Counter(
+            "test_requests_total", "Requests", ("outcome",), registry=registry
+        ).labels(outcome="ok").inc()
+        router = SimpleWSGIRouter(HealthCheck("test-app"), metrics_registry=registry)
+
+        environ = {"PATH_INFO": "/metrics", "REQUEST_METHOD": "GET"}
+        start_response = MagicMock()
+
+        response = list(router(environ, start_response))
+
+        body = response[0].decode("utf-8")
+        assert "# TYPE test_requests_total counter" in body
+        assert 'test_requests_total{outcome="ok"} 1.0' in body
+        start_response.assert_called_once_with(
+            "200 OK", [("Content-Type", "text/plain; version=0.0.4; charset=utf-8")]
+        )
+
 
 class TestCreateHealthApp:
     """Test the create_health_app function."""
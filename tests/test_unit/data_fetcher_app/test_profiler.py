@@ -0,0 +1,97 @@
+"""Unit tests for the run-level resource profiler."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from data_fetcher_app.profiler import RunProfiler, create_run_profiler
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestRunProfiler:
+    """Test the RunProfiler class."""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call_with_stack(self) -> None:
+        """A synchronous sleep in a coroutine is reported with its stack."""
+        profiler = RunProfiler(
+            block_threshold_seconds=0.05,
+            probe_interval_seconds=0.01,
+            interval_seconds=0.05,
+        )
+        profiler.start()
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.3)
+        await asyncio.sleep(0.05)
+        report = await profiler.stop()
+
+        assert report.blocking["count"] >= 1
+        event = report.blocking["events"][0]
+        assert event["duration_seconds"] >= 0.2
+        assert any("_block_the_loop" in frame for frame in event["stack"])
+        assert report.loop_lag["max_seconds"] >= 0.2
+        assert report.rss["max_bytes"] > 0
+        assert report.resource_samples
+
+    @pytest.mark.asyncio
+    async def test_idle_loop_has_no_blocking_events(self) -> None:
+        """A loop that only awaits is not reported as blocked."""
+        profiler = RunProfiler(block_threshold_seconds=0.5, probe_interval_seconds=0.01)
+        async with profiler:
+            await asyncio.sleep(0.1)
+
+        report = profiler.report()
+        assert report.blocking["count"] == 0
+        assert report.loop_lag["samples"] > 0
+        assert report.stack_samples == 0
+
+    @pytest.mark.asyncio
+    async def test_writes_report_and_folded_stacks(self, tmp_path: Path) -> None:
+        """The report and sampled stacks are written to the output directory."""
+        profiler = RunProfiler(
+            block_threshold_seconds=0.05,
+            probe_interval_seconds=0.01,
+            stack_sample_interval_seconds=0.005,
+            output_dir=str(tmp_path),
+            run_id="run-1",
+        )
+        async with profiler:
+            _block_the_loop(0.1)
+            await asyncio.sleep(0.02)
+
+        report = json.loads((tmp_path / "run-1.profile.json").read_text())
+        assert report["blocking"]["count"] >= 1
+        assert report["stack_samples"] > 0
+        folded = (tmp_path / "run-1.stacks.folded").read_text()
+        assert "_block_the_loop" in folded
+
+
+class TestCreateRunProfiler:
+    """Test building the profiler from CLI arguments."""
+
+    def test_disabled_by_default(self) -> None:
+        """No profiler is created unless --profile is set."""
+        assert create_run_profiler({"run_id": "r"}) is None
+
+    def test_from_arguments(self) -> None:
+        """Threshold, output directory and run ID come from the arguments."""
+        profiler = create_run_profiler(
+            {
+                "profile": True,
+                "profile_block_threshold_ms": 250,
+                "profile_output_dir": "/tmp/profiles",
+                "run_id": "fetcher_us_fl_1",
+            }
+        )
+
+        assert profiler is not None
+        assert profiler.block_threshold_seconds == 0.25
+        assert profiler.output_dir == "/tmp/profiles"
+        assert profiler.run_id == "fetcher_us_fl_1"
+        assert profiler.sample_stacks
@@ -0,0 +1,101 @@
+"""Tests for the Bloom filter used to deduplicate large crawls."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from data_fetcher_core.bloom_filter import BloomFilter
+from data_fetcher_core.kv_store import InMemoryKeyValueStore, ProcessedItemSet
+
+
+class TestBloomFilter:
+    """Test sizing, membership and serialization of the Bloom filter."""
+
+    def test_has_no_false_negatives(self) -> None:
+        """Every added item is reported as present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"https://api.example.com/page/{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_is_bounded(self) -> None:
+        """Unseen items are rarely reported present at capacity."""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(f"unseen-{i}" in bloom for i in range(10000))
+        assert false_positives / 10000 < 0.03
+
+    def test_memory_is_fixed_by_capacity(self) -> None:
+        """The bit array size does not depend on the number of items added."""
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        size = bloom.size_bytes
+        for i in range(1000):
+            bloom.add(str(i))
+
+        assert bloom.size_bytes == size
+        # ~14.4 bits per item at 0.1% error rate
+        assert size < 2 * 1024 * 1024
+
+    def test_round_trips_through_bytes(self) -> None:
+        """A restored filter answers membership identically."""
+        bloom = BloomFilter(capacity=100)
+        bloom.add("a")
+        bloom.add("b")
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+        assert "a" in restored
+        assert "b" in restored
+        assert len(restored) == 2
+        assert restored.to_bytes() == bloom.to_bytes()
+
+    def test_rejects_invalid_parameters(self) -> None:
+        """Capacity and error rate are validated."""
+        with pytest.raises(ValueError, match="capacity"):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError, match="error_rate"):
+            BloomFilter(capacity=10, error_rate=1.5)
+        with pytest.raises(ValueError, match="BloomFilter"):
+            BloomFilter.from_bytes(b"x" * 32)
+
+
+class TestProcessedItemSetWithFilter:
+    """Test ProcessedItemSet backed by a Bloom filter."""
+
+    @pytest.fixture
+    async def store(self) -> AsyncIterator[InMemoryKeyValueStore]:
+        """Create a fresh in-memory store for each test."""
+        store = InMemoryKeyValueStore(serializer="json", default_ttl=3600)
+        yield store
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_replaces_journal_chunks(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """Chunks folded into a snapshot are deleted and not replayed."""
+        items = ProcessedItemSet(
+            "key", batch_size=1, seen_filter=BloomFilter(100), snapshot_interval=2
+        )
+        await items.load(store)
+        for item in ("a", "b", "c"):
+            items.add(item)
+            await items.flush(store)
+
+        assert await store.get("key:chunk:0000000000") is None
+        assert await store.get("key:chunk:0000000001") is None
+        assert await store.get("key:chunk:0000000002") == ["c"]
+        assert (await store.get("key:bloom"))["through"] == 2
+
+        restored = ProcessedItemSet("key", batch_size=1, seen_filter=BloomFilter(100))
+        await restored.load(store)
+        restored.add("d")
+        await restored.flush(store)
+
+        assert restored.probabilistic is True
+        assert all(item in restored for item in ("a", "b", "c", "d"))
+        assert await store.get("key:chunk:0000000003") == ["d"]
@@ -13,6 +13,9 @@ from data_fetcher_core.core import (
     FetchPlan,
     FetchRunContext,
 )
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http.http_manager import HttpManager
+from data_fetcher_http_api.api_loader import HttpBundleLoader
 
 
 class TestRequestMeta:
@@ -280,3 +283,65 @@ class TestFetchPlan:
         assert plan.concurrency == 8
         assert plan.context == context
         assert plan.config == recipe
+
+    def test_from_config_uses_yaml_settings(self) -> None:
+        """Test FetchPlan.from_config takes concurrency and queue size from YAML."""
+        recipe = DataRegistryFetcherConfig(
+            loader={"dummy": {}}, locators=[], concurrency=6, target_queue_size=50
+        )
+        plan = FetchPlan.from_config(recipe, FetchRunContext(run_id="test_run"))
+        assert plan.concurrency == 6
+        assert plan.target_queue_size == 50
+
+    def test_from_config_applies_overrides(self) -> None:
+        """Test FetchPlan.from_config prefers explicit overrides."""
+        recipe = DataRegistryFetcherConfig(loader={"dummy": {}}, locators=[])
+        plan = FetchPlan.from_config(
+            recipe,
+            FetchRunContext(run_id="test_run"),
+            concurrency=3,
+            target_queue_size=10,
+        )
+        assert plan.concurrency == 3
+        assert plan.target_queue_size == 10
+
+    def test_from_config_auto_concurrency_uses_pool_size(self) -> None:
+        """Test auto concurrency never exceeds the loader's connection pool."""
+        loader = HttpBundleLoader(
+            http_manager=HttpManager(),
+            http_config=HttpProtocolConfig(pool_max_size=4),
+        )
+        recipe = DataRegistryFetcherConfig(loader=loader, locators=[], concurrency=10)
+        context = FetchRunContext(run_id="test_run")
+
+        auto = FetchPlan.from_config(recipe, context, auto_concurrency=True)
+        capped = FetchPlan.from_config(
+            recipe, context, concurrency=2, auto_concurrency=True
+        )
+        assert auto.concurrency == 4
+        assert capped.concurrency == 2
+
+    def test_from_config_auto_concurrency_honours_yaml_concurrency(self) -> None:
+        """Test a YAML concurrency below the pool size wins over the pool size."""
+        loader = HttpBundleLoader(
+            http_manager=HttpManager(),
+            http_config=HttpProtocolConfig(pool_max_size=4),
+        )
+        context = FetchRunContext(run_id="test_run")
+
+        yaml_set = FetchPlan.from_config(
+            DataRegistryFetcherConfig(loader=loader, locators=[], concurrency=2),
+            context,
+            auto_concurrency=True,
+        )
+        unset = FetchPlan.from_config(
+            DataRegistryFetcherConfig(loader=loader, locators=[]),
+            context,
+            auto_concurrency=True,
+        )
+        default = FetchPlan.from_config(
+            DataRegistryFetcherConfig(loader=loader, locators=[]), context
+        )
+        assert yaml_set.concurrency == 2
+        assert unset.concurrency == 4
+        assert default.concurrency == 10
@@ -0,0 +1,133 @@
+"""Tests for the AWS Secrets Manager credential provider cache."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from data_fetcher_core.credentials import AWSSecretsCredentialProvider
+
+SECRET = '{"host": "sftp.example.com", "username": "u", "password": "p", "port": "22"}'
+
+
+class SlowSecretsClient:
+    """Secrets Manager client stand-in counting calls."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_secret_value(self, SecretId: str) -> dict[str, Any]:  # noqa: N803
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"Name": SecretId, "SecretString": SECRET}
+
+
+def _provider(client: SlowSecretsClient, **kwargs: Any) -> AWSSecretsCredentialProvider:
+    provider = AWSSecretsCredentialProvider(region="eu-west-2", **kwargs)
+    provider._client = client
+    return provider
+
+
+class TestAWSSecretsCredentialProvider:
+    """Test whole-secret caching and single-flight fetching."""
+
+    @pytest.mark.asyncio
+    async def test_all_keys_come_from_one_fetch(self) -> None:
+        """Reading every key of a secret calls Secrets Manager once."""
+        client = SlowSecretsClient()
+        provider = _provider(client)
+
+        values = [
+            await provider.get_credential("us-fl", key)
+            for key in ("host", "username", "password", "port")
+        ]
+
+        assert values == ["sftp.example.com", "u", "p", "22"]
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self) -> None:
+        """A burst of lookups while the secret is loading makes one call."""
+        client = SlowSecretsClient(delay=0.05)
+        provider = _provider(client)
+
+        values = await asyncio.gather(
+            *(provider.get_credential("us-fl", "password") for _ in range(20))
+        )
+
+        assert values == ["p"] * 20
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_secret_is_fetched_again(self) -> None:
+        """Secrets are fetched again once the TTL has passed."""
+        client = SlowSecretsClient()
+        provider = _provider(client, cache_ttl_seconds=0.01)
+
+        await provider.get_credential("us-fl", "host")
+        await asyncio.sleep(0.02)
+        await provider.get_credential("us-fl", "host")
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_key_raises_value_error(self) -> None:
+        """Unknown keys are reported without refetching the secret."""
+        client = SlowSecretsClient()
+        provider = _provider(client)
+
+        with pytest.raises(ValueError, match="Key 'token' not found"):
+            await provider.get_credential("us-fl", "token")
+        await provider.get_credential("us-fl", "host")
+
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self) -> None:
+        """A failed fetch is retried by the next lookup."""
+        client = MagicMock()
+        client.get_secret_value.side_effect = [
+            RuntimeError("throttled"),
+            {"SecretString": SECRET},
+        ]
+        provider = AWSSecretsCredentialProvider(region="eu-west-2")
+        provider._client = client
+
+        with pytest.raises(ValueError, match="throttled"):
+            await provider.get_credential("us-fl", "host")
+
+        assert await provider.get_credential("us-fl", "host") == "sftp.example.com"
+
+    @patch("boto3.session.Session", autospec=True)
+    @pytest.mark.asyncio
+    async def test_client_is_created_once(self, sess_mock: MagicMock) -> None:
+        """One Secrets Manager client serves every secret."""
+        instance = MagicMock()
+        instance.client.return_value = SlowSecretsClient()
+        sess_mock.return_value = instance
+        provider = AWSSecretsCredentialProvider(region="eu-west-2")
+
+        await provider.get_credential("us-fl", "host")
+        await provider.get_credential("fr", "host")
+
+        assert instance.client.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_one_secret(self) -> None:
+        """Invalidating a configuration refetches only its secret."""
+        client = SlowSecretsClient()
+        provider = _provider(client)
+        await provider.get_credential("us-fl", "host")
+        await provider.get_credential("fr", "host")
+
+        provider.invalidate("us-fl")
+        await provider.get_credential("us-fl", "host")
+        await provider.get_credential("fr", "host")
+
+        assert client.calls == 3
@@ -0,0 +1,77 @@
+"""Tests for the fetcher run lifecycle."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.fetcher import Fetcher
+
+
+class HookedLocator:
+    """Locator handing out one bundle and recording its run-end hook."""
+
+    def __init__(self, *, fail_on_run_end: bool = False) -> None:
+        self.remaining = [BundleRef(bid="bid-1", request_meta={"url": "x"})]
+        self.fail_on_run_end = fail_on_run_end
+        self.run_ended = False
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, _bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch, self.remaining = self.remaining, []
+        return batch
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        self.run_ended = True
+        if self.fail_on_run_end:
+            raise RuntimeError("flush failed")
+
+
+class HookedLoader:
+    """Loader recording its run-end hook."""
+
+    def __init__(self) -> None:
+        self.run_ended = False
+
+    async def load(
+        self, bundle: BundleRef, _storage: object, _ctx: object, _config: object
+    ) -> BundleLoadResult:
+        return BundleLoadResult(bundle=bundle, bundle_meta={}, resources=[])
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        self.run_ended = True
+
+
+class TestRunEndHooks:
+    """Test the hooks called once the workers have finished."""
+
+    @pytest.mark.asyncio
+    async def test_failing_hook_does_not_skip_the_others(self) -> None:
+        """Every on_run_end hook runs even when an earlier one raises."""
+        failing, healthy = HookedLocator(fail_on_run_end=True), HookedLocator()
+        loader = HookedLoader()
+        plan = FetchPlan(
+            config=DataRegistryFetcherConfig(
+                loader=loader,  # type: ignore[arg-type]
+                locators=[failing, healthy],  # type: ignore[list-item]
+            ),
+            context=FetchRunContext(
+                run_id="run",
+                app_config=SimpleNamespace(storage=object()),  # type: ignore[arg-type]
+            ),
+        )
+
+        result = await asyncio.wait_for(Fetcher().run(plan), timeout=5)
+
+        assert result.processed_count == 2
+        assert failing.run_ended
+        assert healthy.run_ended
+        assert loader.run_ended
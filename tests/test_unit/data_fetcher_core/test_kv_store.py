@@ -12,6 +12,8 @@ import pytest
 from data_fetcher_core.kv_store import (
     InMemoryKeyValueStore,
 )
+from data_fetcher_core.kv_store.factory import _get_redis_config
+from data_fetcher_core.kv_store.helper import deserialize_value, serialize_value
 
 
 class TestInMemoryKeyValueStore:
@@ -148,6 +150,88 @@ class TestInMemoryKeyValueStore:
         finally:
             await store.close()
 
+    @pytest.mark.asyncio
+    async def test_raw_values_bypass_serializer(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """Values written with put_raw are stored and returned as is."""
+        try:
+            await store.put_raw("raw_key", '{"a": 1}')
+            await store.put_raw("raw_bytes", b"\x00\xff")
+
+            assert await store.get_raw("raw_key") == '{"a": 1}'
+            assert await store.get("raw_key") == {"a": 1}
+            assert await store.get_raw("raw_bytes") == b"\x00\xff"
+            assert await store.get_raw("missing") is None
+            assert await store.range_get("raw_", raw=True) == [
+                ("raw_bytes", b"\x00\xff"),
+                ("raw_key", '{"a": 1}'),
+            ]
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_expire_many_counts_existing_keys(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """expire_many sets the TTL of every existing key it is given."""
+        try:
+            await store.put("first", 1, ttl=1)
+            await store.put("second", 2, ttl=1)
+
+            assert await store.expire_many(["first", "second", "missing"], 60) == 2
+            await asyncio.sleep(1.1)
+
+            assert await store.get("first") == 1
+            assert await store.get("second") == 2
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_range_pages_in_key_order(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """iter_range yields the range in batches of at most batch_size."""
+        try:
+            for i in range(5):
+                await store.put(f"item:{i}", i)
+            await store.put("other", "x")
+
+            batches = [
+                batch
+                async for batch in store.iter_range("item:", "item;", batch_size=2)
+            ]
+
+            assert [[key for key, _ in batch] for batch in batches] == [
+                ["item:0", "item:1"],
+                ["item:2", "item:3"],
+                ["item:4"],
+            ]
+        finally:
+            await store.close()
+
+
+class TestSerialization:
+    """Test value serialization helpers."""
+
+    def test_pickle_is_not_hex_encoded_in_binary_mode(self) -> None:
+        """Binary-safe stores keep pickles as bytes, half the size of hex."""
+        value = {"data": list(range(100))}
+
+        pickled = serialize_value(value, "pickle", binary=True)
+        hexed = serialize_value(value, "pickle")
+
+        assert isinstance(pickled, bytes)
+        assert len(hexed) == 2 * len(pickled)
+        assert deserialize_value(pickled, "pickle") == value
+
+    def test_hex_pickle_is_read_from_binary_store(self) -> None:
+        """Pickles hex-encoded by a text-mode store still load as bytes."""
+        hexed = serialize_value([1, 2], "pickle")
+
+        assert deserialize_value(str(hexed).encode(), "pickle") == [1, 2]
+        assert deserialize_value(hexed, "pickle") == [1, 2]
+
 
 # Redis integration tests moved to tests/test_integration/test_redis.py
 
@@ -193,3 +277,16 @@ if __name__ == "__main__":
 
     # Run the demonstration
     asyncio.run(demo())
+
+
+class TestRedisConfig:
+    """Test Redis settings resolved from arguments and the environment."""
+
+    def test_explicit_text_mode_overrides_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """redis_binary=False is kept even when the environment enables it."""
+        monkeypatch.setenv("OC_KV_STORE_REDIS_BINARY", "true")
+
+        assert _get_redis_config(redis_binary=False)["binary"] is False
+        assert _get_redis_config()["binary"] is True
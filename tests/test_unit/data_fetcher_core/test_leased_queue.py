@@ -0,0 +1,267 @@
+"""Tests for the Redis-backed leased work queue and distributed fetching."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.exceptions import LeadershipLostError
+from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.queue import (
+    BundleRefSerializer,
+    JSONSerializer,
+    RedisLeasedQueue,
+)
+from tests.shims.redis_stand_in import RedisStandIn, RedisStandInServer
+
+
+def make_queue(
+    server: RedisStandInServer, lease_ttl_seconds: float = 60.0, **kwargs: Any
+) -> RedisLeasedQueue:
+    return RedisLeasedQueue(
+        client=RedisStandIn(server),
+        namespace="fetcher:test:run",
+        serializer=JSONSerializer(),
+        lease_ttl_seconds=lease_ttl_seconds,
+        **kwargs,
+    )
+
+
+class TestRedisLeasedQueue:
+    """Test leased delivery semantics."""
+
+    @pytest.mark.asyncio
+    async def test_claim_and_ack(self) -> None:
+        """Claimed items leave the pending list and ack removes them entirely."""
+        queue = make_queue(RedisStandInServer())
+        await queue.enqueue([{"n": 1}, {"n": 2}])
+
+        leases = await queue.claim(max_items=1)
+        assert [lease.item for lease in leases] == [{"n": 1}]
+        assert await queue.size() == 1
+        assert await queue.is_drained() is False
+
+        await queue.ack(leases[0])
+        await queue.ack((await queue.claim())[0])
+        assert await queue.is_drained() is True
+
+    @pytest.mark.asyncio
+    async def test_consumers_never_claim_the_same_item(self) -> None:
+        """Two replicas sharing Redis split the items between them."""
+        server = RedisStandInServer()
+        first, second = make_queue(server), make_queue(server)
+        await first.enqueue([{"n": i} for i in range(10)])
+
+        claimed = await asyncio.gather(
+            *(q.claim(max_items=1) for q in [first, second] * 5)
+        )
+
+        items = [lease.item["n"] for batch in claimed for lease in batch]
+        assert sorted(items) == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_redelivered(self) -> None:
+        """An item whose holder stops heartbeating is claimed again elsewhere."""
+        server = RedisStandInServer()
+        crashed = make_queue(server, lease_ttl_seconds=0.05)
+        survivor = make_queue(server, lease_ttl_seconds=0.05)
+        await crashed.enqueue([{"n": 1}])
+        assert await crashed.claim()
+        assert await survivor.claim() == []
+
+        await asyncio.sleep(0.1)
+        assert await survivor.reap_expired() == 1
+
+        leases = await survivor.claim()
+        assert [lease.item for lease in leases] == [{"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_lease_alive(self) -> None:
+        """Renewed leases are not reaped."""
+        server = RedisStandInServer()
+        holder = make_queue(server, lease_ttl_seconds=0.2)
+        await holder.enqueue([{"n": 1}])
+        await holder.claim()
+
+        for _ in range(3):
+            await asyncio.sleep(0.1)
+            assert await holder.heartbeat() == 1
+        assert await make_queue(server).reap_expired() == 0
+
+    @pytest.mark.asyncio
+    async def test_leadership_is_exclusive_until_released(self) -> None:
+        """Only one replica leads; another takes over once it is released."""
+        server = RedisStandInServer()
+        first, second = make_queue(server), make_queue(server)
+
+        assert await first.try_acquire_leadership() is True
+        assert await second.try_acquire_leadership() is False
+        await first.release_leadership()
+        assert await second.try_acquire_leadership() is True
+
+    @pytest.mark.asyncio
+    async def test_former_leader_cannot_publish(self) -> None:
+        """A leader whose lock was taken over stops publishing work."""
+        server = RedisStandInServer()
+        former, current = make_queue(server, 0.05), make_queue(server, 0.05)
+        assert await former.try_acquire_leadership() is True
+
+        await asyncio.sleep(0.1)
+        assert await current.try_acquire_leadership() is True
+
+        with pytest.raises(LeadershipLostError):
+            await former.publish([{"n": 1}])
+        with pytest.raises(LeadershipLostError):
+            await former.mark_locators_done()
+        assert former.is_leader is False
+        assert await current.publish([{"n": 2}]) == 1
+        assert [lease.item for lease in await current.claim()] == [{"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_completed_run_keys_expire(self) -> None:
+        """A later run in the same namespace does not see the previous run done."""
+        server = RedisStandInServer()
+        first_run = make_queue(server, lease_ttl_seconds=0.05)
+        assert await first_run.try_acquire_leadership() is True
+        await first_run.publish([{"n": 1}])
+        await first_run.ack((await first_run.claim())[0])
+        await first_run.mark_locators_done()
+        await first_run.close()
+        assert await first_run.locators_done() is True
+
+        await asyncio.sleep(0.1)
+        second_run = make_queue(server, lease_ttl_seconds=0.05)
+        assert await second_run.locators_done() is False
+        assert await second_run.try_acquire_leadership() is True
+
+    @pytest.mark.asyncio
+    async def test_unfinished_run_keys_are_kept(self) -> None:
+        """Work left by an interrupted run is picked up by the next one."""
+        server = RedisStandInServer()
+        interrupted = make_queue(server, lease_ttl_seconds=0.05)
+        await interrupted.enqueue([{"n": 1}])
+        await interrupted.close()
+
+        await asyncio.sleep(0.1)
+        resumed = make_queue(server, lease_ttl_seconds=0.05)
+        assert [lease.item for lease in await resumed.claim()] == [{"n": 1}]
+
+
+class ListLocator:
+    """Locator handing out a fixed number of bundles."""
+
+    def __init__(self, count: int) -> None:
+        self.remaining = [
+            BundleRef(bid=f"bid-{i}", request_meta={"url": f"https://x/{i}"})
+            for i in range(count)
+        ]
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch = self.remaining[:bundle_refs_needed]
+        self.remaining = self.remaining[bundle_refs_needed:]
+        return batch
+
+
+class RecordingLoader:
+    """Loader recording every URL it loads."""
+
+    def __init__(self, loaded: list[str]) -> None:
+        self.loaded = loaded
+
+    async def load(
+        self, bundle: BundleRef, _storage: object, _ctx: object, _config: object
+    ) -> BundleLoadResult:
+        await asyncio.sleep(0.01)
+        self.loaded.append(bundle.request_meta["url"])
+        return BundleLoadResult(bundle=bundle, bundle_meta={}, resources=[])
+
+
+class TestDistributedFetcher:
+    """Test replicas sharing a leased queue."""
+
+    @pytest.mark.asyncio
+    async def test_replicas_process_every_bundle_once(self) -> None:
+        """Only the leader runs locators and every bundle is loaded once."""
+        server = RedisStandInServer()
+        loaded: list[str] = []
+
+        def make_plan(locator: ListLocator, run_id: str) -> FetchPlan:
+            return FetchPlan(
+                config=DataRegistryFetcherConfig(
+                    loader=RecordingLoader(loaded),  # type: ignore[arg-type]
+                    locators=[locator],  # type: ignore[list-item]
+                ),
+                context=FetchRunContext(
+                    run_id=run_id,
+                    app_config=SimpleNamespace(storage=object()),  # type: ignore[arg-type]
+                ),
+                concurrency=2,
+                target_queue_size=4,
+            )
+
+        locators = [ListLocator(12), ListLocator(12)]
+        fetchers = [
+            Fetcher(
+                work_queue=RedisLeasedQueue(
+                    client=RedisStandIn(server),
+                    namespace="fetcher:test:run",
+                    serializer=BundleRefSerializer(),
+                    lease_ttl_seconds=1.0,
+                    heartbeat_interval_seconds=0.05,
+                )
+            )
+            for _ in locators
+        ]
+
+        results = await asyncio.gather(
+            *(
+                fetcher.run(make_plan(locator, f"run-{i}"))
+                for i, (fetcher, locator) in enumerate(
+                    zip(fetchers, locators, strict=True)
+                )
+            )
+        )
+
+        assert sorted(loaded) == sorted(f"https://x/{i}" for i in range(12))
+        assert sum(result.processed_count for result in results) == 12
+        # Exactly one replica consumed its locator
+        assert sorted(len(locator.remaining) for locator in locators) == [0, 12]
+
+    @pytest.mark.asyncio
+    async def test_successive_runs_share_the_namespace(self) -> None:
+        """A second run of the same registry processes its bundles again."""
+        server = RedisStandInServer()
+
+        async def run_once() -> int:
+            plan = FetchPlan(
+                config=DataRegistryFetcherConfig(
+                    loader=RecordingLoader([]),  # type: ignore[arg-type]
+                    locators=[ListLocator(3)],  # type: ignore[list-item]
+                ),
+                context=FetchRunContext(
+                    run_id="run",
+                    app_config=SimpleNamespace(storage=object()),  # type: ignore[arg-type]
+                ),
+            )
+            queue = RedisLeasedQueue(
+                client=RedisStandIn(server),
+                namespace="fetcher:test:test",
+                serializer=BundleRefSerializer(),
+                lease_ttl_seconds=0.05,
+            )
+            result = await Fetcher(work_queue=queue).run(plan)
+            return result.processed_count
+
+        assert await run_once() == 3
+        await asyncio.sleep(0.1)
+        assert await run_once() == 3
@@ -0,0 +1,67 @@
+"""Tests for the framework metrics and their Prometheus rendering."""
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from data_fetcher_core.metrics import (
+    BUNDLES_TOTAL,
+    get_metrics_registry,
+    render_metrics,
+)
+
+
+class TestMetrics:
+    """Test metric recording and Prometheus rendering."""
+
+    def test_counter_and_gauge_render_per_label(self) -> None:
+        """Each label combination is rendered as its own series."""
+        registry = CollectorRegistry()
+        bytes_total = Counter("bytes_total", "Bytes", ("protocol",), registry=registry)
+        depth = Gauge("queue_depth", "Depth", registry=registry)
+
+        bytes_total.labels(protocol="http").inc(10)
+        bytes_total.labels(protocol="http").inc(5)
+        bytes_total.labels(protocol="sftp").inc(2)
+        depth.set(7)
+        depth.dec(2)
+
+        text = render_metrics(registry)
+        assert 'bytes_total{protocol="http"} 15.0' in text
+        assert 'bytes_total{protocol="sftp"} 2.0' in text
+        assert "queue_depth 5.0" in text
+        assert "# TYPE queue_depth gauge" in text
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Bucket counts include every smaller observation."""
+        registry = CollectorRegistry()
+        latency = Histogram(
+            "latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry
+        )
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        text = render_metrics(registry)
+        assert 'latency_seconds_bucket{le="0.1"} 2.0' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3.0' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4.0' in text
+        assert "latency_seconds_count 4.0" in text
+
+    def test_framework_metrics_are_in_the_process_registry(self) -> None:
+        """Metrics recorded by the framework are served from the shared registry."""
+        registry = get_metrics_registry()
+        before = (
+            registry.get_sample_value(
+                "data_fetcher_bundles_total", {"outcome": "processed"}
+            )
+            or 0.0
+        )
+
+        BUNDLES_TOTAL.labels(outcome="processed").inc()
+
+        assert (
+            registry.get_sample_value(
+                "data_fetcher_bundles_total", {"outcome": "processed"}
+            )
+            == before + 1
+        )
+        assert "# TYPE data_fetcher_bundles_total counter" in render_metrics()
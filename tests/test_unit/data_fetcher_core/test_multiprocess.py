@@ -0,0 +1,171 @@
+"""Tests for the multi-process fetcher execution mode."""
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.multiprocess import MultiProcessFetcher
+from data_fetcher_core.tracing import configure_tracer
+
+
+class ListLocator:
+    """Locator handing out a fixed number of bundles and recording results."""
+
+    def __init__(self, count: int) -> None:
+        self.remaining = [
+            BundleRef(bid=f"bid-{i}", request_meta={"url": f"https://x/{i}"})
+            for i in range(count)
+        ]
+        self.processed: list[tuple[str, dict[str, Any]]] = []
+        self.errors: list[str] = []
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch = self.remaining[:bundle_refs_needed]
+        self.remaining = self.remaining[bundle_refs_needed:]
+        return batch
+
+    async def handle_bundle_processed(
+        self, bundle: BundleRef, result: BundleLoadResult, _ctx: FetchRunContext
+    ) -> None:
+        self.processed.append((bundle.request_meta["url"], dict(result.bundle_meta)))
+
+    async def handle_bundle_error(
+        self, bundle: BundleRef, _error: str, _ctx: FetchRunContext
+    ) -> None:
+        self.errors.append(bundle.request_meta["url"])
+
+
+class EchoLoader:
+    """Loader failing on URLs ending in 3 and echoing the process id otherwise."""
+
+    async def load(
+        self, bundle: BundleRef, _storage: object, _ctx: object, _config: object
+    ) -> BundleLoadResult:
+        if bundle.request_meta["url"].endswith("3"):
+            raise RuntimeError("boom")
+        return BundleLoadResult(
+            bundle=bundle, bundle_meta={"pid": os.getpid()}, resources=[]
+        )
+
+
+class MarkerStorage:
+    """Storage leaving a marker file per process when the run ends."""
+
+    def __init__(self, marker_dir: str) -> None:
+        self.marker_dir = Path(marker_dir)
+
+    async def on_run_end(self, _ctx: FetchRunContext) -> None:
+        (self.marker_dir / str(os.getpid())).touch()
+
+
+async def build_worker_plan(args: dict[str, Any]) -> FetchPlan:
+    """Build a worker plan in the child process."""
+    config = DataRegistryFetcherConfig(loader=EchoLoader(), locators=[])
+    marker_dir = args.get("marker_dir")
+    storage = MarkerStorage(marker_dir) if marker_dir else object()
+    context = FetchRunContext(
+        run_id=args["run_id"], app_config=SimpleNamespace(storage=storage)
+    )
+    return FetchPlan(config=config, context=context, concurrency=2)
+
+
+class TestMultiProcessFetcher:
+    """Test coordination between the locator process and worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_results_and_errors_are_aggregated(self) -> None:
+        """Every bundle is loaded once and reported back to the locator."""
+        locator = ListLocator(count=10)
+        plan = FetchPlan(
+            config=DataRegistryFetcherConfig(loader=EchoLoader(), locators=[locator]),
+            context=FetchRunContext(run_id="mp_test"),
+            target_queue_size=4,
+        )
+        fetcher = MultiProcessFetcher(
+            processes=2,
+            plan_builder=build_worker_plan,
+            builder_args={"run_id": "mp_test"},
+        )
+
+        result = await fetcher.run(plan)
+
+        assert result.processed_count == 9
+        assert len(result.errors) == 1
+        assert locator.errors == ["https://x/3"]
+        assert sorted(url for url, _ in locator.processed) == sorted(
+            f"https://x/{i}" for i in range(10) if i != 3
+        )
+        assert all(meta["pid"] != os.getpid() for _, meta in locator.processed)
+
+    @pytest.mark.asyncio
+    async def test_worker_storage_run_end_hook_is_called(self, tmp_path: Path) -> None:
+        """Each worker process flushes its own storage once its work is done."""
+        plan = FetchPlan(
+            config=DataRegistryFetcherConfig(
+                loader=EchoLoader(), locators=[ListLocator(count=4)]
+            ),
+            context=FetchRunContext(run_id="mp_test"),
+        )
+        fetcher = MultiProcessFetcher(
+            processes=2,
+            plan_builder=build_worker_plan,
+            builder_args={"run_id": "mp_test", "marker_dir": str(tmp_path)},
+        )
+
+        await fetcher.run(plan)
+
+        markers = list(tmp_path.iterdir())
+        assert len(markers) == 2
+        assert str(os.getpid()) not in {marker.name for marker in markers}
+
+    @pytest.mark.asyncio
+    async def test_worker_spans_are_exported(self, tmp_path: Path) -> None:
+        """Bundle spans recorded in worker processes reach the export file."""
+        path = tmp_path / "trace.jsonl"
+        configure_tracer(export_path=path)
+        plan = FetchPlan(
+            config=DataRegistryFetcherConfig(
+                loader=EchoLoader(), locators=[ListLocator(count=4)]
+            ),
+            context=FetchRunContext(run_id="mp_test"),
+        )
+        fetcher = MultiProcessFetcher(
+            processes=2,
+            plan_builder=build_worker_plan,
+            builder_args={"run_id": "mp_test"},
+        )
+
+        try:
+            await fetcher.run(plan)
+        finally:
+            configure_tracer()
+
+        bundle_spans = [
+            span
+            for line in path.read_text().splitlines()
+            for resource_spans in json.loads(line)["resourceSpans"]
+            for scope_spans in resource_spans["scopeSpans"]
+            for span in scope_spans["spans"]
+            if span["name"] == "bundle"
+        ]
+        assert len(bundle_spans) == 4
+
+    def test_rejects_invalid_process_count(self) -> None:
+        """At least one worker process is required."""
+        with pytest.raises(ValueError, match="processes"):
+            MultiProcessFetcher(
+                processes=0, plan_builder=build_worker_plan, builder_args={}
+            )
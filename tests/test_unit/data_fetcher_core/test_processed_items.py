@@ -0,0 +1,133 @@
+"""Tests for the incrementally persisted processed item set."""
+
+import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+import pytest
+
+from data_fetcher_core.kv_store import InMemoryKeyValueStore, ProcessedItemSet
+
+
+class TestProcessedItemSet:
+    """Test batched, append-only persistence of processed items."""
+
+    @pytest.fixture
+    async def store(self) -> AsyncIterator[InMemoryKeyValueStore]:
+        """Create a fresh in-memory store for each test."""
+        store = InMemoryKeyValueStore(serializer="json", default_ttl=3600)
+        yield store
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_only_full_batches(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """Items are buffered until a batch is full unless forced."""
+        items = ProcessedItemSet("prefix:processed_urls:base", batch_size=2)
+        await items.load(store)
+
+        items.add("a")
+        assert await items.flush(store) is False
+        assert items.pending_count == 1
+
+        items.add("b")
+        assert await items.flush(store) is True
+        assert items.pending_count == 0
+
+        items.add("c")
+        assert await items.flush(store, force=True) is True
+        assert await store.get("prefix:processed_urls:base:chunk:0000000000") == [
+            "a",
+            "b",
+        ]
+        assert await store.get("prefix:processed_urls:base:chunk:0000000001") == ["c"]
+
+    def test_duplicates_are_not_persisted_twice(self) -> None:
+        """Adding a known item does not buffer it again."""
+        items = ProcessedItemSet("key", batch_size=10)
+
+        assert items.add("a") is True
+        assert items.add("a") is False
+        assert items.pending_count == 1
+        assert "a" in items
+        assert len(items) == 1
+
+    @pytest.mark.asyncio
+    async def test_load_replays_chunks_and_legacy_list(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """A new instance sees legacy and chunked items and appends after them."""
+        await store.put("key", ["legacy"])
+        await store.put("key-other", ["unrelated"])
+        first = ProcessedItemSet("key", batch_size=1)
+        first.add("a")
+        await first.flush(store)
+
+        second = ProcessedItemSet("key", batch_size=1)
+        await second.load(store)
+        second.add("b")
+        await second.flush(store)
+
+        assert second.loaded is True
+        assert all(item in second for item in ("legacy", "a", "b"))
+        assert "unrelated" not in second
+        assert await store.get("key:chunk:0000000001") == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_items_buffered(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """Items stay pending when the store write fails."""
+        items = ProcessedItemSet("key", batch_size=1)
+        items.add("a")
+
+        async def failing_put(*_args: object, **_kwargs: object) -> None:
+            raise ConnectionError("store unavailable")
+
+        store.put = failing_put  # type: ignore[method-assign]
+
+        with pytest.raises(ConnectionError):
+            await items.flush(store)
+        assert items.pending_count == 1
+
+    @pytest.mark.asyncio
+    async def test_early_chunks_outlive_ttl_while_set_grows(
+        self, store: InMemoryKeyValueStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The TTL of earlier chunks is refreshed as the set keeps growing."""
+        clock = {"now": 1000.0}
+        monkeypatch.setattr(time, "time", lambda: clock["now"])
+        monkeypatch.setattr(time, "monotonic", lambda: clock["now"])
+        items = ProcessedItemSet("key", batch_size=1, ttl=timedelta(seconds=100))
+        await items.load(store)
+
+        for step, item in enumerate(["a", "b", "c", "d"]):
+            clock["now"] = 1000.0 + step * 60
+            items.add(item)
+            await items.flush(store)
+
+        assert await store.get("key:chunk:0000000000") == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_ttl_refresh_is_one_batched_call(
+        self, store: InMemoryKeyValueStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Refreshing the TTL expires every chunk in a single store call."""
+        writer = ProcessedItemSet("key", batch_size=1)
+        for item in ["a", "b", "c"]:
+            writer.add(item)
+            await writer.flush(store)
+        calls: list[list[str]] = []
+        expire_many = store.expire_many
+
+        async def _record(keys: list[str], ttl: timedelta) -> int:
+            calls.append(keys)
+            return await expire_many(keys, ttl)
+
+        monkeypatch.setattr(store, "expire_many", _record)
+        items = ProcessedItemSet("key", batch_size=1, ttl=timedelta(seconds=100))
+
+        await items.load(store)
+
+        assert calls == [[f"key:chunk:{n:010d}" for n in range(3)]]
@@ -5,7 +5,8 @@ including KVStoreQueue, serializers, and queue operations.
 """
 
 import asyncio
-from typing import Any
+import json
+from typing import Any, cast
 
 import pytest
 from yarl import URL
@@ -290,6 +291,32 @@ class TestKVStoreQueue:
         await queue.enqueue([request])
         assert await queue.size() == 1
 
+    @pytest.mark.asyncio
+    async def test_items_are_encoded_once(
+        self, kv_store: KeyValueStore, queue: KVStoreQueue
+    ) -> None:
+        """Items are stored as the serializer's output, not JSON-encoded again."""
+        request = {"url": "https://example.com"}
+        await queue.enqueue([request])
+
+        stored = await kv_store.get_raw("test_queue:items:0")
+
+        assert json.loads(cast("str", stored))["url"] == "https://example.com"
+        assert (await queue.dequeue())[0]["url"] == "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_reads_items_encoded_twice(
+        self, kv_store: KeyValueStore, queue: KVStoreQueue
+    ) -> None:
+        """Items written before they were stored raw can still be dequeued."""
+        await queue.enqueue([{"url": "https://placeholder.com"}])
+        await kv_store.put(
+            "test_queue:items:0",
+            RequestMetaSerializer().dumps({"url": "https://old.com"}),
+        )
+
+        assert (await queue.dequeue())[0]["url"] == "https://old.com"
+
     def test_invalid_namespace(self, kv_store: Any) -> None:
         """Test queue creation with invalid namespace."""
         with pytest.raises(
@@ -1,18 +1,30 @@
-"""Tests for the unified retry engine."""
+"""Tests for the unified retry engine, retry budgets and circuit breakers."""
 
+import asyncio
+
+import httpx
 import pytest
 
+from data_fetcher_core.exceptions import CircuitOpenError, ConfigurationError
+
 # Project has unified retry in data_fetcher_core.retry module; import accordingly
 from data_fetcher_core.retry import (
+    CircuitBreaker,
+    CircuitState,
+    RetryBudget,
     RetryConfig,
     RetryEngine,
     async_retry_with_backoff,
+    background_task_context,
     create_aggressive_retry_engine,
     create_connection_retry_engine,
     create_operation_retry_engine,
     create_retry_engine,
+    is_retryable_error,
     sync_retry_with_backoff,
 )
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http.http_pool import HttpConnectionPool
 
 
 class TestRetryConfig:
@@ -272,3 +284,265 @@ class TestRetryDecorators:
         result = retry_func()
         assert result == "success"
         assert call_count == 3
+
+
+class FlakyService:
+    """Async callable failing while ``down`` is set."""
+
+    def __init__(self) -> None:
+        self.down = True
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("connection refused")
+        return "ok"
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold_and_fails_fast(self) -> None:
+        """Consecutive failures open the circuit and later calls are rejected."""
+        breaker = CircuitBreaker("sftp:us-fl", failure_threshold=2)
+        service = FlakyService()
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await breaker.call(service)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await breaker.call(service)
+        assert service.calls == 2
+        assert exc_info.value.circuit == "sftp:us-fl"
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_after_recovery(self) -> None:
+        """After the timeout one probe is let through and success closes."""
+        breaker = CircuitBreaker("h", failure_threshold=1, recovery_timeout=0.01)
+        service = FlakyService()
+        with pytest.raises(ConnectionError):
+            await breaker.call(service)
+        await asyncio.sleep(0.02)
+        service.down = False
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert await breaker.call(service) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens(self) -> None:
+        """A failing probe re-opens the circuit for another timeout."""
+        breaker = CircuitBreaker("h", failure_threshold=3, recovery_timeout=0.01)
+        service = FlakyService()
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await breaker.call(service)
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(service)
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_non_failures_do_not_trip(self) -> None:
+        """Errors rejected by the predicate keep the circuit closed."""
+        breaker = CircuitBreaker(
+            "h",
+            failure_threshold=1,
+            is_failure=lambda exc: not isinstance(exc, FileNotFoundError),
+        )
+
+        async def _missing() -> None:
+            raise FileNotFoundError("/in/a.csv")
+
+        with pytest.raises(FileNotFoundError):
+            await breaker.call(_missing)
+
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestRetryEngineCircuitBreaker:
+    """Test that the retry engine stops retrying once a circuit opens."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_stops_retries(self) -> None:
+        """Retries stop as soon as the circuit opens."""
+        breaker = CircuitBreaker("h", failure_threshold=2, recovery_timeout=60)
+        engine = create_retry_engine(
+            max_retries=5, base_delay=0.001, circuit_breaker=breaker
+        )
+        service = FlakyService()
+
+        with pytest.raises(CircuitOpenError):
+            await engine.execute_with_retry_async(service)
+
+        assert service.calls == 2
+
+
+class TestHttpPoolCircuitBreaker:
+    """Test per-host circuit breakers in the HTTP pool."""
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_the_host_circuit(self) -> None:
+        """Repeated 5xx responses open only the failing host's circuit."""
+        requests: list[str] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.host)
+            return httpx.Response(503 if request.url.host == "down.example" else 200)
+
+        pool = HttpConnectionPool(
+            config=HttpProtocolConfig(
+                max_retries=0,
+                rate_limit_requests_per_second=1000.0,
+                circuit_failure_threshold=2,
+            )
+        )
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+        for _ in range(2):
+            await pool.request_with_existing(client, "GET", "https://down.example/")
+        with pytest.raises(CircuitOpenError):
+            await pool.request_with_existing(client, "GET", "https://down.example/")
+        response = await pool.request_with_existing(
+            client, "GET", "https://up.example/"
+        )
+
+        assert response.status_code == 200
+        assert requests == ["down.example", "down.example", "up.example"]
+        await client.aclose()
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.example/")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+class TestRetryClassification:
+    """Test which errors are retried."""
+
+    @pytest.mark.parametrize(
+        ("error", "retryable"),
+        [
+            (ConnectionError("reset"), True),
+            (TimeoutError(), True),
+            (ConfigurationError("bad", "loader"), False),
+            (_status_error(503), True),
+            (_status_error(429), True),
+            (_status_error(404), False),
+            (_status_error(401), False),
+        ],
+    )
+    def test_default_classification(self, error: Exception, *, retryable: bool) -> None:
+        """Network errors, throttling and 5xx are retried; 4xx are not."""
+        assert is_retryable_error(error) is retryable
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(self) -> None:
+        """A non-retryable error fails after one attempt."""
+        engine = create_retry_engine(max_retries=3, base_delay=0.001)
+        calls = 0
+
+        async def _fail() -> None:
+            nonlocal calls
+            calls += 1
+            raise _status_error(404)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await engine.execute_with_retry_async(_fail)
+
+        assert calls == 1
+
+
+class TestRetryBudget:
+    """Test that retries are capped to a fraction of requests."""
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_retries(self) -> None:
+        """Once the budget is spent failures are no longer retried."""
+        budget = RetryBudget(ratio=0.1, min_tokens=2)
+        engine = create_retry_engine(
+            max_retries=3, base_delay=0.001, retry_budget=budget
+        )
+        service = FlakyService()
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await engine.execute_with_retry_async(service)
+
+        # 3 first attempts plus the 2 starting tokens (and 0.3 earned)
+        assert service.calls == 5
+        assert budget.tokens < 1
+
+    def test_requests_refill_budget(self) -> None:
+        """Requests earn tokens up to the maximum."""
+        budget = RetryBudget(ratio=0.5, min_tokens=0, max_tokens=1)
+
+        assert not budget.try_spend()
+        for _ in range(4):
+            budget.record_request()
+
+        assert budget.tokens == 1
+        assert budget.try_spend()
+
+
+class TestNestedRetries:
+    """Test that nested retry loops are flattened."""
+
+    @pytest.mark.asyncio
+    async def test_inner_retry_makes_single_attempt(self) -> None:
+        """Only the outer loop retries, so attempts are not multiplied."""
+        outer = create_retry_engine(max_retries=2, base_delay=0.001)
+        inner = create_retry_engine(max_retries=2, base_delay=0.001)
+        service = FlakyService()
+
+        async def _operation() -> object:
+            return await inner.execute_with_retry_async(service)
+
+        with pytest.raises(ConnectionError):
+            await outer.execute_with_retry_async(_operation)
+
+        assert service.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_retries_are_independent(self) -> None:
+        """A retry loop after another one has finished retries normally."""
+        engine = create_retry_engine(max_retries=2, base_delay=0.001)
+        first = FlakyService()
+        second = FlakyService()
+
+        for service in (first, second):
+            with pytest.raises(ConnectionError):
+                await engine.execute_with_retry_async(service)
+
+        assert (first.calls, second.calls) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_background_task_retries_on_its_own(self) -> None:
+        """A task started inside a retry loop with a background context retries."""
+        outer = create_retry_engine(max_retries=0)
+        inner = create_retry_engine(max_retries=2, base_delay=0.001)
+        service = FlakyService()
+        tasks: list[asyncio.Task[object]] = []
+
+        async def _start() -> None:
+            tasks.append(
+                asyncio.create_task(
+                    inner.execute_with_retry_async(service),
+                    context=background_task_context(),
+                )
+            )
+
+        await outer.execute_with_retry_async(_start)
+
+        with pytest.raises(ConnectionError):
+            await tasks[0]
+        assert service.calls == 3
@@ -0,0 +1,189 @@
+"""Tests for speculative duplicates of straggler bundles."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.speculation import StragglerMonitor
+from data_fetcher_core.storage.bundle_storage_context import attempt_number
+from data_fetcher_core.storage.file_storage import FileStorage
+from data_fetcher_core.storage.pipeline_bus_storage import DataPipelineBusStorage
+
+
+class RacingLoader:
+    """Loader writing which attempt stored a bundle, after a per-attempt delay."""
+
+    def __init__(self, delays: dict[int, float]) -> None:
+        self.delays = delays
+        self.attempts: list[tuple[str, int]] = []
+
+    async def load(
+        self,
+        bundle: BundleRef,
+        storage: FileStorage,
+        _ctx: object,
+        config: DataRegistryFetcherConfig,
+    ) -> BundleLoadResult:
+        number = attempt_number()
+        self.attempts.append((str(bundle.bid), number))
+        delay = self.delays.get(number, 0.0) if str(bundle.bid) == "slow" else 0.01
+
+        async def _stream() -> AsyncGenerator[bytes]:
+            await asyncio.sleep(delay)
+            yield f"attempt {number}".encode()
+
+        context = await storage.start_bundle(bundle, config)
+        await context.add_resource("data.txt", {"url": "data.txt"}, _stream())
+        await context.complete({})
+        return BundleLoadResult(bundle=bundle, bundle_meta={}, resources=[])
+
+
+class ListLocator:
+    """Locator handing out the given bundle ids."""
+
+    def __init__(self, bids: list[str]) -> None:
+        self.remaining = [BundleRef(bid=bid, request_meta={}) for bid in bids]
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch = self.remaining[:bundle_refs_needed]
+        self.remaining = self.remaining[bundle_refs_needed:]
+        return batch
+
+
+def _config(loader: RacingLoader, bids: list[str]) -> DataRegistryFetcherConfig:
+    return DataRegistryFetcherConfig(
+        loader=loader,  # type: ignore[arg-type]
+        locators=[ListLocator(bids)],  # type: ignore[list-item]
+        speculative_stragglers=True,
+        straggler_min_seconds=0.0,
+    )
+
+
+def _stored(output_dir: Path, bid: str) -> str:
+    return (output_dir / f"bundle_{bid}" / "data.txt").read_text()
+
+
+async def _race(loader: RacingLoader, storage: Any) -> None:
+    """Load the "slow" bundle and start a duplicate attempt shortly after."""
+    config = _config(loader, [])
+    bundle = BundleRef(bid="slow", request_meta={})
+    monitor = StragglerMonitor(min_seconds=0.0)
+    monitor._durations.append(0.001)
+
+    async def _load() -> BundleLoadResult:
+        return await loader.load(bundle, storage, None, config)
+
+    load = asyncio.create_task(monitor.load(bundle, _load))
+    await asyncio.sleep(0.01)
+    assert await monitor.speculate()
+    await load
+
+
+class TestFetcherSpeculation:
+    """Test duplicating stragglers at the end of a run."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_of_straggler_wins(self, tmp_path: Path) -> None:
+        """An idle worker duplicates the hanging bundle and its copy is kept."""
+        loader = RacingLoader({0: 10.0, 1: 0.01})
+        storage = FileStorage(str(tmp_path))
+        plan = FetchPlan(
+            config=_config(loader, ["a", "b", "c", "slow"]),
+            context=FetchRunContext(
+                run_id="run",
+                app_config=SimpleNamespace(storage=storage),  # type: ignore[arg-type]
+            ),
+            concurrency=2,
+        )
+
+        result = await asyncio.wait_for(Fetcher().run(plan), timeout=5)
+
+        assert result.processed_count == 4
+        assert ("slow", 1) in loader.attempts
+        assert _stored(tmp_path, "slow") == "attempt 1"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "bundle_a",
+            "bundle_b",
+            "bundle_c",
+            "bundle_slow",
+        ]
+
+
+class TestStragglerMonitor:
+    """Test racing attempts of one bundle."""
+
+    @pytest.mark.asyncio
+    async def test_original_attempt_wins_and_duplicate_is_dropped(
+        self, tmp_path: Path
+    ) -> None:
+        """When the original finishes first the duplicate's copy is removed."""
+        loader = RacingLoader({0: 0.05, 1: 10.0})
+        storage = FileStorage(str(tmp_path))
+        config = _config(loader, [])
+        bundle = BundleRef(bid="slow", request_meta={})
+        monitor = StragglerMonitor(min_seconds=0.0)
+        monitor._durations.append(0.001)
+
+        async def _load() -> BundleLoadResult:
+            return await loader.load(bundle, storage, None, config)
+
+        load = asyncio.create_task(monitor.load(bundle, _load))
+        await asyncio.sleep(0.01)
+        speculated = await monitor.speculate()
+        await load
+
+        assert speculated
+        assert loader.attempts == [("slow", 0), ("slow", 1)]
+        assert _stored(tmp_path, "slow") == "attempt 0"
+        assert [p.name for p in tmp_path.iterdir()] == ["bundle_slow"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("delays", [{0: 0.05, 1: 10.0}, {0: 10.0, 1: 0.05}])
+    async def test_losing_attempt_is_aborted_in_storage(
+        self, tmp_path: Path, delays: dict[int, float]
+    ) -> None:
+        """The cancelled attempt's bundle does not stay active in storage."""
+        storage = FileStorage(str(tmp_path))
+
+        await _race(RacingLoader(delays), storage)
+
+        assert storage._active_bundles == {}
+        assert [p.name for p in tmp_path.iterdir()] == ["bundle_slow"]
+
+    @pytest.mark.asyncio
+    async def test_losing_pipeline_bundle_is_aborted(self) -> None:
+        """Each attempt mints a pipeline bundle; the loser's is aborted."""
+        bus = MagicMock()
+        bus.bundle_found.side_effect = ["pipeline-0", "pipeline-1"]
+
+        async def _upload(*, async_stream: AsyncGenerator[bytes], **_: Any) -> None:
+            async for _chunk in async_stream:
+                pass
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=_upload)
+        storage = DataPipelineBusStorage(pipeline_bus=bus)
+
+        await _race(RacingLoader({0: 0.05, 1: 10.0}), storage)
+
+        bus.complete_bundle.assert_called_once_with("pipeline-0", {})
+        bus.abort_bundle.assert_called_once_with("pipeline-1")
+        assert storage._active_bundles == {}
+
+    def test_no_straggler_without_history(self) -> None:
+        """Nothing is duplicated before any bundle has completed."""
+        assert StragglerMonitor(min_seconds=0.0).pick_straggler() is None
@@ -165,3 +165,110 @@ async def test_range_operations(setup_kvstore: StateManagementManager) -> None:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_aggregates_counters_until_flush(
+    setup_kvstore: StateManagementManager,
+) -> None:
+    """Counter increments are buffered and flushed as one atomic delta."""
+    store = setup_kvstore.store
+    tracker = StateTracker(store, "aggregated", flush_interval=3600)
+
+    results = await asyncio.gather(
+        *(tracker.increment_counter("requests") for _ in range(50))
+    )
+
+    assert max(results) == 50
+    assert await store.get_counter("aggregated:count:requests") == 0
+    assert await tracker.get_counter("requests") == 50
+
+    await tracker.flush()
+    other = create_state_tracker(store, "aggregated")
+    assert await other.get_counter("requests") == 50
+    assert await other.increment_counter("requests", 5) == 5
+    await other.close()
+    assert await tracker.get_counter("requests") == 55
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_processing_stats_merge_flushes(
+    setup_kvstore: StateManagementManager,
+) -> None:
+    """Timing statistics from several trackers are merged in the store."""
+    store = setup_kvstore.store
+    first = StateTracker(store, "timing", flush_interval=3600)
+    second = StateTracker(store, "timing", flush_interval=3600)
+
+    for duration in (0.2, 0.4):
+        await first.record_processing_time("load", duration)
+    await second.record_processing_time("load", 3.0)
+    await second.flush()
+
+    stats = await first.get_processing_stats("load")
+
+    assert stats["count"] == 3
+    assert stats["avg_time"] == pytest.approx(3.6 / 3)
+    assert stats["min_time"] == pytest.approx(0.2)
+    assert stats["max_time"] == pytest.approx(3.0)
+    assert stats["buckets"]["0.25"] == 1
+    assert stats["buckets"]["0.5"] == 2
+    assert stats["buckets"]["+Inf"] == 3
+    assert await first.get_processing_stats("unknown") == {}
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_ignores_values_of_earlier_versions(
+    setup_kvstore: StateManagementManager,
+) -> None:
+    """Counters and timings stored as serialized values do not break tracking."""
+    store = setup_kvstore.store
+    await store.put("legacy:counter:requests", {"unexpected": "value"})
+    await store.put("legacy:timing:load", {"count": 1, "total_time": 9.0})
+    tracker = StateTracker(store, "legacy", flush_interval=3600)
+
+    await tracker.increment_counter("requests")
+    await tracker.record_processing_time("load", 0.5)
+    await tracker.close()
+
+    assert await tracker.get_counter("requests") == 1
+    assert (await tracker.get_processing_stats("load"))["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_extremes_are_merged_atomically(
+    setup_kvstore: StateManagementManager,
+) -> None:
+    """Flushes racing each other keep the overall minimum and maximum."""
+    store = setup_kvstore.store
+    trackers = [StateTracker(store, "racing", flush_interval=3600) for _ in range(5)]
+    for index, tracker in enumerate(trackers):
+        await tracker.record_processing_time("load", 0.1 * (index + 1))
+
+    await asyncio.gather(*(tracker.flush() for tracker in trackers))
+    stats = await trackers[0].get_processing_stats("load")
+
+    assert stats["min_time"] == pytest.approx(0.1)
+    assert stats["max_time"] == pytest.approx(0.5)
+    await asyncio.gather(*(tracker.close() for tracker in trackers))
+
+
+@pytest.mark.asyncio
+async def test_state_tracker_flushes_in_background(
+    setup_kvstore: StateManagementManager,
+) -> None:
+    """Buffered samples are written once the interval passes, without new samples."""
+    store = setup_kvstore.store
+    tracker = StateTracker(store, "background", flush_interval=0.05)
+    await tracker.increment_counter("requests", 3)
+    assert await store.get_counter("background:count:requests") == 0
+
+    await asyncio.sleep(0.2)
+    assert await store.get_counter("background:count:requests") == 3
+
+    await tracker.increment_counter("requests")
+    await tracker.close()
+    assert await store.get_counter("background:count:requests") == 4
@@ -0,0 +1,126 @@
+"""Tests for per-bundle tracing spans."""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+
+from data_fetcher_core.tracing import Tracer, configure_tracer
+
+
+class TestTracer:
+    """Test span nesting, stage timing, summaries and OTLP export."""
+
+    def test_nested_spans_share_trace_and_parent(self) -> None:
+        """Spans opened inside a span become its children."""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(span_processors=[SimpleSpanProcessor(exporter)])
+
+        with tracer.span("bundle", bid="b1"), tracer.span("load"):
+            tracer.record("queue_wait", 0, 10)
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        root, load = spans["bundle"], spans["load"]
+        assert root.parent is None
+        assert load.context.trace_id == root.context.trace_id
+        assert load.parent.span_id == root.context.span_id
+        assert spans["queue_wait"].parent.span_id == load.context.span_id
+        assert tracer.current_span() is None
+        assert tracer.summary()["queue_wait"]["count"] == 1
+
+    def test_separate_root_spans_start_new_traces(self) -> None:
+        """Each bundle gets its own trace."""
+        tracer = Tracer()
+
+        with tracer.span("bundle") as first:
+            pass
+        with tracer.span("bundle") as second:
+            pass
+
+        assert first.get_span_context().trace_id != second.get_span_context().trace_id
+
+    def test_stage_reports_busy_time_only(self) -> None:
+        """Time between timed blocks is not attributed to the stage."""
+        tracer = Tracer()
+
+        with tracer.span("bundle"):
+            stage = tracer.stage("transfer")
+            with stage:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            with stage:
+                time.sleep(0.01)
+            stage.finish()
+
+        stats = tracer.summary()["transfer"]
+        assert stats["count"] == 1
+        assert 0.02 <= stats["total_seconds"] < 0.05
+
+    def test_span_records_error_and_reraises(self) -> None:
+        """Failing blocks are still recorded, with an error status."""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(span_processors=[SimpleSpanProcessor(exporter)])
+
+        with pytest.raises(ValueError, match="boom"), tracer.span("upload"):
+            raise ValueError("boom")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code is StatusCode.ERROR
+        assert span.events[0].name == "exception"
+
+    def test_summary_shares_are_relative_to_bundle_time(self) -> None:
+        """Stages are ranked by total time with their share of bundle time."""
+        tracer = Tracer()
+        tracer.record("bundle", 0, 4_000_000_000)
+        tracer.record("upload", 0, 3_000_000_000)
+        tracer.record("remote_stat", 0, 1_000_000_000)
+
+        summary = tracer.summary()
+
+        assert list(summary) == ["bundle", "upload", "remote_stat"]
+        assert summary["upload"]["share"] == pytest.approx(0.75)
+
+    def test_export_path_receives_otlp_json_lines(self, tmp_path: Path) -> None:
+        """Exported spans follow the OTLP/JSON layout, one request per line."""
+        path = tmp_path / "trace.jsonl"
+        tracer = Tracer(service_name="fetcher-test", export_path=path)
+        with tracer.span("bundle", bid="b1"), tracer.span("load"):
+            pass
+        tracer.shutdown()
+
+        (line,) = path.read_text().splitlines()
+        resource_spans = json.loads(line)["resourceSpans"][0]
+        assert {
+            "key": "service.name",
+            "value": {"stringValue": "fetcher-test"},
+        } in resource_spans["resource"]["attributes"]
+        load, bundle = resource_spans["scopeSpans"][0]["spans"]
+        assert len(bundle["traceId"]) == 32
+        assert len(bundle["spanId"]) == 16
+        assert "parentSpanId" not in bundle
+        assert load["parentSpanId"] == bundle["spanId"]
+        assert int(load["endTimeUnixNano"]) >= int(load["startTimeUnixNano"])
+
+    def test_worker_tracers_append_to_the_export_file(self, tmp_path: Path) -> None:
+        """Tracers configured from the settings share the coordinator's file."""
+        path = tmp_path / "trace.jsonl"
+        path.write_text("stale\n")
+        coordinator = configure_tracer(export_path=path)
+        with coordinator.span("bundle"):
+            pass
+        coordinator.force_flush()
+
+        worker = configure_tracer(**coordinator.settings, append=True)
+        with worker.span("bundle"):
+            pass
+        configure_tracer()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert all("resourceSpans" in json.loads(line) for line in lines)
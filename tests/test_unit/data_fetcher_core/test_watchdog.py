@@ -0,0 +1,144 @@
+"""Tests for per-bundle deadlines, stall detection and re-queueing."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.exceptions import BundleTimeoutError, FatalError
+from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.watchdog import record_progress, run_with_watchdog
+
+
+class Trickle:
+    """Operation reporting ``chunk`` bytes every 10 ms."""
+
+    def __init__(self, chunk: int, chunks: int) -> None:
+        self.chunk = chunk
+        self.chunks = chunks
+        self.cancelled = False
+
+    async def __call__(self) -> str:
+        try:
+            for _ in range(self.chunks):
+                await asyncio.sleep(0.01)
+                record_progress(self.chunk)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "done"
+
+
+class TestRunWithWatchdog:
+    """Test cancelling slow and stalled operations."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_operation(self) -> None:
+        """An operation running past its deadline is cancelled."""
+        operation = Trickle(chunk=1000, chunks=100)
+
+        with pytest.raises(BundleTimeoutError) as exc_info:
+            await run_with_watchdog(operation, bid="b1", deadline_seconds=0.05)
+
+        assert exc_info.value.reason == "deadline"
+        assert operation.cancelled
+
+    @pytest.mark.asyncio
+    async def test_slow_transfer_is_stalled(self) -> None:
+        """Throughput below the minimum over a window cancels the operation."""
+        operation = Trickle(chunk=1, chunks=100)
+
+        with pytest.raises(BundleTimeoutError) as exc_info:
+            await run_with_watchdog(
+                operation, bid="b1", min_bytes_per_second=1000, window_seconds=0.05
+            )
+
+        assert exc_info.value.reason == "stalled"
+        assert operation.cancelled
+
+    @pytest.mark.asyncio
+    async def test_steady_transfer_completes(self) -> None:
+        """Transfers above the minimum throughput run to completion."""
+        operation = Trickle(chunk=1000, chunks=10)
+
+        result = await run_with_watchdog(
+            operation, bid="b1", min_bytes_per_second=1000, window_seconds=0.03
+        )
+
+        assert result == "done"
+
+
+class HangOnceLoader:
+    """Loader whose first load of each bundle never finishes."""
+
+    def __init__(self) -> None:
+        self.attempts: dict[str, int] = {}
+
+    async def load(
+        self, bundle: BundleRef, _storage: object, _ctx: object, _config: object
+    ) -> BundleLoadResult:
+        bid = str(bundle.bid)
+        self.attempts[bid] = self.attempts.get(bid, 0) + 1
+        if self.attempts[bid] == 1:
+            await asyncio.sleep(10)
+        return BundleLoadResult(bundle=bundle, bundle_meta={}, resources=[])
+
+
+class OneBundleLocator:
+    """Locator handing out a single bundle."""
+
+    def __init__(self) -> None:
+        self.remaining = [BundleRef(bid="bid-1", request_meta={"url": "sftp:///a"})]
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, _bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch, self.remaining = self.remaining, []
+        return batch
+
+
+def _plan(loader: HangOnceLoader, max_bundle_requeues: int) -> FetchPlan:
+    return FetchPlan(
+        config=DataRegistryFetcherConfig(
+            loader=loader,  # type: ignore[arg-type]
+            locators=[OneBundleLocator()],  # type: ignore[list-item]
+            bundle_deadline_seconds=0.05,
+            max_bundle_requeues=max_bundle_requeues,
+        ),
+        context=FetchRunContext(
+            run_id="run",
+            app_config=SimpleNamespace(storage=object()),  # type: ignore[arg-type]
+        ),
+    )
+
+
+class TestFetcherRequeue:
+    """Test that timed-out bundles are re-queued."""
+
+    @pytest.mark.asyncio
+    async def test_timed_out_bundle_is_requeued(self) -> None:
+        """A bundle that hangs once is loaded again and succeeds."""
+        loader = HangOnceLoader()
+
+        result = await asyncio.wait_for(Fetcher().run(_plan(loader, 2)), timeout=5)
+
+        assert loader.attempts == {"bid-1": 2}
+        assert result.processed_count == 1
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_bundle_fails_without_requeues_left(self) -> None:
+        """Without requeues left the timeout fails the bundle."""
+        loader = HangOnceLoader()
+
+        with pytest.raises(FatalError, match="1 error"):
+            await asyncio.wait_for(Fetcher().run(_plan(loader, 0)), timeout=5)
+
+        assert loader.attempts == {"bid-1": 1}
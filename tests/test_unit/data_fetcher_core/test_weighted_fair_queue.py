@@ -0,0 +1,178 @@
+"""Tests for the weighted-fair queue and fair locator scheduling."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from data_fetcher_core.core import (
+    BundleLoadResult,
+    BundleRef,
+    DataRegistryFetcherConfig,
+    FetchPlan,
+    FetchRunContext,
+)
+from data_fetcher_core.exceptions import ConfigurationError
+from data_fetcher_core.fetcher import Fetcher
+from data_fetcher_core.queue import BundleRefSerializer, WeightedFairQueue
+
+
+@pytest.fixture
+def queue() -> WeightedFairQueue:
+    """Create an empty weighted-fair queue."""
+    return WeightedFairQueue(serializer=BundleRefSerializer())
+
+
+class TestWeightedFairQueue:
+    """Test WeightedFairQueue scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_equal_weights_interleave_flows(
+        self, queue: WeightedFairQueue
+    ) -> None:
+        """Flows of equal weight alternate, each keeping FIFO order."""
+        await queue.enqueue(["a1", "a2", "a3"], flow="a")
+        await queue.enqueue(["b1", "b2"], flow="b")
+
+        assert await queue.size() == 5
+        assert await queue.dequeue(max_items=5) == ["a1", "b1", "a2", "b2", "a3"]
+        assert await queue.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_weights_share_the_queue(self, queue: WeightedFairQueue) -> None:
+        """A flow of weight 3 gets three items for each item of weight 1."""
+        queue.set_flow("bulk", weight=1.0)
+        queue.set_flow("fast", weight=3.0)
+        await queue.enqueue([f"bulk{i}" for i in range(10)], flow="bulk")
+        await queue.enqueue([f"fast{i}" for i in range(10)], flow="fast")
+
+        served = await queue.dequeue(max_items=8)
+
+        assert sum(item.startswith("fast") for item in served) == 6
+        assert sum(item.startswith("bulk") for item in served) == 2
+
+    @pytest.mark.asyncio
+    async def test_priority_is_served_first(self, queue: WeightedFairQueue) -> None:
+        """Higher-priority flows are drained before lower-priority ones."""
+        queue.set_flow("retries", priority=10)
+        await queue.enqueue(["bulk1", "bulk2"], flow="bulk")
+        await queue.enqueue(["retry1", "retry2"], flow="retries")
+
+        assert await queue.peek(max_items=3) == ["retry1", "retry2", "bulk1"]
+        assert await queue.dequeue(max_items=4) == [
+            "retry1",
+            "retry2",
+            "bulk1",
+            "bulk2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_idle_flow_rejoins_at_current_virtual_time(
+        self, queue: WeightedFairQueue
+    ) -> None:
+        """A flow that was idle does not get a burst to catch up."""
+        await queue.enqueue([f"a{i}" for i in range(6)], flow="a")
+        await queue.dequeue(max_items=4)
+        await queue.enqueue(["b1", "b2", "b3"], flow="b")
+
+        assert await queue.dequeue(max_items=4) == ["b1", "a4", "b2", "a5"]
+
+    @pytest.mark.asyncio
+    async def test_clear_and_flow_sizes(self, queue: WeightedFairQueue) -> None:
+        """Clearing empties every flow."""
+        await queue.enqueue(["a1"], flow="a")
+        await queue.enqueue(["b1", "b2"], flow="b")
+
+        assert await queue.flow_sizes() == {"a": 1, "b": 2}
+        assert await queue.clear() == 3
+        assert await queue.dequeue() == []
+
+    def test_rejects_non_positive_weight(self, queue: WeightedFairQueue) -> None:
+        """Weights must be positive."""
+        with pytest.raises(ConfigurationError, match="positive"):
+            queue.set_flow("a", weight=0)
+
+
+class ListLocator:
+    """Locator handing out a fixed list of bundles."""
+
+    def __init__(self, name: str, count: int) -> None:
+        self.remaining = [
+            BundleRef(bid=f"{name}-{i}", request_meta={"url": f"https://x/{name}/{i}"})
+            for i in range(count)
+        ]
+
+    async def get_next_bundle_refs(
+        self, _ctx: FetchRunContext, bundle_refs_needed: int
+    ) -> list[BundleRef]:
+        batch = self.remaining[:bundle_refs_needed]
+        self.remaining = self.remaining[bundle_refs_needed:]
+        return batch
+
+
+class RecordingLoader:
+    """Loader recording the order in which bundles are loaded."""
+
+    def __init__(self) -> None:
+        self.loaded: list[str] = []
+
+    async def load(
+        self, bundle: BundleRef, _storage: object, _ctx: object, _config: object
+    ) -> BundleLoadResult:
+        self.loaded.append(bundle.request_meta["url"])
+        return BundleLoadResult(bundle=bundle, bundle_meta={}, resources=[])
+
+
+async def _run(config: DataRegistryFetcherConfig) -> None:
+    context = FetchRunContext(
+        run_id="fair_test", app_config=SimpleNamespace(storage=object())
+    )
+    await Fetcher().run(
+        FetchPlan(config=config, context=context, concurrency=1, target_queue_size=10)
+    )
+
+
+class TestFairLocatorScheduling:
+    """Test that the fetcher interleaves locators when fair queueing is on."""
+
+    @pytest.mark.asyncio
+    async def test_small_locator_is_not_starved(self) -> None:
+        """A small locator after a large one finishes early in the run."""
+        loader = RecordingLoader()
+        config = DataRegistryFetcherConfig(
+            loader=loader,
+            locators=[ListLocator("backfill", 100), ListLocator("retries", 5)],
+            fair_queueing=True,
+        )
+
+        await _run(config)
+
+        assert len(loader.loaded) == 105
+        last_retry = max(
+            position for position, url in enumerate(loader.loaded) if "/retries/" in url
+        )
+        assert last_retry < 30
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_fair_queueing(self) -> None:
+        """Without fair queueing locators are still drained in order."""
+        loader = RecordingLoader()
+        config = DataRegistryFetcherConfig(
+            loader=loader,
+            locators=[ListLocator("backfill", 20), ListLocator("retries", 5)],
+        )
+
+        await _run(config)
+
+        assert all("/retries/" in url for url in loader.loaded[20:])
+
+    @pytest.mark.asyncio
+    async def test_mismatched_weights_are_rejected(self) -> None:
+        """Per-locator weights must match the configured locators."""
+        config = DataRegistryFetcherConfig(
+            loader=RecordingLoader(),
+            locators=[ListLocator("a", 1), ListLocator("b", 1)],
+            locator_weights=[1.0],
+        )
+
+        with pytest.raises(ConfigurationError, match="locator_weights"):
+            await _run(config)
@@ -0,0 +1,124 @@
+"""Tests for hedged HTTP requests."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from data_fetcher_core.metrics import get_metrics_registry
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http.http_hedging import LatencyTracker
+from data_fetcher_http.http_pool import HttpConnectionPool
+
+
+class SlowFirstTransport(httpx.AsyncBaseTransport):
+    """Transport whose ``slow_calls``-th request hangs."""
+
+    def __init__(self, slow_calls: set[int]) -> None:
+        self.slow_calls = slow_calls
+        self.calls = 0
+        self.cancelled = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        call = self.calls
+        try:
+            if call in self.slow_calls:
+                await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return httpx.Response(200, json={"call": call}, request=request)
+
+
+def _pool(hedge_max_ratio: float = 1.0) -> HttpConnectionPool:
+    pool = HttpConnectionPool(
+        config=HttpProtocolConfig(
+            hedge_requests=True,
+            hedge_min_samples=3,
+            hedge_max_ratio=hedge_max_ratio,
+            rate_limit_requests_per_second=1000.0,
+        )
+    )
+    for _ in range(3):
+        pool._latencies.record(0.01)  # type: ignore[union-attr]
+    return pool
+
+
+def _count(outcome: str) -> float:
+    value = get_metrics_registry().get_sample_value(
+        "data_fetcher_http_hedged_requests_total", {"outcome": outcome}
+    )
+    return value or 0.0
+
+
+class TestLatencyTracker:
+    """Test latency quantiles."""
+
+    def test_quantile(self) -> None:
+        """The p95 of 1..100 ms is 95 ms."""
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        assert tracker.quantile(0.95) == pytest.approx(0.095)
+        assert LatencyTracker().quantile(0.95) is None
+
+
+class TestHedgedRequests:
+    """Test hedging in HttpConnectionPool."""
+
+    @pytest.mark.asyncio
+    async def test_slow_get_is_hedged_and_hedge_wins(self) -> None:
+        """A GET slower than p95 is sent again and the fast copy wins."""
+        transport = SlowFirstTransport(slow_calls={1})
+        pool = _pool()
+        sent_before, won_before = _count("sent"), _count("won")
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await asyncio.wait_for(
+                pool.request_with_existing(client, "GET", "https://api.example/p"),
+                timeout=1,
+            )
+
+        assert response.json() == {"call": 2}
+        assert transport.cancelled == 1
+        assert _count("sent") - sent_before == 1
+        assert _count("won") - won_before == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_get_is_not_hedged(self) -> None:
+        """Requests finishing within the hedge delay are sent once."""
+        transport = SlowFirstTransport(slow_calls=set())
+        pool = _pool()
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await pool.request_with_existing(client, "GET", "https://api.example/p")
+
+        assert transport.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_post_is_never_hedged(self) -> None:
+        """Non-idempotent requests are not duplicated."""
+        transport = SlowFirstTransport(slow_calls=set())
+        pool = _pool()
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await pool.request_with_existing(client, "POST", "https://api.example/p")
+
+        assert transport.calls == 1
+        assert len(pool._latencies) == 3  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_hedges_respect_budget(self) -> None:
+        """Without hedge budget a slow request is waited for."""
+        transport = SlowFirstTransport(slow_calls=set())
+        pool = _pool(hedge_max_ratio=0.0)
+        pool._latencies = LatencyTracker()
+        for _ in range(3):
+            pool._latencies.record(0.0)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await pool.request_with_existing(client, "GET", "https://api.example/p")
+
+        assert transport.calls == 1
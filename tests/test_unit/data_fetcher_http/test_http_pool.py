@@ -0,0 +1,63 @@
+"""Tests for HTTP connection pool pre-warming and idle maintenance."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http.http_pool import HttpConnectionPool
+
+
+def _pool(requests: list[httpx.Request], **kwargs: object) -> HttpConnectionPool:
+    transport = httpx.MockTransport(
+        lambda request: requests.append(request) or httpx.Response(200)
+    )
+    pool = HttpConnectionPool(config=HttpProtocolConfig(**kwargs))  # type: ignore[arg-type]
+
+    async def _create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=transport, base_url=pool.config.base_url or ""
+        )
+
+    pool._create_client = _create_client  # type: ignore[method-assign]
+    return pool
+
+
+class TestHttpPoolWarmUp:
+    """Test opening pool_min_size clients up front."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_pings_base_url(self) -> None:
+        """Each warmed client opens its connection with a HEAD request."""
+        requests: list[httpx.Request] = []
+        pool = _pool(
+            requests,
+            pool_min_size=2,
+            base_url="https://api.example.com",
+            rate_limit_requests_per_second=1000.0,
+        )
+
+        assert await pool.warm_up() == 2
+
+        assert [request.method for request in requests] == ["HEAD", "HEAD"]
+        assert pool._idle.qsize() == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_clients_beyond_min_are_closed(self) -> None:
+        """Clients idle past the timeout are closed down to the minimum."""
+        requests: list[httpx.Request] = []
+        pool = _pool(requests, pool_min_size=1, pool_idle_timeout_seconds=0.01)
+        clients = [await pool._create_client() for _ in range(3)]
+        pool._total = 3
+        for client in clients:
+            await pool._put_idle(client)
+        await asyncio.sleep(0.02)
+
+        await pool.maintain_idle()
+
+        assert pool._total == 1
+        assert sum(client.is_closed for client in clients) == 2
+        assert requests == []
+        await pool.close()
@@ -0,0 +1,282 @@
+"""Tests for the partitioned cursor-pagination bundle locator."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from structlog.testing import capture_logs
+
+from data_fetcher_core.core import BundleLoadResult, BundleRef, FetchRunContext
+from data_fetcher_core.kv_store.memory import InMemoryKeyValueStore
+from data_fetcher_http.http_config import HttpProtocolConfig
+from data_fetcher_http_api.api_partitioned_bundle_locators import (
+    PartitionedPaginationHttpBundleLocator,
+    PartitionState,
+)
+from data_fetcher_http_api.fr_strategy_factories import SirenProviderFactory
+
+
+def _narrowing(current: str | None) -> str:
+    """Three-value narrowing strategy used by the tests."""
+    order = ["p:0", "p:1", "p:2"]
+    if current is None:
+        return order[0]
+    index = order.index(current)
+    return order[min(index + 1, len(order) - 1)]
+
+
+def _result(bundle: BundleRef, **meta: object) -> BundleLoadResult:
+    return BundleLoadResult(bundle=bundle, bundle_meta=dict(meta), resources=[])
+
+
+@pytest.fixture
+def context() -> FetchRunContext:
+    """Run context with an in-memory KV store and a BID-minting storage."""
+    ctx = FetchRunContext(run_id="test-run")
+    ctx.app_config = MagicMock()
+    ctx.app_config.kv_store = InMemoryKeyValueStore()
+    ctx.app_config.storage = MagicMock()
+    ctx.app_config.storage.bundle_found = MagicMock(return_value="test-bid-123")
+    return ctx
+
+
+def _locator(**kwargs: object) -> PartitionedPaginationHttpBundleLocator:
+    params: dict[str, object] = {
+        "http_config": HttpProtocolConfig(),
+        "base_url": "https://api.example.com/siren",
+        "date_start": "2024-01-01",
+        "date_end": "2024-01-03",
+        "max_active_partitions": 2,
+        "rate_limit_requests_per_second": 1000.0,
+    }
+    params.update(kwargs)
+    return PartitionedPaginationHttpBundleLocator(**params)  # type: ignore[arg-type]
+
+
+class TestPartitionState:
+    """Test partition state serialization."""
+
+    def test_round_trip_drops_in_flight(self) -> None:
+        """In-flight pages are re-requested after a restart."""
+        state = PartitionState(date="2024-01-01", narrowing="p:1", cursor="abc")
+        state.in_flight = True
+
+        restored = PartitionState.from_dict(state.to_dict())
+
+        assert restored.key == "2024-01-01|p:1"
+        assert restored.cursor == "abc"
+        assert restored.in_flight is False
+
+
+class TestPartitionedPaginationHttpBundleLocator:
+    """Test concurrent partition fan-out and per-partition cursor order."""
+
+    @pytest.mark.asyncio
+    async def test_emits_one_page_per_active_partition(
+        self, context: FetchRunContext
+    ) -> None:
+        """Each open partition contributes at most one in-flight page."""
+        locator = _locator()
+
+        refs = await locator.get_next_bundle_refs(context, 10)
+
+        assert sorted(ref.request_meta["partition"] for ref in refs) == [
+            "2024-01-01|*",
+            "2024-01-02|*",
+        ]
+        assert await locator.get_next_bundle_refs(context, 10) == []
+        assert locator.has_pending_work() is True
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_follows_processed_page(
+        self, context: FetchRunContext
+    ) -> None:
+        """A partition's next page uses the cursor reported by the loader."""
+        locator = _locator(max_active_partitions=1, date_end="2024-01-01")
+        [first] = await locator.get_next_bundle_refs(context, 10)
+
+        await locator.handle_bundle_processed(
+            first, _result(first, next_cursor="CURSOR2"), context
+        )
+        [second] = await locator.get_next_bundle_refs(context, 10)
+
+        assert second.request_meta["cursor"] == "CURSOR2"
+        assert "curseur=CURSOR2" in second.request_meta["url"]
+
+        await locator.handle_bundle_processed(
+            second, _result(second, next_cursor=None), context
+        )
+        assert await locator.get_next_bundle_refs(context, 10) == []
+        assert locator.has_pending_work() is False
+
+    @pytest.mark.asyncio
+    async def test_narrowing_splits_partition(self, context: FetchRunContext) -> None:
+        """A date that needs narrowing fans out into one partition per value."""
+        locator = _locator(
+            max_active_partitions=3,
+            date_end="2024-01-01",
+            narrowing_strategy=_narrowing,
+        )
+        [first] = await locator.get_next_bundle_refs(context, 10)
+
+        with capture_logs() as logs:
+            await locator.handle_bundle_processed(
+                first, _result(first, next_cursor=None, should_narrow=True), context
+            )
+        refs = await locator.get_next_bundle_refs(context, 10)
+
+        assert sorted(ref.request_meta["partition"] for ref in refs) == [
+            "2024-01-01|p:0",
+            "2024-01-01|p:1",
+            "2024-01-01|p:2",
+        ]
+        [narrowed] = [log for log in logs if log["event"] == "PARTITION_NARROWED"]
+        assert narrowed["children"] == 3
+
+    @pytest.mark.asyncio
+    async def test_narrowed_partitions_respect_active_cap(
+        self, context: FetchRunContext
+    ) -> None:
+        """Narrowed partitions are queued behind max_active_partitions."""
+        locator = _locator(
+            max_active_partitions=2,
+            date_end="2024-01-02",
+            narrowing_strategy=_narrowing,
+        )
+        first, second = await locator.get_next_bundle_refs(context, 10)
+
+        await locator.handle_bundle_processed(
+            first, _result(first, next_cursor=None, should_narrow=True), context
+        )
+        [child] = await locator.get_next_bundle_refs(context, 10)
+        child_key = child.request_meta["partition"]
+        assert child_key == "2024-01-01|p:0"
+        assert len(locator._partitions) == 2
+
+        # Queued children are persisted with the open partitions
+        resumed = _locator(
+            max_active_partitions=2,
+            date_end="2024-01-02",
+            narrowing_strategy=_narrowing,
+        )
+        refs = await resumed.get_next_bundle_refs(context, 10)
+        assert sorted(ref.request_meta["partition"] for ref in refs) == [
+            "2024-01-01|p:0",
+            "2024-01-02|*",
+        ]
+        assert resumed.has_pending_work() is True
+
+        [done] = [ref for ref in refs if ref.request_meta["partition"] == child_key]
+        await resumed.handle_bundle_processed(
+            done, _result(done, next_cursor=None), context
+        )
+        [queued] = await resumed.get_next_bundle_refs(context, 10)
+        assert queued.request_meta["partition"] == "2024-01-01|p:1"
+
+    @pytest.mark.asyncio
+    async def test_narrowed_partition_over_limit_is_not_completed(
+        self, context: FetchRunContext
+    ) -> None:
+        """A narrowed partition that still needs narrowing is reported as truncated."""
+        locator = _locator(
+            max_active_partitions=1,
+            date_end="2024-01-01",
+            narrowing_strategy=_narrowing,
+        )
+        [first] = await locator.get_next_bundle_refs(context, 10)
+        await locator.handle_bundle_processed(
+            first, _result(first, next_cursor=None, should_narrow=True), context
+        )
+        [child, *_] = await locator.get_next_bundle_refs(context, 10)
+
+        with capture_logs() as logs:
+            await locator.handle_bundle_processed(
+                child, _result(child, next_cursor=None, should_narrow=True), context
+            )
+
+        assert child.request_meta["partition"] not in locator._partitions
+        assert [log["event"] for log in logs] == [
+            "PARTITION_TRUNCATED_TOO_MANY_RECORDS"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_cursor_is_a_failure(self, context: FetchRunContext) -> None:
+        """Pages without a reported cursor are retried, not treated as the last page."""
+        locator = _locator(
+            max_active_partitions=1, date_end="2024-01-01", max_partition_failures=2
+        )
+        [first] = await locator.get_next_bundle_refs(context, 10)
+
+        await locator.handle_bundle_processed(first, _result(first), context)
+        [retry] = await locator.get_next_bundle_refs(context, 10)
+        assert retry.request_meta["cursor"] == "*"
+
+        await locator.handle_bundle_processed(retry, _result(retry), context)
+        assert locator.has_pending_work() is False
+
+    @pytest.mark.asyncio
+    async def test_error_releases_partition_then_abandons(
+        self, context: FetchRunContext
+    ) -> None:
+        """Failed pages are retried until the failure limit is reached."""
+        locator = _locator(
+            max_active_partitions=1, date_end="2024-01-01", max_partition_failures=2
+        )
+        [first] = await locator.get_next_bundle_refs(context, 10)
+
+        await locator.handle_bundle_error(first, "boom", context)
+        [retry] = await locator.get_next_bundle_refs(context, 10)
+        assert retry.request_meta["url"] == first.request_meta["url"]
+
+        await locator.handle_bundle_error(retry, "boom", context)
+        assert locator.has_pending_work() is False
+
+    @pytest.mark.asyncio
+    async def test_state_is_restored_from_kv_store(
+        self, context: FetchRunContext
+    ) -> None:
+        """A new locator instance resumes open partitions and cursors."""
+        locator = _locator(max_active_partitions=1)
+        [first] = await locator.get_next_bundle_refs(context, 10)
+        await locator.handle_bundle_processed(
+            first, _result(first, next_cursor="NEXT"), context
+        )
+
+        resumed = _locator(max_active_partitions=1)
+        [page] = await resumed.get_next_bundle_refs(context, 10)
+
+        assert page.request_meta["partition"] == "2024-01-01|*"
+        assert page.request_meta["cursor"] == "NEXT"
+
+    @pytest.mark.asyncio
+    async def test_ignores_bundles_from_other_locators(
+        self, context: FetchRunContext
+    ) -> None:
+        """Processed notifications for unknown partitions are ignored."""
+        locator = _locator()
+        await locator.get_next_bundle_refs(context, 10)
+        other = BundleRef(bid="test-bid-123", request_meta={"url": "sftp://x"})
+
+        await locator.handle_bundle_processed(other, _result(other), context)
+
+        assert len(locator._partitions) == 2
+
+
+class TestSirenProviderFactory:
+    """Test creating the partitioned locator from SIREN provider config."""
+
+    def test_partitioned_locator_keeps_rate_limit_and_prefix(self) -> None:
+        """Rate limit and state prefix are passed to the partitioned locator."""
+        locator = SirenProviderFactory(http_manager=MagicMock()).create(
+            {
+                "http_config": HttpProtocolConfig(),
+                "base_url": "https://api.example.com/siren",
+                "date_start": "2024-01-01",
+                "rate_limit_requests_per_second": 0.5,
+                "state_management_prefix": "fr_siren",
+                "max_active_partitions": 4,
+            }
+        )
+
+        assert isinstance(locator, PartitionedPaginationHttpBundleLocator)
+        assert locator.rate_limit_requests_per_second == 0.5
+        assert locator.state_management_prefix == "fr_siren"
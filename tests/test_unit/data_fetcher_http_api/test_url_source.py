@@ -0,0 +1,107 @@
+"""Tests for the lazily consumed URL source used by API locators."""
+
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import pytest
+
+from data_fetcher_core.kv_store import InMemoryKeyValueStore, RedisKeyValueStore
+from data_fetcher_http_api.url_source import UrlSource
+from tests.shims.redis_stand_in import RedisStandIn
+
+
+class TestUrlSource:
+    """Test ordering, laziness and streaming sources of UrlSource."""
+
+    @pytest.fixture
+    async def store(self) -> AsyncIterator[InMemoryKeyValueStore]:
+        """Create a fresh in-memory store for each test."""
+        store = InMemoryKeyValueStore(serializer="json", default_ttl=3600)
+        yield store
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_serves_buffer_then_sources_in_order(self) -> None:
+        """Appended URLs come first, then each source in the order added."""
+        source = UrlSource(["a", "b"])
+        source.extend(["c"])
+        source.append("first")
+
+        popped = [await source.pop() for _ in range(5)]
+
+        assert popped == ["first", "a", "b", "c", None]
+        assert not source
+
+    @pytest.mark.asyncio
+    async def test_consumes_iterators_lazily(self) -> None:
+        """Only as many items are pulled from a generator as are popped."""
+        pulled: list[int] = []
+
+        def generate() -> Iterator[str]:
+            for i in range(1_000_000):
+                pulled.append(i)
+                yield f"url-{i}"
+
+        source = UrlSource(generate())
+
+        assert await source.pop() == "url-0"
+        assert await source.pop() == "url-1"
+        assert pulled == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_streams_urls_from_file(self, tmp_path: Path) -> None:
+        """Blank lines and comments in a URL file are skipped."""
+        path = tmp_path / "urls.txt"
+        path.write_text("# failed companies\nhttps://a\n\n  https://b  \n")
+
+        source = UrlSource(UrlSource.iter_file(path))
+
+        assert [await source.pop() for _ in range(3)] == [
+            "https://a",
+            "https://b",
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_streams_urls_from_kv_range(
+        self, store: InMemoryKeyValueStore
+    ) -> None:
+        """Every URL under the prefix is read in key order."""
+        for i in range(5):
+            await store.put(f"failed:{i:03d}", f"https://api/{i}")
+        await store.put("failed:005", {"url": "https://api/5"})
+        await store.put("failed;other", "https://unrelated")
+
+        source = UrlSource(UrlSource.iter_kv_range(store, "failed:"))
+        urls = []
+        while (url := await source.pop()) is not None:
+            urls.append(url)
+
+        assert urls == [f"https://api/{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_streams_every_url_from_redis_in_batches(self) -> None:
+        """Every URL under the prefix is read once, one SCAN page at a time."""
+        store = RedisKeyValueStore(serializer="json", key_prefix="app:")
+        client = RedisStandIn()
+        store._redis = client  # type: ignore[assignment]
+        for i in reversed(range(1500)):
+            await store.put(f"failed:{i:04d}", f"https://api/{i}")
+        await store.put("other:0000", "https://unrelated")
+        mget = client.mget
+        batch_sizes: list[int] = []
+
+        async def _recording_mget(keys: list[str]) -> list[str | None]:
+            batch_sizes.append(len(keys))
+            return await mget(keys)
+
+        client.mget = _recording_mget  # type: ignore[method-assign]
+
+        source = UrlSource(UrlSource.iter_kv_range(store, "failed:", batch_size=100))
+        urls = [await source.pop()]
+        assert batch_sizes == [100]
+        while (url := await source.pop()) is not None:
+            urls.append(url)
+
+        assert sorted(urls) == sorted(f"https://api/{i}" for i in range(1500))
+        assert max(batch_sizes) <= 100
@@ -0,0 +1,130 @@
+"""Tests for shared SFTP credentials and refresh on authentication failure."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from paramiko.ssh_exception import AuthenticationException
+
+from data_fetcher_core.retry import create_retry_engine
+from data_fetcher_sftp.sftp_config import SftpProtocolConfig
+from data_fetcher_sftp.sftp_credentials import SftpCredentialsWrapper
+from data_fetcher_sftp.sftp_manager import SftpManager
+
+
+class CountingProvider:
+    """Credential provider counting lookups, with a rotatable password."""
+
+    def __init__(self) -> None:
+        self.password = "old"
+        self.lookups = 0
+        self.invalidated: list[str] = []
+
+    async def get_credential(self, config_name: str, config_key: str) -> str:
+        self.lookups += 1
+        await asyncio.sleep(0)
+        return {
+            "host": f"{config_name}.example.com",
+            "username": "user",
+            "password": self.password,
+            "port": "22",
+        }[config_key]
+
+    def invalidate(self, config_name: str) -> None:
+        self.invalidated.append(config_name)
+
+    def clear(self) -> None:
+        pass
+
+
+def _context(provider: CountingProvider) -> Any:
+    return SimpleNamespace(app_config=SimpleNamespace(credential_provider=provider))
+
+
+class TestSftpCredentialsWrapper:
+    """Test credential caching in the wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_resolve_once(self) -> None:
+        """Concurrent lookups share one resolution."""
+        provider = CountingProvider()
+        wrapper = SftpCredentialsWrapper("us-fl", provider)
+
+        results = await asyncio.gather(*(wrapper.get_credentials() for _ in range(5)))
+
+        assert all(result is results[0] for result in results)
+        assert provider.lookups == 4
+
+    @pytest.mark.asyncio
+    async def test_same_provider_keeps_cache(self) -> None:
+        """Re-setting the same provider does not discard cached credentials."""
+        provider = CountingProvider()
+        wrapper = SftpCredentialsWrapper("us-fl", provider)
+        await wrapper.get_credentials()
+
+        wrapper.update_credential_provider(provider)
+        await wrapper.get_credentials()
+
+        assert provider.lookups == 4
+
+    @pytest.mark.asyncio
+    async def test_refresh_invalidates_provider_cache(self) -> None:
+        """Refreshing fetches again and invalidates the provider's copy."""
+        provider = CountingProvider()
+        wrapper = SftpCredentialsWrapper("us-fl", provider)
+        await wrapper.get_credentials()
+        provider.password = "new"
+
+        wrapper.refresh()
+
+        assert (await wrapper.get_credentials()).password == "new"
+        assert provider.invalidated == ["us-fl"]
+
+
+class TestSftpManagerCredentials:
+    """Test that connections of a pool share one credentials wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_new_connections_reuse_credentials(self) -> None:
+        """Opening several connections resolves credentials once."""
+        provider = CountingProvider()
+        manager = SftpManager()
+        config = SftpProtocolConfig(config_name="us-fl", pool_max_size=3)
+
+        with patch("pysftp.Connection") as connection_cls:
+            connection_cls.return_value = MagicMock()
+            connections = [
+                await manager.get_connection(config, _context(provider))
+                for _ in range(3)
+            ]
+
+        assert connection_cls.call_count == 3
+        assert provider.lookups == 4
+        for connection in connections:
+            await connection.release()
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_refreshes_credentials(self) -> None:
+        """A rejected password is refreshed before the connection is retried."""
+        provider = CountingProvider()
+        manager = SftpManager()
+        config = SftpProtocolConfig(config_name="us-fl", max_retries=1)
+        pool = manager._get_or_create_pool(config)
+        pool._retry_engine = create_retry_engine(max_retries=1, base_delay=0.01)
+        connection = MagicMock()
+
+        def _connect(**kwargs: object) -> MagicMock:
+            if kwargs["password"] == "old":
+                provider.password = "new"
+                raise AuthenticationException("Authentication failed.")
+            return connection
+
+        with patch("pysftp.Connection", side_effect=_connect) as connection_cls:
+            leased = await manager.get_connection(config, _context(provider))
+
+        assert connection_cls.call_count == 2
+        assert connection_cls.call_args.kwargs["password"] == "new"
+        assert provider.invalidated == ["us-fl"]
+        await leased.release()
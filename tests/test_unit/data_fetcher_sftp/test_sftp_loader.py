@@ -0,0 +1,235 @@
+"""Tests for the single-lease SFTP loader path."""
+
+import io
+import stat
+import threading
+from collections.abc import AsyncGenerator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from data_fetcher_core.core import BundleRef, DataRegistryFetcherConfig, FetchRunContext
+from data_fetcher_core.exceptions import BundleTimeoutError
+from data_fetcher_core.watchdog import run_with_watchdog
+from data_fetcher_sftp.sftp_config import SftpProtocolConfig
+from data_fetcher_sftp.sftp_loader import RemoteFileAttributes, SftpBundleLoader
+
+FILE_MODE = stat.S_IFREG | 0o644
+
+
+class FakeConnection:
+    """Leased connection recording the operations it serves."""
+
+    def __init__(self, files: dict[str, bytes]) -> None:
+        self.files = files
+        self.calls: list[str] = []
+
+    async def __aenter__(self) -> "FakeConnection":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.calls.append("release")
+
+    async def stat(self, path: str) -> Any:
+        self.calls.append("stat")
+        if path in self.files:
+            return SimpleNamespace(
+                st_size=len(self.files[path]), st_mtime=1.0, st_mode=FILE_MODE
+            )
+        return SimpleNamespace(st_size=0, st_mtime=1.0, st_mode=stat.S_IFDIR | 0o755)
+
+    async def listdir_attr(self, path: str) -> list[Any]:
+        self.calls.append("listdir_attr")
+        return [
+            SimpleNamespace(
+                filename=name.rsplit("/", 1)[-1],
+                st_size=len(data),
+                st_mtime=1.0,
+                st_mode=FILE_MODE,
+            )
+            for name, data in self.files.items()
+            if name.startswith(f"{path}/")
+        ]
+
+    async def open(self, path: str, _mode: str = "r") -> io.BytesIO:
+        self.calls.append("open")
+        return io.BytesIO(self.files[path])
+
+    async def discard(self) -> None:
+        self.calls.append("discard")
+
+
+class StuckFile(io.BytesIO):
+    """Remote file whose reads block until ``unblock`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.unblock = threading.Event()
+
+    def read(self, _size: int | None = -1) -> bytes:
+        self.unblock.wait(timeout=5)
+        return b""
+
+
+class FakeManager:
+    """SFTP manager counting leases."""
+
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.leases = 0
+
+    async def get_connection(self, _config: object, _ctx: object) -> FakeConnection:
+        self.leases += 1
+        return self.connection
+
+
+class FakeBundleContext:
+    """Bundle storage context collecting streamed bytes."""
+
+    def __init__(self) -> None:
+        self.resources: dict[str, bytes] = {}
+
+    async def add_resource(
+        self, resource_name: str, metadata: object, stream: AsyncGenerator[bytes]
+    ) -> None:
+        self.resources[resource_name] = b"".join([chunk async for chunk in stream])
+
+    async def complete(self, _metadata: object) -> None:
+        pass
+
+
+class FakeStorage:
+    """Storage handing out one bundle context."""
+
+    def __init__(self) -> None:
+        self.context = FakeBundleContext()
+
+    async def start_bundle(self, _bundle: object, _recipe: object) -> FakeBundleContext:
+        return self.context
+
+
+def _loader(files: dict[str, bytes]) -> tuple[SftpBundleLoader, FakeManager]:
+    manager = FakeManager(FakeConnection(files))
+    loader = SftpBundleLoader(
+        sftp_manager=manager,  # type: ignore[arg-type]
+        sftp_config=SftpProtocolConfig(config_name="us-fl"),
+    )
+    return loader, manager
+
+
+async def _load(
+    loader: SftpBundleLoader, request_meta: dict[str, Any], **config: Any
+) -> FakeStorage:
+    storage = FakeStorage()
+    await loader.load(
+        BundleRef(bid="bid-1", request_meta=request_meta),
+        storage,  # type: ignore[arg-type]
+        FetchRunContext(run_id="run"),
+        DataRegistryFetcherConfig(loader=loader, locators=[], **config),
+    )
+    return storage
+
+
+class TestSftpBundleLoaderSingleLease:
+    """Test that a bundle is loaded over one leased connection."""
+
+    @pytest.mark.asyncio
+    async def test_listing_attributes_skip_stat(self) -> None:
+        """A file with size and mtime from the locator costs a single open."""
+        loader, manager = _loader({"/in/a.csv": b"a,b\n"})
+
+        storage = await _load(
+            loader,
+            {"url": "sftp:///in/a.csv", "size": 4, "mtime": 1.0, "mode": FILE_MODE},
+        )
+
+        assert manager.leases == 1
+        assert manager.connection.calls == ["open", "release"]
+        assert storage.context.resources == {"/in/a.csv": b"a,b\n"}
+
+    @pytest.mark.asyncio
+    async def test_missing_attributes_stat_on_same_lease(self) -> None:
+        """Without listing attributes the path is stat'ed on the same lease."""
+        loader, manager = _loader({"/in/a.csv": b"a,b\n"})
+
+        await _load(loader, {"url": "sftp:///in/a.csv"})
+
+        assert manager.leases == 1
+        assert manager.connection.calls == ["stat", "open", "release"]
+
+    @pytest.mark.asyncio
+    async def test_directory_uses_one_listing(self) -> None:
+        """Directory bundles list attributes once and open each file."""
+        loader, manager = _loader({"/in/a.csv": b"a", "/in/b.csv": b"b"})
+
+        storage = await _load(loader, {"url": "sftp:///in"})
+
+        assert manager.leases == 1
+        assert manager.connection.calls == [
+            "stat",
+            "listdir_attr",
+            "open",
+            "open",
+            "release",
+        ]
+        assert set(storage.context.resources) == {"/in/a.csv", "/in/b.csv"}
+
+
+class TestSftpBundleLoaderCancellation:
+    """Test cancelling a stuck transfer."""
+
+    @pytest.mark.asyncio
+    async def test_stuck_read_is_cancelled_and_connection_discarded(self) -> None:
+        """A read that never returns does not block the loop and drops the lease."""
+        loader, manager = _loader({"/in/a.csv": b""})
+        stuck = StuckFile()
+
+        async def _open(_path: str, _mode: str = "r") -> StuckFile:
+            return stuck
+
+        manager.connection.open = _open  # type: ignore[method-assign]
+
+        try:
+            with pytest.raises(BundleTimeoutError):
+                await run_with_watchdog(
+                    lambda: _load(
+                        loader,
+                        {"url": "sftp:///in/a.csv", "size": 1, "mtime": 1.0},
+                        bundle_deadline_seconds=0.05,
+                    ),
+                    bid="bid-1",
+                    deadline_seconds=0.05,
+                )
+        finally:
+            stuck.unblock.set()
+
+        assert "discard" in manager.connection.calls
+
+    @pytest.mark.asyncio
+    async def test_unwatched_reads_stay_on_the_loop(self) -> None:
+        """Without a deadline or stall check chunks are read without a thread."""
+        loader, manager = _loader({"/in/a.csv": b""})
+        reader_threads: set[int] = set()
+
+        class ThreadRecordingFile(io.BytesIO):
+            def read(self, size: int | None = -1) -> bytes:
+                reader_threads.add(threading.get_ident())
+                return super().read(size)
+
+        async def _open(_path: str, _mode: str = "r") -> io.BytesIO:
+            return ThreadRecordingFile(b"a,b\n")
+
+        manager.connection.open = _open  # type: ignore[method-assign]
+
+        storage = await _load(
+            loader, {"url": "sftp:///in/a.csv", "size": 4, "mtime": 1.0}
+        )
+
+        assert storage.context.resources == {"/in/a.csv": b"a,b\n"}
+        assert reader_threads == {threading.get_ident()}
+
+
+def test_request_meta_without_attributes() -> None:
+    """Bundles from locators that do not list attributes fall back to stat."""
+    assert RemoteFileAttributes.from_request_meta({"url": "sftp:///a"}) is None
@@ -56,6 +56,9 @@ class TestSftpManager:
         mock_config.base_retry_delay = 1.0
         mock_config.max_retry_delay = 60.0
         mock_config.retry_exponential_base = 2.0
+        mock_config.retry_budget_ratio = 0.2
+        mock_config.circuit_failure_threshold = 5
+        mock_config.circuit_recovery_seconds = 30.0
         mock_config.get_connection_key.return_value = "test_key"
         return mock_config
 
@@ -0,0 +1,294 @@
+"""Tests for SFTP connection pool pre-warming and idle maintenance."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from data_fetcher_core.retry import _retry_active, create_retry_engine
+from data_fetcher_sftp.sftp_config import SftpProtocolConfig
+from data_fetcher_sftp.sftp_credentials import SftpCredentialsWrapper
+from data_fetcher_sftp.sftp_pool import SftpConnectionPool
+
+
+class StaticProvider:
+    """Credential provider returning fixed credentials."""
+
+    async def get_credential(self, config_name: str, config_key: str) -> str:
+        return {
+            "host": f"{config_name}.example.com",
+            "username": "user",
+            "password": "secret",
+            "port": "22",
+        }[config_key]
+
+
+def _warm_args() -> tuple[Any, SftpCredentialsWrapper]:
+    provider = StaticProvider()
+    app_config = SimpleNamespace(credential_provider=provider)
+    return app_config, SftpCredentialsWrapper("us-fl", provider)
+
+
+class TestSftpPoolWarmUp:
+    """Test opening pool_min_size connections up front."""
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_min_connections_concurrently(self) -> None:
+        """Warm-up opens the minimum in parallel and leaves them idle."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", pool_min_size=3)
+        )
+
+        def _connect(**_kwargs: object) -> MagicMock:
+            time.sleep(0.1)
+            return MagicMock()
+
+        with patch("pysftp.Connection", side_effect=_connect) as connection_cls:
+            started = time.monotonic()
+            opened = await pool.warm_up(*_warm_args())
+            elapsed = time.monotonic() - started
+
+        assert opened == 3
+        assert connection_cls.call_count == 3
+        assert elapsed < 0.25
+        assert pool._idle.qsize() == 3
+        await pool.close()
+        assert pool._maintenance_task is None
+
+    @pytest.mark.asyncio
+    async def test_failed_connections_do_not_hold_slots(self) -> None:
+        """A connection that cannot be opened frees its reserved slot."""
+        config = SftpProtocolConfig(config_name="us-fl", pool_min_size=2)
+        pool = SftpConnectionPool(config=config)
+        pool._create_inner_connection = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[MagicMock(), OSError("connection refused")]
+        )
+
+        opened = await pool.warm_up(*_warm_args())
+
+        assert opened == 1
+        assert pool._total == 1
+        await pool.close()
+
+
+class TestSftpPoolLimit:
+    """Test that concurrent acquires honour pool_max_size."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_open_at_most_max_size(self) -> None:
+        """Slots are reserved before the handshake, so waiters reuse connections."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", pool_max_size=2)
+        )
+
+        def _connect(**_kwargs: object) -> MagicMock:
+            time.sleep(0.05)
+            return MagicMock()
+
+        async def _use() -> None:
+            async with await pool.acquire(*_warm_args()) as connection:
+                await connection.listdir(".")
+
+        with patch("pysftp.Connection", side_effect=_connect) as connection_cls:
+            await asyncio.gather(*(_use() for _ in range(8)))
+
+        assert connection_cls.call_count == 2
+        assert pool._total == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_handshake_frees_reserved_slot(self) -> None:
+        """A connection that cannot be opened does not keep its slot."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", pool_max_size=1)
+        )
+        pool._create_inner_connection = AsyncMock(  # type: ignore[method-assign]
+            side_effect=OSError("connection refused")
+        )
+
+        with pytest.raises(OSError, match="connection refused"):
+            await pool.acquire(*_warm_args())
+
+        assert pool._total == 0
+        await pool.close()
+
+
+class TestSftpPoolIdleMaintenance:
+    """Test reaping and keep-alive of idle connections."""
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_beyond_min_are_closed(self) -> None:
+        """Connections idle past the timeout are closed down to the minimum."""
+        config = SftpProtocolConfig(
+            config_name="us-fl",
+            pool_min_size=1,
+            pool_idle_timeout_seconds=0.01,
+            pool_keepalive_seconds=None,
+        )
+        pool = SftpConnectionPool(config=config)
+        connections = [MagicMock() for _ in range(3)]
+        pool._total = 3
+        for connection in connections:
+            await pool._put_idle(connection)
+        await asyncio.sleep(0.02)
+
+        await pool.maintain_idle()
+
+        assert pool._total == 1
+        assert pool._idle.qsize() == 1
+        assert sum(c.close.call_count for c in connections) == 2
+
+    @pytest.mark.asyncio
+    async def test_keepalive_drops_dead_connections(self) -> None:
+        """Keep-alive checks discard connections that no longer respond."""
+        config = SftpProtocolConfig(
+            config_name="us-fl",
+            pool_keepalive_seconds=1.0,
+            health_check_skip_seconds=0.0,
+        )
+        pool = SftpConnectionPool(config=config)
+        alive = MagicMock()
+        dead = MagicMock()
+        type(dead).pwd = property(lambda _self: (_ for _ in ()).throw(EOFError()))
+        pool._total = 2
+        await pool._put_idle(alive)
+        await pool._put_idle(dead)
+
+        await pool.maintain_idle()
+
+        assert pool._total == 1
+        assert pool._idle.get_nowait() is alive
+
+    @pytest.mark.asyncio
+    async def test_maintenance_started_under_retry_is_not_nested(self) -> None:
+        """The maintenance task does not inherit the retry loop that started it."""
+        pool = SftpConnectionPool(config=SftpProtocolConfig(config_name="us-fl"))
+        engine = create_retry_engine(max_retries=0)
+        retry_active: list[bool] = []
+
+        async def _maintain() -> None:
+            retry_active.append(_retry_active.get())
+
+        pool._maintain = _maintain  # type: ignore[method-assign]
+
+        async def _acquire() -> None:
+            await (await pool.acquire(*_warm_args())).release()
+
+        with patch("pysftp.Connection", return_value=MagicMock()):
+            await engine.execute_with_retry_async(_acquire)
+        assert pool._maintenance_task is not None
+        await pool._maintenance_task
+
+        assert retry_active == [False]
+        await pool.close()
+
+
+class PwdCountingConnection(MagicMock):
+    """Connection stand-in counting ``pwd`` round trips."""
+
+    pwd_calls = 0
+
+    @property
+    def pwd(self) -> str:
+        self.pwd_calls += 1
+        return "/"
+
+
+class TestSftpPoolCheapChecks:
+    """Test skipped health checks and client-side cwd tracking."""
+
+    @pytest.mark.asyncio
+    async def test_recently_used_connection_skips_round_trips(self) -> None:
+        """A busy connection is leased without pwd or repeated chdir calls."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", base_dir="/data")
+        )
+        inner = PwdCountingConnection()
+
+        with patch("pysftp.Connection", return_value=inner):
+            for _ in range(3):
+                async with await pool.acquire(*_warm_args()) as connection:
+                    await connection.listdir(".")
+
+        assert inner.pwd_calls == 0
+        inner.chdir.assert_called_once_with("/data")
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_operation_forces_health_check(self) -> None:
+        """A connection whose operation raised is probed before reuse."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", max_retries=0)
+        )
+        inner = PwdCountingConnection()
+        inner.listdir.side_effect = EOFError("channel closed")
+
+        with patch("pysftp.Connection", return_value=inner):
+            connection = await pool.acquire(*_warm_args())
+            with pytest.raises(EOFError, match="channel closed"):
+                await connection.listdir(".")
+            await connection.release()
+
+        assert inner.pwd_calls == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_changed_directory_is_reset_on_release(self) -> None:
+        """Leaving base_dir makes release change back to it."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(config_name="us-fl", base_dir="/data")
+        )
+        inner = MagicMock()
+
+        with patch("pysftp.Connection", return_value=inner):
+            async with await pool.acquire(*_warm_args()) as connection:
+                await connection.request("chdir", "/data/2024")
+
+        assert [c.args[0] for c in inner.chdir.call_args_list] == [
+            "/data",
+            "/data/2024",
+            "/data",
+        ]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_long_idle_connection_is_checked(self) -> None:
+        """Connections idle past the skip window are health-checked on acquire."""
+        pool = SftpConnectionPool(
+            config=SftpProtocolConfig(
+                config_name="us-fl", health_check_skip_seconds=0.01
+            )
+        )
+        inner = PwdCountingConnection()
+
+        with patch("pysftp.Connection", return_value=inner):
+            await (await pool.acquire(*_warm_args())).release()
+            await asyncio.sleep(0.02)
+            await (await pool.acquire(*_warm_args())).release()
+
+        assert inner.pwd_calls == 1
+        await pool.close()
+
+
+class TestSftpPoolDiscard:
+    """Test dropping connections of cancelled transfers."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_lease_is_closed_not_pooled(self) -> None:
+        """A lease exited by cancellation closes its connection."""
+        pool = SftpConnectionPool(config=SftpProtocolConfig(config_name="us-fl"))
+        inner = MagicMock()
+
+        with patch("pysftp.Connection", return_value=inner):
+            connection = await pool.acquire(*_warm_args())
+            with pytest.raises(asyncio.CancelledError):
+                async with connection:
+                    raise asyncio.CancelledError
+
+        inner.close.assert_called_once()
+        assert pool._total == 0
+        assert pool._idle.qsize() == 0
+        await pool.close()